@@ -0,0 +1,3 @@
+"""
+Performance benchmarks for the PSS Fleet Data API client. Run with `python -m benchmarks --help`.
+"""
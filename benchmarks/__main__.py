@@ -0,0 +1,65 @@
+import argparse
+import importlib
+import pkgutil
+import sys
+from pathlib import Path
+
+from .runner import DEFAULT_SIZES, find_regressions, format_results, get_benchmarks, load_baselines, results_to_json, run_benchmark, save_baselines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Runs the performance benchmarks and compares them to the stored baselines."
+    )
+    parser.add_argument("-k", "--filter", help="Only run benchmarks containing this string in their name.")
+    parser.add_argument("-s", "--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="The numbers of users in the synthetic collections.")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="The number of timed runs per benchmark and size. The best run is reported.")
+    parser.add_argument("--time-tolerance", type=float, default=0.25, help="The relative amount by which the wall time may exceed its baseline.")
+    parser.add_argument("--memory-tolerance", type=float, default=0.10, help="The relative amount by which memory metrics may exceed their baseline.")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as new baselines instead of comparing them.")
+    parser.add_argument("--output", type=Path, help="Write the results as JSON to this file.")
+    parser.add_argument("--list", action="store_true", help="List the available benchmarks and exit.")
+    args = parser.parse_args()
+
+    for module_info in pkgutil.iter_modules([str(Path(__file__).parent)]):
+        if module_info.name.startswith("bench_"):
+            importlib.import_module(f"{__package__}.{module_info.name}")
+
+    benchmarks = get_benchmarks(args.filter)
+    if args.list:
+        print("\n".join(benchmark.name for benchmark in benchmarks))
+        return 0
+
+    results = []
+    for benchmark in benchmarks:
+        for size in args.sizes:
+            if benchmark.sizes and size not in benchmark.sizes:
+                continue
+            result = run_benchmark(benchmark, size, args.repeat)
+            print(format_results([result]).splitlines()[-1], flush=True)
+            results.append(result)
+
+    print()
+    print(format_results(results))
+
+    if args.output:
+        args.output.write_text(results_to_json(results), encoding="utf-8")
+
+    if args.save_baseline:
+        save_baselines(results)
+        print(f"\nStored baselines for {len(results)} results.")
+        return 0
+
+    regressions = find_regressions(results, load_baselines(), args.time_tolerance, args.memory_tolerance)
+    if regressions:
+        print(f"\nFound {len(regressions)} regression(s):")
+        for regression in regressions:
+            print(f"- {regression}")
+        return 1
+
+    print("\nNo regressions found.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
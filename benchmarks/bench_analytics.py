@@ -0,0 +1,91 @@
+import random
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+from pss_fleet_data.analytics import MappedCollection, build_time_series, diff_collections, get_top_users, write_mapped_collection
+from pss_fleet_data.models.api_models import ApiCollection
+
+from .runner import benchmark
+from .synthetic import SEED, create_api_collection, create_collection
+
+
+_TEMP_DIRECTORY = tempfile.TemporaryDirectory(prefix="pss_fleet_data_benchmarks_")
+
+
+@lru_cache(maxsize=None)
+def create_next_api_collection(user_count: int) -> ApiCollection:
+    """Derives a later synthetic collection from `create_api_collection(user_count)`: 1% of the users left the game, 1% are new,
+    5% switched alliances and a third gained trophies. Results are cached per size.
+
+    Args:
+        user_count (int): The number of users of the earlier collection.
+
+    Returns:
+        ApiCollection: The later collection.
+    """
+    rng = random.Random(SEED + 1)
+    before = create_api_collection(user_count)
+    alliance_count = len(before.fleets)
+    users = []
+    for user in before.users:
+        roll = rng.random()
+        if roll < 0.01:
+            continue
+        if roll < 0.06:
+            alliance_id = rng.randint(1, alliance_count)
+            user = (user[0], user[1], alliance_id, user[3], user[4], 6) + user[6:]
+        elif roll < 0.4:
+            user = user[:3] + (user[3] + rng.randint(1, 100),) + user[4:]
+        users.append(user)
+
+    new_users = before.users[: user_count // 100]
+    users.extend((user_count + user[0],) + user[1:] for user in new_users)
+
+    meta = before.meta.model_copy(update={"collection_id": 2, "user_count": len(users)})
+    return before.model_copy(update={"meta": meta, "users": users})
+
+
+@benchmark("analytics.diff_collections.api")
+def diff_collections_with_api_collections(size: int):
+    before = create_api_collection(size)
+    after = create_next_api_collection(size)
+    return lambda: diff_collections(before, after)
+
+
+@benchmark("analytics.diff_collections.collection")
+def diff_collections_with_collection(size: int):
+    before = create_collection(size)
+    after = create_next_api_collection(size)
+    return lambda: diff_collections(before, after)
+
+
+@benchmark("analytics.build_time_series")
+def build_time_series_of_12_collections(size: int):
+    collections = [create_api_collection(size), create_next_api_collection(size)] * 6
+    return lambda: build_time_series(collections, ("trophy", "alliance_score", "championship_score"))
+
+
+@benchmark("analytics.get_top_users")
+def get_top_100_users(size: int):
+    api_collection = create_api_collection(size)
+    return lambda: get_top_users(api_collection, n=100)
+
+
+@benchmark("analytics.get_top_users.division")
+def get_top_100_users_per_division(size: int):
+    api_collection = create_api_collection(size)
+    return lambda: get_top_users(api_collection, n=100, group_by="division")
+
+
+@benchmark("analytics.mapped_collection.open")
+def open_mapped_collection_and_sum_trophies(size: int):
+    file_path = Path(_TEMP_DIRECTORY.name, f"collection_{size}.bin")
+    _ = write_mapped_collection(create_api_collection(size), file_path)
+
+    def open_and_sum() -> int:
+        with MappedCollection(file_path) as mapped_collection:
+            with mapped_collection.get_user_view("trophy") as trophies:
+                return sum(trophies)
+
+    return open_and_sum
@@ -0,0 +1,50 @@
+import json
+from typing import Any, Callable
+
+from httpx import AsyncClient, MockTransport, Request, Response
+
+from pss_fleet_data import PssFleetDataClient
+
+from .runner import benchmark
+from .synthetic import create_api_collection, create_collection, create_collection_json
+
+
+BASE_URL = "https://fleetdata.example.com"
+
+
+def create_mock_client(handler: Callable[[Request], Response], **kwargs: Any) -> PssFleetDataClient:
+    """Creates a `PssFleetDataClient` sending all requests to a `httpx.MockTransport`, so that no network I/O is measured.
+
+    Args:
+        handler (Callable[[Request], Response]): Creates the response for a request.
+        **kwargs: Further arguments passed to the `PssFleetDataClient`, e.g. an `executor`.
+
+    Returns:
+        PssFleetDataClient: The client.
+    """
+    client = PssFleetDataClient(base_url=BASE_URL, api_key="benchmark", **kwargs)
+    client._PssFleetDataClient__http_client = AsyncClient(base_url=BASE_URL, transport=MockTransport(handler))
+    return client
+
+
+@benchmark("client.get_collection")
+def client_get_collection(size: int):
+    content = create_collection_json(size).encode()
+    client = create_mock_client(lambda _: Response(200, content=content, headers={"Content-Type": "application/json"}))
+    return lambda: client.get_collection(1)
+
+
+@benchmark("client.get_users_from_collection")
+def client_get_users_from_collection(size: int):
+    api_collection = create_api_collection(size)
+    content = api_collection.model_copy(update={"fleets": []}).model_dump_json().encode()
+    client = create_mock_client(lambda _: Response(200, content=content, headers={"Content-Type": "application/json"}))
+    return lambda: client.get_users_from_collection(1)
+
+
+@benchmark("client.create_collection")
+def client_create_collection(size: int):
+    collection = create_collection(size)
+    metadata = json.loads(create_api_collection(size).meta.model_dump_json())
+    client = create_mock_client(lambda _: Response(201, json=metadata))
+    return lambda: client.create_collection(collection)
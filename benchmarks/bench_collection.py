@@ -0,0 +1,54 @@
+from pss_fleet_data import CollectionResolver
+
+from .runner import benchmark
+from .synthetic import create_api_collection, create_collection
+
+
+@benchmark("collection.get_user")
+def get_user(size: int):
+    collection = create_collection(size).model_copy()
+    user_ids = [user.id for user in collection.users]
+
+    def get_users():
+        # Include building the index in every run
+        collection.clear_indexes()
+        return [collection.get_user(user_id) for user_id in user_ids]
+
+    return get_users
+
+
+@benchmark("collection.get_alliance_members")
+def get_alliance_members(size: int):
+    collection = create_collection(size).model_copy()
+    alliance_ids = [alliance.id for alliance in collection.alliances]
+
+    def get_members():
+        collection.clear_indexes()
+        return [collection.get_alliance_members(alliance_id) for alliance_id in alliance_ids]
+
+    return get_members
+
+
+@benchmark("collection.search_users")
+def search_users(size: int):
+    collection = create_collection(size).model_copy()
+    prefixes = [f"user {i}" for i in range(1, 100)]
+
+    def search():
+        collection.clear_indexes()
+        return [collection.search_users(prefix, limit=10) for prefix in prefixes]
+
+    return search
+
+
+@benchmark("resolver.get_user_history")
+def get_user_history(size: int):
+    api_collection = create_api_collection(size)
+    user_ids = [api_user[0] for api_user in api_collection.users[:1_000]]
+
+    def get_user_histories():
+        # Include building the indexes in every run
+        resolver = CollectionResolver(api_collection)
+        return [resolver.get_user_history(user_id) for user_id in user_ids]
+
+    return get_user_histories
@@ -0,0 +1,50 @@
+import json
+
+from httpx import Response
+
+from pss_fleet_data.models.converters import FromAPI, FromResponse, ToAPI
+
+from .runner import benchmark
+from .synthetic import create_api_collection, create_collection, create_collection_response, create_user_history_json
+
+
+@benchmark("converters.from_response.to_collection")
+def from_response_to_collection(size: int):
+    response = create_collection_response(size)
+    return lambda: FromResponse.to_collection(response)
+
+
+@benchmark("converters.from_response.to_user_history_list", sizes=(1_000, 10_000))
+def from_response_to_user_history_list(size: int):
+    response = Response(200, text=create_user_history_json(size), headers={"Content-Type": "application/json"})
+    return lambda: FromResponse.to_user_history_list(response)
+
+
+@benchmark("converters.from_api.to_pss_user")
+def from_api_to_pss_user(size: int):
+    api_users = create_api_collection(size).users
+    return lambda: [FromAPI.to_pss_user(api_user) for api_user in api_users]
+
+
+@benchmark("converters.from_api.to_collection_async")
+def from_api_to_collection_async(size: int):
+    api_collection = create_api_collection(size)
+    return lambda: FromAPI.to_collection_async(api_collection)
+
+
+@benchmark("converters.to_api.from_collection")
+def to_api_from_collection(size: int):
+    collection = create_collection(size)
+    return lambda: ToAPI.from_collection(collection)
+
+
+@benchmark("converters.create_collection.serialization")
+def create_collection_serialization(size: int):
+    collection = create_collection(size)
+
+    # Mirrors the request body creation in `PssFleetDataClient.create_collection`
+    def serialize():
+        api_collection = ToAPI.from_collection(collection)
+        return json.loads(api_collection.model_dump_json())
+
+    return serialize
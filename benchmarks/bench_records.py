@@ -0,0 +1,17 @@
+from pss_fleet_data.models.records import get_fleet_users
+
+from .runner import benchmark
+from .synthetic import create_api_collection
+
+
+# Compare the bytes per user to `converters.from_api.to_pss_user`.
+@benchmark("records.get_fleet_users")
+def records_get_fleet_users(size: int):
+    api_collection = create_api_collection(size)
+    return lambda: get_fleet_users(api_collection)
+
+
+@benchmark("records.fleet_user.to_pss_user")
+def records_fleet_user_to_pss_user(size: int):
+    fleet_users = get_fleet_users(create_api_collection(size))
+    return lambda: [fleet_user.to_pss_user() for fleet_user in fleet_users]
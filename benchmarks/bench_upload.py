@@ -0,0 +1,31 @@
+import tempfile
+from pathlib import Path
+
+from pss_fleet_data.core.validation import validate_collection_file
+
+from .runner import benchmark
+from .synthetic import create_collection_json
+
+
+_TEMP_DIRECTORY = tempfile.TemporaryDirectory(prefix="pss_fleet_data_benchmarks_")
+
+
+def create_collection_file(user_count: int) -> Path:
+    """Writes a synthetic `Collection` to a temporary file, that gets deleted on exit.
+
+    Args:
+        user_count (int): The number of users to create.
+
+    Returns:
+        Path: The path to the file.
+    """
+    file_path = Path(_TEMP_DIRECTORY.name, f"collection_{user_count}.json")
+    if not file_path.exists():
+        file_path.write_text(create_collection_json(user_count), encoding="utf-8")
+    return file_path
+
+
+@benchmark("validation.validate_collection_file")
+def validate_collection_file_streamed(size: int):
+    file_path = create_collection_file(size)
+    return lambda: validate_collection_file(file_path)
@@ -0,0 +1,56 @@
+from pssapi.enums import AllianceMembership
+
+from pss_fleet_data import utils
+
+from .runner import benchmark
+from .synthetic import create_api_collection, create_collection, create_timestamps
+
+
+@benchmark("utils.convert_datetime_to_seconds")
+def convert_datetime_to_seconds(size: int):
+    dates = [user.last_login_date for user in create_collection(size).users]
+    return lambda: [utils.convert_datetime_to_seconds(date) for date in dates]
+
+
+@benchmark("utils.convert_datetimes_to_seconds")
+def convert_datetimes_to_seconds(size: int):
+    dates = [user.last_login_date for user in create_collection(size).users]
+    return lambda: utils.convert_datetimes_to_seconds(dates)
+
+
+@benchmark("utils.decode_alliance_membership")
+def decode_alliance_membership(size: int):
+    memberships = [api_user[5] for api_user in create_api_collection(size).users]
+    return lambda: [utils.decode_alliance_membership(membership) for membership in memberships]
+
+
+@benchmark("utils.decode_alliance_memberships")
+def decode_alliance_memberships(size: int):
+    memberships = [api_user[5] for api_user in create_api_collection(size).users]
+    return lambda: utils.decode_alliance_memberships(memberships)
+
+
+@benchmark("utils.encode_alliance_membership")
+def encode_alliance_membership(size: int):
+    memberships = [user.alliance_membership or AllianceMembership.NONE for user in create_collection(size).users]
+    return lambda: [utils.encode_alliance_membership(membership) for membership in memberships]
+
+
+@benchmark("utils.encode_alliance_memberships")
+def encode_alliance_memberships(size: int):
+    memberships = [user.alliance_membership or AllianceMembership.NONE for user in create_collection(size).users]
+    return lambda: utils.encode_alliance_memberships(memberships)
+
+
+@benchmark("utils.parse_datetime.distinct")
+def parse_datetime_distinct(size: int):
+    values = [timestamp.isoformat() for timestamp in create_timestamps(size)]
+    return lambda: [utils.parse_datetime(value) for value in values]
+
+
+@benchmark("utils.parse_datetime.repeated")
+def parse_datetime_repeated(size: int):
+    # The timestamps of a month of hourly `Collection`s, as in the histories of many `User`s.
+    timestamps = [timestamp.isoformat() for timestamp in create_timestamps(720)]
+    values = [timestamps[index % len(timestamps)] for index in range(size)]
+    return lambda: [utils.parse_datetime(value) for value in values]
@@ -0,0 +1,112 @@
+"""
+Measures the import time of `pss_fleet_data` with `python -X importtime` in fresh interpreters.
+Run with `python -m benchmarks.import_time --help`.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+
+
+DEFAULT_STATEMENTS = (
+    "import pss_fleet_data",
+    "from pss_fleet_data import PssFleetDataClient",
+)
+"""The import statements measured by default."""
+
+
+@dataclass
+class ImportTiming:
+    """
+    A single line of the `-X importtime` output.
+    """
+
+    module: str
+    """The name of the imported module."""
+    depth: int
+    """The nesting level of the import. Modules imported directly by the measured statement or by the interpreter startup have depth 0."""
+    self_us: int
+    """The time spent on importing the module itself. In microseconds."""
+    cumulative_us: int
+    """The time spent on importing the module and its dependencies. In microseconds."""
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """Parses the output written to stderr by `python -X importtime`.
+
+    Args:
+        output (str): The output to be parsed.
+
+    Returns:
+        list[ImportTiming]: The timings of all imported modules, in the order they finished importing.
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line.removeprefix("import time:").split("|", 2)
+        # Nested imports are indented by two spaces per level after the separator's space.
+        depth = (len(module) - len(module.lstrip()) - 1) // 2
+        timings.append(ImportTiming(module.strip(), depth, int(self_us), int(cumulative_us)))
+    return timings
+
+
+def measure_import(statement: str) -> list[ImportTiming]:
+    """Runs an import statement in a fresh interpreter with `-X importtime`.
+
+    Args:
+        statement (str): The import statement to be measured.
+
+    Returns:
+        list[ImportTiming]: The timings of all modules imported by the interpreter, including its startup.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True)
+    return parse_importtime(result.stderr)
+
+
+def get_total_us(timings: list[ImportTiming], startup_modules: set[str]) -> int:
+    """Sums up the cumulative import times of the outermost modules imported on behalf of a statement.
+
+    Args:
+        timings (list[ImportTiming]): The timings returned by `measure_import`.
+        startup_modules (set[str]): The modules imported by the interpreter startup. They're excluded.
+
+    Returns:
+        int: The total import time. In microseconds.
+    """
+    return sum(timing.cumulative_us for timing in timings if timing.depth == 0 and timing.module not in startup_modules)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.import_time", description="Measures the import time of pss_fleet_data.")
+    parser.add_argument("statements", nargs="*", default=list(DEFAULT_STATEMENTS), help="The import statements to be measured.")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="The number of fresh interpreters per statement. The median is reported.")
+    parser.add_argument("-t", "--top", type=int, default=10, help="The number of slowest modules to list per statement.")
+    parser.add_argument("--max-ms", type=float, help="Fail, if the median import time of any statement exceeds this many milliseconds.")
+    args = parser.parse_args()
+
+    startup_modules = {timing.module for timing in measure_import("pass")}
+    exceeded = False
+    for statement in args.statements:
+        runs = [measure_import(statement) for _ in range(max(args.repeat, 1))]
+        totals = [get_total_us(timings, startup_modules) for timings in runs]
+        median_ms = statistics.median(totals) / 1000
+        exceeded = exceeded or (args.max_ms is not None and median_ms > args.max_ms)
+
+        print(f"{statement}: {median_ms:,.1f} ms (median of {len(totals)}, min {min(totals) / 1000:,.1f} ms)")
+        fastest_run = runs[totals.index(min(totals))]
+        slowest = sorted((timing for timing in fastest_run if timing.module not in startup_modules), key=lambda timing: timing.self_us, reverse=True)
+        for timing in slowest[: args.top]:
+            print(f"  {timing.self_us / 1000:>8.1f} ms  {timing.module}")
+        print()
+
+    if exceeded:
+        print(f"Import time exceeded {args.max_ms} ms.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+Measures how long `PssFleetDataClient.get_collection` blocks the event loop while converting a large response, with the conversion
+running on the event loop in a single chunk or in chunks, or in an executor. Run with `python -m benchmarks.loop_lag --help`.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Optional
+
+from httpx import Response
+
+from .bench_client import create_mock_client
+from .synthetic import create_collection_json
+
+
+DEFAULT_SIZES = (10_000, 100_000)
+"""The numbers of users measured by default."""
+
+MODES: dict[str, Callable[[], Optional[Executor]]] = {
+    "blocking": lambda: None,
+    "chunked": lambda: None,
+    "thread": lambda: ThreadPoolExecutor(max_workers=1),
+    "process": lambda: ProcessPoolExecutor(max_workers=1),
+}
+"""The executors passed to the client per mode. `blocking` and `chunked` convert on the event loop, `blocking` in a single chunk."""
+
+_SINGLE_CHUNK = 2**31
+"""The conversion chunk size of the `blocking` mode. Larger than any `Collection`."""
+
+
+@dataclass
+class LoopLag:
+    """
+    The responsiveness of the event loop during a single call.
+    """
+
+    total_time: float
+    """The time in seconds the call took."""
+    max_lag: float
+    """The longest time in seconds a timer fired late."""
+    mean_lag: float
+    """The average time in seconds a timer fired late."""
+
+
+async def measure_loop_lag(call: Callable[[], Awaitable[Any]], interval: float) -> LoopLag:
+    """Awaits a call while a ticker task sleeps for `interval` seconds in a loop, recording how late it wakes up each time.
+
+    Args:
+        call (Callable[[], Awaitable[Any]]): Creates the awaitable to be measured.
+        interval (float): The time in seconds the ticker sleeps.
+
+    Returns:
+        LoopLag: The lags measured.
+    """
+    lags = []
+    done = asyncio.Event()
+
+    async def tick():
+        while not done.is_set():
+            start = perf_counter()
+            await asyncio.sleep(interval)
+            lags.append(max(perf_counter() - start - interval, 0.0))
+
+    ticker = asyncio.create_task(tick())
+    # Let the ticker start before the call.
+    await asyncio.sleep(0)
+    start = perf_counter()
+    try:
+        _ = await call()
+    finally:
+        total_time = perf_counter() - start
+        done.set()
+        await ticker
+    return LoopLag(total_time, max(lags, default=0.0), statistics.fmean(lags) if lags else 0.0)
+
+
+async def run_mode(mode: str, size: int, repeat: int, interval: float, offload_threshold: int, chunk_size: Optional[int]) -> list[LoopLag]:
+    """Measures `get_collection` in a mode `repeat` times against a mocked transport returning a synthetic `Collection`.
+
+    Args:
+        mode (str): A key of `MODES`.
+        size (int): The number of users in the `Collection`.
+        repeat (int): The number of calls measured.
+        interval (float): The time in seconds the ticker sleeps.
+        offload_threshold (int): The minimum size in bytes of a response body to be converted in the executor.
+        chunk_size (int, optional): The number of records converted on the event loop at once. Ignored in the `blocking` mode.
+
+    Returns:
+        list[LoopLag]: The lags measured per call.
+    """
+    content = create_collection_json(size).encode()
+    executor = MODES[mode]()
+    client = create_mock_client(
+        lambda _: Response(200, content=content, headers={"Content-Type": "application/json"}),
+        executor=executor,
+        offload_threshold=offload_threshold,
+        conversion_chunk_size=_SINGLE_CHUNK if mode == "blocking" else chunk_size,
+    )
+    try:
+        if executor is not None:
+            # Start the workers outside of the measurement.
+            await asyncio.get_running_loop().run_in_executor(executor, int)
+        return [await measure_loop_lag(lambda: client.get_collection(1), interval) for _ in range(repeat)]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.loop_lag", description="Measures the event loop lag caused by get_collection.")
+    parser.add_argument("-s", "--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="The numbers of users in the Collections.")
+    parser.add_argument("-m", "--modes", nargs="+", choices=list(MODES), default=list(MODES), help="The modes to be measured.")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="The number of calls per mode and size. The best run is reported.")
+    parser.add_argument("-i", "--interval", type=float, default=0.001, help="The time in seconds the ticker task sleeps.")
+    parser.add_argument("-c", "--chunk-size", type=int, help="The number of records converted on the event loop at once. Defaults to the config.")
+    parser.add_argument("-t", "--offload-threshold", type=int, default=1, help="The minimum size in bytes of a response body to be offloaded.")
+    args = parser.parse_args()
+
+    print(f"{'mode':<10}{'users':>10}{'total':>12}{'max lag':>12}{'mean lag':>12}")
+    for size in args.sizes:
+        for mode in args.modes:
+            lags = asyncio.run(run_mode(mode, size, max(args.repeat, 1), args.interval, args.offload_threshold, args.chunk_size))
+            best = min(lags, key=lambda lag: lag.max_lag)
+            print(f"{mode:<10}{size:>10,}{best.total_time * 1000:>10.1f}ms{best.max_lag * 1000:>10.1f}ms{best.mean_lag * 1000:>10.2f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+import asyncio
+import gc
+import inspect
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+"""The default numbers of users in the synthetic collections to run the benchmarks with."""
+BASELINES_FILE_PATH = Path(__file__).parent / "baselines.json"
+"""The file storing the baseline results the benchmark results get compared to."""
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """
+    A registered benchmark. The `setup` function receives the size of the synthetic data to be created and returns the callable to be measured.
+    """
+
+    name: str
+    """The unique name of the benchmark."""
+    setup: Callable[[int], Callable[[], Any]]
+    """Creates the test data and returns the callable to be measured. If the callable returns an awaitable, it will be awaited."""
+    sizes: Optional[tuple[int, ...]] = None
+    """The sizes this benchmark supports. `None`, if it supports any size."""
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    The measured performance of a benchmark for a certain size.
+    """
+
+    name: str
+    """The name of the benchmark."""
+    size: int
+    """The number of users in the synthetic data."""
+    seconds: float
+    """The best wall time of a single run. In seconds."""
+    throughput: float
+    """The number of users processed per second in the best run."""
+    peak_memory: int
+    """The peak memory traced during a single run. In bytes."""
+    allocated_blocks: int
+    """The number of memory blocks allocated during a single run and still held by its result."""
+
+    @property
+    def bytes_per_user(self) -> float:
+        """
+        The peak memory traced during a single run per user. In bytes.
+        """
+        return self.peak_memory / self.size if self.size else 0.0
+
+
+@dataclass
+class Regression:
+    """
+    A metric of a benchmark result exceeding its baseline by more than the allowed tolerance.
+    """
+
+    name: str
+    size: int
+    metric: str
+    baseline: float
+    actual: float
+
+    def __str__(self) -> str:
+        return f"{self.name} [{self.size}]: {self.metric} regressed from {self.baseline:,.4f} to {self.actual:,.4f}"
+
+
+_BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, sizes: Optional[Iterable[int]] = None) -> Callable[[Callable[[int], Callable[[], Any]]], Callable[[int], Callable[[], Any]]]:
+    """Registers a benchmark setup function.
+
+    Args:
+        name (str): The unique name of the benchmark, e.g. `converters.from_api.to_pss_user`.
+        sizes (Iterable[int], optional): The sizes this benchmark supports. Defaults to `None` (any size).
+
+    Raises:
+        ValueError: Raised, if a benchmark with the same name has already been registered.
+
+    Returns:
+        Callable: A decorator registering the decorated setup function.
+    """
+
+    def decorator(setup: Callable[[int], Callable[[], Any]]) -> Callable[[int], Callable[[], Any]]:
+        if name in _BENCHMARKS:
+            raise ValueError(f"A benchmark named '{name}' has already been registered.")
+        _BENCHMARKS[name] = Benchmark(name, setup, tuple(sizes) if sizes else None)
+        return setup
+
+    return decorator
+
+
+def get_benchmarks(name_filter: Optional[str] = None) -> list[Benchmark]:
+    """Returns the registered benchmarks, sorted by name.
+
+    Args:
+        name_filter (str, optional): Only return benchmarks containing this string in their name. Defaults to `None`.
+
+    Returns:
+        list[Benchmark]: The matching benchmarks.
+    """
+    return [benchmark for name, benchmark in sorted(_BENCHMARKS.items()) if not name_filter or name_filter in name]
+
+
+def run_benchmark(benchmark: Benchmark, size: int, repeat: int) -> BenchmarkResult:
+    """Runs a benchmark for a given size and measures wall time, peak memory and allocated memory blocks.
+
+    Args:
+        benchmark (Benchmark): The benchmark to run.
+        size (int): The size of the synthetic data to be created.
+        repeat (int): The number of timed runs. The best run is reported.
+
+    Returns:
+        BenchmarkResult: The measured performance.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        measured = benchmark.setup(size)
+
+        def func():
+            result = measured()
+            if inspect.isawaitable(result):
+                return loop.run_until_complete(result)
+            return result
+
+        func()  # warm-up
+
+        timings = []
+        for _ in range(max(repeat, 1)):
+            gc.collect()
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+
+        peak_memory, allocated_blocks = _measure_memory(func)
+    finally:
+        loop.close()
+
+    best = min(timings)
+    return BenchmarkResult(
+        name=benchmark.name,
+        size=size,
+        seconds=best,
+        throughput=size / best if best else float("inf"),
+        peak_memory=peak_memory,
+        allocated_blocks=allocated_blocks,
+    )
+
+
+def load_baselines(file_path: Path = BASELINES_FILE_PATH) -> dict[str, dict[str, dict[str, float]]]:
+    """Loads the stored baselines.
+
+    Args:
+        file_path (Path, optional): The baselines file. Defaults to `BASELINES_FILE_PATH`.
+
+    Returns:
+        dict[str, dict[str, dict[str, float]]]: The baseline metrics by benchmark name and size. Empty, if there is no baselines file.
+    """
+    if not file_path.exists():
+        return {}
+    return json.loads(file_path.read_text(encoding="utf-8"))
+
+
+def save_baselines(results: Iterable[BenchmarkResult], file_path: Path = BASELINES_FILE_PATH):
+    """Stores the given results as new baselines, keeping existing baselines of benchmarks and sizes not included in `results`.
+
+    Args:
+        results (Iterable[BenchmarkResult]): The results to be stored.
+        file_path (Path, optional): The baselines file. Defaults to `BASELINES_FILE_PATH`.
+    """
+    baselines = load_baselines(file_path)
+    for result in results:
+        baselines.setdefault(result.name, {})[str(result.size)] = {
+            "seconds": result.seconds,
+            "peak_memory": result.peak_memory,
+            "allocated_blocks": result.allocated_blocks,
+        }
+    file_path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def find_regressions(
+    results: Iterable[BenchmarkResult],
+    baselines: dict[str, dict[str, dict[str, float]]],
+    time_tolerance: float,
+    memory_tolerance: float,
+) -> list[Regression]:
+    """Compares results to their baselines.
+
+    Args:
+        results (Iterable[BenchmarkResult]): The results to be checked.
+        baselines (dict[str, dict[str, dict[str, float]]]): The baselines as returned by `load_baselines`.
+        time_tolerance (float): The relative amount by which the wall time may exceed the baseline, e.g. `0.25` for 25 %.
+        memory_tolerance (float): The relative amount by which the peak memory and allocated blocks may exceed the baseline.
+
+    Returns:
+        list[Regression]: The metrics exceeding their baselines. Results without a baseline are skipped.
+    """
+    regressions = []
+    for result in results:
+        baseline = baselines.get(result.name, {}).get(str(result.size))
+        if not baseline:
+            continue
+
+        for metric, tolerance in (("seconds", time_tolerance), ("peak_memory", memory_tolerance), ("allocated_blocks", memory_tolerance)):
+            expected = baseline.get(metric)
+            actual = getattr(result, metric)
+            if expected is not None and actual > expected * (1 + tolerance):
+                regressions.append(Regression(result.name, result.size, metric, expected, actual))
+    return regressions
+
+
+def format_results(results: Iterable[BenchmarkResult]) -> str:
+    """Formats results as a table.
+
+    Args:
+        results (Iterable[BenchmarkResult]): The results to be formatted.
+
+    Returns:
+        str: A human-readable table.
+    """
+    lines = [f"{'benchmark':<55} {'size':>8} {'seconds':>10} {'users/s':>14} {'peak MiB':>10} {'bytes/user':>11} {'blocks':>10}"]
+    for result in results:
+        lines.append(
+            f"{result.name:<55} {result.size:>8} {result.seconds:>10.4f} {result.throughput:>14,.0f} "
+            f"{result.peak_memory / 1024 / 1024:>10.2f} {result.bytes_per_user:>11,.0f} {result.allocated_blocks:>10}"
+        )
+    return "\n".join(lines)
+
+
+def results_to_json(results: Iterable[BenchmarkResult]) -> str:
+    return json.dumps([asdict(result) for result in results], indent=2)
+
+
+def _measure_memory(func: Callable[[], Any]) -> tuple[int, int]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    allocated_blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    del result
+    return peak, max(allocated_blocks, 0)
@@ -0,0 +1,193 @@
+import random
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+from httpx import Response
+from pydantic import TypeAdapter
+
+from pss_fleet_data.models import Collection
+from pss_fleet_data.models.api_models import ApiAlliance, ApiCollection, ApiCollectionMetadata, ApiUser, ApiUserHistory
+from pss_fleet_data.models.converters import FromAPI
+
+
+USERS_PER_ALLIANCE = 50
+"""The average number of users per alliance in the synthetic collections."""
+NON_MEMBER_RATIO = 0.1
+"""The share of users in the synthetic collections without an alliance."""
+SEED = 20160106
+
+
+def create_api_alliances(count: int, seed: int = SEED) -> list[ApiAlliance]:
+    """Creates deterministic synthetic alliances in the format returned by the API.
+
+    Args:
+        count (int): The number of alliances to create.
+        seed (int, optional): The seed of the random number generator. Defaults to `SEED`.
+
+    Returns:
+        list[ApiAlliance]: The synthetic alliances.
+    """
+    rng = random.Random(seed)
+    return [
+        (
+            alliance_id,
+            f"Alliance {alliance_id}",
+            rng.randint(0, 500_000),
+            rng.choice((0, 1, 2, 3, 4)),
+            rng.randint(0, 200_000),
+            rng.randint(0, 10_000),
+            rng.randint(1, 100),
+            rng.randint(0, 100),
+        )
+        for alliance_id in range(1, count + 1)
+    ]
+
+
+def create_api_users(count: int, alliance_count: int, seed: int = SEED) -> list[ApiUser]:
+    """Creates deterministic synthetic users in the format returned by the API.
+    About every tenth user is not member of an alliance.
+
+    Args:
+        count (int): The number of users to create.
+        alliance_count (int): The number of alliances the users may be members of.
+        seed (int, optional): The seed of the random number generator. Defaults to `SEED`.
+
+    Returns:
+        list[ApiUser]: The synthetic users.
+    """
+    rng = random.Random(seed)
+    users = []
+    for user_id in range(1, count + 1):
+        alliance_id = rng.randint(1, alliance_count) if rng.random() >= NON_MEMBER_RATIO else 0
+        last_login_date = rng.randint(200_000_000, 270_000_000)
+        users.append(
+            (
+                user_id,
+                f"User {user_id}",
+                alliance_id,
+                rng.randint(0, 8_000),
+                rng.randint(0, 5_000),
+                rng.randint(0, 6) if alliance_id else -1,
+                last_login_date - rng.randint(0, 100_000_000),
+                last_login_date,
+                last_login_date + rng.randint(0, 3_600),
+                rng.randint(0, 10_000),
+                rng.randint(0, 10_000),
+                rng.randint(0, 20_000),
+                rng.randint(0, 20_000),
+                rng.randint(0, 1_000),
+                rng.randint(0, 20_000),
+                rng.randint(0, 20_000),
+                rng.randint(0, 1_000),
+                rng.randint(0, 5_000),
+                rng.randint(0, 8_000),
+                rng.randint(0, 100),
+            )
+        )
+    return users
+
+
+def create_api_collection_metadata(user_count: int, alliance_count: int) -> ApiCollectionMetadata:
+    return ApiCollectionMetadata(
+        collection_id=1,
+        timestamp=datetime(2024, 4, 30, 23, 59, tzinfo=timezone.utc),
+        duration=timedelta(minutes=12).total_seconds(),
+        fleet_count=alliance_count,
+        user_count=user_count,
+        tourney_running=True,
+        data_version=9,
+        schema_version=9,
+        max_tournament_battle_attempts=6,
+    )
+
+
+@lru_cache(maxsize=None)
+def create_api_collection(user_count: int) -> ApiCollection:
+    """Creates a validated synthetic `ApiCollection` with `user_count` users. Results are cached per size.
+
+    Args:
+        user_count (int): The number of users to create.
+
+    Returns:
+        ApiCollection: The synthetic collection.
+    """
+    alliance_count = max(user_count // USERS_PER_ALLIANCE, 1)
+    return ApiCollection(
+        meta=create_api_collection_metadata(user_count, alliance_count),
+        fleets=create_api_alliances(alliance_count),
+        users=create_api_users(user_count, alliance_count),
+    )
+
+
+@lru_cache(maxsize=None)
+def create_collection_json(user_count: int) -> str:
+    """Creates the JSON document the API returns for a synthetic `Collection`. Results are cached per size.
+
+    Args:
+        user_count (int): The number of users to create.
+
+    Returns:
+        str: The serialized collection.
+    """
+    return create_api_collection(user_count).model_dump_json()
+
+
+def create_collection_response(user_count: int) -> Response:
+    """Creates an `httpx.Response` containing a synthetic `Collection`.
+
+    Args:
+        user_count (int): The number of users to create.
+
+    Returns:
+        Response: A response with status code 200.
+    """
+    return Response(200, text=create_collection_json(user_count), headers={"Content-Type": "application/json"})
+
+
+def create_timestamps(count: int) -> list[datetime]:
+    """Creates hourly timestamps, like those of the `Collection`s recorded by the API, starting at the beginning of 2024.
+
+    Args:
+        count (int): The number of timestamps to create.
+
+    Returns:
+        list[datetime]: The timestamps localized to UTC.
+    """
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [start + timedelta(hours=hour) for hour in range(count)]
+
+
+@lru_cache(maxsize=None)
+def create_user_history_json(entry_count: int) -> str:
+    """Creates the JSON document the API returns for the history of a synthetic `User` with one entry per hour. Results are cached per size.
+
+    Args:
+        entry_count (int): The number of entries in the history.
+
+    Returns:
+        str: The serialized history.
+    """
+    alliance = create_api_alliances(1)[0]
+    user = create_api_users(1, 1)[0]
+    histories = [
+        ApiUserHistory(
+            collection=create_api_collection_metadata(1, 1).model_copy(update={"collection_id": index + 1, "timestamp": timestamp}),
+            user=user,
+            fleet=alliance,
+        )
+        for index, timestamp in enumerate(create_timestamps(entry_count))
+    ]
+    return TypeAdapter(list[ApiUserHistory]).dump_json(histories).decode()
+
+
+@lru_cache(maxsize=None)
+def create_collection(user_count: int) -> Collection:
+    """Creates a synthetic client-side `Collection`. Results are cached per size.
+
+    Args:
+        user_count (int): The number of users to create.
+
+    Returns:
+        Collection: The synthetic collection.
+    """
+    return FromAPI.to_collection(create_api_collection(user_count))
@@ -1,32 +1,106 @@
-from pssapi.entities import Alliance as PssAlliance
-from pssapi.entities import User as PssUser
+from typing import TYPE_CHECKING
 
-from . import core, models, utils
-from .client import PssFleetDataClient
-from .core import exceptions
-from .core.exceptions import ApiError
-from .models import Collection, CollectionMetadata, enums
-from .models.enums import ErrorCode, ParameterInterval
+from .core.lazy import create_lazy_module_attributes
+
+
+if TYPE_CHECKING:
+    from pssapi.entities import Alliance as PssAlliance
+    from pssapi.entities import User as PssUser
+
+    from . import analytics, core, models, utils
+    from .client import PssFleetDataClient
+    from .core import exceptions
+    from .core.bulk import CollectionResult
+    from .core.cache import CollectionCache
+    from .core.circuit_breaker import CircuitBreaker
+    from .core.exceptions import ApiError
+    from .core.instrumentation import InstrumentationHook, RequestMetrics
+    from .core.ledger import UploadLedger
+    from .core.metrics import HistogramCollector, PrometheusExporter
+    from .core.rate_limit import RateLimiter
+    from .core.resolver import CollectionResolver
+    from .core.sync import SyncCheckpoint, SyncResult
+    from .core.upload import UploadResult
+    from .models import Collection, CollectionMetadata, enums
+    from .models.enums import ErrorCode, ParameterInterval
+    from .models.records import FleetAlliance, FleetUser
+
+
+# Importing the client, the models and pssapi is expensive, so they only get imported on first access.
+__getattr__, __dir__ = create_lazy_module_attributes(
+    __name__,
+    {
+        # Modules
+        "analytics": ".analytics",
+        "core": ".core",
+        "enums": ".models.enums",
+        "exceptions": ".core.exceptions",
+        "models": ".models",
+        "utils": ".utils",
+        # Classes
+        "CircuitBreaker": ".core.circuit_breaker:CircuitBreaker",
+        "Collection": ".models.client_models:Collection",
+        "CollectionCache": ".core.cache:CollectionCache",
+        "CollectionMetadata": ".models.client_models:CollectionMetadata",
+        "CollectionResolver": ".core.resolver:CollectionResolver",
+        "CollectionResult": ".core.bulk:CollectionResult",
+        "FleetAlliance": ".models.records:FleetAlliance",
+        "FleetUser": ".models.records:FleetUser",
+        "HistogramCollector": ".core.metrics:HistogramCollector",
+        "InstrumentationHook": ".core.instrumentation:InstrumentationHook",
+        "PrometheusExporter": ".core.metrics:PrometheusExporter",
+        "PssAlliance": "pssapi.entities:Alliance",
+        "PssFleetDataClient": ".client:PssFleetDataClient",
+        "PssUser": "pssapi.entities:User",
+        "RateLimiter": ".core.rate_limit:RateLimiter",
+        "RequestMetrics": ".core.instrumentation:RequestMetrics",
+        "SyncCheckpoint": ".core.sync:SyncCheckpoint",
+        "SyncResult": ".core.sync:SyncResult",
+        "UploadLedger": ".core.ledger:UploadLedger",
+        "UploadResult": ".core.upload:UploadResult",
+        # exceptions
+        "ApiError": ".core.exceptions:ApiError",
+        # enums
+        "ErrorCode": ".models.enums:ErrorCode",
+        "ParameterInterval": ".models.enums:ParameterInterval",
+    },
+)
 
 
 __all__ = [
     # Modules
-    core.__name__,
-    enums.__name__,
-    exceptions.__name__,
-    models.__name__,
-    utils.__name__,
+    "analytics",
+    "core",
+    "enums",
+    "exceptions",
+    "models",
+    "utils",
     # Classes
-    Collection.__name__,
-    CollectionMetadata.__name__,
-    PssAlliance.__name__,
-    PssFleetDataClient.__name__,
-    PssUser.__name__,
+    "CircuitBreaker",
+    "Collection",
+    "CollectionCache",
+    "CollectionMetadata",
+    "CollectionResolver",
+    "CollectionResult",
+    "FleetAlliance",
+    "FleetUser",
+    "HistogramCollector",
+    "InstrumentationHook",
+    "PrometheusExporter",
+    "PssAlliance",
+    "PssFleetDataClient",
+    "PssUser",
+    "RateLimiter",
+    "RequestMetrics",
+    "SyncCheckpoint",
+    "SyncResult",
+    "UploadLedger",
+    "UploadResult",
     # exceptions
-    ApiError.__name__,
+    "ApiError",
     # enums
-    ErrorCode.__name__,
-    ParameterInterval.__name__,
+    "ErrorCode",
+    "ParameterInterval",
 ]
 
 
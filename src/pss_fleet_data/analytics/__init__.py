@@ -0,0 +1,66 @@
+from typing import TYPE_CHECKING
+
+from ..core.lazy import create_lazy_module_attributes
+
+
+if TYPE_CHECKING:
+    from . import arrow, binary, columns, diff, leaderboard, timeseries
+    from .arrow import write_alliance_parquet, write_user_parquet
+    from .binary import MappedCollection, write_mapped_collection
+    from .diff import CollectionDiff, diff_collections
+    from .leaderboard import LeaderboardGrouping, get_top_alliances, get_top_users
+    from .table import Table
+    from .timeseries import TimeSeries, build_time_series
+
+
+__getattr__, __dir__ = create_lazy_module_attributes(
+    __name__,
+    {
+        # modules
+        "arrow": ".arrow",
+        "binary": ".binary",
+        "columns": ".columns",
+        "diff": ".diff",
+        "leaderboard": ".leaderboard",
+        "timeseries": ".timeseries",
+        # classes
+        "CollectionDiff": ".diff:CollectionDiff",
+        "LeaderboardGrouping": ".leaderboard:LeaderboardGrouping",
+        "MappedCollection": ".binary:MappedCollection",
+        "Table": ".table:Table",
+        "TimeSeries": ".timeseries:TimeSeries",
+        # functions
+        "build_time_series": ".timeseries:build_time_series",
+        "diff_collections": ".diff:diff_collections",
+        "get_top_alliances": ".leaderboard:get_top_alliances",
+        "get_top_users": ".leaderboard:get_top_users",
+        "write_alliance_parquet": ".arrow:write_alliance_parquet",
+        "write_mapped_collection": ".binary:write_mapped_collection",
+        "write_user_parquet": ".arrow:write_user_parquet",
+    },
+)
+
+
+__all__ = [
+    # modules
+    "arrow",
+    "binary",
+    "columns",
+    "diff",
+    "leaderboard",
+    "timeseries",
+    # classes
+    "CollectionDiff",
+    "LeaderboardGrouping",
+    "MappedCollection",
+    "Table",
+    "TimeSeries",
+    # functions
+    "build_time_series",
+    "diff_collections",
+    "get_top_alliances",
+    "get_top_users",
+    "write_alliance_parquet",
+    "write_mapped_collection",
+    "write_user_parquet",
+]
@@ -0,0 +1,270 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Union
+
+from .. import utils
+from ..core.lazy import import_optional_dependency
+from ..models.api_models import ApiAllianceHistory, ApiCollectionMetadata, ApiUserHistory
+from ..models.client_models import AllianceHistory, CollectionMetadata, UserHistory
+from ..models.converters import ToAPI
+from .columns import ALLIANCE_FIELDS, USER_FIELDS, CollectionSource, get_alliance_columns, get_collection_id, get_timestamp, get_user_columns
+from .table import Table
+
+
+if TYPE_CHECKING:
+    import pyarrow
+
+
+_COLLECTION_FIELDS = ("collection_id", "timestamp")
+
+_REQUIRED_USER_FIELDS = ("user_id", "user_name", "alliance_id", "trophy", "alliance_score", "alliance_membership")
+_REQUIRED_ALLIANCE_FIELDS = ("alliance_id", "alliance_name", "score", "division_design_id")
+
+
+def get_alliance_schema(include_collection: bool = False) -> "pyarrow.Schema":
+    """Creates the Arrow schema of `Alliance` records. It mirrors an `ApiAlliance`: optional fields are nullable. Requires the optional dependency `pyarrow`.
+
+    Args:
+        include_collection (bool, optional): Prepend the columns `collection_id` and `timestamp`. Defaults to `False`.
+
+    Raises:
+        ImportError: Raised, if `pyarrow` is not installed.
+
+    Returns:
+        pyarrow.Schema: The schema with the columns in `ALLIANCE_FIELDS`.
+    """
+    pyarrow = import_optional_dependency("pyarrow", "arrow")
+    fields = [
+        pyarrow.field(field, pyarrow.string() if field == "alliance_name" else pyarrow.int64(), nullable=field not in _REQUIRED_ALLIANCE_FIELDS)
+        for field in ALLIANCE_FIELDS
+    ]
+    return pyarrow.schema(_get_collection_fields(pyarrow) + fields if include_collection else fields)
+
+
+def get_alliance_history_record_batch(histories: Iterable[Union[AllianceHistory, ApiAllianceHistory]]) -> "pyarrow.RecordBatch":
+    """Converts the points in the history of `Alliance`s into an Arrow record batch with one row per point. Requires the optional dependency `pyarrow`.
+
+    Args:
+        histories (Iterable[AllianceHistory | ApiAllianceHistory]): The points in the history, e.g. returned by `PssFleetDataClient.get_alliance_history`.
+
+    Raises:
+        ImportError: Raised, if `pyarrow` is not installed.
+
+    Returns:
+        pyarrow.RecordBatch: The record batch with the schema `get_alliance_schema(include_collection=True)`.
+    """
+    metadatas = []
+    rows = []
+    for history in histories:
+        metadatas.append(history.collection)
+        rows.append(history.fleet if isinstance(history, ApiAllianceHistory) else ToAPI.from_pss_alliance(history.alliance))
+    return _create_history_record_batch(get_alliance_schema(include_collection=True), metadatas, rows)
+
+
+def get_alliance_record_batch(source: CollectionSource, include_collection: bool = False) -> "pyarrow.RecordBatch":
+    """Converts the `Alliance`s of a collection into an Arrow record batch. The values of an `ApiCollection` get taken from the raw tuples
+    without creating `pssapi` objects. Requires the optional dependency `pyarrow`.
+
+    Args:
+        source (CollectionSource): The collection.
+        include_collection (bool, optional): Prepend the columns `collection_id` and `timestamp`. Defaults to `False`.
+
+    Raises:
+        ImportError: Raised, if `pyarrow` is not installed.
+
+    Returns:
+        pyarrow.RecordBatch: The record batch with the schema `get_alliance_schema(include_collection)`.
+    """
+    schema = get_alliance_schema(include_collection)
+    return _create_record_batch(schema, source, get_alliance_columns(source), include_collection)
+
+
+def get_user_history_record_batch(histories: Iterable[Union[UserHistory, ApiUserHistory]]) -> "pyarrow.RecordBatch":
+    """Converts the points in the history of `User`s into an Arrow record batch with one row per point. Requires the optional dependency `pyarrow`.
+
+    Args:
+        histories (Iterable[UserHistory | ApiUserHistory]): The points in the history, e.g. returned by `PssFleetDataClient.get_user_history`.
+
+    Raises:
+        ImportError: Raised, if `pyarrow` is not installed.
+
+    Returns:
+        pyarrow.RecordBatch: The record batch with the schema `get_user_schema(include_collection=True)`.
+    """
+    metadatas = []
+    rows = []
+    for history in histories:
+        metadatas.append(history.collection)
+        rows.append(history.user if isinstance(history, ApiUserHistory) else ToAPI.from_pss_user(history.user))
+    return _create_history_record_batch(get_user_schema(include_collection=True), metadatas, rows)
+
+
+def get_user_record_batch(source: CollectionSource, include_collection: bool = False) -> "pyarrow.RecordBatch":
+    """Converts the `User`s of a collection into an Arrow record batch. Values are encoded like in an `ApiUser`: the alliance membership
+    as an `int`, dates as seconds since the PSS start date. The values of an `ApiCollection` get taken from the raw tuples without creating
+    `pssapi` objects. Requires the optional dependency `pyarrow`.
+
+    Args:
+        source (CollectionSource): The collection.
+        include_collection (bool, optional): Prepend the columns `collection_id` and `timestamp`. Defaults to `False`.
+
+    Raises:
+        ImportError: Raised, if `pyarrow` is not installed.
+
+    Returns:
+        pyarrow.RecordBatch: The record batch with the schema `get_user_schema(include_collection)`.
+    """
+    schema = get_user_schema(include_collection)
+    return _create_record_batch(schema, source, get_user_columns(source), include_collection)
+
+
+def get_user_schema(include_collection: bool = False) -> "pyarrow.Schema":
+    """Creates the Arrow schema of `User` records. It mirrors an `ApiUser`: optional fields are nullable. Requires the optional dependency `pyarrow`.
+
+    Args:
+        include_collection (bool, optional): Prepend the columns `collection_id` and `timestamp`. Defaults to `False`.
+
+    Raises:
+        ImportError: Raised, if `pyarrow` is not installed.
+
+    Returns:
+        pyarrow.Schema: The schema with the columns in `USER_FIELDS`.
+    """
+    pyarrow = import_optional_dependency("pyarrow", "arrow")
+    fields = [pyarrow.field(field, _get_user_field_type(pyarrow, field), nullable=field not in _REQUIRED_USER_FIELDS) for field in USER_FIELDS]
+    return pyarrow.schema(_get_collection_fields(pyarrow) + fields if include_collection else fields)
+
+
+def iter_alliance_record_batches(sources: Iterable[CollectionSource]) -> Iterator["pyarrow.RecordBatch"]:
+    """Converts the `Alliance`s of many collections into one Arrow record batch per collection, including the columns `collection_id` and `timestamp`.
+    The collections get converted one at a time, so that a generator of collections doesn't have to be held in memory at once.
+
+    Args:
+        sources (Iterable[CollectionSource]): The collections.
+
+    Raises:
+        ImportError: Raised, if `pyarrow` is not installed.
+
+    Yields:
+        pyarrow.RecordBatch: The record batch of a collection.
+    """
+    for source in sources:
+        yield get_alliance_record_batch(source, include_collection=True)
+
+
+def iter_user_record_batches(sources: Iterable[CollectionSource]) -> Iterator["pyarrow.RecordBatch"]:
+    """Converts the `User`s of many collections into one Arrow record batch per collection, including the columns `collection_id` and `timestamp`.
+    The collections get converted one at a time, so that a generator of collections doesn't have to be held in memory at once.
+
+    Args:
+        sources (Iterable[CollectionSource]): The collections.
+
+    Raises:
+        ImportError: Raised, if `pyarrow` is not installed.
+
+    Yields:
+        pyarrow.RecordBatch: The record batch of a collection.
+    """
+    for source in sources:
+        yield get_user_record_batch(source, include_collection=True)
+
+
+def write_alliance_parquet(sources: Iterable[CollectionSource], file_path: Union[str, Path]) -> int:
+    """Writes the `Alliance`s of many collections to a Parquet file, one row group per collection. See `iter_alliance_record_batches`.
+    Requires the optional dependency `pyarrow`.
+
+    Args:
+        sources (Iterable[CollectionSource]): The collections.
+        file_path (str | Path): The path to the Parquet file. An existing file gets overwritten.
+
+    Raises:
+        ImportError: Raised, if `pyarrow` is not installed.
+        OSError: Raised, if the file can't be written.
+
+    Returns:
+        int: The number of rows written.
+    """
+    return _write_parquet(iter_alliance_record_batches(sources), get_alliance_schema(include_collection=True), file_path)
+
+
+def write_user_parquet(sources: Iterable[CollectionSource], file_path: Union[str, Path]) -> int:
+    """Writes the `User`s of many collections to a Parquet file, one row group per collection. See `iter_user_record_batches`.
+    Requires the optional dependency `pyarrow`.
+
+    Args:
+        sources (Iterable[CollectionSource]): The collections.
+        file_path (str | Path): The path to the Parquet file. An existing file gets overwritten.
+
+    Raises:
+        ImportError: Raised, if `pyarrow` is not installed.
+        OSError: Raised, if the file can't be written.
+
+    Returns:
+        int: The number of rows written.
+    """
+    return _write_parquet(iter_user_record_batches(sources), get_user_schema(include_collection=True), file_path)
+
+
+def _create_history_record_batch(
+    schema: "pyarrow.Schema", metadatas: list[Union[ApiCollectionMetadata, CollectionMetadata]], rows: list[tuple]
+) -> "pyarrow.RecordBatch":
+    pyarrow = import_optional_dependency("pyarrow", "arrow")
+    collection_field_count = len(_COLLECTION_FIELDS)
+    record_fields = schema.names[collection_field_count:]
+    # Transpose the rows into columns in one pass.
+    columns = list(zip(*rows, strict=True)) if rows else [()] * len(record_fields)
+    arrays = [
+        pyarrow.array([metadata.collection_id for metadata in metadatas], type=schema.field("collection_id").type),
+        pyarrow.array([utils.localize_to_utc(metadata.timestamp) for metadata in metadatas], type=schema.field("timestamp").type),
+    ]
+    arrays.extend(pyarrow.array(column, type=schema.field(field).type) for field, column in zip(record_fields, columns, strict=True))
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _create_record_batch(schema: "pyarrow.Schema", source: CollectionSource, columns: Table, include_collection: bool) -> "pyarrow.RecordBatch":
+    pyarrow = import_optional_dependency("pyarrow", "arrow")
+    arrays = []
+    if include_collection:
+        row_count = len(columns)
+        arrays.append(pyarrow.array([get_collection_id(source)] * row_count, type=schema.field("collection_id").type))
+        arrays.append(pyarrow.array([utils.localize_to_utc(get_timestamp(source))] * row_count, type=schema.field("timestamp").type))
+    arrays.extend(pyarrow.array(columns[name], type=schema.field(name).type) for name in columns.column_names)
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _get_collection_fields(pyarrow: Any) -> list["pyarrow.Field"]:
+    return [
+        pyarrow.field("collection_id", pyarrow.int64(), nullable=True),
+        pyarrow.field("timestamp", pyarrow.timestamp("s", tz="UTC"), nullable=False),
+    ]
+
+
+def _get_user_field_type(pyarrow: Any, field: str) -> "pyarrow.DataType":
+    if field == "user_name":
+        return pyarrow.string()
+    if field == "alliance_membership":
+        return pyarrow.int8()
+    return pyarrow.int64()
+
+
+def _write_parquet(record_batches: Iterator["pyarrow.RecordBatch"], schema: "pyarrow.Schema", file_path: Union[str, Path]) -> int:
+    parquet = import_optional_dependency("pyarrow.parquet", "arrow")
+    row_count = 0
+    with parquet.ParquetWriter(str(file_path), schema) as writer:
+        for record_batch in record_batches:
+            writer.write_batch(record_batch)
+            row_count += record_batch.num_rows
+    return row_count
+
+
+__all__ = [
+    get_alliance_history_record_batch.__name__,
+    get_alliance_record_batch.__name__,
+    get_alliance_schema.__name__,
+    get_user_history_record_batch.__name__,
+    get_user_record_batch.__name__,
+    get_user_schema.__name__,
+    iter_alliance_record_batches.__name__,
+    iter_user_record_batches.__name__,
+    write_alliance_parquet.__name__,
+    write_user_parquet.__name__,
+]
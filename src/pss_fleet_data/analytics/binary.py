@@ -0,0 +1,310 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+from .. import utils
+from ..models.api_models import ApiCollection, ApiCollectionMetadata
+from ..models.client_models import CollectionMetadata
+from ..models.converters import FromAPI, ToAPI
+from .columns import ALLIANCE_FIELDS, USER_FIELDS, CollectionSource, check_alliance_fields, check_user_fields, get_alliance_columns, get_user_columns
+from .table import Table
+
+
+FORMAT_VERSION = 1
+"""The version of the binary layout written by `write_mapped_collection`."""
+
+_MAGIC = b"PSSFDBIN"
+_PREFIX = struct.Struct("<8sII")
+"""The magic bytes, the format version and the length of the JSON header."""
+_ALIGNMENT = 8
+
+_NULL_VALUES = {"i": -(2**31), "q": -(2**63)}
+"""The values standing in for `None` in numeric columns: the lowest value of the column's type."""
+_STRING_FIELDS = ("alliance_name", "user_name")
+_FIELDS = {"fleets": ALLIANCE_FIELDS, "users": USER_FIELDS}
+_FIELD_CHECKS = {"fleets": check_alliance_fields, "users": check_user_fields}
+
+
+class MappedCollection:
+    """
+    A collection stored in the binary layout written by `write_mapped_collection`, read through a memory map. Numeric columns can be accessed
+    as zero-copy `memoryview`s, so opening a file is cheap regardless of its size and the pages of a file get shared between processes.
+    """
+
+    def __init__(self, file_path: Union[str, Path]):
+        """Opens a file written by `write_mapped_collection`.
+
+        Args:
+            file_path (str | Path): The path to the file.
+
+        Raises:
+            OSError: Raised, if the file can't be read.
+            ValueError: Raised, if the file is not in the binary layout of a collection or has been written on a machine with a different byte order.
+        """
+        self.__file_path: Path = Path(file_path)
+        with open(self.__file_path, "rb") as fp:
+            self.__mmap: mmap.mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self.__header: dict[str, Any] = _read_header(self.__mmap, self.__file_path)
+        except ValueError:
+            self.__mmap.close()
+            raise
+
+        self.__buffer: memoryview = memoryview(self.__mmap)
+        self.__metadata: CollectionMetadata = FromAPI.to_collection_metadata(ApiCollectionMetadata.model_validate(self.__header["meta"]))
+
+    @property
+    def alliance_count(self) -> int:
+        """
+        The number of `Alliance`s in the collection.
+        """
+        return self.__header["alliance_count"]
+
+    @property
+    def file_path(self) -> Path:
+        """
+        The path to the file.
+        """
+        return self.__file_path
+
+    @property
+    def metadata(self) -> CollectionMetadata:
+        """
+        The metadata of the collection.
+        """
+        return self.__metadata
+
+    @property
+    def user_count(self) -> int:
+        """
+        The number of `User`s in the collection.
+        """
+        return self.__header["user_count"]
+
+    def __enter__(self) -> "MappedCollection":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        """Closes the memory map. All views returned by `get_alliance_view` and `get_user_view` have to be released before.
+
+        Raises:
+            BufferError: Raised, if a view is still in use.
+        """
+        self.__buffer.release()
+        self.__mmap.close()
+
+    def get_alliance_columns(self, fields: Optional[Iterable[str]] = None) -> Table:
+        """Copies `Alliance` columns out of the file. See `pss_fleet_data.analytics.columns.get_alliance_columns`.
+
+        Args:
+            fields (Iterable[str], optional): The names of the columns. See `ALLIANCE_FIELDS`. Defaults to `None` (all columns).
+
+        Raises:
+            ValueError: Raised, if an unknown field has been requested.
+
+        Returns:
+            Table: A table with one row per `Alliance`.
+        """
+        return self._get_columns("fleets", fields)
+
+    def get_alliance_view(self, field: str) -> memoryview:
+        """Creates a zero-copy view of a numeric `Alliance` column. `None` values are stored as the lowest value of the view's type.
+        To use it with NumPy, call `numpy.frombuffer(view, dtype=view.format)`.
+
+        Args:
+            field (str): The name of the column. See `ALLIANCE_FIELDS`.
+
+        Raises:
+            ValueError: Raised, if the field is unknown or not numeric.
+
+        Returns:
+            memoryview: A read-only view of format `i` (int32) or `q` (int64).
+        """
+        return self._get_view("fleets", field)
+
+    def get_user_columns(self, fields: Optional[Iterable[str]] = None) -> Table:
+        """Copies `User` columns out of the file. See `pss_fleet_data.analytics.columns.get_user_columns`.
+
+        Args:
+            fields (Iterable[str], optional): The names of the columns. See `USER_FIELDS`. Defaults to `None` (all columns).
+
+        Raises:
+            ValueError: Raised, if an unknown field has been requested.
+
+        Returns:
+            Table: A table with one row per `User`.
+        """
+        return self._get_columns("users", fields)
+
+    def get_user_view(self, field: str) -> memoryview:
+        """Creates a zero-copy view of a numeric `User` column. `None` values are stored as the lowest value of the view's type.
+        To use it with NumPy, call `numpy.frombuffer(view, dtype=view.format)`.
+
+        Args:
+            field (str): The name of the column. See `USER_FIELDS`.
+
+        Raises:
+            ValueError: Raised, if the field is unknown or not numeric.
+
+        Returns:
+            memoryview: A read-only view of format `i` (int32) or `q` (int64).
+        """
+        return self._get_view("users", field)
+
+    def to_api_collection(self) -> ApiCollection:
+        """Copies the whole collection out of the file, e.g. to use it with the other analytics functions.
+
+        Returns:
+            ApiCollection: The collection in the format returned by the API.
+        """
+        users = self.get_user_columns()
+        alliances = self.get_alliance_columns()
+        # The data has been validated before it got written.
+        return ApiCollection.model_construct(
+            meta=ApiCollectionMetadata.model_validate(self.__header["meta"]),
+            fleets=list(zip(*(alliances[field] for field in ALLIANCE_FIELDS), strict=True)),
+            users=list(zip(*(users[field] for field in USER_FIELDS), strict=True)),
+        )
+
+    def _get_columns(self, prefix: str, fields: Optional[Iterable[str]]) -> Table:
+        fields = _FIELDS[prefix] if fields is None else _FIELD_CHECKS[prefix](fields)
+        columns = {}
+        for field in fields:
+            if field in _STRING_FIELDS:
+                columns[field] = self._read_strings(prefix, field)
+                continue
+
+            with self._get_view(prefix, field) as view:
+                values = view.tolist()
+                null_value = _NULL_VALUES[view.format]
+            columns[field] = [None if value == null_value else value for value in values] if null_value in values else values
+        return Table(columns)
+
+    def _get_section(self, name: str, type_code: str) -> memoryview:
+        section = self.__header["columns"][name]
+        start = self.__header["data_offset"] + section["offset"]
+        end = start + section["size"]
+        return self.__buffer[start:end].cast(type_code)
+
+    def _get_view(self, prefix: str, field: str) -> memoryview:
+        _ = _FIELD_CHECKS[prefix]((field,))
+        if field in _STRING_FIELDS:
+            raise ValueError(f"The field is not numeric: {field}")
+        return self._get_section(f"{prefix}.{field}", self.__header["columns"][f"{prefix}.{field}"]["type_code"])
+
+    def _read_strings(self, prefix: str, field: str) -> list[str]:
+        with self._get_section(f"{prefix}.{field}.offsets", "q") as offsets_view, self._get_section(f"{prefix}.{field}.data", "B") as data_view:
+            offsets = offsets_view.tolist()
+            data = data_view.tobytes()
+        return [data[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:], strict=False)]
+
+
+def write_mapped_collection(source: CollectionSource, file_path: Union[str, Path]) -> int:
+    """Writes a collection in a compact binary layout to be read with `MappedCollection`: a JSON header holding the metadata, followed by
+    one fixed-width array per numeric field and an offsets array plus a UTF-8 blob per name field. Every array starts at a multiple of 8 bytes.
+    Numeric columns are stored as int32, if all values fit, else as int64. The file is only readable on machines with the same byte order.
+
+    Args:
+        source (CollectionSource): The collection.
+        file_path (str | Path): The path to the file. An existing file gets overwritten.
+
+    Raises:
+        OSError: Raised, if the file can't be written.
+
+    Returns:
+        int: The size of the file in bytes.
+    """
+    if isinstance(source, ApiCollection):
+        api_metadata = source.meta
+    else:
+        api_metadata = ToAPI.from_collection_metadata(source.metadata, keep_collection_id=True)
+
+    sections: dict[str, tuple[str, bytes]] = {}
+    for prefix, table in (("fleets", get_alliance_columns(source)), ("users", get_user_columns(source))):
+        for field in table.column_names:
+            values = table[field]
+            if field in _STRING_FIELDS:
+                encoded_values = [value.encode("utf-8") for value in values]
+                sections[f"{prefix}.{field}.offsets"] = ("q", array("q", accumulate(map(len, encoded_values), initial=0)).tobytes())
+                sections[f"{prefix}.{field}.data"] = ("B", b"".join(encoded_values))
+            else:
+                type_code = _get_format(values)
+                null_value = _NULL_VALUES[type_code]
+                sections[f"{prefix}.{field}"] = (type_code, array(type_code, [null_value if value is None else value for value in values]).tobytes())
+
+    columns = {}
+    offset = 0
+    for name, (type_code, data) in sections.items():
+        columns[name] = {"type_code": type_code, "offset": offset, "size": len(data)}
+        offset = _align(offset + len(data))
+
+    header = {
+        "byteorder": sys.byteorder,
+        "meta": api_metadata.model_dump(mode="json"),
+        "alliance_count": len(source.fleets or []) if isinstance(source, ApiCollection) else len(source.alliances or []),
+        "user_count": len(source.users or []),
+        "columns": columns,
+    }
+    # The data offset is part of the header, so its length has to be known first. Reserve enough digits for any offset.
+    header["data_offset"] = 10**12
+    header_length = len(json.dumps(header).encode("utf-8"))
+    header["data_offset"] = _align(_PREFIX.size + header_length)
+    header_bytes = json.dumps(header).encode("utf-8").ljust(header_length)
+
+    with utils.open_atomic(file_path, "wb") as fp:
+        _ = fp.write(_PREFIX.pack(_MAGIC, FORMAT_VERSION, header_length))
+        _ = fp.write(header_bytes)
+        _ = fp.write(b"\0" * (header["data_offset"] - _PREFIX.size - header_length))
+        for _, data in sections.values():
+            _ = fp.write(data)
+            _ = fp.write(b"\0" * (_align(len(data)) - len(data)))
+        size = fp.tell()
+    return size
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _get_format(values: list[Optional[int]]) -> str:
+    present_values = [value for value in values if value is not None]
+    if not present_values:
+        return "i"
+    # The lowest value of a type is reserved for `None`.
+    if _NULL_VALUES["i"] < min(present_values) and max(present_values) < 2**31:
+        return "i"
+    return "q"
+
+
+def _read_header(buffer: mmap.mmap, file_path: Path) -> dict[str, Any]:
+    if len(buffer) < _PREFIX.size:
+        raise ValueError(f"The file is not a mapped collection: {file_path}")
+
+    magic, version, header_length = _PREFIX.unpack_from(buffer)
+    if magic != _MAGIC:
+        raise ValueError(f"The file is not a mapped collection: {file_path}")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported format version {version}: {file_path}")
+
+    header_start = _PREFIX.size
+    header_end = header_start + header_length
+    header = json.loads(buffer[header_start:header_end])
+    if header["byteorder"] != sys.byteorder:
+        raise ValueError(f"The file has been written on a machine with a different byte order: {file_path}")
+    return header
+
+
+__all__ = [
+    "FORMAT_VERSION",
+    MappedCollection.__name__,
+    write_mapped_collection.__name__,
+]
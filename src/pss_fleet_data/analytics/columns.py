@@ -0,0 +1,198 @@
+from datetime import datetime
+from operator import attrgetter, itemgetter
+from typing import Any, Iterable, Optional, Union
+
+from pssapi.enums import AllianceMembership
+
+from .. import utils
+from ..models.api_models import ApiCollection
+from ..models.client_models import Collection
+from .table import Table
+
+
+USER_FIELDS: tuple[str, ...] = (
+    "user_id",
+    "user_name",
+    "alliance_id",
+    "trophy",
+    "alliance_score",
+    "alliance_membership",
+    "alliance_join_date",
+    "last_login_date",
+    "last_heartbeat_date",
+    "crew_donated",
+    "crew_received",
+    "pvp_attack_wins",
+    "pvp_attack_losses",
+    "pvp_attack_draws",
+    "pvp_defence_wins",
+    "pvp_defence_losses",
+    "pvp_defence_draws",
+    "championship_score",
+    "highest_trophy",
+    "tournament_bonus_score",
+)
+"""The names of the `User` columns, in the order of the fields of an `ApiUser`."""
+
+ALLIANCE_FIELDS: tuple[str, ...] = (
+    "alliance_id",
+    "alliance_name",
+    "score",
+    "division_design_id",
+    "trophy",
+    "championship_score",
+    "number_of_members",
+    "number_of_approved_members",
+)
+"""The names of the `Alliance` columns, in the order of the fields of an `ApiAlliance`."""
+
+_PSS_USER_ATTRIBUTES = {
+    "user_id": "id",
+    "user_name": "name",
+    "last_heartbeat_date": "last_heart_beat_date",
+}
+_PSS_USER_DATE_FIELDS = ("alliance_join_date", "last_login_date", "last_heartbeat_date")
+
+
+CollectionSource = Union[Collection, ApiCollection]
+"""A `Collection` or a `Collection` as returned by the API."""
+
+
+def check_alliance_fields(fields: Iterable[str]) -> tuple[str, ...]:
+    """Checks, if all given names are names of `Alliance` columns.
+
+    Args:
+        fields (Iterable[str]): The names to be checked.
+
+    Raises:
+        ValueError: Raised, if any of the names is not in `ALLIANCE_FIELDS`.
+
+    Returns:
+        tuple[str, ...]: The names.
+    """
+    return _check_fields(fields, ALLIANCE_FIELDS)
+
+
+def check_user_fields(fields: Iterable[str]) -> tuple[str, ...]:
+    """Checks, if all given names are names of `User` columns.
+
+    Args:
+        fields (Iterable[str]): The names to be checked.
+
+    Raises:
+        ValueError: Raised, if any of the names is not in `USER_FIELDS`.
+
+    Returns:
+        tuple[str, ...]: The names.
+    """
+    return _check_fields(fields, USER_FIELDS)
+
+
+def get_alliance_columns(source: CollectionSource, fields: Optional[Iterable[str]] = None) -> Table:
+    """Extracts the `Alliance` data of a collection into columns. Values are encoded like in an `ApiAlliance`.
+
+    Args:
+        source (CollectionSource): The collection to extract the data from.
+        fields (Iterable[str], optional): The names of the columns to be extracted. See `ALLIANCE_FIELDS`. Defaults to `None` (all columns).
+
+    Raises:
+        ValueError: Raised, if an unknown field has been requested.
+
+    Returns:
+        Table: A table with one row per `Alliance`.
+    """
+    fields = _check_fields(fields, ALLIANCE_FIELDS)
+    if isinstance(source, ApiCollection):
+        alliances = source.fleets or []
+        return Table({field: list(map(itemgetter(ALLIANCE_FIELDS.index(field)), alliances)) for field in fields})
+
+    alliances = source.alliances or []
+    return Table({field: list(map(attrgetter(field), alliances)) for field in fields})
+
+
+def get_collection_id(source: CollectionSource) -> Optional[int]:
+    """Returns the `collection_id` of a collection.
+
+    Args:
+        source (CollectionSource): The collection.
+
+    Returns:
+        Optional[int]: The ID of the collection in the database, if it has been stored there.
+    """
+    if isinstance(source, ApiCollection):
+        return source.meta.collection_id
+    return source.metadata.collection_id
+
+
+def get_timestamp(source: CollectionSource) -> datetime:
+    """Returns the timestamp of a collection.
+
+    Args:
+        source (CollectionSource): The collection.
+
+    Returns:
+        datetime: The moment the data of the collection started to get recorded.
+    """
+    if isinstance(source, ApiCollection):
+        return source.meta.timestamp
+    return source.metadata.timestamp
+
+
+def get_user_columns(source: CollectionSource, fields: Optional[Iterable[str]] = None) -> Table:
+    """Extracts the `User` data of a collection into columns. Values are encoded like in an `ApiUser`: the alliance membership as an `int`,
+    dates as seconds since the PSS start date.
+
+    Args:
+        source (CollectionSource): The collection to extract the data from.
+        fields (Iterable[str], optional): The names of the columns to be extracted. See `USER_FIELDS`. Defaults to `None` (all columns).
+
+    Raises:
+        ValueError: Raised, if an unknown field has been requested.
+
+    Returns:
+        Table: A table with one row per `User`.
+    """
+    fields = _check_fields(fields, USER_FIELDS)
+    if isinstance(source, ApiCollection):
+        users = source.users or []
+        return Table({field: list(map(itemgetter(USER_FIELDS.index(field)), users)) for field in fields})
+
+    users = source.users or []
+    return Table({field: _get_pss_user_column(users, field) for field in fields})
+
+
+def _check_fields(fields: Optional[Iterable[str]], valid_fields: tuple[str, ...]) -> tuple[str, ...]:
+    if fields is None:
+        return valid_fields
+
+    fields = tuple(fields)
+    invalid_fields = [field for field in fields if field not in valid_fields]
+    if invalid_fields:
+        raise ValueError(f"Unknown fields: {', '.join(invalid_fields)}")
+    return fields
+
+
+def _get_pss_user_column(users: list, field: str) -> list[Any]:
+    values = list(map(attrgetter(_PSS_USER_ATTRIBUTES.get(field, field)), users))
+
+    if field == "alliance_membership":
+        # pssapi parses the membership "None" of users without an alliance to `None`
+        return utils.encode_alliance_memberships([membership or AllianceMembership.NONE for membership in values])
+
+    if field in _PSS_USER_DATE_FIELDS:
+        return utils.convert_datetimes_to_seconds(values)
+
+    return values
+
+
+__all__ = [
+    "ALLIANCE_FIELDS",
+    "CollectionSource",
+    "USER_FIELDS",
+    check_alliance_fields.__name__,
+    check_user_fields.__name__,
+    get_alliance_columns.__name__,
+    get_collection_id.__name__,
+    get_timestamp.__name__,
+    get_user_columns.__name__,
+]
@@ -0,0 +1,260 @@
+from collections import Counter
+from dataclasses import dataclass
+from itertools import compress
+from typing import Any, Optional
+
+from .columns import CollectionSource, get_alliance_columns, get_collection_id, get_user_columns
+from .table import Table
+
+
+_USER_DIFF_FIELDS = ("user_id", "user_name", "alliance_id", "alliance_membership", "trophy", "alliance_score", "championship_score")
+_USER_DELTA_FIELDS = ("trophy_delta", "alliance_score_delta", "championship_score_delta")
+_ALLIANCE_DELTA_FIELDS = ("score_delta", "trophy_delta", "championship_score_delta", "number_of_members_delta")
+_ALLIANCE_DIFF_FIELDS = ("alliance_id", "alliance_name", "division_design_id", "score", "trophy", "championship_score", "number_of_members")
+
+USER_DELTA_COLUMNS: tuple[str, ...] = (
+    "user_id",
+    "user_name",
+    "added",
+    "removed",
+    "joined",
+    "left",
+    "rank_changed",
+    "alliance_id_before",
+    "alliance_id_after",
+    "alliance_membership_before",
+    "alliance_membership_after",
+    "trophy_before",
+    "trophy_after",
+    "trophy_delta",
+    "alliance_score_delta",
+    "championship_score_delta",
+)
+"""The columns of the `users` table of a `CollectionDiff`.
+
+- `added`/`removed`: The `User` only exists in the newer/older collection.
+- `joined`/`left`: The `User` joined/left an `Alliance`. A `User` who switched `Alliance`s has both set. Only set for `User`s existing in both
+  collections, so `User`s added to or removed from the data don't count as joining or leaving.
+- `rank_changed`: The `User` stayed in the same `Alliance`, but its alliance membership (member rank) changed.
+- `*_before`/`*_after`: The values in the older/newer collection. `None`, if the `User` doesn't exist in that collection.
+- `*_delta`: The newer value minus the older value. `None`, if the `User` doesn't exist in both collections.
+"""
+
+ALLIANCE_DELTA_COLUMNS: tuple[str, ...] = (
+    "alliance_id",
+    "alliance_name",
+    "added",
+    "removed",
+    "division_design_id_before",
+    "division_design_id_after",
+    "score_delta",
+    "trophy_delta",
+    "championship_score_delta",
+    "number_of_members_delta",
+    "members_joined",
+    "members_left",
+)
+"""The columns of the `alliances` table of a `CollectionDiff`.
+
+- `added`/`removed`: The `Alliance` only exists in the newer/older collection.
+- `*_before`/`*_after`: The values in the older/newer collection. `None`, if the `Alliance` doesn't exist in that collection.
+- `*_delta`: The newer value minus the older value. `None`, if the `Alliance` doesn't exist in both collections or a value is missing.
+- `members_joined`/`members_left`: The number of `User`s existing in both collections who joined/left the `Alliance`.
+"""
+
+
+@dataclass(frozen=True)
+class CollectionDiff:
+    """
+    The per-`User` and per-`Alliance` changes between two collections.
+    """
+
+    collection_id_before: Optional[int]
+    """The ID of the older collection."""
+    collection_id_after: Optional[int]
+    """The ID of the newer collection."""
+    users: Table
+    """One row per `User` found in any of the collections. See `USER_DELTA_COLUMNS`."""
+    alliances: Table
+    """One row per `Alliance` found in any of the collections. See `ALLIANCE_DELTA_COLUMNS`."""
+
+
+def diff_collections(before: CollectionSource, after: CollectionSource, changed_only: bool = False) -> CollectionDiff:
+    """Computes the changes of `User`s and `Alliance`s between two collections.
+    Rows get matched on `user_id` and `alliance_id` with a hash join, so this scales linearly with the number of `User`s.
+
+    Args:
+        before (CollectionSource): The older collection.
+        after (CollectionSource): The newer collection.
+        changed_only (bool, optional): Only include rows that changed in any way. Defaults to `False`.
+
+    Returns:
+        CollectionDiff: The changes. Rows of the newer collection come first, in their order, followed by removed rows.
+    """
+    users = diff_users(before, after, changed_only=changed_only)
+    alliances = diff_alliances(before, after, changed_only=changed_only, user_deltas=users)
+    return CollectionDiff(
+        collection_id_before=get_collection_id(before),
+        collection_id_after=get_collection_id(after),
+        users=users,
+        alliances=alliances,
+    )
+
+
+def diff_users(before: CollectionSource, after: CollectionSource, changed_only: bool = False) -> Table:
+    """Computes the changes of `User`s between two collections, matched on `user_id`.
+
+    Args:
+        before (CollectionSource): The older collection.
+        after (CollectionSource): The newer collection.
+        changed_only (bool, optional): Only include rows that changed in any way. Defaults to `False`.
+
+    Returns:
+        Table: The changes with the columns `USER_DELTA_COLUMNS`.
+    """
+    old = get_user_columns(before, _USER_DIFF_FIELDS)
+    new = get_user_columns(after, _USER_DIFF_FIELDS)
+    old_indices, removed_indices = _join(old["user_id"], new["user_id"])
+    added_count = len(new["user_id"])
+    removed_count = len(removed_indices)
+
+    alliance_ids_before = _take(old["alliance_id"], old_indices, removed_indices)
+    alliance_ids_after = new["alliance_id"] + [None] * removed_count
+    memberships_before = _take(old["alliance_membership"], old_indices, removed_indices)
+    memberships_after = new["alliance_membership"] + [None] * removed_count
+    trophies_before = _take(old["trophy"], old_indices, removed_indices)
+    trophies_after = new["trophy"] + [None] * removed_count
+    existing_in_both = [i is not None for i in old_indices] + [False] * removed_count
+
+    columns = {
+        "user_id": new["user_id"] + [old["user_id"][i] for i in removed_indices],
+        "user_name": new["user_name"] + [old["user_name"][i] for i in removed_indices],
+        "added": [i is None for i in old_indices] + [False] * removed_count,
+        "removed": [False] * added_count + [True] * removed_count,
+        "joined": [
+            existing and bool(alliance_id_after) and alliance_id_after != alliance_id_before
+            for existing, alliance_id_before, alliance_id_after in zip(existing_in_both, alliance_ids_before, alliance_ids_after, strict=True)
+        ],
+        "left": [
+            existing and bool(alliance_id_before) and alliance_id_after != alliance_id_before
+            for existing, alliance_id_before, alliance_id_after in zip(existing_in_both, alliance_ids_before, alliance_ids_after, strict=True)
+        ],
+        "rank_changed": [
+            alliance_id_after == alliance_id_before and membership_after != membership_before
+            for alliance_id_before, alliance_id_after, membership_before, membership_after in zip(
+                alliance_ids_before, alliance_ids_after, memberships_before, memberships_after, strict=True
+            )
+        ],
+        "alliance_id_before": alliance_ids_before,
+        "alliance_id_after": alliance_ids_after,
+        "alliance_membership_before": memberships_before,
+        "alliance_membership_after": memberships_after,
+        "trophy_before": trophies_before,
+        "trophy_after": trophies_after,
+        "trophy_delta": _subtract(trophies_after, trophies_before),
+        "alliance_score_delta": _subtract_joined(new["alliance_score"], old["alliance_score"], old_indices, removed_count),
+        "championship_score_delta": _subtract_joined(new["championship_score"], old["championship_score"], old_indices, removed_count),
+    }
+    users = Table(columns)
+
+    if changed_only:
+        return users.filter(_get_changed_mask(columns, ("added", "removed", "joined", "left", "rank_changed"), _USER_DELTA_FIELDS))
+    return users
+
+
+def diff_alliances(before: CollectionSource, after: CollectionSource, changed_only: bool = False, user_deltas: Optional[Table] = None) -> Table:
+    """Computes the changes of `Alliance`s between two collections, matched on `alliance_id`.
+
+    Args:
+        before (CollectionSource): The older collection.
+        after (CollectionSource): The newer collection.
+        changed_only (bool, optional): Only include rows that changed in any way. Defaults to `False`.
+        user_deltas (Table, optional): The result of `diff_users` for the same collections, used to count members joined and left. Defaults to `None` (computed).
+
+    Returns:
+        Table: The changes with the columns `ALLIANCE_DELTA_COLUMNS`.
+    """
+    if user_deltas is None:
+        user_deltas = diff_users(before, after, changed_only=True)
+    members_joined = Counter(compress(user_deltas["alliance_id_after"], user_deltas["joined"]))
+    members_left = Counter(compress(user_deltas["alliance_id_before"], user_deltas["left"]))
+
+    old = get_alliance_columns(before, _ALLIANCE_DIFF_FIELDS)
+    new = get_alliance_columns(after, _ALLIANCE_DIFF_FIELDS)
+    old_indices, removed_indices = _join(old["alliance_id"], new["alliance_id"])
+    added_count = len(new["alliance_id"])
+    removed_count = len(removed_indices)
+
+    alliance_ids = new["alliance_id"] + [old["alliance_id"][i] for i in removed_indices]
+    divisions_before = _take(old["division_design_id"], old_indices, removed_indices)
+    divisions_after = new["division_design_id"] + [None] * removed_count
+
+    columns = {
+        "alliance_id": alliance_ids,
+        "alliance_name": new["alliance_name"] + [old["alliance_name"][i] for i in removed_indices],
+        "added": [i is None for i in old_indices] + [False] * removed_count,
+        "removed": [False] * added_count + [True] * removed_count,
+        "division_design_id_before": divisions_before,
+        "division_design_id_after": divisions_after,
+        "score_delta": _subtract_joined(new["score"], old["score"], old_indices, removed_count),
+        "trophy_delta": _subtract_joined(new["trophy"], old["trophy"], old_indices, removed_count),
+        "championship_score_delta": _subtract_joined(new["championship_score"], old["championship_score"], old_indices, removed_count),
+        "number_of_members_delta": _subtract_joined(new["number_of_members"], old["number_of_members"], old_indices, removed_count),
+        "members_joined": [members_joined[alliance_id] for alliance_id in new["alliance_id"]] + [0] * removed_count,
+        "members_left": [members_left[alliance_id] for alliance_id in alliance_ids],
+    }
+    columns["division_changed"] = [
+        division_before is not None and division_after is not None and division_before != division_after
+        for division_before, division_after in zip(divisions_before, divisions_after, strict=True)
+    ]
+    mask = _get_changed_mask(columns, ("added", "removed", "division_changed", "members_joined", "members_left"), _ALLIANCE_DELTA_FIELDS)
+    del columns["division_changed"]
+    alliances = Table(columns)
+
+    if changed_only:
+        return alliances.filter(mask)
+    return alliances
+
+
+def _get_changed_mask(columns: dict[str, list[Any]], flag_column_names: tuple[str, ...], delta_column_names: tuple[str, ...]) -> list[bool]:
+    # A row changed, if any of its flags is set or any of its deltas is neither 0 nor None.
+    return [any(values) for values in zip(*(columns[name] for name in (*flag_column_names, *delta_column_names)), strict=True)]
+
+
+def _join(old_ids: list[int], new_ids: list[int]) -> tuple[list[Optional[int]], list[int]]:
+    # Hash join on the IDs: the index of the matching old row for every new row and the indices of the old rows without a match.
+    old_index_by_id = dict(zip(old_ids, range(len(old_ids)), strict=True))
+    old_indices = list(map(old_index_by_id.get, new_ids))
+    for i in old_indices:
+        if i is not None:
+            old_index_by_id[old_ids[i]] = None
+    removed_indices = [i for i in old_index_by_id.values() if i is not None]
+    return old_indices, removed_indices
+
+
+def _subtract(minuends: list[Optional[int]], subtrahends: list[Optional[int]]) -> list[Optional[int]]:
+    return [
+        None if minuend is None or subtrahend is None else minuend - subtrahend for minuend, subtrahend in zip(minuends, subtrahends, strict=True)
+    ]
+
+
+def _subtract_joined(
+    new_values: list[Optional[int]], old_values: list[Optional[int]], old_indices: list[Optional[int]], removed_count: int
+) -> list[Optional[int]]:
+    # The delta of a new row and its matching old row. `None` for unmatched rows.
+    return _subtract(new_values, [None if i is None else old_values[i] for i in old_indices]) + [None] * removed_count
+
+
+def _take(values: list[Any], old_indices: list[Optional[int]], removed_indices: list[int]) -> list[Any]:
+    # The values of the matching old rows followed by the values of the removed old rows.
+    return [None if i is None else values[i] for i in old_indices] + [values[i] for i in removed_indices]
+
+
+__all__ = [
+    "ALLIANCE_DELTA_COLUMNS",
+    CollectionDiff.__name__,
+    "USER_DELTA_COLUMNS",
+    diff_alliances.__name__,
+    diff_collections.__name__,
+    diff_users.__name__,
+]
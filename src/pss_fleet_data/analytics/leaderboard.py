@@ -0,0 +1,145 @@
+from enum import StrEnum
+from heapq import nlargest
+from typing import Any, Iterable, Optional, Union
+
+from .columns import ALLIANCE_FIELDS, USER_FIELDS, CollectionSource, get_alliance_columns, get_user_columns
+from .table import Table
+
+
+class LeaderboardGrouping(StrEnum):
+    """
+    The groups to rank `User`s or `Alliance`s in separately.
+    """
+
+    ALLIANCE = "alliance"
+    """Rank `User`s per `Alliance`. `User`s without an `Alliance` are not ranked."""
+    DIVISION = "division"
+    """Rank per tournament division (`division_design_id`). `Alliance`s without a division (`0`) and their members are not ranked."""
+
+
+_USER_LEADERBOARD_FIELDS = ("user_id", "user_name", "alliance_id")
+_ALLIANCE_LEADERBOARD_FIELDS = ("alliance_id", "alliance_name", "division_design_id")
+
+
+def get_top_alliances(
+    source: CollectionSource,
+    field: str = "score",
+    n: int = 100,
+    group_by: Optional[Union[LeaderboardGrouping, str]] = None,
+) -> Table:
+    """Ranks the `Alliance`s of a collection by a field. Only the top `n` `Alliance`s per group get sorted, so this is cheap for small `n`.
+
+    Args:
+        source (CollectionSource): The collection.
+        field (str, optional): The name of the field to rank by, e.g. `score`, `trophy` or `championship_score`.
+        See `pss_fleet_data.analytics.columns.ALLIANCE_FIELDS`. Defaults to `score`.
+        n (int, optional): The number of `Alliance`s to rank per group. Defaults to `100`.
+        group_by (LeaderboardGrouping | str, optional): Rank the `Alliance`s per division. Defaults to `None` (one ranking).
+
+    Raises:
+        ValueError: Raised, if the field is unknown, if `n` is negative or if `Alliance`s can't be grouped that way.
+
+    Returns:
+        Table: One row per ranked `Alliance` with the columns `rank`, `alliance_id`, `alliance_name`, `division_design_id` and `field`.
+        Sorted by group and rank.
+    """
+    grouping = _get_grouping(group_by)
+    if grouping == LeaderboardGrouping.ALLIANCE:
+        raise ValueError("`Alliance`s can't be grouped by `Alliance`.")
+
+    column_names = _get_column_names(_ALLIANCE_LEADERBOARD_FIELDS, field, ALLIANCE_FIELDS)
+    alliances = get_alliance_columns(source, column_names)
+    group_keys = [division_design_id or None for division_design_id in alliances["division_design_id"]] if grouping else None
+    return _rank(alliances, field, n, group_keys)
+
+
+def get_top_users(
+    source: CollectionSource,
+    field: str = "trophy",
+    n: int = 100,
+    group_by: Optional[Union[LeaderboardGrouping, str]] = None,
+) -> Table:
+    """Ranks the `User`s of a collection by a field. Only the top `n` `User`s per group get sorted, so this is cheap for small `n`.
+
+    Args:
+        source (CollectionSource): The collection.
+        field (str, optional): The name of the field to rank by, e.g. `trophy`, `alliance_score` or `championship_score`.
+        See `pss_fleet_data.analytics.columns.USER_FIELDS`. Defaults to `trophy`.
+        n (int, optional): The number of `User`s to rank per group. Defaults to `100`.
+        group_by (LeaderboardGrouping | str, optional): Rank the `User`s per `Alliance` or per division. Defaults to `None` (one ranking).
+
+    Raises:
+        ValueError: Raised, if the field or grouping is unknown or if `n` is negative.
+
+    Returns:
+        Table: One row per ranked `User` with the columns `rank`, `user_id`, `user_name`, `alliance_id` and `field`. If grouped by division,
+        it also has the column `division_design_id`. Sorted by group and rank.
+    """
+    grouping = _get_grouping(group_by)
+    column_names = _get_column_names(_USER_LEADERBOARD_FIELDS, field, USER_FIELDS)
+    users = get_user_columns(source, column_names)
+
+    group_keys = None
+    if grouping == LeaderboardGrouping.ALLIANCE:
+        group_keys = [alliance_id or None for alliance_id in users["alliance_id"]]
+    elif grouping == LeaderboardGrouping.DIVISION:
+        alliances = get_alliance_columns(source, ("alliance_id", "division_design_id"))
+        division_by_alliance_id = dict(zip(alliances["alliance_id"], alliances["division_design_id"], strict=True))
+        divisions = [division_by_alliance_id.get(alliance_id) for alliance_id in users["alliance_id"]]
+        users = Table({**{name: users[name] for name in users.column_names}, "division_design_id": divisions})
+        group_keys = [division_design_id or None for division_design_id in divisions]
+
+    return _rank(users, field, n, group_keys)
+
+
+def _get_column_names(leaderboard_fields: tuple[str, ...], field: str, valid_fields: tuple[str, ...]) -> tuple[str, ...]:
+    if field not in valid_fields:
+        raise ValueError(f"Unknown field: {field}")
+    return tuple(dict.fromkeys((*leaderboard_fields, field)))
+
+
+def _get_grouping(group_by: Optional[Union[LeaderboardGrouping, str]]) -> Optional[LeaderboardGrouping]:
+    if group_by is None:
+        return None
+    try:
+        return LeaderboardGrouping(group_by)
+    except ValueError:
+        raise ValueError(f"Unknown grouping: {group_by}") from None
+
+
+def _get_top_indices(indices: Iterable[int], values: list[Any], n: int) -> list[int]:
+    # A heap of size n: O(len(indices) * log(n)) instead of sorting all rows. Ties keep the order of the collection.
+    return nlargest(n, indices, key=values.__getitem__)
+
+
+def _rank(table: Table, field: str, n: int, group_keys: Optional[list[Any]]) -> Table:
+    if n < 0:
+        raise ValueError("The parameter 'n' must not be negative.")
+
+    values = table[field]
+    if group_keys is None:
+        top_indices = _get_top_indices((i for i, value in enumerate(values) if value is not None), values, n)
+        ranks = list(range(1, len(top_indices) + 1))
+    else:
+        indices_by_group: dict[Any, list[int]] = {}
+        for i, (group_key, value) in enumerate(zip(group_keys, values, strict=True)):
+            if group_key is not None and value is not None:
+                indices_by_group.setdefault(group_key, []).append(i)
+
+        top_indices = []
+        ranks = []
+        for group_key in sorted(indices_by_group):
+            group_top_indices = _get_top_indices(indices_by_group[group_key], values, n)
+            top_indices.extend(group_top_indices)
+            ranks.extend(range(1, len(group_top_indices) + 1))
+
+    columns = {"rank": ranks}
+    columns.update((name, [table[name][i] for i in top_indices]) for name in table.column_names)
+    return Table(columns)
+
+
+__all__ = [
+    LeaderboardGrouping.__name__,
+    get_top_alliances.__name__,
+    get_top_users.__name__,
+]
@@ -0,0 +1,141 @@
+from itertools import compress
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
+
+from ..core.lazy import import_optional_dependency
+
+
+if TYPE_CHECKING:
+    import numpy
+    import pandas
+
+
+class Table:
+    """
+    A compact, column-oriented table. Every column is a `list` of the same length.
+    """
+
+    def __init__(self, columns: dict[str, list[Any]]):
+        """Initializes a `Table`.
+
+        Args:
+            columns (dict[str, list[Any]]): The columns of the table by name.
+
+        Raises:
+            ValueError: Raised, if the columns are of different lengths.
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns of a `Table` must have the same length!")
+
+        self.__columns: dict[str, list[Any]] = dict(columns)
+        self.__length: int = lengths.pop() if lengths else 0
+
+    @property
+    def column_names(self) -> tuple[str, ...]:
+        """
+        The names of the columns of this table, in order.
+        """
+        return tuple(self.__columns)
+
+    def __contains__(self, column_name: str) -> bool:
+        return column_name in self.__columns
+
+    def __getitem__(self, column_name: str) -> list[Any]:
+        return self.__columns[column_name]
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __repr__(self) -> str:
+        return f"<Table rows={self.__length}, columns={list(self.__columns)}>"
+
+    def filter(self, mask: Iterable[bool]) -> "Table":
+        """Returns a new table containing only the rows for which `mask` is truthy.
+
+        Args:
+            mask (Iterable[bool]): One value per row, e.g. a `bool` column of this table.
+
+        Returns:
+            Table: The filtered table.
+        """
+        mask = list(mask)
+        return Table({name: list(compress(values, mask)) for name, values in self.__columns.items()})
+
+    def row(self, index: int) -> dict[str, Any]:
+        """Returns a single row.
+
+        Args:
+            index (int): The index of the row.
+
+        Returns:
+            dict[str, Any]: The values of the row by column name.
+        """
+        return {name: values[index] for name, values in self.__columns.items()}
+
+    def rows(self) -> Iterator[dict[str, Any]]:
+        """Iterates over the rows of this table.
+
+        Yields:
+            dict[str, Any]: The values of a row by column name.
+        """
+        names = tuple(self.__columns)
+        for values in zip(*self.__columns.values(), strict=True):
+            yield dict(zip(names, values, strict=True))
+
+    def select(self, *column_names: str) -> "Table":
+        """Returns a new table containing only the specified columns.
+
+        Args:
+            *column_names (str): The names of the columns to be selected.
+
+        Returns:
+            Table: The table with the selected columns.
+        """
+        return Table({name: self.__columns[name] for name in column_names})
+
+    def to_dict(self) -> dict[str, list[Any]]:
+        """Returns the columns of this table.
+
+        Returns:
+            dict[str, list[Any]]: A shallow copy of the columns by name.
+        """
+        return {name: list(values) for name, values in self.__columns.items()}
+
+    def to_numpy(self, column_names: Optional[Iterable[str]] = None) -> dict[str, "numpy.ndarray"]:
+        """Converts the columns of this table to NumPy arrays. Requires the optional dependency `numpy`.
+
+        Args:
+            column_names (Iterable[str], optional): The names of the columns to be converted. Defaults to `None` (all columns).
+
+        Raises:
+            ImportError: Raised, if `numpy` is not installed.
+
+        Returns:
+            dict[str, numpy.ndarray]: The arrays by column name. Columns containing `None` become arrays of dtype `object`.
+        """
+        numpy = import_optional_dependency("numpy", "analytics")
+        column_names = self.column_names if column_names is None else tuple(column_names)
+        return {name: numpy.asarray(self.__columns[name]) for name in column_names}
+
+    def to_pandas(self, index: Optional[str] = None) -> "pandas.DataFrame":
+        """Converts this table to a pandas `DataFrame`. Requires the optional dependency `pandas`.
+
+        Args:
+            index (str, optional): The name of the column to be used as index. Defaults to `None`.
+
+        Raises:
+            ImportError: Raised, if `pandas` is not installed.
+
+        Returns:
+            pandas.DataFrame: The data frame.
+        """
+        pandas = import_optional_dependency("pandas", "analytics")
+        data_frame = pandas.DataFrame(self.__columns, columns=list(self.__columns))
+        if index is not None:
+            data_frame = data_frame.set_index(index)
+        return data_frame
+
+
+__all__ = [
+    Table.__name__,
+]
@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from ..core.lazy import import_optional_dependency
+from .columns import CollectionSource, get_collection_id, get_timestamp, get_user_columns
+from .table import Table
+
+
+if TYPE_CHECKING:
+    import numpy
+    import pandas
+
+
+@dataclass(frozen=True)
+class TimeSeries:
+    """
+    The values of a single `User` field over time: a dense `User` x timestamp matrix, stored column by column.
+    """
+
+    field: str
+    """The name of the `User` field, e.g. `trophy`. See `pss_fleet_data.analytics.columns.USER_FIELDS`."""
+    user_ids: list[int]
+    """The IDs of the `User`s. They define the order of the values in every column."""
+    collection_ids: list[Optional[int]]
+    """The IDs of the collections the values were taken from, in chronological order."""
+    timestamps: list[datetime]
+    """The timestamps of the collections the values were taken from, in chronological order."""
+    columns: list[list[Any]]
+    """One column per timestamp with one value per `User`. `None`, if a `User` is not part of that collection."""
+
+    def get_values(self, user_id: int) -> list[Any]:
+        """Returns the values of a single `User` over time.
+
+        Args:
+            user_id (int): The ID of the `User`.
+
+        Raises:
+            ValueError: Raised, if the `User` is not part of this time series.
+
+        Returns:
+            list[Any]: One value per timestamp.
+        """
+        index = self.user_ids.index(user_id)
+        return [column[index] for column in self.columns]
+
+    def to_table(self) -> Table:
+        """Converts this time series to a `Table` with the column `user_id` and one column per timestamp named after its ISO format.
+
+        Returns:
+            Table: The table.
+        """
+        columns = {"user_id": self.user_ids}
+        columns.update((timestamp.isoformat(), column) for timestamp, column in zip(self.timestamps, self.columns, strict=True))
+        return Table(columns)
+
+    def to_numpy(self) -> "numpy.ndarray":
+        """Converts this time series to a 2-dimensional NumPy array with one row per `User` and one column per timestamp.
+        Requires the optional dependency `numpy`.
+
+        Raises:
+            ImportError: Raised, if `numpy` is not installed.
+
+        Returns:
+            numpy.ndarray: An array of dtype `float`. Missing values are `nan`.
+        """
+        numpy = import_optional_dependency("numpy", "analytics")
+        return numpy.array(self.columns, dtype=float).reshape(len(self.columns), len(self.user_ids)).T
+
+    def to_pandas(self) -> "pandas.DataFrame":
+        """Converts this time series to a pandas `DataFrame` indexed by `user_id` with one column per timestamp.
+        Requires the optional dependency `pandas`.
+
+        Raises:
+            ImportError: Raised, if `pandas` is not installed.
+
+        Returns:
+            pandas.DataFrame: The data frame. Missing values are `nan`.
+        """
+        pandas = import_optional_dependency("pandas", "analytics")
+        data_frame = pandas.DataFrame(dict(zip(self.timestamps, self.columns, strict=True)), index=pandas.Index(self.user_ids, name="user_id"))
+        data_frame.columns.name = "timestamp"
+        return data_frame
+
+
+def build_time_series(
+    collections: Iterable[CollectionSource], fields: Iterable[str], user_ids: Optional[Iterable[int]] = None
+) -> dict[str, TimeSeries]:
+    """Pulls the values of the given `User` fields out of many collections into time series. The collections get sorted by timestamp.
+
+    Args:
+        collections (Iterable[CollectionSource]): The collections to take the values from.
+        fields (Iterable[str]): The names of the `User` fields, e.g. `trophy`. See `pss_fleet_data.analytics.columns.USER_FIELDS`.
+        user_ids (Iterable[int], optional): The IDs of the `User`s to include. Defaults to `None` (all `User`s in any of the collections,
+        in order of their first appearance).
+
+    Raises:
+        ValueError: Raised, if an unknown field has been requested.
+
+    Returns:
+        dict[str, TimeSeries]: The time series by field name.
+    """
+    fields = tuple(fields)
+    collections = sorted(collections, key=get_timestamp)
+    user_columns = [get_user_columns(collection, ("user_id", *fields)) for collection in collections]
+
+    if user_ids is None:
+        user_ids = list(dict.fromkeys(user_id for columns in user_columns for user_id in columns["user_id"]))
+    else:
+        user_ids = list(user_ids)
+    index_by_user_id = dict(zip(user_ids, range(len(user_ids)), strict=True))
+
+    user_count = len(user_ids)
+    values_by_field: dict[str, list[list[Any]]] = {field: [] for field in fields}
+    for columns in user_columns:
+        # Look up the row of every User once per collection and reuse it for all fields.
+        # Values of Users not requested get written to an extra row, which gets dropped afterwards.
+        indices = [index_by_user_id.get(user_id, user_count) for user_id in columns["user_id"]]
+        for field in fields:
+            column = [None] * (user_count + 1)
+            for index, value in zip(indices, columns[field], strict=True):
+                column[index] = value
+            del column[user_count]
+            values_by_field[field].append(column)
+
+    collection_ids = [get_collection_id(collection) for collection in collections]
+    timestamps = [get_timestamp(collection) for collection in collections]
+    return {
+        field: TimeSeries(field=field, user_ids=user_ids, collection_ids=collection_ids, timestamps=timestamps, columns=values_by_field[field])
+        for field in fields
+    }
+
+
+__all__ = [
+    TimeSeries.__name__,
+    build_time_series.__name__,
+]
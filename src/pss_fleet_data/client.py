@@ -1,18 +1,74 @@
+import asyncio
 import json
-from datetime import datetime
+from concurrent.futures import Executor
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from functools import partial, wraps
 from pathlib import Path
-from typing import Any, Optional, Union
+from time import perf_counter
+from typing import Any, AsyncIterable, Awaitable, Callable, Iterable, Mapping, Optional, TypeVar, Union
 
-from httpx import URL, AsyncClient, Response, Timeout
+from httpx import URL, AsyncClient, HTTPError, Request, Response, Timeout
 from pssapi.entities import Alliance as PssAlliance
 from pssapi.entities import User as PssUser
 
 from . import utils
+from .analytics import columns, diff, timeseries
+from .analytics.diff import CollectionDiff
+from .analytics.timeseries import TimeSeries
+from .core import bulk, offload, tracing, upload, validation
+from .core.bulk import CollectionResult
+from .core.cache import CollectionCache
+from .core.circuit_breaker import CircuitBreaker, CircuitOpenError
 from .core.config import get_config
-from .models.api_models import ApiErrorResponse
+from .core.exceptions import ApiError, InvalidAllianceIdError, InvalidCollectionIdError, InvalidUserIdError
+from .core.instrumentation import InstrumentationHook, RequestMetrics
+from .core.ledger import UploadLedger
+from .core.rate_limit import RateLimiter
+from .core.sync import SyncCheckpoint, SyncResult
+from .core.tracing import Span, Tracer, trace_span
+from .core.upload import CollectionFileStream, UploadResult
+from .core.validation import CollectionFileError
+from .models.api_models import ApiCollection
 from .models.client_models import AllianceHistory, Collection, CollectionMetadata, UserHistory
-from .models.converters import FromAPI, FromResponse, ToAPI
-from .models.enums import ParameterInterval
+from .models.converters import FromResponse, ToAPI
+from .models.enums import ErrorCode, ParameterInterval
+
+
+T = TypeVar("T")
+
+_METRICS_EXTENSION = "pss_fleet_data.request_metrics"
+"""The key of the `httpx.Response.extensions` item holding the `RequestMetrics` of a response."""
+
+_NO_CIRCUIT_BREAKER = nullcontext()
+
+_CHUNKED_CONVERTERS: dict[Callable[[Response], Any], Callable[..., Awaitable[Any]]] = {
+    FromResponse.to_alliance_history_list: FromResponse.to_alliance_history_list_async,
+    FromResponse.to_collection: FromResponse.to_collection_async,
+    FromResponse.to_user_history_list: FromResponse.to_user_history_list_async,
+}
+"""The async converters yielding to the event loop between chunks, replacing the converters of potentially large responses."""
+
+
+def _traced(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Records a span named after the decorated client method, if the client has a tracer. Spans of requests sent
+    and responses processed within the method become its children.
+    """
+
+    @wraps(func)
+    async def wrapper(self: "PssFleetDataClient", *args, **kwargs) -> T:
+        tracer = self.tracer
+        if tracer is None:
+            return await func(self, *args, **kwargs)
+
+        token = tracing.use_tracer(tracer)
+        try:
+            with tracer.start_as_current_span(func.__qualname__):
+                return await func(self, *args, **kwargs)
+        finally:
+            tracing.reset_tracer(token)
+
+    return wrapper
 
 
 class PssFleetDataClient:
@@ -25,6 +81,14 @@ class PssFleetDataClient:
         proxy: Optional[Union[str, URL]] = None,
         request_timeout: Optional[float] = None,
         connect_timeout: Optional[float] = None,
+        hooks: Optional[Iterable[InstrumentationHook]] = None,
+        tracer: Optional[Tracer] = None,
+        cache: Optional[CollectionCache] = None,
+        ledger: Optional[UploadLedger] = None,
+        executor: Optional[Executor] = None,
+        offload_threshold: Optional[int] = None,
+        conversion_chunk_size: Optional[int] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ):
         """Initializes a PSS Fleet Data API client.
 
@@ -34,12 +98,36 @@ class PssFleetDataClient:
             proxy (str | httpx.URL, optional): The proxy server to send the requests through. Defaults to `None`.
             request_timeout (float | int, optional): The request timeout in seconds after which any request gets cancelled. Defaults to `None` (no request timeout).
             connect_timeout (float | int, optional): The connection timeout in seconds after which a connection attempt gets cancelled. Increase, if the connection is bad. Defaults to `5.0`.
+            hooks (Iterable[InstrumentationHook], optional): Hooks to be notified about every request sent and its timings, e.g. a `HistogramCollector`. Defaults to `None`.
+            tracer (Tracer, optional): An OpenTelemetry-compatible tracer to record spans of client method calls, requests, JSON decoding, validation and conversion with. Defaults to `None` (no tracing).
+            cache (CollectionCache, optional): A cache for `Collection`s retrieved by analytics methods like `diff_collections` and `get_time_series`. `get_alliance_from_collection` and `get_user_from_collection` answer from cached `Collection`s without sending requests. Defaults to `None` (no caching).
+            ledger (UploadLedger, optional): A ledger of the content uploaded with `create_collection`, `upload_collection` and `upload_collections`. Content found in it doesn't get uploaded again. Defaults to `None` (no de-duplication).
+            executor (concurrent.futures.Executor, optional): An executor to decode and convert large responses in, so that the event loop stays responsive. With a `ProcessPoolExecutor`, only the decoding and validation of `Collection`s run in a worker process. See `pss_fleet_data.core.offload.create_executor`. The caller is responsible for shutting it down. Defaults to `None` (convert on the event loop).
+            offload_threshold (int, optional): The minimum size in bytes of a response body to be converted in the `executor`. Defaults to `Config.offload_threshold`.
+            conversion_chunk_size (int, optional): The number of `User`s, `Alliance`s or history items to convert on the event loop before yielding to other tasks. Defaults to `Config.conversion_chunk_size`.
+            circuit_breaker (CircuitBreaker, optional): Stops sending requests while the API is failing. Requests raise a `CircuitOpenError` instead, while it's open. State changes get reported to the `hooks`. Defaults to `None` (always send requests).
+
+        Raises:
+            TypeError: Raised, if `offload_threshold` or `conversion_chunk_size` is not of type `int`.
+            ValueError: Raised, if `offload_threshold` or `conversion_chunk_size` is lower than 1.
         """
         base_url = utils.ensure.str_or_url(base_url, "base_url", default=get_config().default_base_url)
         self.__api_key = utils.ensure.str_(api_key, "api_key")
         self.__proxy = utils.ensure.str_or_url(proxy, "proxy")
         self.__connect_timeout = utils.ensure.positive_float_or_int(connect_timeout, "connect_timeout", default=5.0)
         self.__request_timeout = utils.ensure.positive_float_or_int(request_timeout, "request_timeout")
+        self.__hooks: tuple[InstrumentationHook, ...] = tuple(hooks or ())
+        self.__tracer: Optional[Tracer] = tracer
+        self.__cache: Optional[CollectionCache] = cache
+        self.__ledger: Optional[UploadLedger] = ledger
+        # Set, when the upload of the content with the hash has finished, so that uploads of identical content wait for it instead of sending it again.
+        self.__uploads_in_flight: dict[str, asyncio.Event] = {}
+        self.__executor: Optional[Executor] = executor
+        self.__offload_threshold: int = utils.ensure.positive_int(offload_threshold, "offload_threshold", default=get_config().offload_threshold)
+        self.__conversion_chunk_size: int = utils.ensure.positive_int(
+            conversion_chunk_size, "conversion_chunk_size", default=get_config().conversion_chunk_size
+        )
+        self.__circuit_breaker: Optional[CircuitBreaker] = circuit_breaker
 
         timeout_config = Timeout(self.request_timeout, connect=self.connect_timeout)
         self.__http_client = AsyncClient(base_url=base_url, proxy=self.proxy, timeout=timeout_config)
@@ -59,6 +147,20 @@ class PssFleetDataClient:
         """
         return self.__http_client.base_url
 
+    @property
+    def cache(self) -> Optional[CollectionCache]:
+        """
+        The cache for `Collection`s retrieved by analytics methods. `None`, if `Collection`s don't get cached.
+        """
+        return self.__cache
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """
+        The circuit breaker stopping requests while the API is failing. `None`, if requests always get sent.
+        """
+        return self.__circuit_breaker
+
     @property
     def connect_timeout(self) -> float:
         """
@@ -66,6 +168,41 @@ class PssFleetDataClient:
         """
         return float(self.__connect_timeout)
 
+    @property
+    def conversion_chunk_size(self) -> int:
+        """
+        The number of `User`s, `Alliance`s or history items converted on the event loop before yielding to other tasks.
+        """
+        return self.__conversion_chunk_size
+
+    @property
+    def executor(self) -> Optional[Executor]:
+        """
+        The executor large responses get decoded and converted in. `None`, if all responses get converted on the event loop.
+        """
+        return self.__executor
+
+    @property
+    def hooks(self) -> tuple[InstrumentationHook, ...]:
+        """
+        The instrumentation hooks passed to the client at creation. They get notified about every request sent and its timings.
+        """
+        return self.__hooks
+
+    @property
+    def ledger(self) -> Optional[UploadLedger]:
+        """
+        The ledger of the content uploaded. Content found in it doesn't get uploaded again.
+        """
+        return self.__ledger
+
+    @property
+    def offload_threshold(self) -> int:
+        """
+        The minimum size in bytes of a response body to be converted in the `executor`.
+        """
+        return self.__offload_threshold
+
     @property
     def proxy(self) -> Optional[str]:
         """
@@ -80,8 +217,16 @@ class PssFleetDataClient:
         """
         return float(self.__request_timeout) if self.__request_timeout is not None else None
 
+    @property
+    def tracer(self) -> Optional[Tracer]:
+        """
+        The tracer passed to the client at creation. `None`, if tracing is disabled.
+        """
+        return self.__tracer
+
     # Operations
 
+    @_traced
     async def get_home_page(self) -> str:
         """Return the home page of the API.
 
@@ -91,8 +236,10 @@ class PssFleetDataClient:
         response = await self._get("/")
         return response.text
 
+    @_traced
     async def create_collection(self, collection: Collection, api_key: Optional[str] = None) -> CollectionMetadata:
         """Add a `Collection` of the latest schema version (version 9) to the API.
+        If the client has a `ledger`, identical content that has been created before doesn't get sent again.
 
         Args:
             collection (Collection): The `Collection` of schema version 9 to be added.
@@ -119,18 +266,31 @@ class PssFleetDataClient:
             CollectionMetadata: The metadata of the newly created `Collection`.
         """
         api_collection = ToAPI.from_collection(collection)
-        request_json = json.loads(api_collection.model_dump_json())
+        content = api_collection.model_dump_json()
         api_key = api_key or self.api_key
 
-        response = await self._post_with_api_key(
-            "/collections",
-            api_key=api_key,
-            json=request_json,
-        )
+        content_hash = None
+        if self.__ledger is not None:
+            content_hash = UploadLedger.hash_content(content.encode())
+            recorded_collection_metadata = await self._wait_for_upload_in_flight(content_hash)
+            if recorded_collection_metadata is not None:
+                return recorded_collection_metadata
 
-        result = FromResponse.to_collection_metadata(response)
+        try:
+            response = await self._post_with_api_key(
+                "/collections",
+                api_key=api_key,
+                json=json.loads(content),
+            )
+
+            result = await self._convert_response(response, FromResponse.to_collection_metadata)
+            if content_hash is not None:
+                await self.__ledger.put_async(content_hash, result)
+        finally:
+            self._finish_upload_in_flight(content_hash)
         return result
 
+    @_traced
     async def delete_collection(self, collection_id: int, api_key: Optional[str] = None) -> bool:
         """Deletes the `Collection` with the given `collection_id`.
 
@@ -155,9 +315,88 @@ class PssFleetDataClient:
         _ = await self._delete_with_api_key(
             f"/collections/{collection_id}",
             api_key=api_key,
+            route="/collections/{collection_id}",
         )
         return True
 
+    @_traced
+    async def delete_collections(
+        self,
+        collection_ids: Iterable[int],
+        max_concurrency: int = 4,
+        rate_limiter: Optional[RateLimiter] = None,
+        dry_run: bool = False,
+        api_key: Optional[str] = None,
+    ) -> list[CollectionResult]:
+        """Deletes many `Collection`s concurrently. Errors don't stop the other deletions, but get reported per `Collection`.
+
+        Args:
+            collection_ids (Iterable[int]): The `collection_id`s of the `Collection`s to be deleted.
+            max_concurrency (int, optional): The maximum number of `Collection`s to be deleted at the same time. Defaults to `4`.
+            rate_limiter (RateLimiter, optional): Limits the rate of requests. Share it between bulk operations to limit their combined rate. Defaults to `None`.
+            dry_run (bool, optional): Don't delete anything, but check which `Collection`s exist. The existing `Collection`s get retrieved with `get_collections`.
+            Defaults to `False`.
+            api_key (str, optional): The API key to send for authorization. Defaults to the `api_key` passed to the constructor of `PssFleetDataClient`.
+
+        Raises:
+            TypeError: Raised, if `max_concurrency` is not of type `int`.\n
+            ValueError: Raised, if `max_concurrency` is lower than 1.\n
+            ApiError: Raised, if `dry_run` is `True` and the existing `Collection`s can't be retrieved. See `get_collections`.
+
+        Returns:
+            list[CollectionResult]: One result per `collection_id` in the given order, holding the error raised, e.g. a `CollectionNotFoundError`.
+            In a dry run, holding the metadata of the existing `Collection` or a `CollectionNotFoundError`.
+        """
+        collection_ids = list(collection_ids)
+        max_concurrency = utils.ensure.positive_int(max_concurrency, "max_concurrency")
+        api_key = api_key or self.api_key
+
+        if dry_run:
+            collection_metadatas_by_id = await self._get_collection_metadatas_by_id(collection_ids)
+            return [
+                (
+                    CollectionResult(collection_id=collection_id, metadata=collection_metadatas_by_id[collection_id], dry_run=True)
+                    if collection_id in collection_metadatas_by_id
+                    else CollectionResult(collection_id=collection_id, error=bulk.create_collection_not_found_error(collection_id), dry_run=True)
+                )
+                for collection_id in collection_ids
+            ]
+
+        async def delete_collection(collection_id: int) -> CollectionResult:
+            try:
+                _ = await self.delete_collection(collection_id, api_key=api_key)
+            except (ApiError, CircuitOpenError, HTTPError) as e:
+                return CollectionResult(collection_id=collection_id, error=e)
+            return CollectionResult(collection_id=collection_id)
+
+        return await self._run_concurrently(
+            (partial(delete_collection, collection_id) for collection_id in collection_ids), max_concurrency, rate_limiter
+        )
+
+    @_traced
+    async def diff_collections(self, collection_id_before: int, collection_id_after: int, changed_only: bool = False) -> CollectionDiff:
+        """Retrieves two `Collection`s concurrently and computes the changes of `User`s and `Alliance`s between them.
+        The `User`s and `Alliance`s don't get converted to `pssapi` entities, which makes this a lot faster than calling `get_collection` twice.
+        `Collection`s found in the client's `cache` don't get requested.
+
+        Args:
+            collection_id_before (int): The `collection_id` of the older `Collection`.
+            collection_id_after (int): The `collection_id` of the newer `Collection`.
+            changed_only (bool, optional): Only include `User`s and `Alliance`s that changed in any way. Defaults to `False`.
+
+        Raises:
+            CollectionNotFoundError: Raised, if a `Collection` with one of the provided `collection_id`s was not found.\n
+            InvalidCollectionIdError: Raised, if the path parameter `collection_id` received a value that can't be parsed to `int`.\n
+            TooManyRequestsError: Raised, if the client is sending too many requests and is getting rate-limited.\n
+            ServerError: Raised, if an internal server error occurs.
+
+        Returns:
+            CollectionDiff: The changes between the `Collection`s. See `pss_fleet_data.analytics.diff_collections`.
+        """
+        before, after = await self._get_api_collections((collection_id_before, collection_id_after))
+        return diff.diff_collections(before, after, changed_only=changed_only)
+
+    @_traced
     async def get_alliance_history(
         self,
         alliance_id: int,
@@ -205,12 +444,15 @@ class PssFleetDataClient:
             desc=desc,
             skip=skip,
             take=take,
+            route="/allianceHistory/{alliance_id}",
         )
-        alliance_histories = FromResponse.to_alliance_history_list(response)
+        alliance_histories = await self._convert_response(response, FromResponse.to_alliance_history_list)
         return alliance_histories
 
+    @_traced
     async def get_alliance_from_collection(self, collection_id: int, alliance_id: int) -> AllianceHistory:
         """Retrieves data of a specific `Alliance` from a specific `Collection`. Includes the `Alliance`'s members, if applicable.
+        If the `Collection` is in the client's `cache`, the data is taken from there without sending a request.
 
         Args:
             collection_id (int): The `collection_id` of the `Collection` to obtain the data from.
@@ -227,10 +469,22 @@ class PssFleetDataClient:
         Returns:
             AllianceHistory: An object containing the metadata of the `Collection`, the `Alliance` data and optional `User`s data.
         """
-        response = await self._get(f"/collections/{collection_id}/alliances/{alliance_id}")
-        alliance_history = FromResponse.to_alliance_history(response)
+        resolver = None
+        if self.__cache is not None:
+            # Parse the ids like the API does, so that cached `Collection`s get found and invalid ids raise the same errors.
+            collection_id = _parse_path_id(collection_id, "collectionId", InvalidCollectionIdError, ErrorCode.PARAMETER_COLLECTION_ID_INVALID)
+            alliance_id = _parse_path_id(alliance_id, "allianceId", InvalidAllianceIdError, ErrorCode.PARAMETER_ALLIANCE_ID_INVALID)
+            resolver = await self.__cache.get_resolver_async(collection_id)
+        if resolver is not None:
+            return resolver.get_alliance_history(alliance_id)
+
+        response = await self._get(
+            f"/collections/{collection_id}/alliances/{alliance_id}", route="/collections/{collection_id}/alliances/{alliance_id}"
+        )
+        alliance_history = await self._convert_response(response, FromResponse.to_alliance_history)
         return alliance_history
 
+    @_traced
     async def get_alliances_from_collection(self, collection_id: int) -> tuple[Optional[CollectionMetadata], list[PssAlliance]]:
         """Retrieves all `Alliance` data from a the specified `Collection` without their members.
 
@@ -246,14 +500,15 @@ class PssFleetDataClient:
         Returns:
             tuple[CollectionMetadata, list[pssapi.entities.Alliance]]: The metadata of the requested `Collection` and its `Alliance` data. Does not include any `User` data.
         """
-        response = await self._get(f"/collections/{collection_id}/alliances")
-        collection = FromResponse.to_collection(response)
+        response = await self._get(f"/collections/{collection_id}/alliances", route="/collections/{collection_id}/alliances")
+        collection = await self._convert_response(response, FromResponse.to_collection)
 
         if not collection:
             return None, []
 
         return (collection.metadata, collection.alliances)
 
+    @_traced
     async def get_collection(self, collection_id: int) -> Collection:
         """Retrieves all data from the `Collection` with the specified `collection_id`.
 
@@ -269,10 +524,11 @@ class PssFleetDataClient:
         Returns:
             Collection: The requested `Collection`.
         """
-        response = await self._get(f"/collections/{collection_id}")
-        collection = FromResponse.to_collection(response)
+        response = await self._get(f"/collections/{collection_id}", route="/collections/{collection_id}")
+        collection = await self._convert_response(response, FromResponse.to_collection)
         return collection
 
+    @_traced
     async def get_collections(
         self,
         from_date: Optional[datetime] = None,
@@ -317,9 +573,10 @@ class PssFleetDataClient:
             skip=skip,
             take=take,
         )
-        collections = FromResponse.to_collection_metadata_list(response)
+        collections = await self._convert_response(response, FromResponse.to_collection_metadata_list)
         return collections
 
+    @_traced
     async def get_most_recent_collection_by_timestamp(self, timestamp: datetime) -> Optional[Collection]:
         """Retrieves the most recent `Collection` that was recorded before or at the given `timestamp`.
         Checks, if there's one been recorded within an hour before the given `timestamp`.
@@ -346,6 +603,7 @@ class PssFleetDataClient:
             return collection
         return None
 
+    @_traced
     async def get_most_recent_collection_metadata_by_timestamp(self, timestamp: datetime) -> Optional[CollectionMetadata]:
         """Retrieves the metadata of the most recent `Collection` that was recorded before or at the given `timestamp`.
         Checks, if there's one been recorded within an hour before the given `timestamp`.
@@ -379,6 +637,42 @@ class PssFleetDataClient:
                 return collection_metadatas[0]
         return None
 
+    @_traced
+    async def get_time_series(
+        self,
+        collection_ids: Iterable[int],
+        fields: Iterable[str] = ("trophy",),
+        user_ids: Optional[Iterable[int]] = None,
+        max_concurrency: int = 4,
+    ) -> dict[str, TimeSeries]:
+        """Retrieves many `Collection`s concurrently and builds time series of the requested `User` fields from them.
+        This replaces one call to `get_user_history` per `User`. `Collection`s found in the client's `cache` don't get requested.
+
+        Args:
+            collection_ids (Iterable[int]): The `collection_id`s of the `Collection`s to take the values from.
+            fields (Iterable[str], optional): The names of the `User` fields, e.g. `trophy`, `alliance_score` or `championship_score`.
+            See `pss_fleet_data.analytics.columns.USER_FIELDS`. Defaults to `("trophy",)`.
+            user_ids (Iterable[int], optional): The IDs of the `User`s to include. Defaults to `None` (all `User`s in any of the `Collection`s).
+            max_concurrency (int, optional): The maximum number of `Collection`s to be requested at the same time. Defaults to `4`.
+
+        Raises:
+            CollectionNotFoundError: Raised, if a `Collection` with one of the provided `collection_id`s was not found.\n
+            InvalidCollectionIdError: Raised, if the path parameter `collection_id` received a value that can't be parsed to `int`.\n
+            TooManyRequestsError: Raised, if the client is sending too many requests and is getting rate-limited.\n
+            ServerError: Raised, if an internal server error occurs.\n
+            TypeError: Raised, if `max_concurrency` is not of type `int`.\n
+            ValueError: Raised, if an unknown field has been requested or if `max_concurrency` is lower than 1.
+
+        Returns:
+            dict[str, TimeSeries]: The time series by field name. See `pss_fleet_data.analytics.build_time_series`.
+        """
+        fields = columns.check_user_fields(fields)
+        max_concurrency = utils.ensure.positive_int(max_concurrency, "max_concurrency")
+
+        api_collections = await self._get_api_collections(collection_ids, max_concurrency=max_concurrency)
+        return timeseries.build_time_series(api_collections, fields, user_ids=user_ids)
+
+    @_traced
     async def get_top_100_users_from_collection(
         self,
         collection_id: int,
@@ -404,16 +698,23 @@ class PssFleetDataClient:
         Returns:
             tuple[CollectionMetadata, list[pssapi.entities.User]]: The metadata of the requested `Collection` and its top 100 `User` data. Does not include any `Alliance` data.
         """
-        response = await self._get_with_filter_parameters(f"/collections/{collection_id}/top100Users", skip=skip, take=take)
-        collection = FromResponse.to_collection(response)
+        response = await self._get_with_filter_parameters(
+            f"/collections/{collection_id}/top100Users",
+            skip=skip,
+            take=take,
+            route="/collections/{collection_id}/top100Users",
+        )
+        collection = await self._convert_response(response, FromResponse.to_collection)
 
         if not collection:
             return None, []
 
         return (collection.metadata, collection.users)
 
+    @_traced
     async def get_user_from_collection(self, collection_id: int, user_id: int) -> UserHistory:
         """Retrieves data of a specific `User` from a specific `Collection`. Includes the `User`'s `Alliance`, if applicable.
+        If the `Collection` is in the client's `cache`, the data is taken from there without sending a request.
 
         Args:
             collection_id (int): The `collection_id` of the `Collection` to obtain the data from.
@@ -430,10 +731,20 @@ class PssFleetDataClient:
         Returns:
             UserHistory: An object containing the metadata of the `Collection`, the `User` data and optional `Alliance` data.
         """
-        response = await self._get(f"/collections/{collection_id}/users/{user_id}")
-        user_history = FromResponse.to_user_history(response)
+        resolver = None
+        if self.__cache is not None:
+            # Parse the ids like the API does, so that cached `Collection`s get found and invalid ids raise the same errors.
+            collection_id = _parse_path_id(collection_id, "collectionId", InvalidCollectionIdError, ErrorCode.PARAMETER_COLLECTION_ID_INVALID)
+            user_id = _parse_path_id(user_id, "userId", InvalidUserIdError, ErrorCode.PARAMETER_USER_ID_INVALID)
+            resolver = await self.__cache.get_resolver_async(collection_id)
+        if resolver is not None:
+            return resolver.get_user_history(user_id)
+
+        response = await self._get(f"/collections/{collection_id}/users/{user_id}", route="/collections/{collection_id}/users/{user_id}")
+        user_history = await self._convert_response(response, FromResponse.to_user_history)
         return user_history
 
+    @_traced
     async def get_users_from_collection(self, collection_id: int) -> tuple[CollectionMetadata, list[PssUser]]:
         """Retrieves all `User` data from a the specified `Collection` without their `Alliance`s.
 
@@ -449,14 +760,15 @@ class PssFleetDataClient:
         Returns:
             tuple[CollectionMetadata, list[pssapi.entities.User]]: The metadata of the requested `Collection` and its `User` data. Does not include any `Alliance` data.
         """
-        response = await self._get(f"/collections/{collection_id}/users")
-        collection = FromResponse.to_collection(response)
+        response = await self._get(f"/collections/{collection_id}/users", route="/collections/{collection_id}/users")
+        collection = await self._convert_response(response, FromResponse.to_collection)
 
         if not collection:
             return None, []
 
         return (collection.metadata, collection.users)
 
+    @_traced
     async def get_user_history(
         self,
         user_id: int,
@@ -504,10 +816,12 @@ class PssFleetDataClient:
             desc=desc,
             skip=skip,
             take=take,
+            route="/userHistory/{user_id}",
         )
-        user_histories = FromResponse.to_user_history_list(response)
+        user_histories = await self._convert_response(response, FromResponse.to_user_history_list)
         return user_histories
 
+    @_traced
     async def ping(self) -> str:
         """Sends a ping to the API.
 
@@ -517,15 +831,111 @@ class PssFleetDataClient:
         response = await self._get("/ping")
         return response.json()["ping"]
 
-    async def update_collection(self, collection_id: int, file_path: Union[str, Path], api_key: Optional[str] = None) -> CollectionMetadata:
+    @_traced
+    async def sync_collections(
+        self,
+        cache: Optional[CollectionCache] = None,
+        checkpoint: Optional[SyncCheckpoint] = None,
+        max_concurrency: int = 4,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> SyncResult:
+        """Mirrors the `Collection`s of the API into a local store. Lists the `Collection`s created since the `checkpoint` with `get_collections`
+        and downloads those missing from the store concurrently. Afterwards, the checkpoint gets moved to the newest `Collection` up to which the store
+        is complete. An interrupted sync can be resumed, because stored `Collection`s don't get downloaded again.
+
+        Args:
+            cache (CollectionCache, optional): The store. Must have a `directory`. Defaults to the `cache` passed to the constructor of `PssFleetDataClient`.
+            checkpoint (SyncCheckpoint, optional): The checkpoint of the last sync. Defaults to `None` (list all `Collection`s).
+            max_concurrency (int, optional): The maximum number of `Collection`s to be downloaded at the same time. Defaults to `4`.
+            rate_limiter (RateLimiter, optional): Limits the rate of requests. Share it between bulk operations to limit their combined rate. Defaults to `None`.
+
+        Raises:
+            TypeError: Raised, if `max_concurrency` is not of type `int`.\n
+            ValueError: Raised, if there's no cache with a `directory` or if `max_concurrency` is lower than 1.\n
+            ApiError: Raised, if the `Collection`s can't be listed. See `get_collections`.\n
+            OSError: Raised, if the checkpoint can't be written.
+
+        Returns:
+            SyncResult: The `Collection`s downloaded and skipped, the errors raised per `collection_id` and the newest `Collection` up to which the store is complete.
+        """
+        if cache is None:
+            cache = self.__cache
+        if cache is None or cache.directory is None:
+            raise ValueError("Syncing requires a `CollectionCache` with a `directory`.")
+        max_concurrency = utils.ensure.positive_int(max_concurrency, "max_concurrency")
+
+        from_date = checkpoint.timestamp if checkpoint is not None else None
+        collection_metadatas = await self._get_all_collection_metadatas(from_date=from_date)
+        missing_collection_metadatas = [
+            collection_metadata for collection_metadata in collection_metadatas if collection_metadata.collection_id not in cache
+        ]
+
+        async def download_collection(collection_id: int) -> Optional[Exception]:
+            try:
+                response = await self._get(f"/collections/{collection_id}", route="/collections/{collection_id}")
+                await cache.put_async(await self._convert_response(response, FromResponse.to_api_collection))
+            except (ApiError, CircuitOpenError, HTTPError, OSError) as e:
+                return e
+            return None
+
+        errors = await self._run_concurrently(
+            (partial(download_collection, collection_metadata.collection_id) for collection_metadata in missing_collection_metadatas),
+            max_concurrency,
+            rate_limiter,
+        )
+        errors_by_collection_id = {
+            collection_metadata.collection_id: error
+            for collection_metadata, error in zip(missing_collection_metadatas, errors, strict=True)
+            if error is not None
+        }
+
+        # The store is complete up to the first failed download. The next sync lists the failed `Collection`s again.
+        new_checkpoint = None
+        for collection_metadata in collection_metadatas:
+            if collection_metadata.collection_id in errors_by_collection_id:
+                break
+            new_checkpoint = collection_metadata
+        if checkpoint is not None and new_checkpoint is not None:
+            await checkpoint.save_async(new_checkpoint)
+
+        missing_collection_ids = {collection_metadata.collection_id for collection_metadata in missing_collection_metadatas}
+        return SyncResult(
+            downloaded=[
+                collection_metadata
+                for collection_metadata in missing_collection_metadatas
+                if collection_metadata.collection_id not in errors_by_collection_id
+            ],
+            skipped=[
+                collection_metadata for collection_metadata in collection_metadatas if collection_metadata.collection_id not in missing_collection_ids
+            ],
+            errors=errors_by_collection_id,
+            checkpoint=new_checkpoint,
+        )
+
+    @_traced
+    async def update_collection(
+        self,
+        collection_id: int,
+        file_path: Union[str, Path],
+        api_key: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        compress: bool = False,
+        validate: bool = False,
+    ) -> CollectionMetadata:
         """Uploads the `Collection` at the given `file_path` to overwrite the data of the specified `collection_id`.
+        The file gets streamed in chunks read in a worker thread, so the event loop doesn't get blocked.
 
         Args:
             colection_id (int): The `collectionId` of the `Collection` file to be updated.
             file_path (str | Path): The path to the `Collection` file to be uploaded.
             api_key (str, optional): The API key to send for authorization. Defaults to the `api_key` passed to the constructor of `PssFleetDataClient`.
+            chunk_size (int, optional): The number of bytes to read and send at once. Defaults to `Config.upload_chunk_size`.
+            compress (bool, optional): Experimental. Compress the upload with gzip on the fly. The API server may not accept `Content-Encoding: gzip`,
+            so leave it off, unless the server is known to support it. Defaults to `False`.
+            validate (bool, optional): Validate the file locally before uploading it, so that invalid files don't get transferred. Defaults to `False`.
 
         Raises:
+            CollectionFileError: Raised, if `validate` is `True` and the file doesn't match the schema expected by the API.\n
             ConflictError: Raised, if the `timestamp` of the file to be uploaded differs from the `timestamp` of the `Collection` to be updated.\n
             InvalidBoolError: Raised, if a parameter expecting a value of type `bool` received a value that can't be parsed to `bool`. Can also be part of a body parameter.\n
             InvalidDateTimeError: Raised, if a parameter expecting a value of type `datetime` received a value that can't be parsed to `datetime`. Can also be part of a body parameter.\n
@@ -549,26 +959,113 @@ class PssFleetDataClient:
             raise TypeError("Parameter `file` must be of type `str`.")
 
         api_key = api_key or self.api_key
+        if validate:
+            await asyncio.to_thread(validation.validate_collection_file, file_path, chunk_size)
 
-        with open(file_path, "rb") as fp:
-            files = {"collection_file": ("collection", fp, "application/json")}
-            response = await self._put_with_api_key(
-                f"/collections/upload/{collection_id}",
-                api_key=api_key,
-                files=files,
-            )
+        stream = CollectionFileStream(file_path, chunk_size=chunk_size, compress=compress)
+        response = await self._put_with_api_key(
+            f"/collections/upload/{collection_id}",
+            api_key=api_key,
+            content=stream,
+            headers=stream.get_headers(),
+            route="/collections/upload/{collection_id}",
+        )
 
-        result = FromResponse.to_collection_metadata(response)
+        result = await self._convert_response(response, FromResponse.to_collection_metadata)
         return result
 
-    async def upload_collection(self, file_path: Union[str, Path], api_key: Optional[str] = None) -> CollectionMetadata:
+    @_traced
+    async def update_collections(
+        self,
+        file_paths_by_collection_id: Mapping[int, Union[str, Path]],
+        max_concurrency: int = 4,
+        rate_limiter: Optional[RateLimiter] = None,
+        dry_run: bool = False,
+        api_key: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        compress: bool = False,
+        validate: bool = False,
+    ) -> list[CollectionResult]:
+        """Updates many `Collection`s concurrently with the data of the given `Collection` files. See `update_collection`.
+        Errors don't stop the other updates, but get reported per `Collection`.
+
+        Args:
+            file_paths_by_collection_id (Mapping[int, str | Path]): The paths to the `Collection` files to be uploaded by the `collection_id` of the
+            `Collection` to be updated.
+            max_concurrency (int, optional): The maximum number of `Collection`s to be updated at the same time. Defaults to `4`.
+            rate_limiter (RateLimiter, optional): Limits the rate of requests. Share it between bulk operations to limit their combined rate. Defaults to `None`.
+            dry_run (bool, optional): Don't upload anything, but check which `Collection`s exist and have the timestamp of their file.
+            The existing `Collection`s get retrieved with `get_collections`. Defaults to `False`.
+            api_key (str, optional): The API key to send for authorization. Defaults to the `api_key` passed to the constructor of `PssFleetDataClient`.
+            chunk_size (int, optional): The number of bytes to read and send at once. Defaults to `Config.upload_chunk_size`.
+            compress (bool, optional): Experimental. Compress the uploads with gzip on the fly. The API server may not accept `Content-Encoding: gzip`,
+            so leave it off, unless the server is known to support it. Defaults to `False`.
+            validate (bool, optional): Validate every file locally, also in a dry run. Invalid files get reported with a `CollectionFileError`. Defaults to `False`.
+
+        Raises:
+            TypeError: Raised, if any of the file paths is not of type `str` or `Path` or if `max_concurrency` or `chunk_size` is not of type `int`.\n
+            ValueError: Raised, if `max_concurrency` or `chunk_size` is lower than 1.\n
+            ApiError: Raised, if `dry_run` is `True` and the existing `Collection`s can't be retrieved. See `get_collections`.
+
+        Returns:
+            list[CollectionResult]: One result per `Collection` in the order of `file_paths_by_collection_id`, holding either the metadata of the updated
+            `Collection` or the error raised, e.g. a `ConflictError`. In a dry run, holding the metadata of the existing `Collection` or the error expected.
+        """
+        if any(not isinstance(file_path, (str, Path)) for file_path in file_paths_by_collection_id.values()):
+            raise TypeError("The file paths must be of type `str` or `Path`.")
+
+        file_paths_by_collection_id = {collection_id: Path(file_path) for collection_id, file_path in file_paths_by_collection_id.items()}
+        max_concurrency = utils.ensure.positive_int(max_concurrency, "max_concurrency")
+        chunk_size = utils.ensure.positive_int(chunk_size, "chunk_size")
+        api_key = api_key or self.api_key
+
+        if dry_run:
+            collection_metadatas_by_id = await self._get_collection_metadatas_by_id(file_paths_by_collection_id.keys())
+            return await asyncio.gather(
+                *(
+                    self._check_collection_update(collection_id, file_path, collection_metadatas_by_id.get(collection_id), chunk_size, validate)
+                    for collection_id, file_path in file_paths_by_collection_id.items()
+                )
+            )
+
+        async def update_collection(collection_id: int, file_path: Path) -> CollectionResult:
+            try:
+                collection_metadata = await self.update_collection(
+                    collection_id, file_path, api_key=api_key, chunk_size=chunk_size, compress=compress, validate=validate
+                )
+            except (ApiError, CircuitOpenError, CollectionFileError, HTTPError, OSError) as e:
+                return CollectionResult(collection_id=collection_id, error=e)
+            return CollectionResult(collection_id=collection_id, metadata=collection_metadata)
+
+        return await self._run_concurrently(
+            (partial(update_collection, collection_id, file_path) for collection_id, file_path in file_paths_by_collection_id.items()),
+            max_concurrency,
+            rate_limiter,
+        )
+
+    @_traced
+    async def upload_collection(
+        self,
+        file_path: Union[str, Path],
+        api_key: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        compress: bool = False,
+        validate: bool = False,
+    ) -> CollectionMetadata:
         """Uploads the `Collection` at the given `file_path`.
+        The file gets streamed in chunks read in a worker thread, so the event loop doesn't get blocked.
+        If the client has a `ledger`, a file with content that has been uploaded before doesn't get uploaded again.
 
         Args:
             file_path (str | Path): The path to the `Collection` file to be uploaded.
             api_key (str, optional): The API key to send for authorization. Defaults to the `api_key` passed to the constructor of `PssFleetDataClient`.
+            chunk_size (int, optional): The number of bytes to read and send at once. Defaults to `Config.upload_chunk_size`.
+            compress (bool, optional): Experimental. Compress the upload with gzip on the fly. The API server may not accept `Content-Encoding: gzip`,
+            so leave it off, unless the server is known to support it. Defaults to `False`.
+            validate (bool, optional): Validate the file locally before uploading it, so that invalid files don't get transferred. Defaults to `False`.
 
         Raises:
+            CollectionFileError: Raised, if `validate` is `True` and the file doesn't match the schema expected by the API.\n
             InvalidBoolError: Raised, if a parameter expecting a value of type `bool` received a value that can't be parsed to `bool`. Can also be part of a body parameter.\n
             InvalidDateTimeError: Raised, if a parameter expecting a value of type `datetime` received a value that can't be parsed to `datetime`. Can also be part of a body parameter.\n
             InvalidJsonUpload: Raised, if the uploaded JSON file is invalid.\n
@@ -591,26 +1088,124 @@ class PssFleetDataClient:
         if not isinstance(file_path, (str, Path)):
             raise TypeError("Parameter `file` must be of type `str`.")
 
+        upload_result = await self._upload_collection_file(Path(file_path), api_key or self.api_key, chunk_size, compress, validate)
+        return upload_result.metadata
+
+    @_traced
+    async def upload_collections(
+        self,
+        file_paths: Union[str, Path, Iterable[Union[str, Path]]],
+        max_concurrency: int = 4,
+        skip_existing: bool = False,
+        api_key: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        compress: bool = False,
+        validate: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> list[UploadResult]:
+        """Uploads many `Collection` files concurrently. Files get streamed in chunks read in a worker thread, so the event loop doesn't get blocked.
+        Errors don't stop the other uploads, but get reported per file. If the client has a `ledger`, files with content that has been uploaded before get skipped.
+        Identical files in the same batch get uploaded once, the others wait for that upload and get skipped.
+
+        Args:
+            file_paths (str | Path | Iterable[str | Path]): A directory or paths to `Collection` files and directories. Directories get replaced
+            with the JSON files in them, sorted by name.
+            max_concurrency (int, optional): The maximum number of files to be uploaded at the same time. Defaults to `4`.
+            skip_existing (bool, optional): Skip files with a timestamp, for which a `Collection` already exists, e.g. to resume an interrupted
+            upload. The existing timestamps get retrieved with `get_collections`. Defaults to `False`.
+            api_key (str, optional): The API key to send for authorization. Defaults to the `api_key` passed to the constructor of `PssFleetDataClient`.
+            chunk_size (int, optional): The number of bytes to read and send at once. Defaults to `Config.upload_chunk_size`.
+            compress (bool, optional): Experimental. Compress the uploads with gzip on the fly. The API server may not accept `Content-Encoding: gzip`,
+            so leave it off, unless the server is known to support it. Defaults to `False`.
+            validate (bool, optional): Validate every file locally before uploading it. Invalid files get reported with a `CollectionFileError`. Defaults to `False`.
+            rate_limiter (RateLimiter, optional): Limits the rate of requests. Share it between bulk operations to limit their combined rate. Defaults to `None`.
+
+        Raises:
+            TypeError: Raised, if any of the `file_paths` is not of type `str` or `Path` or if `max_concurrency` or `chunk_size` is not of type `int`.\n
+            ValueError: Raised, if `max_concurrency` or `chunk_size` is lower than 1.\n
+            ApiError: Raised, if `skip_existing` is `True` and the existing `Collection`s can't be retrieved. See `get_collections`.
+
+        Returns:
+            list[UploadResult]: One result per file in the order of `file_paths`, holding either the metadata of the `Collection` created or the error raised,
+            e.g. a `NonUniqueTimestampError`.
+        """
+        file_paths = upload.get_collection_file_paths(file_paths)
+        max_concurrency = utils.ensure.positive_int(max_concurrency, "max_concurrency")
+        chunk_size = utils.ensure.positive_int(chunk_size, "chunk_size")
         api_key = api_key or self.api_key
 
-        with open(file_path, "rb") as fp:
-            files = {"collection_file": ("collection", fp, "application/json")}
-            response = await self._post_with_api_key(
-                "/collections/upload",
-                api_key=api_key,
-                files=files,
+        skipped_file_paths = set()
+        if skip_existing and file_paths:
+            skipped_file_paths = await self._get_existing_collection_file_paths(file_paths)
+
+        async def upload_collection_file(file_path: Path) -> UploadResult:
+            try:
+                return await self._upload_collection_file(file_path, api_key, chunk_size, compress, validate)
+            except (ApiError, CircuitOpenError, CollectionFileError, HTTPError, OSError) as e:
+                return UploadResult(file_path=file_path, error=e)
+
+        uploaded_results = iter(
+            await self._run_concurrently(
+                (partial(upload_collection_file, file_path) for file_path in file_paths if file_path not in skipped_file_paths),
+                max_concurrency,
+                rate_limiter,
             )
+        )
+        return [
+            UploadResult(file_path=file_path, skipped=True) if file_path in skipped_file_paths else next(uploaded_results) for file_path in file_paths
+        ]
 
-        result = FromResponse.to_collection_metadata(response)
-        return result
+    async def _check_collection_update(
+        self,
+        collection_id: int,
+        file_path: Path,
+        collection_metadata: Optional[CollectionMetadata],
+        chunk_size: Optional[int],
+        validate: bool,
+    ) -> CollectionResult:
+        """Checks, if a `Collection` can be updated with a `Collection` file without uploading it. See `update_collections`.
+
+        Args:
+            collection_id (int): The `collection_id` of the `Collection` to be updated.
+            file_path (Path): The path to the `Collection` file.
+            collection_metadata (CollectionMetadata, optional): The metadata of the existing `Collection`. `None`, if it doesn't exist.
+            chunk_size (int, optional): The number of bytes to read at once while validating. `None` means `Config.upload_chunk_size`.
+            validate (bool): Validate the file locally.
 
-    async def _delete(self, path: str, params: Optional[dict[str, Any]] = None, headers: Optional[dict[str, Any]] = None) -> Response:
+        Returns:
+            CollectionResult: A dry run result holding the metadata of the existing `Collection` or the error expected.
+        """
+        if collection_metadata is None:
+            return CollectionResult(collection_id=collection_id, error=bulk.create_collection_not_found_error(collection_id), dry_run=True)
+
+        try:
+            if validate:
+                await asyncio.to_thread(validation.validate_collection_file, file_path, chunk_size)
+            file_timestamp = await asyncio.to_thread(upload.read_collection_timestamp, file_path)
+        except (OSError, ValueError) as e:
+            # Includes `CollectionFileError`.
+            return CollectionResult(collection_id=collection_id, error=e, dry_run=True)
+
+        collection_timestamp = utils.localize_to_utc(collection_metadata.timestamp)
+        if file_timestamp != collection_timestamp:
+            error = bulk.create_timestamp_conflict_error(collection_id, file_timestamp, collection_timestamp)
+            return CollectionResult(collection_id=collection_id, error=error, dry_run=True)
+        return CollectionResult(collection_id=collection_id, metadata=collection_metadata, dry_run=True)
+
+    async def _delete(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, Any]] = None,
+        route: Optional[str] = None,
+    ) -> Response:
         """Deletes the resource at the specified `path`.
 
         Args:
             path (str): The path of the endpoint relative to the API server's base URL.
             params (dict[str, Any], optional): A collection of query parameters to be sent with the request. Defaults to `None`.
             headers (dict[str, Any], optional): A collection of headers to be sent with the request. Defaults to `None`.
+            route (str, optional): The route template of the endpoint, e.g. `/collections/{collection_id}`. Reported to the instrumentation hooks. Defaults to `path`.
 
         Raises:
             CollectionNotDeletedError: Raised, if the requested `Collection` could not be deleted due to an internal server error.\n
@@ -631,9 +1226,7 @@ class PssFleetDataClient:
             httpx.Response: The response from the API.
         """
         request_headers = utils.merge_headers(self.__http_client.headers, headers)
-        response = await self.__http_client.delete(path, params=params, headers=request_headers)
-        _raise_on_error(response)
-
+        response = await self._send("DELETE", path, route, params=params, headers=request_headers)
         return response
 
     async def _delete_with_api_key(
@@ -642,6 +1235,7 @@ class PssFleetDataClient:
         api_key: Optional[str],
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, Any]] = None,
+        route: Optional[str] = None,
     ) -> Response:
         """Deletes the resource at the specified `path` using the specified `api_key`.
 
@@ -650,6 +1244,7 @@ class PssFleetDataClient:
             api_key (str, optional): The api key to be sent with the request for authorization. Defaults to `None`.
             params (dict[str, Any], optional): A collection of query parameters to be sent with the request. Defaults to `None`.
             headers (dict[str, Any], optional): A collection of headers to be sent with the request. Defaults to `None`.
+            route (str, optional): The route template of the endpoint, e.g. `/collections/{collection_id}`. Reported to the instrumentation hooks. Defaults to `path`.
 
         Raises:
             CollectionNotDeletedError: Raised, if the requested `Collection` could not be deleted due to an internal server error.\n
@@ -676,16 +1271,24 @@ class PssFleetDataClient:
             path,
             params=params,
             headers=headers,
+            route=route,
         )
         return response
 
-    async def _get(self, path: str, params: Optional[dict[str, Any]] = None, headers: Optional[dict[str, Any]] = None) -> Response:
+    async def _get(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, Any]] = None,
+        route: Optional[str] = None,
+    ) -> Response:
         """Sends a request to get resources from the API with query parameters.
 
         Args:
             path (str): The path of the endpoint relative to the API server's base URL.
             params (dict[str, Any], optional): A collection of query parameters to be sent with the request. Defaults to `None`.
             headers (dict[str, Any], optional): A collection of headers to be sent with the request. Defaults to `None`.
+            route (str, optional): The route template of the endpoint, e.g. `/collections/{collection_id}`. Reported to the instrumentation hooks. Defaults to `path`.
 
         Raises:
             AllianceNotFoundError: Raised, if an `Alliance` with the provided `alliance_id` was not found.\n
@@ -718,10 +1321,136 @@ class PssFleetDataClient:
             httpx.Response: The response from the API.
         """
         request_headers = utils.merge_headers(self.__http_client.headers, headers)
-        response = await self.__http_client.get(path, params=params, headers=request_headers)
-        _raise_on_error(response)
+        response = await self._send("GET", path, route, params=params, headers=request_headers)
         return response
 
+    async def _get_collection_metadatas_by_id(self, collection_ids: Iterable[int]) -> dict[int, CollectionMetadata]:
+        """Retrieves the metadata of the existing `Collection`s among the given ones by listing all `Collection`s page by page.
+
+        Args:
+            collection_ids (Iterable[int]): The `collection_id`s of the `Collection`s to look up.
+
+        Raises:
+            ApiError: Raised, if the API returned an error response.
+
+        Returns:
+            dict[int, CollectionMetadata]: The metadata of the existing `Collection`s by `collection_id`.
+        """
+        collection_ids = set(collection_ids)
+        if not collection_ids:
+            return {}
+
+        collection_metadatas = await self._get_all_collection_metadatas()
+        return {
+            collection_metadata.collection_id: collection_metadata
+            for collection_metadata in collection_metadatas
+            if collection_metadata.collection_id in collection_ids
+        }
+
+    async def _get_existing_collection_file_paths(self, file_paths: list[Path]) -> set[Path]:
+        """Determines the `Collection` files with a timestamp, for which a `Collection` already exists. Lists all `Collection`s between the earliest and
+        the latest timestamp of the files page by page.
+
+        Args:
+            file_paths (list[Path]): The paths to the `Collection` files.
+
+        Returns:
+            set[Path]: The paths of the files, for which a `Collection` exists. Files without a readable timestamp are not included.
+        """
+        timestamps_by_file_path: dict[Path, datetime] = {}
+        results = await asyncio.gather(
+            *(asyncio.to_thread(upload.read_collection_timestamp, file_path) for file_path in file_paths), return_exceptions=True
+        )
+        for file_path, result in zip(file_paths, results, strict=True):
+            # Files without a readable timestamp get uploaded anyway, so that the API reports the problem.
+            if isinstance(result, datetime):
+                timestamps_by_file_path[file_path] = result
+
+        if not timestamps_by_file_path:
+            return set()
+
+        collection_metadatas = await self._get_all_collection_metadatas(
+            from_date=min(timestamps_by_file_path.values()), to_date=max(timestamps_by_file_path.values())
+        )
+        existing_timestamps = {utils.localize_to_utc(collection_metadata.timestamp) for collection_metadata in collection_metadatas}
+        return {file_path for file_path, timestamp in timestamps_by_file_path.items() if timestamp in existing_timestamps}
+
+    async def _get_all_collection_metadatas(
+        self, from_date: Optional[datetime] = None, to_date: Optional[datetime] = None
+    ) -> list[CollectionMetadata]:
+        """Lists the metadata of all `Collection`s in the given time range page by page. See `get_collections`.
+        The interval is always hourly, so that `Collection`s not recorded at the end of a day or month get listed, too.
+
+        Args:
+            from_date (datetime, optional): The earliest `timestamp` to list. Defaults to `None` (no lower bound).
+            to_date (datetime, optional): The latest `timestamp` to list. Defaults to `None` (no upper bound).
+
+        Raises:
+            ApiError: Raised, if the API returned an error response.
+
+        Returns:
+            list[CollectionMetadata]: The metadata of the `Collection`s sorted by `timestamp`.
+        """
+        page_size = 100
+        result = []
+        skip = 0
+        while True:
+            collection_metadatas = await self.get_collections(
+                from_date=from_date, to_date=to_date, interval=ParameterInterval.HOURLY, skip=skip, take=page_size
+            )
+            result.extend(collection_metadatas)
+            if len(collection_metadatas) < page_size:
+                return result
+            skip += page_size
+
+    async def _get_api_collection(self, collection_id: int) -> ApiCollection:
+        """Retrieves the `Collection` with the specified `collection_id` as returned by the API from the cache or from the API.
+        Retrieved `Collection`s get added to the cache.
+
+        Args:
+            collection_id (int): The `collection_id` of the the `Collection` to be retrieved.
+
+        Raises:
+            CollectionNotFoundError: Raised, if a `Collection` with the provided `collection_id` was not found or the API returned an empty response.
+
+        Returns:
+            ApiCollection: The requested `Collection`.
+        """
+        if self.__cache is not None:
+            api_collection = await self.__cache.get_async(collection_id)
+            if api_collection is not None:
+                return api_collection
+
+        response = await self._get(f"/collections/{collection_id}", route="/collections/{collection_id}")
+        api_collection = await self._convert_response(response, FromResponse.to_api_collection)
+        if api_collection is None:
+            raise bulk.create_collection_not_found_error(collection_id)
+
+        if self.__cache is not None:
+            await self.__cache.put_async(api_collection)
+        return api_collection
+
+    async def _get_api_collections(self, collection_ids: Iterable[int], max_concurrency: Optional[int] = None) -> list[ApiCollection]:
+        """Retrieves many `Collection`s as returned by the API concurrently. See `_get_api_collection`.
+
+        Args:
+            collection_ids (Iterable[int]): The `collection_id`s of the `Collection`s to be retrieved.
+            max_concurrency (int, optional): The maximum number of `Collection`s to be requested at the same time. Defaults to `None` (unlimited).
+
+        Returns:
+            list[ApiCollection]: The requested `Collection`s in the order of `collection_ids`.
+        """
+        if max_concurrency is None:
+            return await asyncio.gather(*(self._get_api_collection(collection_id) for collection_id in collection_ids))
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get_api_collection(collection_id: int) -> ApiCollection:
+            async with semaphore:
+                return await self._get_api_collection(collection_id)
+
+        return await asyncio.gather(*(get_api_collection(collection_id) for collection_id in collection_ids))
+
     async def _get_with_filter_parameters(
         self,
         path: str,
@@ -731,6 +1460,7 @@ class PssFleetDataClient:
         desc: Optional[bool] = False,
         skip: Optional[int] = 0,
         take: Optional[int] = 100,
+        route: Optional[str] = None,
     ) -> Response:
         """Sends a request to get resources from the API with query parameters for filtering the results.
 
@@ -742,6 +1472,7 @@ class PssFleetDataClient:
             desc (bool, optional): Determines, if the results should be returned in descending order. Defaults to `False`.
             skip (int, optional): The number of results to skip in the response. Defaults to `0`.
             take (int, optional): The number of results to be returned. Defaults to `100`.
+            route (str, optional): The route template of the endpoint, e.g. `/collections/{collection_id}`. Reported to the instrumentation hooks. Defaults to `path`.
 
         Raises:
             AllianceNotFoundError: Raised, if an `Alliance` with the provided `alliance_id` was not found.\n
@@ -774,7 +1505,7 @@ class PssFleetDataClient:
             httpx.Response: The response from the API.
         """
         parameters = utils.create_parameter_dict(from_date=from_date, to_date=to_date, interval=interval, desc=desc, skip=skip, take=take)
-        response = await self._get(path, params=parameters)
+        response = await self._get(path, params=parameters, route=route)
         return response
 
     async def _post(
@@ -784,6 +1515,8 @@ class PssFleetDataClient:
         files: Optional[dict[str, tuple]] = None,
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, Any]] = None,
+        route: Optional[str] = None,
+        content: Optional[Union[bytes, AsyncIterable[bytes]]] = None,
     ) -> Response:
         """Posts an HTTP request to the given API endpoint.
 
@@ -793,6 +1526,8 @@ class PssFleetDataClient:
             files (dict[str, tuple], optional): A collection of file to be sent with the request. Defaults to `None`.
             params (dict[str, Any], optional): A collection of query parameters to be sent with the request. Defaults to `None`.
             headers (dict[str, Any], optional): A collection of headers to be sent with the request. Defaults to `None`.
+            route (str, optional): The route template of the endpoint, e.g. `/collections/{collection_id}`. Reported to the instrumentation hooks. Defaults to `path`.
+            content (bytes | AsyncIterable[bytes], optional): A raw request body to be sent with the request, e.g. a `CollectionFileStream`. Defaults to `None`.
 
         Raises:
             ConflictError: Raised, if a resource could not be created due to conflicting data.\n
@@ -821,8 +1556,7 @@ class PssFleetDataClient:
         """
         request_headers = utils.merge_headers(self.__http_client.headers, headers)
 
-        response = await self.__http_client.post(path, json=json, files=files, params=params, headers=request_headers)
-        _raise_on_error(response)
+        response = await self._send("POST", path, route, json=json, files=files, content=content, params=params, headers=request_headers)
         return response
 
     async def _post_with_api_key(
@@ -833,6 +1567,8 @@ class PssFleetDataClient:
         files: Optional[dict[str, tuple]] = None,
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, Any]] = None,
+        route: Optional[str] = None,
+        content: Optional[Union[bytes, AsyncIterable[bytes]]] = None,
     ) -> Response:
         """Posts an HTTP request to the given API endpoint.
 
@@ -843,6 +1579,8 @@ class PssFleetDataClient:
             files (dict[str, tuple], optional): A collection of file to be sent with the request. Defaults to `None`.
             params (dict[str, Any], optional): A collection of query parameters to be sent with the request. Defaults to `None`.
             headers (dict[str, Any], optional): A collection of headers to be sent with the request. Defaults to `None`.
+            route (str, optional): The route template of the endpoint, e.g. `/collections/{collection_id}`. Reported to the instrumentation hooks. Defaults to `path`.
+            content (bytes | AsyncIterable[bytes], optional): A raw request body to be sent with the request, e.g. a `CollectionFileStream`. Defaults to `None`.
 
         Raises:
             ConflictError: Raised, if a resource could not be created due to conflicting data.\n
@@ -872,7 +1610,7 @@ class PssFleetDataClient:
         headers = headers or {}
         headers["Authorization"] = api_key or self.__api_key or ""
 
-        response = await self._post(path, json=json, files=files, params=params, headers=headers)
+        response = await self._post(path, json=json, files=files, params=params, headers=headers, route=route, content=content)
         return response
 
     async def _put(
@@ -882,6 +1620,8 @@ class PssFleetDataClient:
         files: Optional[dict[str, tuple]] = None,
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, Any]] = None,
+        route: Optional[str] = None,
+        content: Optional[Union[bytes, AsyncIterable[bytes]]] = None,
     ) -> Response:
         """Puts an HTTP request to the given API endpoint.
 
@@ -891,6 +1631,8 @@ class PssFleetDataClient:
             files (dict[str, tuple], optional): A collection of file to be sent with the request. Defaults to `None`.
             params (dict[str, Any], optional): A collection of query parameters to be sent with the request. Defaults to `None`.
             headers (dict[str, Any], optional): A collection of headers to be sent with the request. Defaults to `None`.
+            route (str, optional): The route template of the endpoint, e.g. `/collections/{collection_id}`. Reported to the instrumentation hooks. Defaults to `path`.
+            content (bytes | AsyncIterable[bytes], optional): A raw request body to be sent with the request, e.g. a `CollectionFileStream`. Defaults to `None`.
 
         Raises:
             ConflictError: Raised, if a resource could not be created due to conflicting data.\n
@@ -919,8 +1661,7 @@ class PssFleetDataClient:
         """
         request_headers = utils.merge_headers(self.__http_client.headers, headers)
 
-        response = await self.__http_client.put(path, json=json, files=files, params=params, headers=request_headers)
-        _raise_on_error(response)
+        response = await self._send("PUT", path, route, json=json, files=files, content=content, params=params, headers=request_headers)
         return response
 
     async def _put_with_api_key(
@@ -931,6 +1672,8 @@ class PssFleetDataClient:
         files: Optional[dict[str, tuple]] = None,
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, Any]] = None,
+        route: Optional[str] = None,
+        content: Optional[Union[bytes, AsyncIterable[bytes]]] = None,
     ) -> Response:
         """Posts an HTTP request to the given API endpoint.
 
@@ -941,6 +1684,8 @@ class PssFleetDataClient:
             files (dict[str, tuple], optional): A collection of file to be sent with the request. Defaults to `None`.
             params (dict[str, Any], optional): A collection of query parameters to be sent with the request. Defaults to `None`.
             headers (dict[str, Any], optional): A collection of headers to be sent with the request. Defaults to `None`.
+            route (str, optional): The route template of the endpoint, e.g. `/collections/{collection_id}`. Reported to the instrumentation hooks. Defaults to `path`.
+            content (bytes | AsyncIterable[bytes], optional): A raw request body to be sent with the request, e.g. a `CollectionFileStream`. Defaults to `None`.
 
         Raises:
             ConflictError: Raised, if a resource could not be created due to conflicting data.\n
@@ -970,26 +1715,258 @@ class PssFleetDataClient:
         headers = headers or {}
         headers["Authorization"] = api_key or self.__api_key or ""
 
-        response = await self._put(path, json=json, files=files, params=params, headers=headers)
+        response = await self._put(path, json=json, files=files, params=params, headers=headers, route=route, content=content)
+        return response
+
+    async def _run_concurrently(
+        self, operations: Iterable[Callable[[], Awaitable[T]]], max_concurrency: int, rate_limiter: Optional[RateLimiter]
+    ) -> list[T]:
+        """Runs the operations of a bulk operation concurrently, at most `max_concurrency` at the same time. If a `rate_limiter` is given,
+        every operation waits for it after getting a slot.
+
+        Args:
+            operations (Iterable[Callable[[], Awaitable[T]]]): The operations, each sending one request.
+            max_concurrency (int): The maximum number of operations running at the same time.
+            rate_limiter (RateLimiter, optional): Limits the rate of operations started.
+
+        Returns:
+            list[T]: The results of the operations in the given order.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(operation: Callable[[], Awaitable[T]]) -> T:
+            async with semaphore:
+                if rate_limiter is not None:
+                    await rate_limiter.acquire()
+                return await operation()
+
+        return await asyncio.gather(*(run(operation) for operation in operations))
+
+    async def _send(self, method: str, path: str, route: Optional[str] = None, **kwargs) -> Response:
+        """Sends an HTTP request to the given API endpoint and reads the response. Records a span, if tracing is enabled.
+        Fails fast without sending the request, while the circuit breaker is open.
+
+        Args:
+            method (str): The HTTP method of the request.
+            path (str): The path of the endpoint relative to the API server's base URL.
+            route (str, optional): The route template of the endpoint, e.g. `/collections/{collection_id}`. Reported to the instrumentation hooks. Defaults to `path`.
+            **kwargs: Any arguments to be passed to `httpx.AsyncClient.build_request`.
+
+        Raises:
+            ApiError: Raised, if the API returned an error response. See `_raise_on_error`.\n
+            CircuitOpenError: Raised, if the circuit breaker is open.
+
+        Returns:
+            httpx.Response: The response from the API.
+        """
+        route = route or path
+        request = self.__http_client.build_request(method, path, **kwargs)
+        circuit = self.__circuit_breaker.guard(self.__hooks) if self.__circuit_breaker is not None else _NO_CIRCUIT_BREAKER
+        with circuit, trace_span(f"{method} {route}", attributes={"http.request.method": method, "http.route": route, "url.path": path}) as span:
+            if not self.__hooks:
+                response = await self.__http_client.send(request)
+                if span is not None:
+                    span.set_attribute("http.response.status_code", response.status_code)
+                _raise_on_error(response)
+                return response
+
+            return await self._send_instrumented(request, path, route, span)
+
+    async def _send_instrumented(self, request: Request, path: str, route: str, span: Optional[Span]) -> Response:
+        """Sends an HTTP request, reads the response and notifies the instrumentation hooks.
+
+        Args:
+            request (httpx.Request): The request to be sent.
+            path (str): The path of the endpoint relative to the API server's base URL.
+            route (str): The route template of the endpoint. Reported to the instrumentation hooks.
+            span (Span, optional): The span of the request to add the response status code to.
+
+        Raises:
+            ApiError: Raised, if the API returned an error response. See `_raise_on_error`.
+
+        Returns:
+            httpx.Response: The response from the API.
+        """
+        metrics = RequestMetrics(method=request.method, route=route, path=path)
+        for hook in self.__hooks:
+            hook.on_request_start(metrics)
+
+        start = perf_counter()
+        try:
+            response = await self.__http_client.send(request, stream=True)
+            metrics.time_to_first_byte = perf_counter() - start
+            metrics.status_code = response.status_code
+            if span is not None:
+                span.set_attribute("http.response.status_code", response.status_code)
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            metrics.total_time = perf_counter() - start
+            metrics.bytes_received = response.num_bytes_downloaded
+            response.extensions[_METRICS_EXTENSION] = metrics
+
+            _raise_on_error(response)
+        except Exception as exc:
+            metrics.error = exc
+            raise
+        finally:
+            if metrics.total_time is None:
+                metrics.total_time = perf_counter() - start
+            for hook in self.__hooks:
+                hook.on_request_end(metrics)
+
         return response
 
+    async def _upload_collection_file(
+        self, file_path: Path, api_key: Optional[str], chunk_size: Optional[int], compress: bool, validate: bool
+    ) -> UploadResult:
+        """Uploads a `Collection` file, unless the `ledger` shows that its content has been uploaded before. See `upload_collection`.
+
+        Args:
+            file_path (Path): The path to the `Collection` file to be uploaded.
+            api_key (str, optional): The API key to send for authorization.
+            chunk_size (int, optional): The number of bytes to read and send at once. `None` means `Config.upload_chunk_size`.
+            compress (bool): Compress the upload with gzip on the fly.
+            validate (bool): Validate the file locally before uploading it.
+
+        Raises:
+            ApiError: Raised, if the API returned an error response.\n
+            CollectionFileError: Raised, if `validate` is `True` and the file doesn't match the schema expected by the API.\n
+            OSError: Raised, if the file can't be read.
+
+        Returns:
+            UploadResult: The metadata of the `Collection` created. Marked as skipped, if it has been taken from the `ledger`.
+        """
+        if validate:
+            await asyncio.to_thread(validation.validate_collection_file, file_path, chunk_size)
+
+        content_hash = None
+        if self.__ledger is not None:
+            content_hash = await asyncio.to_thread(UploadLedger.hash_file, file_path, chunk_size)
+            recorded_collection_metadata = await self._wait_for_upload_in_flight(content_hash)
+            if recorded_collection_metadata is not None:
+                return UploadResult(file_path=file_path, metadata=recorded_collection_metadata, skipped=True)
+
+        try:
+            stream = CollectionFileStream(file_path, chunk_size=chunk_size, compress=compress)
+            response = await self._post_with_api_key("/collections/upload", api_key=api_key, content=stream, headers=stream.get_headers())
+            collection_metadata = await self._convert_response(response, FromResponse.to_collection_metadata)
+
+            if content_hash is not None:
+                await self.__ledger.put_async(content_hash, collection_metadata)
+        finally:
+            self._finish_upload_in_flight(content_hash)
+        return UploadResult(file_path=file_path, metadata=collection_metadata)
+
+    async def _wait_for_upload_in_flight(self, content_hash: str) -> Optional[CollectionMetadata]:
+        """Looks up content in the `ledger`. While identical content is being uploaded, waits for that upload to finish first.
+        If the content is not recorded, the caller has to upload it and call `_finish_upload_in_flight` afterwards.
+
+        Args:
+            content_hash (str): The hash of the content to be uploaded.
+
+        Returns:
+            Optional[CollectionMetadata]: The metadata of the `Collection` created from identical content. `None`, if the content has to be uploaded.
+        """
+        while True:
+            recorded_collection_metadata = self.__ledger.get(content_hash)
+            if recorded_collection_metadata is not None:
+                return recorded_collection_metadata
+
+            upload_finished = self.__uploads_in_flight.get(content_hash)
+            if upload_finished is None:
+                self.__uploads_in_flight[content_hash] = asyncio.Event()
+                return None
+            # If the other upload fails, the content is still not recorded and the next waiter uploads it.
+            _ = await upload_finished.wait()
+
+    def _finish_upload_in_flight(self, content_hash: Optional[str]):
+        """Wakes the uploads of identical content waiting in `_wait_for_upload_in_flight`.
+
+        Args:
+            content_hash (str, optional): The hash of the content uploaded. `None`, if the client has no `ledger`.
+        """
+        if content_hash is not None:
+            self.__uploads_in_flight.pop(content_hash).set()
+
+    async def _convert_response(self, response: Response, converter: Callable[[Response], T]) -> T:
+        """Converts a response with the given converter, timing the JSON decoding, validation and conversion for the instrumentation hooks.
+        Responses with a body of at least `offload_threshold` bytes get converted in the client's executor, if one has been set.
+        Otherwise `Collection`s and histories get converted in chunks of `conversion_chunk_size` records, yielding to the event loop in between.
+
+        Args:
+            response (httpx.Response): The response to be converted.
+            converter (Callable[[httpx.Response], T]): The function converting the response, e.g. `FromResponse.to_collection`.
+
+        Returns:
+            T: The converted response.
+        """
+        metrics: Optional[RequestMetrics] = response.extensions.get(_METRICS_EXTENSION)
+        chunked_converter = _CHUNKED_CONVERTERS.get(converter)
+        is_large = len(response.content) >= self.__offload_threshold
+        if self.__executor is not None and is_large and offload.can_convert_in_executor(self.__executor, converter):
+            result = await offload.convert_in_executor(self.__executor, response, converter, metrics, self.__conversion_chunk_size)
+        elif chunked_converter is not None:
+            result = await offload.convert_async(response, partial(chunked_converter, chunk_size=self.__conversion_chunk_size), metrics)
+        else:
+            result = offload.convert(response, converter, metrics)
+
+        if metrics is None:
+            return result
+
+        for hook in self.__hooks:
+            hook.on_response_processed(metrics)
+        return result
+
 
 # Helper
 
 
+def _parse_path_id(value: Any, parameter_name: str, error_type: type[ApiError], error_code: ErrorCode) -> int:
+    """Parses the value of an id path parameter to `int` like the API does.
+
+    Args:
+        value (Any): The value to be parsed, e.g. `1` or `"1"`.
+        parameter_name (str): The name of the path parameter in the API, e.g. `collectionId`.
+        error_type (type[ApiError]): The type of the error the API raises for an invalid value, e.g. `InvalidCollectionIdError`.
+        error_code (ErrorCode): The error code the API returns for an invalid value.
+
+    Raises:
+        ApiError: Raised, if the value can't be parsed to `int`. Of type `error_type`.
+
+    Returns:
+        int: The parsed id.
+    """
+    try:
+        return int(str(value))
+    except ValueError:
+        raise error_type(
+            error_code.value,
+            f"The provided value for the parameter `{parameter_name}` is invalid.",
+            "Input should be a valid integer, unable to parse string as an integer",
+            datetime.now(tz=timezone.utc).isoformat(),
+            "",
+            {},
+        ) from None
+
+
 def _raise_on_error(response: Response):
-    """Raises an `ApiError`, if the API returned an error response. Does nothing, if the returned HTTP status code is not 401, 403, 404, 405, 409, 415, 422, 429 or 500.
+    """Raises an `ApiError`, if the API returned an error response. Does nothing, if the returned HTTP status code is below 400.
+    Error responses without an API error code, e.g. HTML pages of a proxy, get mapped by their status code. See `FromResponse.to_error`.
 
     Args:
         response (Response): The response returned by the API.
 
     Raises:
         AllianceNotFoundError: Raised, if an `Alliance` with the provided `alliance_id` was not found.\n
+        BadGatewayError: Raised, if a gateway or proxy in front of the API returned the status code 502.\n
         CollectionNotDeletedError: Raised, if the requested `Collection` could not be deleted due to an internal server error.\n
         CollectionNotFoundError: Raised, if a `Collection` with the provided `collection_id` was not found.\n
         ConflictError: Raised, if a resource could not be created due to conflicting data.\n
         FromDateAfterToDateError: Raised, if the parameters `fromDate` and `toDate` have been specified and `fromDate` is greater than `toDate`.\n
         FromDateTooEarlyError: Raised, if the parameter `fromDate` is lower than the PSS start date.\n
+        GatewayTimeoutError: Raised, if a gateway or proxy in front of the API returned the status code 504.\n
         InvalidAllianceIdError: Raised, if the path parameter `alliance_id` received a value that can't be parsed to `int`.\n
         InvalidBoolError: Raised, if a parameter expecting a value of type `bool` received a value that can't be parsed to `bool`. Can also be part of a body parameter.\n
         InvalidCollectionIdError: Raised, if the path parameter `collection_id` received a value that can't be parsed to `int`.\n
@@ -1016,17 +1993,15 @@ def _raise_on_error(response: Response):
         TooManyRequestsError: Raised, if the client is sending too many requests and is getting rate-limited.\n
         SchemaVersionMismatch: Raised, if the request contains a `Collection` in a schema that doesn't match the expected or specified `schema_version`.\n
         ServerError: Raised, if an internal server error occurs.\n
+        ServiceUnavailableError: Raised, if the API or a proxy in front of it returned the status code 503.\n
         UnsupportedMediaTypeError: Raised, if the requested endpoint received a body parameter of an unsupported media type.\n
         UnsupportedSchemaError: Raised, if the requested endpoint received a `Collection` of an unknown schema.\n
         UserNotFoundError: Raised, if a `User` with the provided `user_id` was not found.
     """
-    if response.status_code not in (400, 401, 403, 404, 405, 409, 415, 422, 429, 500):
+    if response.status_code < 400:
         return
 
-    api_error = ApiErrorResponse(**response.json())
-    exception = FromAPI.to_error(api_error)
-
-    raise exception
+    raise FromResponse.to_error(response)
 
 
 __all__ = [
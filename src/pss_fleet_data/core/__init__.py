@@ -1,9 +1,67 @@
-from .. import utils
-from . import config, exceptions
+from typing import TYPE_CHECKING
+
+from .lazy import create_lazy_module_attributes
+
+
+if TYPE_CHECKING:
+    from .. import utils
+    from . import (
+        bulk,
+        cache,
+        circuit_breaker,
+        config,
+        exceptions,
+        instrumentation,
+        ledger,
+        metrics,
+        offload,
+        rate_limit,
+        resolver,
+        sync,
+        tracing,
+        upload,
+        validation,
+    )
+
+
+__getattr__, __dir__ = create_lazy_module_attributes(
+    __name__,
+    {
+        "bulk": ".bulk",
+        "cache": ".cache",
+        "circuit_breaker": ".circuit_breaker",
+        "config": ".config",
+        "exceptions": ".exceptions",
+        "instrumentation": ".instrumentation",
+        "ledger": ".ledger",
+        "metrics": ".metrics",
+        "offload": ".offload",
+        "rate_limit": ".rate_limit",
+        "resolver": ".resolver",
+        "sync": ".sync",
+        "tracing": ".tracing",
+        "upload": ".upload",
+        "utils": "..utils",
+        "validation": ".validation",
+    },
+)
 
 
 __all__ = [
-    config.__name__,
-    exceptions.__name__,
-    utils.__name__,
+    "bulk",
+    "cache",
+    "circuit_breaker",
+    "config",
+    "exceptions",
+    "instrumentation",
+    "ledger",
+    "metrics",
+    "offload",
+    "rate_limit",
+    "resolver",
+    "sync",
+    "tracing",
+    "upload",
+    "utils",
+    "validation",
 ]
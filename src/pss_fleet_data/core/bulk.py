@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+from ..models.client_models import CollectionMetadata
+from ..models.enums import ErrorCode
+from .exceptions import CollectionNotFoundError, ConflictError
+
+
+@dataclass(frozen=True)
+class CollectionResult:
+    """
+    The outcome of deleting or updating a single `Collection` with `PssFleetDataClient.delete_collections` or `PssFleetDataClient.update_collections`.
+    """
+
+    collection_id: int
+    """The `collection_id` of the `Collection`."""
+    metadata: Optional[CollectionMetadata] = None
+    """The metadata of the updated `Collection` or, in a dry run, of the existing `Collection`. `None` for deletions and failures."""
+    error: Optional[Exception] = None
+    """The error raised, e.g. a `CollectionNotFoundError`. In a dry run, the error expected to be raised. `None`, if the operation succeeded."""
+    dry_run: bool = False
+    """`True`, if the operation has only been checked, but not executed."""
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        `True`, if the operation succeeded or, in a dry run, is expected to succeed.
+        """
+        return self.error is None
+
+
+def create_collection_not_found_error(collection_id: int) -> CollectionNotFoundError:
+    """Creates the error the API raises for an unknown `collection_id`, to report it in a dry run.
+
+    Args:
+        collection_id (int): The unknown `collection_id`.
+
+    Returns:
+        CollectionNotFoundError: The error.
+    """
+    return CollectionNotFoundError(
+        ErrorCode.COLLECTION_NOT_FOUND.value,
+        "The requested Collection could not be found.",
+        f"There is no Collection with the ID '{collection_id}'.",
+        datetime.now(tz=timezone.utc).isoformat(),
+        "Check the provided `collection_id` parameter.",
+        {},
+    )
+
+
+def create_timestamp_conflict_error(collection_id: int, file_timestamp: datetime, collection_timestamp: datetime) -> ConflictError:
+    """Creates the error the API raises, if a `Collection` gets updated with a file of a different timestamp, to report it in a dry run.
+
+    Args:
+        collection_id (int): The `collection_id` of the `Collection` to be updated.
+        file_timestamp (datetime): The timestamp of the file.
+        collection_timestamp (datetime): The timestamp of the `Collection`.
+
+    Returns:
+        ConflictError: The error.
+    """
+    return ConflictError(
+        ErrorCode.CONFLICT.value,
+        "The resource could not be created or updated.",
+        f"The timestamp of the uploaded file ({file_timestamp.isoformat()}) does not match the timestamp of the Collection with the ID "
+        f"'{collection_id}' ({collection_timestamp.isoformat()}).",
+        datetime.now(tz=timezone.utc).isoformat(),
+        "Update the requested Collection with a Collection file having the same timestamp.",
+        {},
+    )
+
+
+__all__ = [
+    CollectionResult.__name__,
+    create_collection_not_found_error.__name__,
+    create_timestamp_conflict_error.__name__,
+]
@@ -0,0 +1,205 @@
+import asyncio
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+from .. import utils
+from ..models.api_models import ApiCollection
+from ..models.client_models import Collection
+from ..models.converters import ToAPI
+from .resolver import CollectionResolver
+
+
+class CollectionCache:
+    """
+    Caches `Collection`s in the format returned by the API by their `collection_id`. Keeps the most recently used `Collection`s in memory
+    and, if a directory is specified, stores all of them as JSON files on disk.
+    """
+
+    def __init__(self, max_size: Optional[int] = 16, directory: Optional[Union[str, Path]] = None):
+        """Initializes a `CollectionCache`.
+
+        Args:
+            max_size (int, optional): The maximum number of `Collection`s to keep in memory. The least recently used `Collection` gets evicted
+            first. Defaults to `16`. `None` means unlimited.
+            directory (str | Path, optional): The directory to store the `Collection`s in as JSON files. It gets created, if it doesn't exist.
+            Defaults to `None` (memory only).
+
+        Raises:
+            TypeError: Raised, if `max_size` is not of type `int`.
+            ValueError: Raised, if `max_size` is lower than 1.
+        """
+        self.__max_size: Optional[int] = utils.ensure.positive_int(max_size, "max_size")
+        self.__directory: Optional[Path] = Path(directory) if directory is not None else None
+        self.__collections: OrderedDict[int, ApiCollection] = OrderedDict()
+        self.__resolvers: dict[int, CollectionResolver] = {}
+
+        if self.__directory is not None:
+            self.__directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def directory(self) -> Optional[Path]:
+        """
+        The directory the `Collection`s get stored in. `None`, if they're only kept in memory.
+        """
+        return self.__directory
+
+    @property
+    def max_size(self) -> Optional[int]:
+        """
+        The maximum number of `Collection`s to keep in memory. `None` means unlimited.
+        """
+        return self.__max_size
+
+    def __contains__(self, collection_id: int) -> bool:
+        if collection_id in self.__collections:
+            return True
+        return self.__directory is not None and self._get_file_path(collection_id).is_file()
+
+    def __len__(self) -> int:
+        return len(self.__collections)
+
+    def clear(self):
+        """Removes all `Collection`s from memory. Files on disk are kept."""
+        self.__collections.clear()
+        self.__resolvers.clear()
+
+    def get(self, collection_id: int) -> Optional[ApiCollection]:
+        """Retrieves a `Collection` from memory or, if it's not in memory, from disk.
+
+        Args:
+            collection_id (int): The `collection_id` of the `Collection` to be retrieved.
+
+        Returns:
+            Optional[ApiCollection]: The cached `Collection`. `None`, if it's not cached.
+        """
+        api_collection = self._get_from_memory(collection_id)
+        if api_collection is not None or self.__directory is None:
+            return api_collection
+
+        api_collection = self._read_file(collection_id)
+        if api_collection is not None:
+            self._keep_in_memory(collection_id, api_collection)
+        return api_collection
+
+    async def get_async(self, collection_id: int) -> Optional[ApiCollection]:
+        """Retrieves a `Collection` like `get`, but reads it from disk in a worker thread, so the event loop doesn't get blocked.
+
+        Args:
+            collection_id (int): The `collection_id` of the `Collection` to be retrieved.
+
+        Returns:
+            Optional[ApiCollection]: The cached `Collection`. `None`, if it's not cached.
+        """
+        api_collection = self._get_from_memory(collection_id)
+        if api_collection is not None or self.__directory is None:
+            return api_collection
+
+        api_collection = await asyncio.to_thread(self._read_file, collection_id)
+        if api_collection is not None:
+            self._keep_in_memory(collection_id, api_collection)
+        return api_collection
+
+    def get_resolver(self, collection_id: int) -> Optional[CollectionResolver]:
+        """Retrieves a resolver answering queries from a cached `Collection`. The resolver is kept as long as the `Collection` is kept in memory.
+
+        Args:
+            collection_id (int): The `collection_id` of the `Collection` to answer the queries from.
+
+        Returns:
+            Optional[CollectionResolver]: The resolver. `None`, if the `Collection` is not cached.
+        """
+        return self._get_resolver(collection_id, self.get(collection_id))
+
+    async def get_resolver_async(self, collection_id: int) -> Optional[CollectionResolver]:
+        """Retrieves a resolver like `get_resolver`, but reads the `Collection` from disk in a worker thread. See `get_async`.
+
+        Args:
+            collection_id (int): The `collection_id` of the `Collection` to answer the queries from.
+
+        Returns:
+            Optional[CollectionResolver]: The resolver. `None`, if the `Collection` is not cached.
+        """
+        return self._get_resolver(collection_id, await self.get_async(collection_id))
+
+    def _get_resolver(self, collection_id: int, api_collection: Optional[ApiCollection]) -> Optional[CollectionResolver]:
+        if api_collection is None:
+            return None
+
+        resolver = self.__resolvers.get(collection_id)
+        if resolver is None or resolver.source is not api_collection:
+            resolver = CollectionResolver(api_collection)
+            self.__resolvers[collection_id] = resolver
+        return resolver
+
+    def put(self, collection: Union[ApiCollection, Collection]):
+        """Adds a `Collection` to the cache, replacing a `Collection` with the same `collection_id`.
+
+        Args:
+            collection (ApiCollection | Collection): The `Collection` to be cached. A `Collection` gets converted to an `ApiCollection` first.
+
+        Raises:
+            ValueError: Raised, if the `Collection` has no `collection_id`.\n
+            OSError: Raised, if the `Collection` can't be written to disk.
+        """
+        api_collection = self._put_in_memory(collection)
+        if self.__directory is not None:
+            self._write_file(api_collection)
+
+    async def put_async(self, collection: Union[ApiCollection, Collection]):
+        """Adds a `Collection` to the cache like `put`, but writes it to disk in a worker thread, so the event loop doesn't get blocked.
+
+        Args:
+            collection (ApiCollection | Collection): The `Collection` to be cached. A `Collection` gets converted to an `ApiCollection` first.
+
+        Raises:
+            ValueError: Raised, if the `Collection` has no `collection_id`.\n
+            OSError: Raised, if the `Collection` can't be written to disk.
+        """
+        api_collection = self._put_in_memory(collection)
+        if self.__directory is not None:
+            await asyncio.to_thread(self._write_file, api_collection)
+
+    def _get_file_path(self, collection_id: int) -> Path:
+        return self.__directory / f"{collection_id}.json"
+
+    def _get_from_memory(self, collection_id: int) -> Optional[ApiCollection]:
+        api_collection = self.__collections.get(collection_id)
+        if api_collection is not None:
+            self.__collections.move_to_end(collection_id)
+        return api_collection
+
+    def _keep_in_memory(self, collection_id: int, api_collection: ApiCollection):
+        self.__collections[collection_id] = api_collection
+        self.__collections.move_to_end(collection_id)
+        if self.__max_size is not None and len(self.__collections) > self.__max_size:
+            evicted_collection_id, _ = self.__collections.popitem(last=False)
+            _ = self.__resolvers.pop(evicted_collection_id, None)
+
+    def _put_in_memory(self, collection: Union[ApiCollection, Collection]) -> ApiCollection:
+        if isinstance(collection, Collection):
+            api_collection = ToAPI.from_collection(collection, keep_collection_id=True)
+        else:
+            api_collection = collection
+
+        collection_id = api_collection.meta.collection_id
+        if collection_id is None:
+            raise ValueError("Only Collections with a `collection_id` can be cached.")
+
+        self._keep_in_memory(collection_id, api_collection)
+        return api_collection
+
+    def _read_file(self, collection_id: int) -> Optional[ApiCollection]:
+        file_path = self._get_file_path(collection_id)
+        if not file_path.is_file():
+            return None
+        return ApiCollection.model_validate_json(file_path.read_bytes())
+
+    def _write_file(self, api_collection: ApiCollection):
+        with utils.open_atomic(self._get_file_path(api_collection.meta.collection_id)) as fp:
+            _ = fp.write(api_collection.model_dump_json())
+
+
+__all__ = [
+    CollectionCache.__name__,
+]
@@ -0,0 +1,282 @@
+from collections import deque
+from enum import StrEnum
+from time import monotonic
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+
+from httpx import TransportError
+
+from .. import utils
+from .exceptions import ServerError
+
+
+if TYPE_CHECKING:
+    from .instrumentation import InstrumentationHook
+
+
+_FAILURES = (ServerError, TransportError)
+"""The exceptions counted as failed requests: error responses with a status code of 500 or higher, connection errors and timeouts."""
+
+
+class CircuitState(StrEnum):
+    """
+    The state of a `CircuitBreaker`.
+    """
+
+    CLOSED = "closed"
+    """Requests get sent and their outcomes get recorded."""
+    OPEN = "open"
+    """Requests fail fast with a `CircuitOpenError` without being sent."""
+    HALF_OPEN = "half_open"
+    """A limited number of probe requests get sent to check, if the API has recovered."""
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request, while the `CircuitBreaker` of a `PssFleetDataClient` is open.
+    """
+
+    def __init__(self, retry_after: float):
+        super().__init__(retry_after)
+        self.retry_after: float = retry_after
+        """The number of seconds until probe requests get let through. 0, if the circuit breaker is waiting for probe requests to finish."""
+
+    def __str__(self) -> str:
+        return f"The circuit breaker is open. Retry after {self.retry_after:.1f} seconds."
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests while the API is failing, so that callers fail fast instead of waiting for timeouts. Tracks the failure rate of
+    the requests over a rolling time window. Error responses with a status code of 500 or higher, connection errors, timeouts and, optionally,
+    slow requests count as failures. Pass it to a `PssFleetDataClient`; share one instance between clients to protect them together.
+
+    While closed, requests get sent. Once at least `minimum_calls` requests in the `window` have completed and the share of failures reaches
+    the `failure_rate_threshold`, the circuit opens: requests raise a `CircuitOpenError` for `open_duration` seconds. After that, it is half-open:
+    up to `probe_count` requests get sent. If all of them succeed, the circuit closes, if any fails, it opens again.
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        window: Union[float, int] = 30.0,
+        minimum_calls: int = 10,
+        open_duration: Union[float, int] = 30.0,
+        probe_count: int = 1,
+        slow_call_threshold: Optional[Union[float, int]] = None,
+    ):
+        """Initializes a `CircuitBreaker`.
+
+        Args:
+            failure_rate_threshold (float, optional): The share of failed requests in the `window` at which the circuit opens. Must be greater than 0 and at most 1. Defaults to `0.5`.
+            window (float | int, optional): The length in seconds of the rolling time window. Defaults to `30.0`.
+            minimum_calls (int, optional): The minimum number of requests in the `window` before the circuit can open. Defaults to `10`.
+            open_duration (float | int, optional): The time in seconds the circuit stays open before letting probe requests through. Defaults to `30.0`.
+            probe_count (int, optional): The number of successful probe requests required to close the circuit again. Defaults to `1`.
+            slow_call_threshold (float | int, optional): The time in seconds after which a successful request counts as failed. Defaults to `None` (latency is not considered).
+
+        Raises:
+            TypeError: Raised, if a parameter is not of the expected type.
+            ValueError: Raised, if a parameter is out of range.
+        """
+        failure_rate_threshold = utils.ensure.positive_float_or_int(failure_rate_threshold, "failure_rate_threshold")
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError("The parameter 'failure_rate_threshold' must be greater than 0 and must not be greater than 1.")
+
+        self.__failure_rate_threshold: float = float(failure_rate_threshold)
+        self.__window: float = _ensure_greater_than_zero(window, "window")
+        self.__minimum_calls: int = utils.ensure.positive_int(minimum_calls, "minimum_calls")
+        self.__open_duration: float = _ensure_greater_than_zero(open_duration, "open_duration")
+        self.__probe_count: int = utils.ensure.positive_int(probe_count, "probe_count")
+        self.__slow_call_threshold: Optional[float] = None
+        if slow_call_threshold is not None:
+            self.__slow_call_threshold = _ensure_greater_than_zero(slow_call_threshold, "slow_call_threshold")
+
+        self.__state: CircuitState = CircuitState.CLOSED
+        # Incremented on every state change, so that outcomes of requests started in a previous state get ignored.
+        self.__generation: int = 0
+        self.__calls: deque[tuple[float, bool]] = deque()
+        self.__failure_count: int = 0
+        self.__opened_at: float = 0.0
+        self.__probes_in_flight: int = 0
+        self.__probe_successes: int = 0
+
+    @property
+    def failure_rate(self) -> float:
+        """
+        The share of failed requests in the current window. 0, if the circuit is not closed or no requests have been recorded.
+        """
+        self._prune(monotonic())
+        return self.__failure_count / len(self.__calls) if self.__calls else 0.0
+
+    @property
+    def failure_rate_threshold(self) -> float:
+        """
+        The share of failed requests in the `window` at which the circuit opens.
+        """
+        return self.__failure_rate_threshold
+
+    @property
+    def minimum_calls(self) -> int:
+        """
+        The minimum number of requests in the `window` before the circuit can open.
+        """
+        return self.__minimum_calls
+
+    @property
+    def open_duration(self) -> float:
+        """
+        The time in seconds the circuit stays open before letting probe requests through.
+        """
+        return self.__open_duration
+
+    @property
+    def probe_count(self) -> int:
+        """
+        The number of successful probe requests required to close the circuit again.
+        """
+        return self.__probe_count
+
+    @property
+    def slow_call_threshold(self) -> Optional[float]:
+        """
+        The time in seconds after which a successful request counts as failed. `None`, if latency is not considered.
+        """
+        return self.__slow_call_threshold
+
+    @property
+    def state(self) -> CircuitState:
+        """
+        The current state. An open circuit becomes half-open with the first request after `open_duration`.
+        """
+        return self.__state
+
+    @property
+    def window(self) -> float:
+        """
+        The length in seconds of the rolling time window.
+        """
+        return self.__window
+
+    def guard(self, hooks: Iterable["InstrumentationHook"] = ()) -> "_CircuitCall":
+        """Creates a context manager wrapping a single request. Entering it raises a `CircuitOpenError`, if the request must not be sent.
+        Exiting it records the outcome of the request. Cancelled requests don't get recorded.
+
+        Args:
+            hooks (Iterable[InstrumentationHook], optional): The hooks to notify about state changes. Defaults to `()`.
+
+        Returns:
+            A context manager.
+        """
+        return _CircuitCall(self, tuple(hooks))
+
+    def reset(self, hooks: Iterable["InstrumentationHook"] = ()):
+        """Closes the circuit and forgets all recorded requests.
+
+        Args:
+            hooks (Iterable[InstrumentationHook], optional): The hooks to notify about the state change. Defaults to `()`.
+        """
+        self._change_state(CircuitState.CLOSED, tuple(hooks))
+
+    def _after_call(self, generation: int, failed: bool, hooks: tuple["InstrumentationHook", ...]):
+        if generation != self.__generation:
+            return
+
+        if self.__state is CircuitState.HALF_OPEN:
+            self.__probes_in_flight -= 1
+            if failed:
+                self._change_state(CircuitState.OPEN, hooks)
+                return
+            self.__probe_successes += 1
+            if self.__probe_successes >= self.__probe_count:
+                self._change_state(CircuitState.CLOSED, hooks)
+            return
+
+        now = monotonic()
+        self.__calls.append((now, failed))
+        self.__failure_count += failed
+        self._prune(now)
+        call_count = len(self.__calls)
+        if call_count >= self.__minimum_calls and self.__failure_count >= call_count * self.__failure_rate_threshold:
+            self._change_state(CircuitState.OPEN, hooks)
+
+    def _before_call(self, hooks: tuple["InstrumentationHook", ...]) -> int:
+        if self.__state is CircuitState.OPEN:
+            remaining_time = self.__opened_at + self.__open_duration - monotonic()
+            if remaining_time > 0:
+                raise CircuitOpenError(remaining_time)
+            self._change_state(CircuitState.HALF_OPEN, hooks)
+
+        if self.__state is CircuitState.HALF_OPEN:
+            if self.__probes_in_flight + self.__probe_successes >= self.__probe_count:
+                raise CircuitOpenError(0.0)
+            self.__probes_in_flight += 1
+        return self.__generation
+
+    def _cancel_call(self, generation: int):
+        if generation == self.__generation and self.__state is CircuitState.HALF_OPEN:
+            self.__probes_in_flight -= 1
+
+    def _change_state(self, state: CircuitState, hooks: tuple["InstrumentationHook", ...]):
+        previous_state = self.__state
+        self.__state = state
+        self.__generation += 1
+        self.__calls.clear()
+        self.__failure_count = 0
+        self.__probes_in_flight = 0
+        self.__probe_successes = 0
+        if state is CircuitState.OPEN:
+            self.__opened_at = monotonic()
+
+        if previous_state is state:
+            return
+        for hook in hooks:
+            hook.on_circuit_state_change(previous_state, state)
+
+    def _is_failure(self, exception: Optional[BaseException], duration: float) -> bool:
+        if exception is not None:
+            return isinstance(exception, _FAILURES)
+        return self.__slow_call_threshold is not None and duration >= self.__slow_call_threshold
+
+    def _prune(self, now: float):
+        oldest = now - self.__window
+        while self.__calls and self.__calls[0][0] < oldest:
+            _, failed = self.__calls.popleft()
+            self.__failure_count -= failed
+
+
+class _CircuitCall:
+    __slots__ = ("circuit_breaker", "generation", "hooks", "start")
+
+    def __init__(self, circuit_breaker: CircuitBreaker, hooks: tuple["InstrumentationHook", ...]):
+        self.circuit_breaker = circuit_breaker
+        self.hooks = hooks
+        self.generation = 0
+        self.start = 0.0
+
+    def __enter__(self):
+        self.generation = self.circuit_breaker._before_call(self.hooks)
+        self.start = monotonic()
+        return self
+
+    def __exit__(self, *exc_info):
+        exc_value = exc_info[1]
+        if exc_value is not None and not isinstance(exc_value, Exception):
+            # The request has been cancelled, so its outcome is unknown.
+            self.circuit_breaker._cancel_call(self.generation)
+            return
+        failed = self.circuit_breaker._is_failure(exc_value, monotonic() - self.start)
+        self.circuit_breaker._after_call(self.generation, failed, self.hooks)
+
+
+def _ensure_greater_than_zero(value: Union[float, int], name: str) -> float:
+    value = utils.ensure.positive_float_or_int(value, name)
+    if not value:
+        raise ValueError(f"The parameter '{name}' must be greater than 0.")
+    return float(value)
+
+
+__all__ = [
+    CircuitBreaker.__name__,
+    CircuitOpenError.__name__,
+    CircuitState.__name__,
+]
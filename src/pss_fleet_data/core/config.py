@@ -12,6 +12,12 @@ class Config:
     """The default base url of the Fleet Data API server."""
     pss_start_date: datetime = datetime(2016, 1, 6, tzinfo=timezone.utc)
     """The day Pixel Starships open beta started."""
+    upload_chunk_size: int = 64 * 1024
+    """The default size in bytes of the chunks `Collection` files get read and uploaded in."""
+    conversion_chunk_size: int = 50
+    """The default number of records converted by the async converters between yielding to the event loop."""
+    offload_threshold: int = 1024 * 1024
+    """The default minimum size in bytes of a response body to be converted in the executor of a `PssFleetDataClient`."""
 
 
 __CONFIG = Config()
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 
 # Base Exception
@@ -16,6 +17,7 @@ class ApiError(Exception):
     timestamp: str
     suggestion: str
     links: dict[str, str]  # Url: description
+    retry_after: Optional[float] = None  # Seconds to wait before retrying, if the response had a `Retry-After` header
 
     def __str__(self) -> str:
         return repr(self)
@@ -24,6 +26,8 @@ class ApiError(Exception):
         message = f"The API raised {self.code} at {self.timestamp}: {self.message}\n\t{self.details}\n\tSuggestion: {self.suggestion}"
         if self.links:
             message += "\n\tSee also:\n\t- " + "\n\t- ".join(f"{description}: {url}" for url, description in self.links.items())
+        if self.retry_after is not None:
+            message += f"\n\tRetry after: {self.retry_after:g} seconds"
         return message
 
 
@@ -200,14 +204,37 @@ class CollectionNotDeletedError(ServerError):
     pass
 
 
+# HTTP 502
+
+
+class BadGatewayError(ServerError):
+    pass
+
+
+# HTTP 503
+
+
+class ServiceUnavailableError(ServerError):
+    pass
+
+
+# HTTP 504
+
+
+class GatewayTimeoutError(ServerError):
+    pass
+
+
 __all__ = [
     AllianceNotFoundError.__name__,
     ApiError.__name__,
+    BadGatewayError.__name__,
     CollectionNotDeletedError.__name__,
     CollectionNotFoundError.__name__,
     ConflictError.__name__,
     FromDateAfterToDateError.__name__,
     FromDateTooEarlyError.__name__,
+    GatewayTimeoutError.__name__,
     InvalidAllianceIdError.__name__,
     InvalidBoolError.__name__,
     InvalidCollectionIdError.__name__,
@@ -232,6 +259,7 @@ __all__ = [
     ParameterValueError.__name__,
     SchemaVersionMismatch.__name__,
     ServerError.__name__,
+    ServiceUnavailableError.__name__,
     ToDateTooEarlyError.__name__,
     TooManyRequestsError.__name__,
     UnsupportedMediaTypeError.__name__,
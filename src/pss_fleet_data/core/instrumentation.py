@@ -0,0 +1,170 @@
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from enum import StrEnum
+from time import perf_counter
+from typing import TYPE_CHECKING, Optional
+
+from .tracing import get_current_tracer
+
+
+if TYPE_CHECKING:
+    from .circuit_breaker import CircuitState
+
+
+class RequestPhase(StrEnum):
+    """
+    A phase of processing a response that gets timed separately.
+    """
+
+    JSON_DECODE = "json_decode"
+    """Decoding the JSON body of the response."""
+    VALIDATION = "validation"
+    """Validating the decoded JSON with the API models."""
+    CONVERSION = "conversion"
+    """Converting the API models to client models."""
+
+
+@dataclass
+class RequestMetrics:
+    """
+    The metrics of a single request sent to the API. Passed to the methods of `InstrumentationHook`s.
+    """
+
+    method: str
+    """The HTTP method of the request."""
+    route: str
+    """The route template of the request, e.g. `/collections/{collection_id}/users`."""
+    path: str
+    """The actual path requested, e.g. `/collections/1/users`."""
+    status_code: Optional[int] = None
+    """The HTTP status code returned. `None`, if no response has been received."""
+    time_to_first_byte: Optional[float] = None
+    """The time in seconds from sending the request until the response headers were received."""
+    total_time: Optional[float] = None
+    """The time in seconds from sending the request until the response body was received."""
+    bytes_received: int = 0
+    """The number of bytes of the response body, as received over the network."""
+    json_decode_time: float = 0.0
+    """The time in seconds spent on decoding the JSON body of the response."""
+    validation_time: float = 0.0
+    """The time in seconds spent on validating the decoded JSON with the API models."""
+    conversion_time: float = 0.0
+    """The time in seconds spent on converting the API models to client models."""
+    error: Optional[Exception] = None
+    """The exception raised while sending the request or raised due to an error response. `None`, if the request succeeded."""
+
+
+class InstrumentationHook:
+    """
+    Base class for hooks to be notified about requests sent by a `PssFleetDataClient`. Override the methods you're interested in.
+    Hooks are called synchronously on the event loop, so they should return quickly and must not raise.
+    """
+
+    def on_request_start(self, metrics: RequestMetrics):
+        """Called right before a request gets sent.
+
+        Args:
+            metrics (RequestMetrics): The metrics of the request. Only `method`, `route` and `path` are set.
+        """
+        pass
+
+    def on_request_end(self, metrics: RequestMetrics):
+        """Called after a response has been received completely or the request failed.
+
+        Args:
+            metrics (RequestMetrics): The metrics of the request. The timings of response processing are not set, yet.
+        """
+        pass
+
+    def on_response_processed(self, metrics: RequestMetrics):
+        """Called after the response has been decoded and converted to client models. Not called, if the response didn't need to be converted.
+
+        Args:
+            metrics (RequestMetrics): The metrics of the request including `json_decode_time`, `validation_time` and `conversion_time`.
+        """
+        pass
+
+    def on_circuit_state_change(self, previous_state: "CircuitState", state: "CircuitState"):
+        """Called when the `CircuitBreaker` of the client changes its state, e.g. when it opens after too many requests failed.
+
+        Args:
+            previous_state (CircuitState): The state before the change.
+            state (CircuitState): The new state.
+        """
+        pass
+
+
+class _PhaseTimer:
+    __slots__ = ("attribute", "metrics", "span", "start")
+
+    def __init__(self, metrics: Optional[RequestMetrics], phase: RequestPhase, span: Optional[AbstractContextManager]):
+        self.metrics = metrics
+        self.attribute = f"{phase}_time"
+        self.span = span
+        self.start = 0.0
+
+    def __enter__(self):
+        if self.span is not None:
+            self.span.__enter__()
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.metrics is not None:
+            setattr(self.metrics, self.attribute, getattr(self.metrics, self.attribute) + perf_counter() - self.start)
+        if self.span is not None:
+            return self.span.__exit__(*exc_info)
+
+
+_NO_OP = nullcontext()
+_current_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar("pss_fleet_data_current_metrics", default=None)
+
+
+def measure_phase(phase: RequestPhase, record_span: bool = True):
+    """Returns a context manager adding the time spent within it to the `RequestMetrics` of the response currently being processed
+    and recording it as a span named after the `phase` with the current tracer. Does nothing, if neither is enabled.
+
+    Args:
+        phase (RequestPhase): The phase to be timed.
+        record_span (bool, optional): Record a span. Disable, if a phase gets timed in chunks within a single span. Defaults to `True`.
+
+    Returns:
+        A context manager.
+    """
+    metrics = _current_metrics.get()
+    tracer = get_current_tracer() if record_span else None
+    if metrics is None and tracer is None:
+        return _NO_OP
+    return _PhaseTimer(metrics, phase, tracer.start_as_current_span(phase.value) if tracer is not None else None)
+
+
+def track_processing(metrics: RequestMetrics) -> Token:
+    """Makes `measure_phase` record timings to the given `metrics` in the current context.
+
+    Args:
+        metrics (RequestMetrics): The metrics of the response to be processed.
+
+    Returns:
+        Token: The token to pass to `untrack_processing`.
+    """
+    return _current_metrics.set(metrics)
+
+
+def untrack_processing(token: Token):
+    """Stops recording timings to the metrics passed to `track_processing`.
+
+    Args:
+        token (Token): The token returned by `track_processing`.
+    """
+    _current_metrics.reset(token)
+
+
+__all__ = [
+    InstrumentationHook.__name__,
+    RequestMetrics.__name__,
+    RequestPhase.__name__,
+    measure_phase.__name__,
+    track_processing.__name__,
+    untrack_processing.__name__,
+]
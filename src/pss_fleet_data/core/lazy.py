@@ -0,0 +1,62 @@
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Callable
+
+
+def create_lazy_module_attributes(module_name: str, lazy_attributes: dict[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Creates the module-level `__getattr__` and `__dir__` functions of a module, that import the given attributes on first access.
+
+    Args:
+        module_name (str): The name of the module, usually `__name__`.
+        lazy_attributes (dict[str, str]): The import paths of the lazily imported attributes by attribute name. An import path is either
+        the name of a module or `module:attribute`. Module names may be relative to `module_name`, e.g. `.client:PssFleetDataClient`.
+
+    Returns:
+        tuple[Callable[[str], Any], Callable[[], list[str]]]: The `__getattr__` and `__dir__` functions to be assigned in the module.
+    """
+
+    def __getattr__(name: str) -> Any:
+        import_path = lazy_attributes.get(name)
+        if import_path is None:
+            raise AttributeError(f"module '{module_name}' has no attribute '{name}'")
+
+        source_module_name, _, attribute_name = import_path.partition(":")
+        source_module = import_module(source_module_name, module_name)
+        value = getattr(source_module, attribute_name) if attribute_name else source_module
+
+        # Cache the value, so that __getattr__ doesn't get called again for this attribute.
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(lazy_attributes))
+
+    return __getattr__, __dir__
+
+
+def import_optional_dependency(module_name: str, extra: str) -> ModuleType:
+    """Imports a module of an optional dependency.
+
+    Args:
+        module_name (str): The name of the module to be imported, e.g. `numpy`.
+        extra (str): The name of the extra of this package that installs the dependency, e.g. `analytics`.
+
+    Raises:
+        ImportError: Raised, if the dependency is not installed.
+
+    Returns:
+        ModuleType: The imported module.
+    """
+    try:
+        return import_module(module_name)
+    except ImportError as exc:
+        raise ImportError(
+            f"This feature requires the optional dependency '{module_name}'. Install it with: pip install pss-fleet-data-client[{extra}]"
+        ) from exc
+
+
+__all__ = [
+    create_lazy_module_attributes.__name__,
+    import_optional_dependency.__name__,
+]
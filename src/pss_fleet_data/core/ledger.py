@@ -0,0 +1,151 @@
+import asyncio
+import hashlib
+import json
+from pathlib import Path
+from typing import Optional, Union
+
+from .. import utils
+from ..models.client_models import CollectionMetadata
+from .config import get_config
+
+
+class UploadLedger:
+    """
+    Records the content hash and the metadata of every `Collection` uploaded or created, so that identical content doesn't get uploaded again.
+    If a file path is specified, the entries get appended to a JSON Lines file and loaded from it on initialization.
+    """
+
+    def __init__(self, file_path: Optional[Union[str, Path]] = None):
+        """Initializes an `UploadLedger`.
+
+        Args:
+            file_path (str | Path, optional): The JSON Lines file to store the entries in. It gets created on the first entry, if it doesn't exist.
+            Defaults to `None` (memory only).
+
+        Raises:
+            OSError: Raised, if the file exists, but can't be read.
+        """
+        self.__file_path: Optional[Path] = Path(file_path) if file_path is not None else None
+        self.__metadatas: dict[str, CollectionMetadata] = {}
+        self.__ends_with_newline: bool = True
+
+        if self.__file_path is not None and self.__file_path.is_file():
+            self._load()
+
+    @property
+    def file_path(self) -> Optional[Path]:
+        """
+        The JSON Lines file the entries get stored in. `None`, if they're only kept in memory.
+        """
+        return self.__file_path
+
+    def __contains__(self, content_hash: str) -> bool:
+        return content_hash in self.__metadatas
+
+    def __len__(self) -> int:
+        return len(self.__metadatas)
+
+    def get(self, content_hash: str) -> Optional[CollectionMetadata]:
+        """Retrieves the metadata of the `Collection` created from content with the given hash.
+
+        Args:
+            content_hash (str): The hash of the content. See `hash_content` and `hash_file`.
+
+        Returns:
+            Optional[CollectionMetadata]: The metadata of the `Collection` created. `None`, if the content hasn't been recorded.
+        """
+        return self.__metadatas.get(content_hash)
+
+    def put(self, content_hash: str, collection_metadata: CollectionMetadata):
+        """Records the metadata of the `Collection` created from content with the given hash.
+
+        Args:
+            content_hash (str): The hash of the content. See `hash_content` and `hash_file`.
+            collection_metadata (CollectionMetadata): The metadata of the `Collection` created.
+
+        Raises:
+            OSError: Raised, if the entry can't be written to the file.
+        """
+        entry = self._put_in_memory(content_hash, collection_metadata)
+        if entry is not None:
+            self._append_to_file(entry)
+
+    async def put_async(self, content_hash: str, collection_metadata: CollectionMetadata):
+        """Records the metadata like `put`, but appends the entry to the file in a worker thread, so the event loop doesn't get blocked.
+
+        Args:
+            content_hash (str): The hash of the content. See `hash_content` and `hash_file`.
+            collection_metadata (CollectionMetadata): The metadata of the `Collection` created.
+
+        Raises:
+            OSError: Raised, if the entry can't be written to the file.
+        """
+        entry = self._put_in_memory(content_hash, collection_metadata)
+        if entry is not None:
+            await asyncio.to_thread(self._append_to_file, entry)
+
+    @staticmethod
+    def hash_content(content: bytes) -> str:
+        """Calculates the hash identifying uploaded content.
+
+        Args:
+            content (bytes): The content.
+
+        Returns:
+            str: The SHA-256 hash as a hex string.
+        """
+        return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def hash_file(file_path: Union[str, Path], chunk_size: Optional[int] = None) -> str:
+        """Calculates the hash identifying the content of a file. The file gets read in chunks.
+
+        Args:
+            file_path (str | Path): The path to the file.
+            chunk_size (int, optional): The number of bytes to read at once. Defaults to `Config.upload_chunk_size`.
+
+        Raises:
+            OSError: Raised, if the file can't be read.
+
+        Returns:
+            str: The SHA-256 hash as a hex string.
+        """
+        chunk_size = utils.ensure.positive_int(chunk_size, "chunk_size", default=get_config().upload_chunk_size)
+        content_hash = hashlib.sha256()
+        with open(file_path, "rb") as fp:
+            while chunk := fp.read(chunk_size):
+                content_hash.update(chunk)
+        return content_hash.hexdigest()
+
+    def _append_to_file(self, entry: str):
+        with open(self.__file_path, "a", encoding="utf-8") as fp:
+            fp.write(entry)
+
+    def _load(self):
+        with open(self.__file_path, "r", encoding="utf-8") as fp:
+            for line in fp:
+                self.__ends_with_newline = line.endswith("\n")
+                try:
+                    entry = json.loads(line)
+                    self.__metadatas[entry["hash"]] = CollectionMetadata.model_validate(entry["metadata"])
+                except (KeyError, TypeError, ValueError):
+                    # Skip incomplete lines of interrupted writes.
+                    continue
+
+    def _put_in_memory(self, content_hash: str, collection_metadata: CollectionMetadata) -> Optional[str]:
+        self.__metadatas[content_hash] = collection_metadata
+        if self.__file_path is None:
+            return None
+
+        # Appending keeps writes cheap during bulk uploads. Later entries win on load.
+        entry = json.dumps({"hash": content_hash, "metadata": collection_metadata.model_dump(mode="json")}) + "\n"
+        if not self.__ends_with_newline:
+            # Don't append to the incomplete last line of an interrupted write.
+            entry = "\n" + entry
+            self.__ends_with_newline = True
+        return entry
+
+
+__all__ = [
+    UploadLedger.__name__,
+]
@@ -0,0 +1,213 @@
+from bisect import bisect_left
+from threading import Lock
+from typing import Iterable, Optional
+
+from .instrumentation import InstrumentationHook, RequestMetrics
+
+
+DEFAULT_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+"""The default upper bounds of histogram buckets for durations. In seconds."""
+DEFAULT_SIZE_BUCKETS = (1_024, 10_240, 102_400, 1_048_576, 10_485_760, 52_428_800, 104_857_600)
+"""The default upper bounds of histogram buckets for response sizes. In bytes."""
+
+_DESCRIPTIONS = {
+    "request_duration_seconds": "Time from sending a request until its response body was received.",
+    "time_to_first_byte_seconds": "Time from sending a request until its response headers were received.",
+    "response_size_bytes": "Size of response bodies as received over the network.",
+    "json_decode_seconds": "Time spent on decoding JSON response bodies.",
+    "validation_seconds": "Time spent on validating decoded responses with the API models.",
+    "conversion_seconds": "Time spent on converting validated responses to client models.",
+}
+_SIZE_METRIC_NAMES = ("response_size_bytes",)
+
+
+class Histogram:
+    """
+    A simple histogram with fixed bucket boundaries.
+    """
+
+    def __init__(self, buckets: Iterable[float]):
+        """Initializes a `Histogram`.
+
+        Args:
+            buckets (Iterable[float]): The upper bounds of the buckets. An implicit `+Inf` bucket gets added.
+        """
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        """The upper bounds of the buckets, without the implicit `+Inf` bucket."""
+        self.counts: list[int] = [0] * (len(self.buckets) + 1)
+        """The number of observations per bucket, not cumulative. The last item represents the `+Inf` bucket."""
+        self.count: int = 0
+        """The total number of observations."""
+        self.sum: float = 0.0
+        """The sum of all observed values."""
+
+    def observe(self, value: float):
+        """Records a value.
+
+        Args:
+            value (float): The value to be recorded.
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> list[int]:
+        """Returns the cumulative number of observations per bucket, including the `+Inf` bucket.
+
+        Returns:
+            list[int]: The number of observations less than or equal to each bucket's upper bound.
+        """
+        result = []
+        total = 0
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+
+HistogramKey = tuple[str, str, str, str]
+"""(metric name, method, route, status)"""
+
+
+class HistogramCollector(InstrumentationHook):
+    """
+    An `InstrumentationHook` recording request metrics to in-memory histograms, labeled by HTTP method, route template and status.
+    """
+
+    def __init__(self, duration_buckets: Optional[Iterable[float]] = None, size_buckets: Optional[Iterable[float]] = None):
+        """Initializes a `HistogramCollector`.
+
+        Args:
+            duration_buckets (Iterable[float], optional): The upper bounds of the buckets for durations in seconds. Defaults to `DEFAULT_DURATION_BUCKETS`.
+            size_buckets (Iterable[float], optional): The upper bounds of the buckets for response sizes in bytes. Defaults to `DEFAULT_SIZE_BUCKETS`.
+        """
+        self.__duration_buckets = tuple(duration_buckets or DEFAULT_DURATION_BUCKETS)
+        self.__size_buckets = tuple(size_buckets or DEFAULT_SIZE_BUCKETS)
+        self.__histograms: dict[HistogramKey, Histogram] = {}
+        self.__lock = Lock()
+
+    def on_request_end(self, metrics: RequestMetrics):
+        status = _get_status_label(metrics)
+        self.observe("request_duration_seconds", metrics.method, metrics.route, status, metrics.total_time)
+        self.observe("time_to_first_byte_seconds", metrics.method, metrics.route, status, metrics.time_to_first_byte)
+        if metrics.status_code is not None:
+            self.observe("response_size_bytes", metrics.method, metrics.route, status, metrics.bytes_received)
+
+    def on_response_processed(self, metrics: RequestMetrics):
+        status = _get_status_label(metrics)
+        self.observe("json_decode_seconds", metrics.method, metrics.route, status, metrics.json_decode_time)
+        self.observe("validation_seconds", metrics.method, metrics.route, status, metrics.validation_time)
+        self.observe("conversion_seconds", metrics.method, metrics.route, status, metrics.conversion_time)
+
+    def observe(self, name: str, method: str, route: str, status: str, value: Optional[float]):
+        """Records a value to the histogram identified by the given metric name and labels. Does nothing, if `value` is `None`.
+
+        Args:
+            name (str): The name of the metric, e.g. `request_duration_seconds`.
+            method (str): The HTTP method.
+            route (str): The route template.
+            status (str): The HTTP status code or `error`, if no response was received.
+            value (float, optional): The value to record.
+        """
+        if value is None:
+            return
+
+        key = (name, method, route, status)
+        with self.__lock:
+            histogram = self.__histograms.get(key)
+            if histogram is None:
+                histogram = Histogram(self.__size_buckets if name in _SIZE_METRIC_NAMES else self.__duration_buckets)
+                self.__histograms[key] = histogram
+            histogram.observe(value)
+
+    def get_histogram(self, name: str, method: str, route: str, status: str) -> Optional[Histogram]:
+        """Returns the histogram identified by the given metric name and labels.
+
+        Args:
+            name (str): The name of the metric, e.g. `request_duration_seconds`.
+            method (str): The HTTP method.
+            route (str): The route template.
+            status (str): The HTTP status code or `error`, if no response was received.
+
+        Returns:
+            Optional[Histogram]: The histogram, if any value has been recorded for it. Else, `None`.
+        """
+        return self.__histograms.get((name, method, route, status))
+
+    def get_histograms(self) -> dict[HistogramKey, Histogram]:
+        """Returns a copy of the mapping of all recorded histograms.
+
+        Returns:
+            dict[HistogramKey, Histogram]: The histograms by (metric name, method, route, status).
+        """
+        with self.__lock:
+            return dict(self.__histograms)
+
+    def reset(self):
+        """Removes all recorded histograms."""
+        with self.__lock:
+            self.__histograms.clear()
+
+
+class PrometheusExporter:
+    """
+    Renders the histograms of a `HistogramCollector` in the Prometheus text exposition format, e.g. to be served on a `/metrics` endpoint.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+    """The content type to serve the rendered metrics with."""
+
+    def __init__(self, collector: HistogramCollector, namespace: str = "pss_fleet_data_client"):
+        """Initializes a `PrometheusExporter`.
+
+        Args:
+            collector (HistogramCollector): The collector to export the histograms of.
+            namespace (str, optional): The prefix of the exported metric names. Defaults to `pss_fleet_data_client`.
+        """
+        self.collector: HistogramCollector = collector
+        self.namespace: str = namespace
+
+    def render(self) -> str:
+        """Renders all histograms recorded by the collector.
+
+        Returns:
+            str: The metrics in the Prometheus text exposition format (version 0.0.4).
+        """
+        histograms_by_name: dict[str, list[tuple[HistogramKey, Histogram]]] = {}
+        for key, histogram in sorted(self.collector.get_histograms().items()):
+            histograms_by_name.setdefault(key[0], []).append((key, histogram))
+
+        lines = []
+        for name, histograms in histograms_by_name.items():
+            metric_name = f"{self.namespace}_{name}" if self.namespace else name
+            lines.append(f"# HELP {metric_name} {_DESCRIPTIONS.get(name, name)}")
+            lines.append(f"# TYPE {metric_name} histogram")
+            for (_, method, route, status), histogram in histograms:
+                labels = f'method="{_escape(method)}",route="{_escape(route)}",status="{_escape(status)}"'
+                for upper_bound, count in zip((*histogram.buckets, "+Inf"), histogram.cumulative_counts(), strict=True):
+                    lines.append(f'{metric_name}_bucket{{{labels},le="{_format_number(upper_bound)}"}} {count}')
+                lines.append(f"{metric_name}_sum{{{labels}}} {_format_number(histogram.sum)}")
+                lines.append(f"{metric_name}_count{{{labels}}} {histogram.count}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_number(value) -> str:
+    if isinstance(value, str):
+        return value
+    return repr(float(value))
+
+
+def _get_status_label(metrics: RequestMetrics) -> str:
+    return str(metrics.status_code) if metrics.status_code is not None else "error"
+
+
+__all__ = [
+    Histogram.__name__,
+    HistogramCollector.__name__,
+    PrometheusExporter.__name__,
+]
@@ -0,0 +1,172 @@
+import asyncio
+import contextvars
+import sys
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from httpx import Response
+
+from ..models.converters import FromAPI, FromResponse
+from . import instrumentation
+from .instrumentation import RequestMetrics, RequestPhase
+from .tracing import trace_span
+
+
+T = TypeVar("T")
+
+_PHASE_ATTRIBUTES = tuple(f"{phase}_time" for phase in RequestPhase)
+
+_PROCESS_STAGES: dict[Callable[[Response], Any], tuple[Callable[[Response], Any], Optional[Callable[..., Awaitable[Any]]]]] = {
+    FromResponse.to_api_collection: (FromResponse.to_api_collection, None),
+    FromResponse.to_collection: (FromResponse.to_api_collection, FromAPI.to_collection_async),
+}
+"""The converters supported by process pools, split into the part run in a worker process and the async converter run on the event loop.
+`pssapi` entities can't be pickled, so only the decoding and validation of a response can cross the process boundary."""
+
+
+def can_convert_in_executor(executor: Executor, converter: Callable[[Response], Any]) -> bool:
+    """Checks, if `convert_in_executor` would move any work off the event loop.
+
+    Args:
+        executor (Executor): The executor to run the conversion in.
+        converter (Callable[[httpx.Response], Any]): The function converting the response.
+
+    Returns:
+        bool: `False`, if the executor is a `ProcessPoolExecutor` and the converter can't be split to be run in a worker process.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    return not isinstance(executor, ProcessPoolExecutor) or converter in _PROCESS_STAGES
+
+
+def create_executor(max_workers: Optional[int] = None) -> Executor:
+    """Creates an executor suited for converting large responses with a `PssFleetDataClient`: a `ThreadPoolExecutor` on free-threaded
+    builds of Python, where threads run in parallel, else a `ProcessPoolExecutor`.
+
+    Args:
+        max_workers (int, optional): The maximum number of workers. Defaults to `None` (the default of the executor).
+
+    Returns:
+        Executor: The executor. The caller is responsible for shutting it down.
+    """
+    if is_free_threaded():
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+    # Importing `concurrent.futures.process` imports `multiprocessing`, so it's deferred until a process pool is actually used.
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(max_workers=max_workers)
+
+
+def is_free_threaded() -> bool:
+    """Checks, if the interpreter runs without the global interpreter lock.
+
+    Returns:
+        bool: `True`, if the GIL is disabled.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+async def convert_in_executor(
+    executor: Executor, response: Response, converter: Callable[[Response], T], metrics: Optional[RequestMetrics], chunk_size: Optional[int] = None
+) -> T:
+    """Converts a response in an executor, so that the event loop stays responsive while decoding and converting it. The timings of
+    the phases get recorded to the `metrics`.
+
+    With a `ProcessPoolExecutor`, only the JSON decoding and validation of `Collection` responses run in a worker process, because
+    `pssapi` entities can't be pickled. The conversion to client models runs on the event loop in chunks, see `FromAPI.to_collection_async`.
+    All other converters run on the event loop. Any other executor runs the whole converter in a worker thread.
+
+    Args:
+        executor (Executor): The executor to run the conversion in.
+        response (httpx.Response): The response to be converted.
+        converter (Callable[[httpx.Response], T]): The function converting the response, e.g. `FromResponse.to_collection`.
+        metrics (RequestMetrics, optional): The metrics to record the timings to.
+        chunk_size (int, optional): The number of records to convert on the event loop at once. Defaults to `Config.conversion_chunk_size`.
+
+    Returns:
+        T: The converted response.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    loop = asyncio.get_running_loop()
+    if not isinstance(executor, ProcessPoolExecutor):
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(executor, context.run, convert, response, converter, metrics)
+
+    stages = _PROCESS_STAGES.get(converter)
+    if stages is None:
+        return convert(response, converter, metrics)
+
+    worker_converter, loop_converter = stages
+    result, timings = await loop.run_in_executor(executor, _convert_content, response.content, response.headers.get("Content-Type"), worker_converter)
+    if metrics is not None:
+        for attribute, value in zip(_PHASE_ATTRIBUTES, timings, strict=True):
+            setattr(metrics, attribute, getattr(metrics, attribute) + value)
+
+    if loop_converter is None or result is None:
+        return result
+    with trace_span(RequestPhase.CONVERSION.value):
+        return await convert_async(result, partial(loop_converter, chunk_size=chunk_size), metrics)
+
+
+def convert(source: Any, converter: Callable[[Any], T], metrics: Optional[RequestMetrics]) -> T:
+    """Converts a response with the given converter, recording the timings of the phases to the `metrics`.
+
+    Args:
+        source (Any): The response to be converted.
+        converter (Callable[[Any], T]): The function converting the response.
+        metrics (RequestMetrics, optional): The metrics to record the timings to.
+
+    Returns:
+        T: The converted response.
+    """
+    if metrics is None:
+        return converter(source)
+
+    token = instrumentation.track_processing(metrics)
+    try:
+        return converter(source)
+    finally:
+        instrumentation.untrack_processing(token)
+
+
+async def convert_async(source: Any, converter: Callable[[Any], Awaitable[T]], metrics: Optional[RequestMetrics]) -> T:
+    """Converts a response with the given async converter, e.g. `FromResponse.to_collection_async`, recording the timings of the phases to the `metrics`.
+
+    Args:
+        source (Any): The response to be converted.
+        converter (Callable[[Any], Awaitable[T]]): The async function converting the response.
+        metrics (RequestMetrics, optional): The metrics to record the timings to.
+
+    Returns:
+        T: The converted response.
+    """
+    if metrics is None:
+        return await converter(source)
+
+    token = instrumentation.track_processing(metrics)
+    try:
+        return await converter(source)
+    finally:
+        instrumentation.untrack_processing(token)
+
+
+def _convert_content(content: bytes, content_type: Optional[str], converter: Callable[[Response], T]) -> tuple[T, tuple[float, ...]]:
+    # Runs in a worker process. The content has already been decoded, so only the content type is passed on.
+    response = Response(200, content=content, headers={"Content-Type": content_type} if content_type else None)
+    metrics = RequestMetrics(method="", route="", path="")
+    result = convert(response, converter, metrics)
+    return result, tuple(getattr(metrics, attribute) for attribute in _PHASE_ATTRIBUTES)
+
+
+__all__ = [
+    can_convert_in_executor.__name__,
+    convert.__name__,
+    convert_async.__name__,
+    convert_in_executor.__name__,
+    create_executor.__name__,
+    is_free_threaded.__name__,
+]
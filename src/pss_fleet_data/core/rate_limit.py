@@ -0,0 +1,64 @@
+import asyncio
+from time import monotonic
+
+from .. import utils
+
+
+class RateLimiter:
+    """
+    Limits the rate of requests with a token bucket. Share one instance between bulk operations to limit their combined rate.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initializes a `RateLimiter`.
+
+        Args:
+            rate (float | int): The number of requests allowed per second on average.
+            burst (int, optional): The number of requests allowed at once after a pause. Defaults to `1`.
+
+        Raises:
+            TypeError: Raised, if `rate` is not of type `float` or `int` or if `burst` is not of type `int`.
+            ValueError: Raised, if `rate` or `burst` is not greater than 0.
+        """
+        rate = utils.ensure.positive_float_or_int(rate, "rate")
+        if not rate:
+            raise ValueError("The parameter 'rate' must be greater than 0.")
+
+        self.__rate: float = float(rate)
+        self.__burst: int = utils.ensure.positive_int(burst, "burst")
+        self.__tokens: float = float(self.__burst)
+        self.__updated: float = monotonic()
+        self.__lock: asyncio.Lock = asyncio.Lock()
+
+    @property
+    def burst(self) -> int:
+        """
+        The number of requests allowed at once after a pause.
+        """
+        return self.__burst
+
+    @property
+    def rate(self) -> float:
+        """
+        The number of requests allowed per second on average.
+        """
+        return self.__rate
+
+    async def acquire(self):
+        """Waits until another request is allowed. Waiting callers are served in order."""
+        async with self.__lock:
+            now = monotonic()
+            self.__tokens = min(self.__burst, self.__tokens + (now - self.__updated) * self.__rate)
+            self.__updated = now
+
+            if self.__tokens < 1:
+                await asyncio.sleep((1 - self.__tokens) / self.__rate)
+                self.__tokens = 0.0
+                self.__updated = monotonic()
+            else:
+                self.__tokens -= 1
+
+
+__all__ = [
+    RateLimiter.__name__,
+]
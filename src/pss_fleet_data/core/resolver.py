@@ -0,0 +1,143 @@
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+from ..models.api_models import ApiAlliance, ApiCollection, ApiUser
+from ..models.client_models import AllianceHistory, Collection, CollectionMetadata, UserHistory
+from ..models.converters import FromAPI
+from ..models.enums import ErrorCode
+from .exceptions import AllianceNotFoundError, UserNotFoundError
+
+
+class CollectionResolver:
+    """
+    Answers the queries of `PssFleetDataClient.get_alliance_from_collection` and `PssFleetDataClient.get_user_from_collection` from a local
+    `Collection` instead of sending requests. Joins `User`s to `Alliance`s through indexes, that get built on first use.
+    """
+
+    def __init__(self, source: Union[Collection, ApiCollection]):
+        """Initializes a `CollectionResolver`.
+
+        Args:
+            source (Collection | ApiCollection): The `Collection` to answer the queries from.
+        """
+        self.__source: Union[Collection, ApiCollection] = source
+        self.__metadata: Optional[CollectionMetadata] = None
+        self.__api_alliances_by_id: Optional[dict[int, ApiAlliance]] = None
+        self.__api_users_by_id: Optional[dict[int, ApiUser]] = None
+        self.__api_members_by_alliance_id: Optional[dict[int, list[ApiUser]]] = None
+
+    @property
+    def source(self) -> Union[Collection, ApiCollection]:
+        """
+        The `Collection` the queries get answered from.
+        """
+        return self.__source
+
+    def get_alliance_history(self, alliance_id: int) -> AllianceHistory:
+        """Retrieves the data of an `Alliance` and its members, like `PssFleetDataClient.get_alliance_from_collection`.
+
+        Args:
+            alliance_id (int): The `AllianceId` of the `Alliance` to obtain.
+
+        Raises:
+            AllianceNotFoundError: Raised, if an `Alliance` with the provided `alliance_id` is not part of the `Collection`.
+
+        Returns:
+            AllianceHistory: An object containing the metadata of the `Collection`, the `Alliance` data and its members.
+        """
+        if isinstance(self.__source, Collection):
+            alliance = self.__source.get_alliance(alliance_id)
+            if alliance is None:
+                raise self._create_alliance_not_found_error(alliance_id)
+            return AllianceHistory(collection=self._get_metadata(), alliance=alliance, users=self.__source.get_alliance_members(alliance_id))
+
+        self._ensure_api_indexes()
+        api_alliance = self.__api_alliances_by_id.get(alliance_id)
+        if api_alliance is None:
+            raise self._create_alliance_not_found_error(alliance_id)
+
+        return AllianceHistory(
+            collection=self._get_metadata(),
+            alliance=FromAPI.to_pss_alliance(api_alliance),
+            users=FromAPI.to_pss_users(self.__api_members_by_alliance_id.get(alliance_id, ())),
+        )
+
+    def get_user_history(self, user_id: int) -> UserHistory:
+        """Retrieves the data of a `User` and its `Alliance`, like `PssFleetDataClient.get_user_from_collection`.
+
+        Args:
+            user_id (int): The `UserId` of the `User` to obtain.
+
+        Raises:
+            UserNotFoundError: Raised, if a `User` with the provided `user_id` is not part of the `Collection`.
+
+        Returns:
+            UserHistory: An object containing the metadata of the `Collection`, the `User` data and optional `Alliance` data.
+        """
+        if isinstance(self.__source, Collection):
+            user = self.__source.get_user(user_id)
+            if user is None:
+                raise self._create_user_not_found_error(user_id)
+            alliance = self.__source.get_alliance(user.alliance_id) if user.alliance_id else None
+            return UserHistory(collection=self._get_metadata(), user=user, alliance=alliance)
+
+        self._ensure_api_indexes()
+        api_user = self.__api_users_by_id.get(user_id)
+        if api_user is None:
+            raise self._create_user_not_found_error(user_id)
+
+        api_alliance = self.__api_alliances_by_id.get(api_user[2]) if api_user[2] else None
+        return UserHistory(
+            collection=self._get_metadata(),
+            user=FromAPI.to_pss_user(api_user),
+            alliance=FromAPI.to_pss_alliance(api_alliance) if api_alliance else None,
+        )
+
+    def _create_alliance_not_found_error(self, alliance_id: int) -> AllianceNotFoundError:
+        return AllianceNotFoundError(
+            ErrorCode.ALLIANCE_NOT_FOUND.value,
+            "The requested Alliance could not be found.",
+            f"There is no Alliance with the ID '{alliance_id}' in the Collection with the ID '{self._get_metadata().collection_id}'.",
+            datetime.now(tz=timezone.utc).isoformat(),
+            "Check the provided `alliance_id` parameter.",
+            {},
+        )
+
+    def _create_user_not_found_error(self, user_id: int) -> UserNotFoundError:
+        return UserNotFoundError(
+            ErrorCode.USER_NOT_FOUND.value,
+            "The requested User could not be found.",
+            f"There is no User with the ID '{user_id}' in the Collection with the ID '{self._get_metadata().collection_id}'.",
+            datetime.now(tz=timezone.utc).isoformat(),
+            "Check the provided `user_id` parameter.",
+            {},
+        )
+
+    def _ensure_api_indexes(self):
+        if self.__api_users_by_id is not None:
+            return
+
+        self.__api_alliances_by_id = {api_alliance[0]: api_alliance for api_alliance in self.__source.fleets or ()}
+
+        api_users_by_id = {}
+        api_members_by_alliance_id: dict[int, list[ApiUser]] = {}
+        for api_user in self.__source.users or ():
+            api_users_by_id[api_user[0]] = api_user
+            if api_user[2]:
+                api_members_by_alliance_id.setdefault(api_user[2], []).append(api_user)
+
+        self.__api_members_by_alliance_id = api_members_by_alliance_id
+        self.__api_users_by_id = api_users_by_id
+
+    def _get_metadata(self) -> CollectionMetadata:
+        if self.__metadata is None:
+            if isinstance(self.__source, Collection):
+                self.__metadata = self.__source.metadata
+            else:
+                self.__metadata = FromAPI.to_collection_metadata(self.__source.meta)
+        return self.__metadata
+
+
+__all__ = [
+    CollectionResolver.__name__,
+]
@@ -0,0 +1,124 @@
+import asyncio
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Union
+
+from .. import utils
+from ..models.client_models import CollectionMetadata
+
+
+class SyncCheckpoint:
+    """
+    Records the newest `Collection` up to which a local store is complete, so that the next sync only lists `Collection`s created after it.
+    The checkpoint gets stored in a JSON file and loaded from it on initialization.
+    """
+
+    def __init__(self, file_path: Union[str, Path]):
+        """Initializes a `SyncCheckpoint`.
+
+        Args:
+            file_path (str | Path): The JSON file to store the checkpoint in. It gets created on the first save, if it doesn't exist.
+
+        Raises:
+            OSError: Raised, if the file exists, but can't be read.
+        """
+        self.__file_path: Path = Path(file_path)
+        self.__collection_id: Optional[int] = None
+        self.__timestamp: Optional[datetime] = None
+
+        if self.__file_path.is_file():
+            self._load()
+
+    @property
+    def collection_id(self) -> Optional[int]:
+        """
+        The `collection_id` of the newest `Collection` up to which the store is complete. `None`, if nothing has been synced yet.
+        """
+        return self.__collection_id
+
+    @property
+    def file_path(self) -> Path:
+        """
+        The JSON file the checkpoint gets stored in.
+        """
+        return self.__file_path
+
+    @property
+    def timestamp(self) -> Optional[datetime]:
+        """
+        The `timestamp` of the newest `Collection` up to which the store is complete, localized to UTC. `None`, if nothing has been synced yet.
+        """
+        return self.__timestamp
+
+    def save(self, collection_metadata: CollectionMetadata):
+        """Moves the checkpoint to the given `Collection` and writes it to the file.
+
+        Args:
+            collection_metadata (CollectionMetadata): The metadata of the newest `Collection` up to which the store is complete.
+
+        Raises:
+            OSError: Raised, if the file can't be written.
+        """
+        self.__collection_id = collection_metadata.collection_id
+        self.__timestamp = utils.localize_to_utc(collection_metadata.timestamp)
+        self._write_file(self.__collection_id, self.__timestamp)
+
+    async def save_async(self, collection_metadata: CollectionMetadata):
+        """Moves the checkpoint like `save`, but writes the file in a worker thread, so the event loop doesn't get blocked.
+
+        Args:
+            collection_metadata (CollectionMetadata): The metadata of the newest `Collection` up to which the store is complete.
+
+        Raises:
+            OSError: Raised, if the file can't be written.
+        """
+        self.__collection_id = collection_metadata.collection_id
+        self.__timestamp = utils.localize_to_utc(collection_metadata.timestamp)
+        await asyncio.to_thread(self._write_file, self.__collection_id, self.__timestamp)
+
+    def _write_file(self, collection_id: int, timestamp: datetime):
+        with utils.open_atomic(self.__file_path) as fp:
+            _ = fp.write(json.dumps({"collection_id": collection_id, "timestamp": timestamp.isoformat()}))
+
+    def _load(self):
+        try:
+            checkpoint = json.loads(self.__file_path.read_text(encoding="utf-8"))
+            collection_id = int(checkpoint["collection_id"])
+            timestamp = utils.localize_to_utc(datetime.fromisoformat(checkpoint["timestamp"]))
+        except (KeyError, TypeError, ValueError):
+            # Without a valid checkpoint, the next sync lists all `Collection`s. Stored `Collection`s still don't get downloaded again.
+            return
+        self.__collection_id = collection_id
+        self.__timestamp = timestamp
+
+
+@dataclass(frozen=True)
+class SyncResult:
+    """
+    The outcome of `PssFleetDataClient.sync_collections`.
+    """
+
+    downloaded: list[CollectionMetadata] = field(default_factory=list)
+    """The metadata of the `Collection`s downloaded into the store."""
+    skipped: list[CollectionMetadata] = field(default_factory=list)
+    """The metadata of the listed `Collection`s that have already been in the store."""
+    errors: dict[int, Exception] = field(default_factory=dict)
+    """The errors raised while downloading or storing `Collection`s by `collection_id`, e.g. a `CollectionNotFoundError`."""
+    checkpoint: Optional[CollectionMetadata] = None
+    """The metadata of the newest `Collection` up to which the store is complete. If a `SyncCheckpoint` has been passed, it has been moved there.
+    `None`, if nothing has been listed or the first listed `Collection` couldn't be downloaded."""
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        `True`, if all listed `Collection`s are in the store now.
+        """
+        return not self.errors
+
+
+__all__ = [
+    SyncCheckpoint.__name__,
+    SyncResult.__name__,
+]
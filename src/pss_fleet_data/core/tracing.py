@@ -0,0 +1,85 @@
+from contextlib import nullcontext
+from contextvars import ContextVar, Token
+from typing import Any, ContextManager, Optional, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class Span(Protocol):
+    """
+    The subset of the OpenTelemetry `Span` API used by the client.
+    """
+
+    def set_attribute(self, key: str, value: Any) -> Any:
+        """Sets an attribute on the span."""
+        ...
+
+
+@runtime_checkable
+class Tracer(Protocol):
+    """
+    The subset of the OpenTelemetry `Tracer` API used by the client. Any `opentelemetry.trace.Tracer` satisfies it, e.g. `opentelemetry.trace.get_tracer("pss_fleet_data")`.
+    """
+
+    def start_as_current_span(self, name: str, attributes: Optional[dict[str, Any]] = None) -> ContextManager[Span]:
+        """Returns a context manager starting a new span as child of the current span and ending it on exit."""
+        ...
+
+
+_NO_OP = nullcontext()
+_current_tracer: ContextVar[Optional[Tracer]] = ContextVar("pss_fleet_data_current_tracer", default=None)
+
+
+def get_current_tracer() -> Optional[Tracer]:
+    """Returns the tracer set by `use_tracer` in the current context.
+
+    Returns:
+        Optional[Tracer]: The current tracer. `None`, if tracing is disabled.
+    """
+    return _current_tracer.get()
+
+
+def trace_span(name: str, attributes: Optional[dict[str, Any]] = None) -> ContextManager[Optional[Span]]:
+    """Returns a context manager recording a span with the current tracer. Does nothing, if tracing is disabled.
+
+    Args:
+        name (str): The name of the span.
+        attributes (dict[str, Any], optional): The attributes of the span. Defaults to `None`.
+
+    Returns:
+        A context manager yielding the span or `None`, if tracing is disabled.
+    """
+    tracer = _current_tracer.get()
+    if tracer is None:
+        return _NO_OP
+    return tracer.start_as_current_span(name, attributes=attributes)
+
+
+def use_tracer(tracer: Tracer) -> Token:
+    """Makes `trace_span` record spans with the given `tracer` in the current context.
+
+    Args:
+        tracer (Tracer): The tracer to record spans with.
+
+    Returns:
+        Token: The token to pass to `reset_tracer`.
+    """
+    return _current_tracer.set(tracer)
+
+
+def reset_tracer(token: Token):
+    """Restores the tracer that was current before calling `use_tracer`.
+
+    Args:
+        token (Token): The token returned by `use_tracer`.
+    """
+    _current_tracer.reset(token)
+
+
+__all__ = [
+    Span.__name__,
+    Tracer.__name__,
+    get_current_tracer.__name__,
+    reset_tracer.__name__,
+    trace_span.__name__,
+    use_tracer.__name__,
+]
@@ -0,0 +1,217 @@
+import asyncio
+import json
+import os
+import re
+import uuid
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Iterable, Optional, Union
+
+from .. import utils
+from ..models.client_models import CollectionMetadata
+from .config import get_config
+
+
+_HEAD_SIZE = 4096
+"""The number of bytes to search for the timestamp of a `Collection` file before parsing the whole file."""
+
+_TIMESTAMP_PATTERN = re.compile(rb'"timestamp"\s*:\s*(?:"([^"]*)"|(\d+))')
+
+
+@dataclass(frozen=True)
+class UploadResult:
+    """
+    The outcome of uploading a single `Collection` file with `PssFleetDataClient.upload_collections`.
+    """
+
+    file_path: Path
+    """The path to the `Collection` file."""
+    metadata: Optional[CollectionMetadata] = None
+    """The metadata of the `Collection` created. Taken from the `UploadLedger`, if its content has been uploaded before. `None`, if the upload failed
+    or has been skipped because of its timestamp."""
+    error: Optional[Exception] = None
+    """The error raised while reading or uploading the file, e.g. a `NonUniqueTimestampError`. `None`, if the upload succeeded or has been skipped."""
+    skipped: bool = False
+    """`True`, if the file has not been uploaded, because a `Collection` with its timestamp already exists or its content has been uploaded before."""
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        `True`, if the file has been uploaded, now or according to the `UploadLedger` before.
+        """
+        return self.metadata is not None
+
+
+class CollectionFileStream:
+    """
+    The multipart form body uploading a `Collection` file, streamed in chunks. The file gets read (and compressed) in a worker thread chunk by chunk,
+    so uploading large files neither blocks the event loop nor loads the whole file into memory.
+    """
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        field_name: str = "collection_file",
+        chunk_size: Optional[int] = None,
+        compress: bool = False,
+    ):
+        """Initializes a `CollectionFileStream`.
+
+        Args:
+            file_path (str | Path): The path to the `Collection` file to be uploaded.
+            field_name (str, optional): The name of the form field. Defaults to `collection_file`.
+            chunk_size (int, optional): The number of bytes to read at once. Defaults to `Config.upload_chunk_size`.
+            compress (bool, optional): Experimental. Compress the body with gzip while streaming it. The API server may not accept
+            `Content-Encoding: gzip`, so leave it off, unless the server is known to support it. Defaults to `False`.
+
+        Raises:
+            TypeError: Raised, if `chunk_size` is not of type `int`.
+            ValueError: Raised, if `chunk_size` is lower than 1.
+        """
+        self.__file_path: Path = Path(file_path)
+        self.__chunk_size: int = utils.ensure.positive_int(chunk_size, "chunk_size", default=get_config().upload_chunk_size)
+        self.__compress: bool = compress
+
+        boundary = uuid.uuid4().hex
+        self.__content_type: str = f"multipart/form-data; boundary={boundary}"
+        self.__head: bytes = (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{field_name}"; filename="collection"\r\n' "Content-Type: application/json\r\n\r\n"
+        ).encode()
+        self.__tail: bytes = f"\r\n--{boundary}--\r\n".encode()
+
+    @property
+    def chunk_size(self) -> int:
+        """
+        The number of bytes read at once.
+        """
+        return self.__chunk_size
+
+    @property
+    def compress(self) -> bool:
+        """
+        Determines, if the body gets compressed with gzip.
+        """
+        return self.__compress
+
+    @property
+    def file_path(self) -> Path:
+        """
+        The path to the `Collection` file to be uploaded.
+        """
+        return self.__file_path
+
+    def get_headers(self) -> dict[str, str]:
+        """Creates the headers describing the body. Without compression, the size of the file is known in advance, so that the body
+        doesn't have to be sent with chunked transfer encoding.
+
+        Raises:
+            OSError: Raised, if the file doesn't exist or can't be accessed.
+
+        Returns:
+            dict[str, str]: The headers `Content-Type` and either `Content-Encoding` or `Content-Length`.
+        """
+        headers = {"Content-Type": self.__content_type}
+        if self.__compress:
+            headers["Content-Encoding"] = "gzip"
+        else:
+            headers["Content-Length"] = str(len(self.__head) + os.stat(self.__file_path).st_size + len(self.__tail))
+        return headers
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        # wbits=31 writes a gzip header and trailer.
+        compressor = zlib.compressobj(wbits=31) if self.__compress else None
+        fp: BinaryIO = await asyncio.to_thread(open, self.__file_path, "rb")
+        try:
+            yield self._encode(self.__head, compressor)
+            while True:
+                chunk = await asyncio.to_thread(self._read_chunk, fp, compressor)
+                if chunk is None:
+                    break
+                if chunk:
+                    yield chunk
+        finally:
+            await asyncio.to_thread(fp.close)
+
+        tail = self._encode(self.__tail, compressor)
+        if compressor is not None:
+            tail += compressor.flush()
+        yield tail
+
+    def _read_chunk(self, fp: BinaryIO, compressor: Optional["zlib._Compress"]) -> Optional[bytes]:
+        # Returns `None` at the end of the file. Compressed chunks may be empty, if the compressor buffered all input.
+        chunk = fp.read(self.__chunk_size)
+        if not chunk:
+            return None
+        return self._encode(chunk, compressor)
+
+    @staticmethod
+    def _encode(data: bytes, compressor: Optional["zlib._Compress"]) -> bytes:
+        return compressor.compress(data) if compressor is not None else data
+
+
+def get_collection_file_paths(paths: Union[str, Path, Iterable[Union[str, Path]]]) -> list[Path]:
+    """Collects the paths of `Collection` files. Directories get replaced with the JSON files in them, sorted by name.
+
+    Args:
+        paths (str | Path | Iterable[str | Path]): A directory or paths to `Collection` files and directories.
+
+    Raises:
+        TypeError: Raised, if any of the paths is not of type `str` or `Path`.
+
+    Returns:
+        list[Path]: The paths of the `Collection` files.
+    """
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+
+    file_paths = []
+    for path in paths:
+        if not isinstance(path, (str, Path)):
+            raise TypeError("The paths must be of type `str` or `Path`.")
+        path = Path(path)
+        if path.is_dir():
+            file_paths.extend(sorted(path.glob("*.json")))
+        else:
+            file_paths.append(path)
+    return file_paths
+
+
+def read_collection_timestamp(file_path: Union[str, Path]) -> datetime:
+    """Reads the timestamp of a `Collection` file. Only the beginning of the file gets read, if the metadata is at the start of it.
+
+    Args:
+        file_path (str | Path): The path to the `Collection` file.
+
+    Raises:
+        OSError: Raised, if the file can't be read.
+        ValueError: Raised, if the file has no valid timestamp.
+
+    Returns:
+        datetime: The timestamp localized to UTC.
+    """
+    with open(file_path, "rb") as fp:
+        head = fp.read(_HEAD_SIZE)
+
+    match = _TIMESTAMP_PATTERN.search(head)
+    if match:
+        timestamp = match.group(1).decode() if match.group(1) is not None else int(match.group(2))
+    else:
+        try:
+            timestamp = json.loads(Path(file_path).read_bytes())["meta"]["timestamp"]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"The file has no timestamp: {file_path}") from e
+
+    try:
+        return utils.localize_to_utc(utils.parse_datetime(timestamp))
+    except (OverflowError, TypeError) as e:
+        raise ValueError(f"The file has an invalid timestamp: {file_path}") from e
+
+
+__all__ = [
+    CollectionFileStream.__name__,
+    UploadResult.__name__,
+    get_collection_file_paths.__name__,
+    read_collection_timestamp.__name__,
+]
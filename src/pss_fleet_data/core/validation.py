@@ -0,0 +1,296 @@
+import argparse
+import codecs
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Union
+
+from pydantic import TypeAdapter, ValidationError
+
+from .. import utils
+from ..models.api_models import ApiAlliance, ApiCollectionMetadata, ApiUser
+from .config import get_config
+from .upload import get_collection_file_paths
+
+
+SCHEMA_VERSION = 9
+"""The schema version of `Collection` files accepted by the API for upload."""
+
+_BATCH_SIZE = 1000
+"""The number of records to validate at once."""
+
+_MAX_VALUE_SIZE = 16 * 1024 * 1024
+"""The maximum size in characters of a single metadata object or record. Invalid JSON is only detected at the end of the file otherwise."""
+
+_RECORD_ADAPTERS = {
+    "fleets": TypeAdapter(list[ApiAlliance]),
+    "users": TypeAdapter(list[ApiUser]),
+}
+
+_SEPARATOR_PATTERN = re.compile(r"[ \t\n\r]*([,\]])[ \t\n\r]*")
+_WHITESPACE_PATTERN = re.compile(r"[ \t\n\r]*")
+
+
+class CollectionFileError(ValueError):
+    """
+    Raised, if a `Collection` file doesn't match the schema expected by the API.
+    """
+
+    def __init__(self, file_path: Union[str, Path], location: str, message: str):
+        super().__init__(file_path, location, message)
+        self.file_path: Path = Path(file_path)
+        """The path to the invalid `Collection` file."""
+        self.location: str = location
+        """The location of the first invalid value, e.g. `users[12][3]` for the 4th field of the 13th `User`. Empty, if the file itself is invalid."""
+        self.message: str = message
+        """A description of the problem."""
+
+    def __str__(self) -> str:
+        if self.location:
+            return f"{self.file_path} at {self.location}: {self.message}"
+        return f"{self.file_path}: {self.message}"
+
+
+def validate_collection_file(file_path: Union[str, Path], chunk_size: Optional[int] = None):
+    """Checks, if a `Collection` file matches the schema version 9 expected by the API: the metadata fields, the number of fields
+    of every `Alliance` and `User` and their value bounds. The file gets read in chunks and the records get validated in batches,
+    so that memory use doesn't depend on the size of the file.
+
+    Args:
+        file_path (str | Path): The path to the `Collection` file.
+        chunk_size (int, optional): The number of bytes to read at once. Defaults to `Config.upload_chunk_size`.
+
+    Raises:
+        CollectionFileError: Raised, if the file is not valid. Points out the first invalid record.
+        OSError: Raised, if the file can't be read.
+        TypeError: Raised, if `chunk_size` is not of type `int`.
+        ValueError: Raised, if `chunk_size` is lower than 1.
+    """
+    chunk_size = utils.ensure.positive_int(chunk_size, "chunk_size", default=get_config().upload_chunk_size)
+    with open(file_path, "rb") as fp:
+        reader = _JsonStreamReader(fp, file_path, chunk_size)
+        _validate_collection(reader, file_path)
+
+
+def validate_collection_files(file_paths: Union[str, Path, Iterable[Union[str, Path]]]) -> dict[Path, Optional[Exception]]:
+    """Checks many `Collection` files. See `validate_collection_file`.
+
+    Args:
+        file_paths (str | Path | Iterable[str | Path]): A directory or paths to `Collection` files and directories. Directories get replaced
+        with the JSON files in them, sorted by name.
+
+    Returns:
+        dict[Path, Optional[Exception]]: The `CollectionFileError` or `OSError` raised per file. `None`, if the file is valid.
+    """
+    results = {}
+    for file_path in get_collection_file_paths(file_paths):
+        try:
+            validate_collection_file(file_path)
+        except (CollectionFileError, OSError) as e:
+            results[file_path] = e
+        else:
+            results[file_path] = None
+    return results
+
+
+def main(args: Optional[list[str]] = None) -> int:
+    """Validates `Collection` files from the command line: `python -m pss_fleet_data.core.validation <paths>`.
+
+    Args:
+        args (list[str], optional): The command line arguments. Defaults to `None` (`sys.argv`).
+
+    Returns:
+        int: The exit code. `1`, if any file is invalid.
+    """
+    parser = argparse.ArgumentParser(prog="python -m pss_fleet_data.core.validation", description="Validates Collection files before uploading them.")
+    parser.add_argument("paths", nargs="+", help="Collection files or directories containing Collection files.")
+    parsed_args = parser.parse_args(args)
+
+    results = validate_collection_files(parsed_args.paths)
+    for file_path, error in results.items():
+        print(f"OK      {file_path}" if error is None else f"INVALID {error}")
+
+    invalid_count = sum(error is not None for error in results.values())
+    print(f"{len(results) - invalid_count} valid, {invalid_count} invalid")
+    return 1 if invalid_count else 0
+
+
+def _validate_collection(reader: "_JsonStreamReader", file_path: Union[str, Path]):
+    reader.expect("{")
+    has_metadata = False
+    if reader.peek() == "}":
+        reader.expect("}")
+    else:
+        while True:
+            key = reader.read_value()
+            reader.expect(":")
+            if key in _RECORD_ADAPTERS:
+                _validate_records(reader, file_path, key)
+            elif key == "meta":
+                _validate_metadata(reader.read_value(), file_path)
+                has_metadata = True
+            else:
+                _ = reader.read_value()
+
+            if reader.expect(",", "}") == "}":
+                break
+
+    reader.expect_end()
+    if not has_metadata:
+        raise CollectionFileError(file_path, "meta", "The metadata is missing.")
+
+
+def _validate_metadata(metadata: Any, file_path: Union[str, Path]):
+    if not isinstance(metadata, dict):
+        raise CollectionFileError(file_path, "meta", "The metadata must be an object.")
+
+    try:
+        # The API assigns these fields, so they may be missing from a file.
+        _ = ApiCollectionMetadata.model_validate({"collection_id": None, "data_version": None, "max_tournament_battle_attempts": None, **metadata})
+    except ValidationError as e:
+        error = e.errors()[0]
+        raise CollectionFileError(file_path, _format_location("meta", error["loc"]), error["msg"]) from None
+
+    if metadata["schema_version"] != SCHEMA_VERSION:
+        raise CollectionFileError(
+            file_path, "meta.schema_version", f"Expected schema version {SCHEMA_VERSION}, but got schema version {metadata['schema_version']}."
+        )
+
+
+def _validate_records(reader: "_JsonStreamReader", file_path: Union[str, Path], key: str):
+    adapter = _RECORD_ADAPTERS[key]
+    batch = []
+    offset = 0
+    for record in reader.read_array():
+        batch.append(record)
+        if len(batch) == _BATCH_SIZE:
+            _validate_batch(adapter, batch, offset, file_path, key)
+            offset += len(batch)
+            batch.clear()
+    _validate_batch(adapter, batch, offset, file_path, key)
+
+
+def _validate_batch(adapter: TypeAdapter, batch: list[Any], offset: int, file_path: Union[str, Path], key: str):
+    try:
+        _ = adapter.validate_python(batch)
+    except ValidationError as e:
+        error = e.errors()[0]
+        index, *field_location = error["loc"]
+        raise CollectionFileError(file_path, _format_location(f"{key}[{offset + index}]", field_location), error["msg"]) from None
+
+
+def _format_location(prefix: str, location: Iterable[Union[int, str]]) -> str:
+    return prefix + "".join(f"[{part}]" if isinstance(part, int) else f".{part}" for part in location)
+
+
+class _JsonStreamReader:
+    """
+    Reads the values of a JSON document one by one from a binary file, keeping only the unread part of the current chunk in memory.
+    """
+
+    def __init__(self, fp: BinaryIO, file_path: Union[str, Path], chunk_size: int):
+        self.__fp: BinaryIO = fp
+        self.__file_path: Union[str, Path] = file_path
+        self.__chunk_size: int = chunk_size
+        self.__decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.__json_decoder = json.JSONDecoder()
+        self.__buffer: str = ""
+        self.__position: int = 0
+        self.__end_of_file: bool = False
+
+    def expect(self, *characters: str) -> str:
+        character = self.peek()
+        if character not in characters:
+            expected = " or ".join(f"'{character}'" for character in characters)
+            raise self._create_error(f"Expected {expected}, but got {repr(character) if character else 'the end of the file'}.")
+        self.__position += 1
+        return character
+
+    def expect_end(self):
+        if self.peek():
+            raise self._create_error("Unexpected data after the end of the JSON document.")
+
+    def peek(self) -> str:
+        self._skip_whitespace()
+        if self.__position < len(self.__buffer):
+            return self.__buffer[self.__position]
+        return ""
+
+    def read_array(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.peek() == "]":
+            self.__position += 1
+            return
+
+        scan_once = self.__json_decoder.scan_once
+        while True:
+            # Fast path: the value and the following separator are in the buffer.
+            buffer = self.__buffer
+            try:
+                value, end = scan_once(buffer, self.__position)
+            except (StopIteration, json.JSONDecodeError):
+                # Incomplete or invalid: the slow path reads more data or reports the error.
+                match = None
+            else:
+                match = _SEPARATOR_PATTERN.match(buffer, end)
+
+            if match is not None and match.end() < len(buffer):
+                self.__position = match.end()
+                separator = match.group(1)
+            else:
+                value = self.read_value()
+                separator = self.expect(",", "]")
+
+            yield value
+            if separator == "]":
+                return
+
+    def read_value(self) -> Any:
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self.__json_decoder.raw_decode(self.__buffer, self.__position)
+            except json.JSONDecodeError as e:
+                if self.__end_of_file or len(self.__buffer) - self.__position > _MAX_VALUE_SIZE:
+                    raise self._create_error(e.msg) from None
+            else:
+                # A number at the end of the buffer might continue in the next chunk.
+                if end < len(self.__buffer) or self.__end_of_file:
+                    self.__position = end
+                    return value
+            self._read_chunk()
+
+    def _create_error(self, message: str) -> CollectionFileError:
+        return CollectionFileError(self.__file_path, "", f"Invalid JSON: {message}")
+
+    def _read_chunk(self):
+        chunk = self.__fp.read(self.__chunk_size)
+        self.__end_of_file = not chunk
+        try:
+            text = self.__decoder.decode(chunk, final=self.__end_of_file)
+        except UnicodeDecodeError as e:
+            raise self._create_error(str(e)) from None
+        position = self.__position
+        self.__buffer = self.__buffer[position:] + text
+        self.__position = 0
+
+    def _skip_whitespace(self):
+        while True:
+            self.__position = _WHITESPACE_PATTERN.match(self.__buffer, self.__position).end()
+            if self.__position < len(self.__buffer) or self.__end_of_file:
+                return
+            self._read_chunk()
+
+
+__all__ = [
+    "SCHEMA_VERSION",
+    CollectionFileError.__name__,
+    main.__name__,
+    validate_collection_file.__name__,
+    validate_collection_files.__name__,
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,42 @@
-from . import api_models, converters
-from .client_models import AllianceHistory, Collection, CollectionMetadata, UserHistory
+from typing import TYPE_CHECKING
+
+from ..core.lazy import create_lazy_module_attributes
+
+
+if TYPE_CHECKING:
+    from . import api_models, converters, records
+    from .client_models import AllianceHistory, Collection, CollectionMetadata, UserHistory
+    from .records import FleetAlliance, FleetUser
+
+
+__getattr__, __dir__ = create_lazy_module_attributes(
+    __name__,
+    {
+        # modules
+        "api_models": ".api_models",
+        "converters": ".converters",
+        "records": ".records",
+        # classes
+        "AllianceHistory": ".client_models:AllianceHistory",
+        "Collection": ".client_models:Collection",
+        "CollectionMetadata": ".client_models:CollectionMetadata",
+        "FleetAlliance": ".records:FleetAlliance",
+        "FleetUser": ".records:FleetUser",
+        "UserHistory": ".client_models:UserHistory",
+    },
+)
 
 
 __all__ = [
     # modules
-    api_models.__name__,
-    converters.__name__,
+    "api_models",
+    "converters",
+    "records",
     # classes
-    AllianceHistory.__name__,
-    Collection.__name__,
-    CollectionMetadata.__name__,
-    UserHistory.__name__,
+    "AllianceHistory",
+    "Collection",
+    "CollectionMetadata",
+    "FleetAlliance",
+    "FleetUser",
+    "UserHistory",
 ]
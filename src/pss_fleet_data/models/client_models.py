@@ -1,9 +1,14 @@
+from bisect import bisect_left
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from pssapi.entities import Alliance as PssAlliance
 from pssapi.entities import User as PssUser
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+
+
+if TYPE_CHECKING:
+    from ..analytics.table import Table
 
 
 class AllianceHistory(BaseModel):
@@ -32,6 +37,107 @@ class Collection(BaseModel):
     alliances: list[PssAlliance]
     users: list[PssUser]
 
+    _indexes: "_CollectionIndexes" = PrivateAttr(default_factory=lambda: _CollectionIndexes())
+
+    def clear_indexes(self):
+        """Discards the indexes used by the lookup methods. Call this after modifying `alliances` or `users` in place."""
+        self._indexes = _CollectionIndexes()
+
+    def get_alliance(self, alliance_id: int) -> Optional[PssAlliance]:
+        """Looks up an `Alliance` by its ID.
+
+        Args:
+            alliance_id (int): The ID of the `Alliance`.
+
+        Returns:
+            Optional[PssAlliance]: The `Alliance`, if it's part of this `Collection`.
+        """
+        return self._get_indexes().get_alliances_by_id(self.alliances).get(alliance_id)
+
+    def get_alliance_members(self, alliance_id: int) -> list[PssUser]:
+        """Looks up the members of an `Alliance`.
+
+        Args:
+            alliance_id (int): The ID of the `Alliance`. `0` returns the `User`s without an `Alliance`.
+
+        Returns:
+            list[PssUser]: The members of the `Alliance` in the order of `users`.
+        """
+        member_indices = self._get_indexes().get_member_indices_by_alliance_id(self.users).get(alliance_id, ())
+        return [self.users[i] for i in member_indices]
+
+    def get_top_alliances(self, field: str = "score", n: int = 100, group_by: Optional[str] = None) -> "Table":
+        """Ranks the `Alliance`s of this `Collection` by a field. See `pss_fleet_data.analytics.leaderboard.get_top_alliances`.
+
+        Args:
+            field (str, optional): The name of the field to rank by, e.g. `score`, `trophy` or `championship_score`. Defaults to `score`.
+            n (int, optional): The number of `Alliance`s to rank per group. Defaults to `100`.
+            group_by (str, optional): `division` to rank the `Alliance`s per division. Defaults to `None` (one ranking).
+
+        Raises:
+            ValueError: Raised, if the field or grouping is unknown or if `n` is negative.
+
+        Returns:
+            Table: One row per ranked `Alliance`, sorted by group and rank.
+        """
+        # Imported here, because the analytics package depends on the models.
+        from ..analytics.leaderboard import get_top_alliances
+
+        return get_top_alliances(self, field=field, n=n, group_by=group_by)
+
+    def get_top_users(self, field: str = "trophy", n: int = 100, group_by: Optional[str] = None) -> "Table":
+        """Ranks the `User`s of this `Collection` by a field. See `pss_fleet_data.analytics.leaderboard.get_top_users`.
+
+        Args:
+            field (str, optional): The name of the field to rank by, e.g. `trophy`, `alliance_score` or `championship_score`. Defaults to `trophy`.
+            n (int, optional): The number of `User`s to rank per group. Defaults to `100`.
+            group_by (str, optional): `alliance` or `division` to rank the `User`s per `Alliance` or per division. Defaults to `None` (one ranking).
+
+        Raises:
+            ValueError: Raised, if the field or grouping is unknown or if `n` is negative.
+
+        Returns:
+            Table: One row per ranked `User`, sorted by group and rank.
+        """
+        from ..analytics.leaderboard import get_top_users
+
+        return get_top_users(self, field=field, n=n, group_by=group_by)
+
+    def get_user(self, user_id: int) -> Optional[PssUser]:
+        """Looks up a `User` by its ID.
+
+        Args:
+            user_id (int): The ID of the `User`.
+
+        Returns:
+            Optional[PssUser]: The `User`, if it's part of this `Collection`.
+        """
+        return self._get_indexes().get_users_by_id(self.users).get(user_id)
+
+    def search_users(self, prefix: str, limit: Optional[int] = None) -> list[PssUser]:
+        """Looks up the `User`s whose names start with the given prefix, ignoring case.
+
+        Args:
+            prefix (str): The start of the names.
+            limit (int, optional): The maximum number of `User`s to return. Defaults to `None` (all matching `User`s).
+
+        Returns:
+            list[PssUser]: The matching `User`s, sorted by name.
+        """
+        names, user_indices = self._get_indexes().get_user_name_index(self.users)
+        prefix = prefix.casefold()
+
+        result = []
+        i = bisect_left(names, prefix)
+        while i < len(names) and names[i].startswith(prefix) and (limit is None or len(result) < limit):
+            result.append(self.users[user_indices[i]])
+            i += 1
+        return result
+
+    def _get_indexes(self) -> "_CollectionIndexes":
+        # Reading private attributes through pydantic's __getattr__ is slower than the lookups themselves.
+        return self.__pydantic_private__["_indexes"]
+
 
 class CollectionMetadata(BaseModel):
     """
@@ -71,3 +177,59 @@ class UserHistory(BaseModel):
     """The `User` data."""
     alliance: Optional[PssAlliance]
     """The `Alliance` of this `User`."""
+
+
+class _CollectionIndexes:
+    """
+    The lazily built lookup indexes of a `Collection`. Every index belongs to the list it was built from and gets rebuilt,
+    if the `Collection`'s `alliances` or `users` get replaced.
+    """
+
+    def __init__(self):
+        self.__alliances: Optional[list[PssAlliance]] = None
+        self.__alliances_by_id: dict[int, PssAlliance] = {}
+        self.__users: Optional[list[PssUser]] = None
+        self.__users_by_id: dict[int, PssUser] = {}
+        self.__member_indices_by_alliance_id: dict[int, list[int]] = {}
+        self.__name_indexed_users: Optional[list[PssUser]] = None
+        self.__user_name_index: tuple[list[str], list[int]] = ([], [])
+
+    def __eq__(self, other: object) -> bool:
+        # Indexes are derived data, so they must not affect the comparison of `Collection`s.
+        return isinstance(other, _CollectionIndexes)
+
+    def get_alliances_by_id(self, alliances: list[PssAlliance]) -> dict[int, PssAlliance]:
+        if self.__alliances is not alliances:
+            self.__alliances_by_id = {alliance.id: alliance for alliance in alliances}
+            self.__alliances = alliances
+        return self.__alliances_by_id
+
+    def get_member_indices_by_alliance_id(self, users: list[PssUser]) -> dict[int, list[int]]:
+        self._build_user_index(users)
+        return self.__member_indices_by_alliance_id
+
+    def get_users_by_id(self, users: list[PssUser]) -> dict[int, PssUser]:
+        self._build_user_index(users)
+        return self.__users_by_id
+
+    def get_user_name_index(self, users: list[PssUser]) -> tuple[list[str], list[int]]:
+        if self.__name_indexed_users is not users:
+            # Sorted case-folded names, so that the names starting with a prefix can be found with a binary search.
+            names_and_indices = sorted(((user.name or "").casefold(), i) for i, user in enumerate(users))
+            self.__user_name_index = ([name for name, _ in names_and_indices], [i for _, i in names_and_indices])
+            self.__name_indexed_users = users
+        return self.__user_name_index
+
+    def _build_user_index(self, users: list[PssUser]):
+        if self.__users is users:
+            return
+
+        users_by_id = {}
+        member_indices_by_alliance_id: dict[int, list[int]] = {}
+        for i, user in enumerate(users):
+            users_by_id[user.id] = user
+            member_indices_by_alliance_id.setdefault(user.alliance_id or 0, []).append(i)
+
+        self.__users_by_id = users_by_id
+        self.__member_indices_by_alliance_id = member_indices_by_alliance_id
+        self.__users = users
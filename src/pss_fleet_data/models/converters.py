@@ -1,18 +1,25 @@
-from typing import Optional
+import asyncio
+import json
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Optional, Sequence, TypeVar
 
 from httpx import Response
 from pssapi.entities import Alliance as PssAlliance
 from pssapi.entities import User as PssUser
+from pssapi.enums import AllianceMembership
 
 from .. import utils
+from ..core.config import get_config
 from ..core.exceptions import (
     AllianceNotFoundError,
     ApiError,
+    BadGatewayError,
     CollectionNotDeletedError,
     CollectionNotFoundError,
     ConflictError,
     FromDateAfterToDateError,
     FromDateTooEarlyError,
+    GatewayTimeoutError,
     InvalidAllianceIdError,
     InvalidBoolError,
     InvalidCollectionIdError,
@@ -37,17 +44,23 @@ from ..core.exceptions import (
     ParameterValueError,
     SchemaVersionMismatch,
     ServerError,
+    ServiceUnavailableError,
     ToDateTooEarlyError,
     TooManyRequestsError,
     UnsupportedMediaTypeError,
     UnsupportedSchemaError,
     UserNotFoundError,
 )
+from ..core.instrumentation import RequestPhase, measure_phase
+from ..core.tracing import trace_span
 from .api_models import ApiAlliance, ApiAllianceHistory, ApiCollection, ApiCollectionMetadata, ApiErrorResponse, ApiUser, ApiUserHistory
 from .client_models import AllianceHistory, Collection, CollectionMetadata, UserHistory
 from .enums import ErrorCode
 
 
+T = TypeVar("T")
+
+
 class FromAPI:
     """
     Offers functions to convert objects returned by the API to client objects or errors.
@@ -92,7 +105,7 @@ class FromAPI:
         return AllianceHistory(
             collection=FromAPI.to_collection_metadata(source.collection),
             alliance=FromAPI.to_pss_alliance(source.fleet),
-            users=[FromAPI.to_pss_user(api_user) for api_user in source.users] if source.users else list(),
+            users=FromAPI.to_pss_users(source.users) if source.users else list(),
         )
 
     @staticmethod
@@ -108,7 +121,32 @@ class FromAPI:
         return Collection(
             metadata=FromAPI.to_collection_metadata(source.meta),
             alliances=[FromAPI.to_pss_alliance(api_alliance) for api_alliance in source.fleets] if source.fleets else list(),
-            users=[FromAPI.to_pss_user(api_user) for api_user in source.users] if source.users else list(),
+            users=FromAPI.to_pss_users(source.users) if source.users else list(),
+        )
+
+    @staticmethod
+    async def to_collection_async(source: ApiCollection, chunk_size: Optional[int] = None) -> Collection:
+        """Converts a `Collection` returned by the API to a `Collection` like `to_collection`, but yields to the event loop after every
+        `chunk_size` `Alliance`s and `User`s, so that converting a large `Collection` doesn't block other tasks for seconds.
+        The conversion time gets recorded per chunk, so it doesn't include the time other tasks run in between.
+
+        Args:
+            source (ApiCollection): A `Collection` returned by the API.
+            chunk_size (int, optional): The number of records to convert at once. Defaults to `Config.conversion_chunk_size`.
+
+        Raises:
+            TypeError: Raised, if `chunk_size` is not of type `int`.
+            ValueError: Raised, if `chunk_size` is lower than 1.
+
+        Returns:
+            Collection: The converted `Collection`.
+        """
+        alliances = await _convert_in_chunks(source.fleets or [], FromAPI.to_pss_alliance, chunk_size)
+        users = await _convert_in_chunks(source.users or [], FromAPI.to_pss_users, chunk_size, batched=True)
+        return Collection(
+            metadata=FromAPI.to_collection_metadata(source.meta),
+            alliances=alliances,
+            users=users,
         )
 
     @staticmethod
@@ -167,30 +205,22 @@ class FromAPI:
         if source is None:
             return None
 
-        return PssUser(
-            {
-                "Id": source[0],
-                "Name": source[1],
-                "AllianceId": source[2],
-                "Trophy": source[3],
-                "AllianceScore": source[4],
-                "AllianceMembership": utils.decode_alliance_membership(source[5]),
-                "AllianceJoinDate": utils.format_datetime(utils.parse_datetime(source[6]), remove_tzinfo=True),
-                "LastLoginDate": utils.format_datetime(utils.parse_datetime(source[7]), remove_tzinfo=True),
-                "LastHeartBeatDate": utils.format_datetime(utils.parse_datetime(source[8]), remove_tzinfo=True),
-                "CrewDonated": source[9],
-                "CrewReceived": source[10],
-                "PVPAttackWins": source[11],
-                "PVPAttackLosses": source[12],
-                "PVPAttackDraws": source[13],
-                "PVPDefenceWins": source[14],
-                "PVPDefenceLosses": source[15],
-                "PVPDefenceDraws": source[16],
-                "ChampionshipScore": source[17],
-                "HighestTrophy": source[18],
-                "TournamentBonusScore": source[19],
-            }
-        )
+        return _create_pss_user(source, utils.decode_alliance_membership(source[5]))
+
+    @staticmethod
+    def to_pss_users(sources: Iterable[ApiUser]) -> list[PssUser]:
+        """Converts `User`s returned by the API to `pssapi.entities.User`s at once. Same as calling `to_pss_user` per `User`, but the
+        alliance memberships get decoded per column.
+
+        Args:
+            sources (Iterable[ApiUser]): The `User`s returned by the API.
+
+        Returns:
+            list[pssapi.entities.User]: The converted `User`s in the same order.
+        """
+        sources = sources if isinstance(sources, (list, tuple)) else list(sources)
+        alliance_memberships = utils.decode_alliance_memberships([source[5] for source in sources])
+        return [_create_pss_user(source, alliance_membership) for source, alliance_membership in zip(sources, alliance_memberships, strict=True)]
 
     @staticmethod
     def to_user_history(source: ApiUserHistory) -> UserHistory:
@@ -227,12 +257,15 @@ class FromResponse:
         if not source.text:
             return None
 
-        response_json = source.json()
+        with measure_phase(RequestPhase.JSON_DECODE):
+            response_json = source.json()
         if not response_json:
             return None
 
-        api_alliance_history = ApiAllianceHistory(**response_json)
-        alliance_history = FromAPI.to_alliance_history(api_alliance_history)
+        with measure_phase(RequestPhase.VALIDATION):
+            api_alliance_history = ApiAllianceHistory(**response_json)
+        with measure_phase(RequestPhase.CONVERSION):
+            alliance_history = FromAPI.to_alliance_history(api_alliance_history)
         return alliance_history
 
     @staticmethod
@@ -248,13 +281,69 @@ class FromResponse:
         if not source.text:
             return []
 
-        response_json = source.json()
+        with measure_phase(RequestPhase.JSON_DECODE):
+            response_json = source.json()
+        if not response_json:
+            return []
+
+        with measure_phase(RequestPhase.VALIDATION):
+            api_alliance_history_list = [ApiAllianceHistory(**item) for item in response_json]
+        with measure_phase(RequestPhase.CONVERSION):
+            alliance_history_list = [FromAPI.to_alliance_history(item) for item in api_alliance_history_list]
+        return alliance_history_list
+
+    @staticmethod
+    async def to_alliance_history_list_async(source: Response, chunk_size: Optional[int] = None) -> list[AllianceHistory]:
+        """Converts a `httpx.Response` returned by the API to a list of `AllianceHistory` objects like `to_alliance_history_list`,
+        but yields to the event loop after every `chunk_size` items. See `FromAPI.to_collection_async`.
+
+        Args:
+            source (httpx.Response): The response returned by the API.
+            chunk_size (int, optional): The number of items to convert at once. Defaults to `Config.conversion_chunk_size`.
+
+        Raises:
+            TypeError: Raised, if `chunk_size` is not of type `int`.
+            ValueError: Raised, if `chunk_size` is lower than 1.
+
+        Returns:
+            list[AllianceHistory]: The converted list of `AllianceHistory` objects. The list may be empty.
+        """
+        if not source.text:
+            return []
+
+        with measure_phase(RequestPhase.JSON_DECODE):
+            response_json = source.json()
         if not response_json:
             return []
 
-        alliance_history_list = [FromAPI.to_alliance_history(ApiAllianceHistory(**item)) for item in response_json]
+        with measure_phase(RequestPhase.VALIDATION):
+            api_alliance_history_list = [ApiAllianceHistory(**item) for item in response_json]
+        with trace_span(RequestPhase.CONVERSION.value):
+            alliance_history_list = await _convert_in_chunks(api_alliance_history_list, FromAPI.to_alliance_history, chunk_size)
         return alliance_history_list
 
+    @staticmethod
+    def to_api_collection(source: Response) -> Optional[ApiCollection]:
+        """Converts a `httpx.Response` returned by the API to an `ApiCollection`, without converting the `User`s and `Alliance`s to `pssapi` entities.
+
+        Args:
+            source (httpx.Response): The response returned by the API.
+
+        Returns:
+            Optional[ApiCollection]: The validated `ApiCollection` if the response has content, else `None`.
+        """
+        if not source.text:
+            return None
+
+        with measure_phase(RequestPhase.JSON_DECODE):
+            response_json = source.json()
+        if not response_json:
+            return None
+
+        with measure_phase(RequestPhase.VALIDATION):
+            api_collection = ApiCollection(**response_json)
+        return api_collection
+
     @staticmethod
     def to_collection(source: Response) -> Optional[Collection]:
         """Converts a `httpx.Response` returned by the API to a `Collection`.
@@ -265,15 +354,36 @@ class FromResponse:
         Returns:
             Optional[Collection]: The converted `Collection` if the response has content, else `None`.
         """
-        if not source.text:
+        api_collection = FromResponse.to_api_collection(source)
+        if api_collection is None:
             return None
 
-        response_json = source.json()
-        if not response_json:
+        with measure_phase(RequestPhase.CONVERSION):
+            collection = FromAPI.to_collection(api_collection)
+        return collection
+
+    @staticmethod
+    async def to_collection_async(source: Response, chunk_size: Optional[int] = None) -> Optional[Collection]:
+        """Converts a `httpx.Response` returned by the API to a `Collection` like `to_collection`, but yields to the event loop
+        after every `chunk_size` `Alliance`s and `User`s. See `FromAPI.to_collection_async`.
+
+        Args:
+            source (httpx.Response): The response returned by the API.
+            chunk_size (int, optional): The number of records to convert at once. Defaults to `Config.conversion_chunk_size`.
+
+        Raises:
+            TypeError: Raised, if `chunk_size` is not of type `int`.
+            ValueError: Raised, if `chunk_size` is lower than 1.
+
+        Returns:
+            Optional[Collection]: The converted `Collection` if the response has content, else `None`.
+        """
+        api_collection = FromResponse.to_api_collection(source)
+        if api_collection is None:
             return None
 
-        api_collection = ApiCollection(**response_json)
-        collection = FromAPI.to_collection(api_collection)
+        with trace_span(RequestPhase.CONVERSION.value):
+            collection = await FromAPI.to_collection_async(api_collection, chunk_size)
         return collection
 
     @staticmethod
@@ -289,12 +399,15 @@ class FromResponse:
         if not source.text:
             return None
 
-        response_json = source.json()
+        with measure_phase(RequestPhase.JSON_DECODE):
+            response_json = source.json()
         if not response_json:
             return None
 
-        api_collection_metadata = ApiCollectionMetadata(**response_json)
-        collection_metadata = FromAPI.to_collection_metadata(api_collection_metadata)
+        with measure_phase(RequestPhase.VALIDATION):
+            api_collection_metadata = ApiCollectionMetadata(**response_json)
+        with measure_phase(RequestPhase.CONVERSION):
+            collection_metadata = FromAPI.to_collection_metadata(api_collection_metadata)
         return collection_metadata
 
     @staticmethod
@@ -310,13 +423,54 @@ class FromResponse:
         if not source.text:
             return []
 
-        response_json = source.json()
+        with measure_phase(RequestPhase.JSON_DECODE):
+            response_json = source.json()
         if not response_json:
             return []
 
-        collection_metadata_list = [FromAPI.to_collection_metadata(ApiCollectionMetadata(**item)) for item in response_json]
+        with measure_phase(RequestPhase.VALIDATION):
+            api_collection_metadata_list = [ApiCollectionMetadata(**item) for item in response_json]
+        with measure_phase(RequestPhase.CONVERSION):
+            collection_metadata_list = [FromAPI.to_collection_metadata(item) for item in api_collection_metadata_list]
         return collection_metadata_list
 
+    @staticmethod
+    def to_error(source: Response) -> ApiError:
+        """Converts an error response to an `ApiError` to be raised. Error responses of the API get mapped by their error code without
+        validating them with `ApiErrorResponse`. Any other error response, e.g. an HTML page of a proxy or a status code like 502, 503 or 504,
+        gets mapped by its status code. The delay requested by a `Retry-After` header gets stored in `ApiError.retry_after`.
+
+        Args:
+            source (httpx.Response): The error response.
+
+        Returns:
+            ApiError: The converted `ApiError`. Never raises, regardless of the content of the response.
+        """
+        retry_after = utils.parse_retry_after(source.headers.get("Retry-After"))
+        error_json = _decode_error_json(source.content)
+        if error_json is not None:
+            return _error_code_lookup.get(error_json["code"], _get_error_class(source.status_code))(
+                error_json["code"],
+                str(error_json.get("message", "")),
+                str(error_json.get("details", "")),
+                str(error_json.get("timestamp", "")),
+                str(error_json.get("suggestion", "")),
+                {link.get("path"): link.get("description") for link in error_json.get("links") or () if isinstance(link, dict)},
+                retry_after,
+            )
+
+        status_code = source.status_code
+        is_retryable = status_code == 429 or status_code >= 500
+        return _get_error_class(status_code)(
+            f"HTTP_{status_code}",
+            source.reason_phrase,
+            source.content[:_ERROR_DETAILS_LENGTH].decode("utf-8", errors="replace").strip(),
+            utils.format_datetime(datetime.now(timezone.utc)),
+            "Try again later." if is_retryable else "",
+            {},
+            retry_after,
+        )
+
     @staticmethod
     def to_user_history(source: Response) -> Optional[UserHistory]:
         """Converts a `httpx.Response` returned by the API to a `UserHistory`.
@@ -330,14 +484,47 @@ class FromResponse:
         if not source.text:
             return None
 
-        response_json = source.json()
+        with measure_phase(RequestPhase.JSON_DECODE):
+            response_json = source.json()
         if not response_json:
             return None
 
-        api_user_history = ApiUserHistory(**response_json)
-        user_history = FromAPI.to_user_history(api_user_history)
+        with measure_phase(RequestPhase.VALIDATION):
+            api_user_history = ApiUserHistory(**response_json)
+        with measure_phase(RequestPhase.CONVERSION):
+            user_history = FromAPI.to_user_history(api_user_history)
         return user_history
 
+    @staticmethod
+    async def to_user_history_list_async(source: Response, chunk_size: Optional[int] = None) -> list[UserHistory]:
+        """Converts a `httpx.Response` returned by the API to a list of `UserHistory` objects like `to_user_history_list`,
+        but yields to the event loop after every `chunk_size` items. See `FromAPI.to_collection_async`.
+
+        Args:
+            source (httpx.Response): The response returned by the API.
+            chunk_size (int, optional): The number of items to convert at once. Defaults to `Config.conversion_chunk_size`.
+
+        Raises:
+            TypeError: Raised, if `chunk_size` is not of type `int`.
+            ValueError: Raised, if `chunk_size` is lower than 1.
+
+        Returns:
+            list[UserHistory]: The converted list of `UserHistory` objects. The list may be empty.
+        """
+        if not source.text:
+            return []
+
+        with measure_phase(RequestPhase.JSON_DECODE):
+            response_json = source.json()
+        if not response_json:
+            return []
+
+        with measure_phase(RequestPhase.VALIDATION):
+            api_user_history_list = [ApiUserHistory(**item) for item in response_json]
+        with trace_span(RequestPhase.CONVERSION.value):
+            user_history_list = await _convert_in_chunks(api_user_history_list, FromAPI.to_user_history, chunk_size)
+        return user_history_list
+
     @staticmethod
     def to_user_history_list(source: Response) -> list[UserHistory]:
         """Converts a `httpx.Response` returned by the API to a list of `UserHistory` objects.
@@ -351,11 +538,15 @@ class FromResponse:
         if not source.text:
             return []
 
-        response_json = source.json()
+        with measure_phase(RequestPhase.JSON_DECODE):
+            response_json = source.json()
         if not response_json:
             return []
 
-        user_history_list = [FromAPI.to_user_history(ApiUserHistory(**item)) for item in response_json]
+        with measure_phase(RequestPhase.VALIDATION):
+            api_user_history_list = [ApiUserHistory(**item) for item in response_json]
+        with measure_phase(RequestPhase.CONVERSION):
+            user_history_list = [FromAPI.to_user_history(item) for item in api_user_history_list]
         return user_history_list
 
 
@@ -365,27 +556,30 @@ class ToAPI:
     """
 
     @staticmethod
-    def from_collection(source: Collection) -> ApiCollection:
+    def from_collection(source: Collection, keep_collection_id: bool = False) -> ApiCollection:
         """Converts a `Collection` to a `Collection` to be sent to the API.
 
         Args:
             source (Collection): The `Collection` to be converted.
+            keep_collection_id (bool, optional): Keep the `collection_id`, e.g. to store the `Collection` locally. See `from_collection_metadata`. Defaults to `False`.
 
         Returns:
             ApiCollection: The converted `Collection`.
         """
         return ApiCollection(
-            meta=ToAPI.from_collection_metadata(source.metadata),
+            meta=ToAPI.from_collection_metadata(source.metadata, keep_collection_id=keep_collection_id),
             fleets=[ToAPI.from_pss_alliance(alliance) for alliance in source.alliances] if source.alliances else list(),
-            users=[ToAPI.from_pss_user(users) for users in source.users] if source.users else list(),
+            users=ToAPI.from_pss_users(source.users) if source.users else list(),
         )
 
     @staticmethod
-    def from_collection_metadata(source: CollectionMetadata) -> ApiCollectionMetadata:
-        """Converts a `CollectionMetadata` to a `CollectionMetadata` to be sent to the API.
+    def from_collection_metadata(source: CollectionMetadata, keep_collection_id: bool = False) -> ApiCollectionMetadata:
+        """Converts a `CollectionMetadata` to a `CollectionMetadata` to be sent to the API. The `collection_id` gets dropped by default,
+        because the API assigns it on upload.
 
         Args:
             source (Collection): The `CollectionMetadata` to be converted.
+            keep_collection_id (bool, optional): Keep the `collection_id`, e.g. to store the `Collection` locally. Defaults to `False`.
 
         Returns:
             ApiCollectionMetadata: The converted `CollectionMetadata`.
@@ -396,7 +590,7 @@ class ToAPI:
             fleet_count=source.fleet_count,
             user_count=source.user_count,
             tourney_running=source.tournament_running,
-            collection_id=None,
+            collection_id=source.collection_id if keep_collection_id else None,
             schema_version=source.schema_version,
             max_tournament_battle_attempts=source.max_tournament_battle_attempts,
             data_version=source.data_version,
@@ -439,7 +633,8 @@ class ToAPI:
             source.alliance_id,
             source.trophy,
             source.alliance_score,
-            utils.encode_alliance_membership(source.alliance_membership),
+            # pssapi parses the membership "None" of users without an alliance to `None`
+            utils.encode_alliance_membership(source.alliance_membership or AllianceMembership.NONE),
             utils.convert_datetime_to_seconds(source.alliance_join_date),
             utils.convert_datetime_to_seconds(source.last_login_date),
             utils.convert_datetime_to_seconds(source.last_heart_beat_date),
@@ -456,6 +651,112 @@ class ToAPI:
             source.tournament_bonus_score,
         )
 
+    @staticmethod
+    def from_pss_users(sources: Iterable[PssUser]) -> list[ApiUser]:
+        """Converts `User`s from the PSS API to `User`s to be sent to the API at once. Same as calling `from_pss_user` per `User`, but the
+        alliance memberships and dates get encoded per column.
+
+        Args:
+            sources (Iterable[pssapi.entities.User]): The `User`s to be converted.
+
+        Returns:
+            list[ApiUser]: The converted `User`s in the same order.
+        """
+        sources = list(sources)
+        # pssapi parses the membership "None" of users without an alliance to `None`
+        alliance_memberships = utils.encode_alliance_memberships([source.alliance_membership or AllianceMembership.NONE for source in sources])
+        alliance_join_dates = utils.convert_datetimes_to_seconds([source.alliance_join_date for source in sources])
+        last_login_dates = utils.convert_datetimes_to_seconds([source.last_login_date for source in sources])
+        last_heartbeat_dates = utils.convert_datetimes_to_seconds([source.last_heart_beat_date for source in sources])
+        return [
+            (
+                source.id,
+                source.name,
+                source.alliance_id,
+                source.trophy,
+                source.alliance_score,
+                alliance_membership,
+                alliance_join_date,
+                last_login_date,
+                last_heartbeat_date,
+                source.crew_donated,
+                source.crew_received,
+                source.pvp_attack_wins,
+                source.pvp_attack_losses,
+                source.pvp_attack_draws,
+                source.pvp_defence_wins,
+                source.pvp_defence_losses,
+                source.pvp_defence_draws,
+                source.championship_score,
+                source.highest_trophy,
+                source.tournament_bonus_score,
+            )
+            for source, alliance_membership, alliance_join_date, last_login_date, last_heartbeat_date in zip(
+                sources, alliance_memberships, alliance_join_dates, last_login_dates, last_heartbeat_dates, strict=True
+            )
+        ]
+
+
+def _create_pss_user(source: ApiUser, alliance_membership: AllianceMembership) -> PssUser:
+    return PssUser(
+        {
+            "Id": source[0],
+            "Name": source[1],
+            "AllianceId": source[2],
+            "Trophy": source[3],
+            "AllianceScore": source[4],
+            "AllianceMembership": alliance_membership,
+            "AllianceJoinDate": utils.format_datetime(utils.parse_datetime(source[6]), remove_tzinfo=True),
+            "LastLoginDate": utils.format_datetime(utils.parse_datetime(source[7]), remove_tzinfo=True),
+            "LastHeartBeatDate": utils.format_datetime(utils.parse_datetime(source[8]), remove_tzinfo=True),
+            "CrewDonated": source[9],
+            "CrewReceived": source[10],
+            "PVPAttackWins": source[11],
+            "PVPAttackLosses": source[12],
+            "PVPAttackDraws": source[13],
+            "PVPDefenceWins": source[14],
+            "PVPDefenceLosses": source[15],
+            "PVPDefenceDraws": source[16],
+            "ChampionshipScore": source[17],
+            "HighestTrophy": source[18],
+            "TournamentBonusScore": source[19],
+        }
+    )
+
+
+def _decode_error_json(content: bytes) -> Optional[dict[str, Any]]:
+    # Only attempt to decode bodies looking like a JSON object, so that HTML pages don't raise and catch a `JSONDecodeError`.
+    if content.lstrip()[:1] != b"{":
+        return None
+    try:
+        result = json.loads(content)
+    except ValueError:
+        return None
+    if not isinstance(result, dict) or not isinstance(result.get("code"), str):
+        return None
+    return result
+
+
+def _get_error_class(status_code: int) -> type[ApiError]:
+    error_class = _status_code_lookup.get(status_code)
+    if error_class is not None:
+        return error_class
+    return ServerError if status_code >= 500 else ApiError
+
+
+async def _convert_in_chunks(items: Sequence[Any], converter: Callable[[Any], T], chunk_size: Optional[int], batched: bool = False) -> list[T]:
+    # A batched converter takes a whole chunk and returns a list, e.g. `FromAPI.to_pss_users`.
+    chunk_size = utils.ensure.positive_int(chunk_size, "chunk_size", default=get_config().conversion_chunk_size)
+    results = []
+    for start in range(0, len(items), chunk_size):
+        if start:
+            # Let other tasks run between chunks.
+            await asyncio.sleep(0)
+        end = start + chunk_size
+        with measure_phase(RequestPhase.CONVERSION, record_span=False):
+            results.extend(converter(items[start:end]) if batched else map(converter, items[start:end]))
+    return results
+
 
 _error_code_lookup = {
     ErrorCode.ALLIANCE_NOT_FOUND: AllianceNotFoundError,
@@ -495,3 +796,23 @@ _error_code_lookup = {
     ErrorCode.USER_NOT_FOUND: UserNotFoundError,
 }
 """A lookup from an API `ErrorCode` to a specific `Exception` type."""
+
+_status_code_lookup = {
+    400: ParameterValidationError,
+    401: NotAuthenticatedError,
+    403: MissingAccessError,
+    404: NotFoundError,
+    405: MethodNotAllowedError,
+    409: ConflictError,
+    415: UnsupportedMediaTypeError,
+    422: ParameterValidationError,
+    429: TooManyRequestsError,
+    500: ServerError,
+    502: BadGatewayError,
+    503: ServiceUnavailableError,
+    504: GatewayTimeoutError,
+}
+"""A lookup from an HTTP status code to the `Exception` type raised for error responses without an API `ErrorCode`."""
+
+_ERROR_DETAILS_LENGTH = 500
+"""The maximum number of bytes of the body of an error response without an API `ErrorCode` to be included in the `ApiError`."""
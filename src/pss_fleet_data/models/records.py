@@ -0,0 +1,148 @@
+from typing import NamedTuple, Optional
+
+from pssapi.entities import Alliance as PssAlliance
+from pssapi.entities import User as PssUser
+
+from .api_models import ApiAlliance, ApiCollection, ApiUser
+from .converters import FromAPI, ToAPI
+
+
+class FleetAlliance(NamedTuple):
+    """
+    A compact, immutable `Alliance` record with the fields of an `ApiAlliance` in the same order. It is a tuple itself, so it can be used
+    wherever an `ApiAlliance` is expected. Takes a fraction of the memory of a `pssapi.entities.Alliance`.
+    """
+
+    alliance_id: int
+    alliance_name: str
+    score: int
+    division_design_id: int
+    trophy: Optional[int] = None
+    championship_score: Optional[int] = None
+    number_of_members: Optional[int] = None
+    number_of_approved_members: Optional[int] = None
+
+    @classmethod
+    def from_api(cls, source: ApiAlliance) -> "FleetAlliance":
+        """Creates a `FleetAlliance` from an `Alliance` returned by the API.
+
+        Args:
+            source (ApiAlliance): An `Alliance` returned by the API.
+
+        Returns:
+            FleetAlliance: The record.
+        """
+        return cls._make(source)
+
+    @classmethod
+    def from_pss_alliance(cls, source: PssAlliance) -> "FleetAlliance":
+        """Creates a `FleetAlliance` from a `pssapi.entities.Alliance`.
+
+        Args:
+            source (pssapi.entities.Alliance): The `Alliance` to be converted.
+
+        Returns:
+            FleetAlliance: The record.
+        """
+        return cls._make(ToAPI.from_pss_alliance(source))
+
+    def to_pss_alliance(self) -> PssAlliance:
+        """Converts the record to a `pssapi.entities.Alliance`.
+
+        Returns:
+            pssapi.entities.Alliance: The converted `Alliance`.
+        """
+        return FromAPI.to_pss_alliance(self)
+
+
+class FleetUser(NamedTuple):
+    """
+    A compact, immutable `User` record with the fields of an `ApiUser` in the same order. It is a tuple itself, so it can be used
+    wherever an `ApiUser` is expected. Values are encoded like in an `ApiUser`: the alliance membership as an `int`, dates as seconds
+    since the PSS start date. Takes a fraction of the memory of a `pssapi.entities.User`, because no values get parsed or copied to a dict.
+    """
+
+    user_id: int
+    user_name: str
+    alliance_id: int
+    trophy: int
+    alliance_score: int
+    alliance_membership: int
+    alliance_join_date: Optional[int] = None
+    last_login_date: Optional[int] = None
+    last_heartbeat_date: Optional[int] = None
+    crew_donated: Optional[int] = None
+    crew_received: Optional[int] = None
+    pvp_attack_wins: Optional[int] = None
+    pvp_attack_losses: Optional[int] = None
+    pvp_attack_draws: Optional[int] = None
+    pvp_defence_wins: Optional[int] = None
+    pvp_defence_losses: Optional[int] = None
+    pvp_defence_draws: Optional[int] = None
+    championship_score: Optional[int] = None
+    highest_trophy: Optional[int] = None
+    tournament_bonus_score: Optional[int] = None
+
+    @classmethod
+    def from_api(cls, source: ApiUser) -> "FleetUser":
+        """Creates a `FleetUser` from a `User` returned by the API.
+
+        Args:
+            source (ApiUser): A `User` returned by the API.
+
+        Returns:
+            FleetUser: The record.
+        """
+        return cls._make(source)
+
+    @classmethod
+    def from_pss_user(cls, source: PssUser) -> "FleetUser":
+        """Creates a `FleetUser` from a `pssapi.entities.User`.
+
+        Args:
+            source (pssapi.entities.User): The `User` to be converted.
+
+        Returns:
+            FleetUser: The record.
+        """
+        return cls._make(ToAPI.from_pss_user(source))
+
+    def to_pss_user(self) -> PssUser:
+        """Converts the record to a `pssapi.entities.User`, decoding the alliance membership and the dates.
+
+        Returns:
+            pssapi.entities.User: The converted `User`.
+        """
+        return FromAPI.to_pss_user(self)
+
+
+def get_fleet_alliances(source: ApiCollection) -> list[FleetAlliance]:
+    """Creates `FleetAlliance` records of all `Alliance`s in a `Collection` returned by the API.
+
+    Args:
+        source (ApiCollection): A `Collection` returned by the API.
+
+    Returns:
+        list[FleetAlliance]: The records.
+    """
+    return list(map(FleetAlliance._make, source.fleets or ()))
+
+
+def get_fleet_users(source: ApiCollection) -> list[FleetUser]:
+    """Creates `FleetUser` records of all `User`s in a `Collection` returned by the API.
+
+    Args:
+        source (ApiCollection): A `Collection` returned by the API.
+
+    Returns:
+        list[FleetUser]: The records.
+    """
+    return list(map(FleetUser._make, source.users or ()))
+
+
+__all__ = [
+    FleetAlliance.__name__,
+    FleetUser.__name__,
+    get_fleet_alliances.__name__,
+    get_fleet_users.__name__,
+]
@@ -1,34 +1,78 @@
-from . import ensure
-from .convert import decode_alliance_membership, encode_alliance_membership
-from .datetime import (
-    add_timezone_utc,
-    convert_datetime_to_seconds,
-    format_datetime,
-    get_most_recent_from_to_date_from_timestamp,
-    get_most_recent_timestamp,
-    localize_to_utc,
-    parse_datetime,
-    remove_timezone,
+from typing import TYPE_CHECKING
+
+from ..core.lazy import create_lazy_module_attributes
+
+
+if TYPE_CHECKING:
+    from . import ensure
+    from .convert import decode_alliance_membership, decode_alliance_memberships, encode_alliance_membership, encode_alliance_memberships
+    from .datetime import (
+        add_timezone_utc,
+        convert_datetime_to_seconds,
+        convert_datetimes_to_seconds,
+        format_datetime,
+        get_most_recent_from_to_date_from_timestamp,
+        get_most_recent_timestamp,
+        localize_to_utc,
+        parse_datetime,
+        remove_timezone,
+    )
+    from .files import open_atomic
+    from .requests import create_parameter_dict, merge_headers, parse_retry_after
+
+
+__getattr__, __dir__ = create_lazy_module_attributes(
+    __name__,
+    {
+        # modules
+        "ensure": ".ensure",
+        # .convert
+        "decode_alliance_membership": ".convert:decode_alliance_membership",
+        "decode_alliance_memberships": ".convert:decode_alliance_memberships",
+        "encode_alliance_membership": ".convert:encode_alliance_membership",
+        "encode_alliance_memberships": ".convert:encode_alliance_memberships",
+        # .datetime
+        "add_timezone_utc": ".datetime:add_timezone_utc",
+        "convert_datetime_to_seconds": ".datetime:convert_datetime_to_seconds",
+        "convert_datetimes_to_seconds": ".datetime:convert_datetimes_to_seconds",
+        "format_datetime": ".datetime:format_datetime",
+        "get_most_recent_from_to_date_from_timestamp": ".datetime:get_most_recent_from_to_date_from_timestamp",
+        "get_most_recent_timestamp": ".datetime:get_most_recent_timestamp",
+        "localize_to_utc": ".datetime:localize_to_utc",
+        "parse_datetime": ".datetime:parse_datetime",
+        "remove_timezone": ".datetime:remove_timezone",
+        # .files
+        "open_atomic": ".files:open_atomic",
+        # .requests
+        "create_parameter_dict": ".requests:create_parameter_dict",
+        "merge_headers": ".requests:merge_headers",
+        "parse_retry_after": ".requests:parse_retry_after",
+    },
 )
-from .requests import create_parameter_dict, merge_headers
 
 
 __all__ = [
     # modules
-    ensure.__name__,
+    "ensure",
     # .convert
-    decode_alliance_membership.__name__,
-    encode_alliance_membership.__name__,
+    "decode_alliance_membership",
+    "decode_alliance_memberships",
+    "encode_alliance_membership",
+    "encode_alliance_memberships",
     # .datetime
-    add_timezone_utc.__name__,
-    convert_datetime_to_seconds.__name__,
-    format_datetime.__name__,
-    get_most_recent_from_to_date_from_timestamp.__name__,
-    get_most_recent_timestamp.__name__,
-    localize_to_utc.__name__,
-    parse_datetime.__name__,
-    remove_timezone.__name__,
-    # requests
-    create_parameter_dict.__name__,
-    merge_headers.__name__,
+    "add_timezone_utc",
+    "convert_datetime_to_seconds",
+    "convert_datetimes_to_seconds",
+    "format_datetime",
+    "get_most_recent_from_to_date_from_timestamp",
+    "get_most_recent_timestamp",
+    "localize_to_utc",
+    "parse_datetime",
+    "remove_timezone",
+    # .files
+    "open_atomic",
+    # .requests
+    "create_parameter_dict",
+    "merge_headers",
+    "parse_retry_after",
 ]
@@ -1,10 +1,30 @@
-from typing import Union
+from typing import Iterable, Union
 
 from pssapi.enums import AllianceMembership
 
 from ..models.enums import UserAllianceMembershipEncoded
 
 
+_DECODED_ALLIANCE_MEMBERSHIPS: tuple[AllianceMembership, ...] = (
+    AllianceMembership.FLEET_ADMIRAL,
+    AllianceMembership.VICE_ADMIRAL,
+    AllianceMembership.COMMANDER,
+    AllianceMembership.MAJOR,
+    AllianceMembership.LIEUTENANT,
+    AllianceMembership.ENSIGN,
+    AllianceMembership.CANDIDATE,
+    AllianceMembership.NONE,
+)
+"""The decoded alliance memberships, indexed by the encoded value. `NONE` comes last, so that it gets found at index `-1`."""
+_MIN_ENCODED_ALLIANCE_MEMBERSHIP = int(min(UserAllianceMembershipEncoded))
+_MAX_ENCODED_ALLIANCE_MEMBERSHIP = int(max(UserAllianceMembershipEncoded))
+
+_ENCODED_ALLIANCE_MEMBERSHIPS: dict[str, int] = {
+    str(_DECODED_ALLIANCE_MEMBERSHIPS[encoded]): int(encoded) for encoded in UserAllianceMembershipEncoded
+}
+"""The encoded alliance memberships by decoded value. Since `AllianceMembership` is a `StrEnum`, it can be looked up by enum member, too."""
+
+
 def decode_alliance_membership(membership: Union[int, UserAllianceMembershipEncoded]) -> AllianceMembership:
     """Converts an `int` or `UserCreateAllianceMembership` enum into a `AllianceMembership`.
 
@@ -21,29 +41,40 @@ def decode_alliance_membership(membership: Union[int, UserAllianceMembershipEnco
     if membership is None:
         raise ValueError("The parameter `membership` must not be `None`!")
 
-    if isinstance(membership, bool) or not isinstance(membership, (int, UserAllianceMembershipEncoded)):
+    if isinstance(membership, bool) or not isinstance(membership, int):
         raise TypeError("The parameter `membership` must be of type `int` or `UserCreateAllianceMembership`!")
 
-    if isinstance(membership, int):
-        membership = UserAllianceMembershipEncoded(membership)
-
-    match membership:
-        case UserAllianceMembershipEncoded.NONE:
-            return AllianceMembership.NONE
-        case UserAllianceMembershipEncoded.CANDIDATE:
-            return AllianceMembership.CANDIDATE
-        case UserAllianceMembershipEncoded.ENSIGN:
-            return AllianceMembership.ENSIGN
-        case UserAllianceMembershipEncoded.LIEUTENANT:
-            return AllianceMembership.LIEUTENANT
-        case UserAllianceMembershipEncoded.MAJOR:
-            return AllianceMembership.MAJOR
-        case UserAllianceMembershipEncoded.COMMANDER:
-            return AllianceMembership.COMMANDER
-        case UserAllianceMembershipEncoded.VICE_ADMIRAL:
-            return AllianceMembership.VICE_ADMIRAL
-        case UserAllianceMembershipEncoded.FLEET_ADMIRAL:
-            return AllianceMembership.FLEET_ADMIRAL
+    if not _MIN_ENCODED_ALLIANCE_MEMBERSHIP <= membership <= _MAX_ENCODED_ALLIANCE_MEMBERSHIP:
+        raise ValueError(f"{membership} is not a valid {UserAllianceMembershipEncoded.__name__}")
+
+    return _DECODED_ALLIANCE_MEMBERSHIPS[membership]
+
+
+def decode_alliance_memberships(memberships: Iterable[int]) -> list[AllianceMembership]:
+    """Converts a column of `int`s or `UserCreateAllianceMembership` enums into `AllianceMembership`s at once.
+
+    Args:
+        memberships (Iterable[int]): The alliance memberships (member ranks) to be decoded.
+
+    Raises:
+        ValueError: Raised, if any value is not a valid value for the enum `UserCreateAllianceMembership`.
+        TypeError: Raised, if any value is not of type `int` or `UserCreateAllianceMembership`.
+
+    Returns:
+        list[AllianceMembership]: The decoded alliance memberships (member ranks) in the same order.
+    """
+    memberships = memberships if isinstance(memberships, (list, tuple)) else list(memberships)
+    if not memberships:
+        return []
+
+    value_types = set(map(type, memberships))
+    if bool in value_types or not all(issubclass(value_type, int) for value_type in value_types):
+        raise TypeError("The parameter `memberships` must only contain values of type `int` or `UserCreateAllianceMembership`!")
+
+    if min(memberships) < _MIN_ENCODED_ALLIANCE_MEMBERSHIP or max(memberships) > _MAX_ENCODED_ALLIANCE_MEMBERSHIP:
+        raise ValueError(f"The parameter `memberships` must only contain valid values of {UserAllianceMembershipEncoded.__name__}!")
+
+    return list(map(_DECODED_ALLIANCE_MEMBERSHIPS.__getitem__, memberships))
 
 
 def encode_alliance_membership(membership: Union[str, AllianceMembership]) -> int:
@@ -54,7 +85,7 @@ def encode_alliance_membership(membership: Union[str, AllianceMembership]) -> in
 
     Raises:
         TypeError: Raised, if the parameter `membership` is not of type `str` or `AllianceMembership`.
-        ValueError: Raised, if the parameter `membership` is `None` or not a valid value of the `StrEnum` `AllianceMembership`.
+        ValueError: Raised, if the parameter `membership` is `None` or not a valid value of the `StrEnum` `AllianceMembership` or can't be encoded.
 
     Returns:
         int: An `int` representing an encoded `AllianceMembership` value.
@@ -62,26 +93,28 @@ def encode_alliance_membership(membership: Union[str, AllianceMembership]) -> in
     if not membership:
         raise ValueError("Parameter `membership` must not be `None`!")
 
-    if not isinstance(membership, (str, AllianceMembership)):
+    if not isinstance(membership, str):
         raise TypeError("Parameter `membership` must be of type `str` or `AllianceMembership`!")
 
-    if isinstance(membership, str):
-        membership = AllianceMembership(membership)
-
-    match membership:
-        case AllianceMembership.NONE:
-            return int(UserAllianceMembershipEncoded.NONE)
-        case AllianceMembership.CANDIDATE:
-            return int(UserAllianceMembershipEncoded.CANDIDATE)
-        case AllianceMembership.ENSIGN:
-            return int(UserAllianceMembershipEncoded.ENSIGN)
-        case AllianceMembership.LIEUTENANT:
-            return int(UserAllianceMembershipEncoded.LIEUTENANT)
-        case AllianceMembership.MAJOR:
-            return int(UserAllianceMembershipEncoded.MAJOR)
-        case AllianceMembership.COMMANDER:
-            return int(UserAllianceMembershipEncoded.COMMANDER)
-        case AllianceMembership.VICE_ADMIRAL:
-            return int(UserAllianceMembershipEncoded.VICE_ADMIRAL)
-        case AllianceMembership.FLEET_ADMIRAL:
-            return int(UserAllianceMembershipEncoded.FLEET_ADMIRAL)
+    encoded = _ENCODED_ALLIANCE_MEMBERSHIPS.get(membership)
+    if encoded is None:
+        raise ValueError(f"'{membership}' is not an encodable {AllianceMembership.__name__}")
+    return encoded
+
+
+def encode_alliance_memberships(memberships: Iterable[Union[str, AllianceMembership]]) -> list[int]:
+    """Converts a column of `str`s or `AllianceMembership` enums into `int`s at once.
+
+    Args:
+        memberships (Iterable[Union[str, AllianceMembership]]): The alliance memberships (member ranks) to be encoded.
+
+    Raises:
+        ValueError: Raised, if any value is not a valid value of the `StrEnum` `AllianceMembership` or can't be encoded.
+
+    Returns:
+        list[int]: The encoded alliance memberships in the same order.
+    """
+    try:
+        return list(map(_ENCODED_ALLIANCE_MEMBERSHIPS.__getitem__, memberships))
+    except (KeyError, TypeError) as exc:
+        raise ValueError(f"The parameter `memberships` must only contain encodable values of {AllianceMembership.__name__}!") from exc
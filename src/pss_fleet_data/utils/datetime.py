@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Iterable, Optional, Union
 
 import dateutil
 
@@ -7,6 +8,13 @@ from ..core.config import get_config
 from ..models.enums import ParameterInterval
 
 
+_PARSED_DATETIME_CACHE_SIZE = 4096
+"""The number of parsed `str` values to remember. Histories repeat the timestamps of the same `Collection`s over and over."""
+
+_PSS_START_TIMESTAMP = int(get_config().pss_start_date.timestamp())
+"""The PSS start date as seconds since the POSIX epoch. The `Config` is immutable, so it only gets calculated once."""
+
+
 def add_timezone_utc(dt: Optional[datetime]) -> datetime:
     """Takes a `datetime` and makes it a timezone-aware `datetime` with timezone UTC, if it's not timezone-aware, yet.
 
@@ -49,11 +57,25 @@ def convert_datetime_to_seconds(dt: Optional[datetime]) -> int:
     if not isinstance(dt, datetime):
         raise TypeError("The parameter `dt` must be of type `datetime`!")
 
-    dt = localize_to_utc(dt)
-    if dt < get_config().pss_start_date:
-        return 0
+    return _convert_datetime_to_seconds(dt)
+
+
+def convert_datetimes_to_seconds(dts: Iterable[Optional[datetime]]) -> list[Optional[int]]:
+    """Converts a column of `datetime`s to seconds since the PSS start date at once. See `convert_datetime_to_seconds`.
 
-    return int((dt - get_config().pss_start_date).total_seconds())
+    Args:
+        dts (Iterable[Optional[datetime]]): The `datetime`s to be converted. Timezone-naive values are treated as UTC.
+
+    Raises:
+        TypeError: Raised, if any value is not of type `datetime` or `None`.
+
+    Returns:
+        list[Optional[int]]: The seconds since the PSS start date in the same order. 0 for values before the PSS start date, `None` for `None` values.
+    """
+    try:
+        return list(map(_convert_datetime_to_seconds, dts))
+    except AttributeError as exc:
+        raise TypeError("The parameter `dts` must only contain values of type `datetime` or `None`!") from exc
 
 
 def format_datetime(dt: Optional[datetime], remove_tzinfo: bool = False) -> str:
@@ -164,7 +186,8 @@ def localize_to_utc(dt: Optional[datetime]) -> datetime:
 
 
 def parse_datetime(dt: Optional[Union[datetime, int, str]]) -> datetime:
-    """Parses a `str` or `int` to `datetime` or returns the passed datetime.
+    """Parses a `str` or `int` to `datetime` or returns the passed datetime. ISO 8601 strings get parsed with `datetime.fromisoformat`,
+    other formats with `dateutil`. Recently parsed strings are cached.
 
     Args:
         dt (Union[datetime, int, str]): The `str` or `int` to be parsed. If it's an `int`, it represents the seconds since Jan 6th, 2016 12 am.
@@ -183,9 +206,9 @@ def parse_datetime(dt: Optional[Union[datetime, int, str]]) -> datetime:
 
     if isinstance(dt, int):
         # If it's an integer value, then it's likely encoded as seconds from Jan 6th, 2016 00:00 UTC
-        return get_config().pss_start_date + timedelta(seconds=dt)
+        return datetime.fromtimestamp(_PSS_START_TIMESTAMP + dt, timezone.utc)
     elif isinstance(dt, str):
-        return dateutil.parser.parse(dt)
+        return _parse_datetime_str(dt)
     return dt
 
 
@@ -208,3 +231,24 @@ def remove_timezone(dt: Optional[datetime]) -> datetime:
         raise TypeError("The parameter `dt` must be of type `datetime`!")
 
     return dt.replace(tzinfo=None)
+
+
+def _convert_datetime_to_seconds(dt: Optional[datetime]) -> Optional[int]:
+    if dt is None:
+        return None
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    # `timestamp` respects the timezone, so aware values don't need to be converted to UTC first.
+    seconds = int(dt.timestamp()) - _PSS_START_TIMESTAMP
+    return seconds if seconds > 0 else 0
+
+
+@lru_cache(maxsize=_PARSED_DATETIME_CACHE_SIZE)
+def _parse_datetime_str(dt: str) -> datetime:
+    # `datetime` objects are immutable, so parsed values can be shared.
+    try:
+        # The API only returns ISO 8601 timestamps.
+        return datetime.fromisoformat(dt)
+    except ValueError:
+        return dateutil.parser.parse(dt)
@@ -34,6 +34,33 @@ def positive_float_or_int(
     raise TypeError(f"The parameter '{parameter_name}' must be of type 'float' or 'int'.")
 
 
+def positive_int(parameter_value: Optional[int], parameter_name: str, default: Optional[int] = None) -> Optional[int]:
+    """Ensures that a given parameter is an `int` value greater than 0.
+
+    Args:
+        parameter_value (int, optional): The parameter value to be checked.
+        parameter_name (str): The name of the parameter to be checked (for a descriptive error message).
+        default (int, optional): The default value to be returned, if `parameter_value` is `None`. Defaults to `None`.
+
+    Raises:
+        ValueError: Raised, if the parameter value is lower than 1.
+        TypeError: Raised, if the parameter value is not of type `int`.
+
+    Returns:
+        Optional[int]: The parameter value, if it's of type `int`. The `default` if it's `None`.
+    """
+    if parameter_value is None:
+        return default
+
+    if isinstance(parameter_value, int) and not isinstance(parameter_value, bool):
+        if parameter_value > 0:
+            return parameter_value
+
+        raise ValueError(f"The parameter '{parameter_name}' must be greater than 0.")
+
+    raise TypeError(f"The parameter '{parameter_name}' must be of type 'int'.")
+
+
 def str_(parameter_value: Optional[str], parameter_name: str, default: Optional[str] = None) -> Optional[str]:
     """Ensures that a given parameter is of type `str`.
 
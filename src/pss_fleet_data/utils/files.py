@@ -0,0 +1,40 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Optional, Union
+
+
+@contextmanager
+def open_atomic(file_path: Union[str, Path], mode: str = "w", encoding: Optional[str] = None) -> Iterator[IO]:
+    """Opens a temporary file next to `file_path` for writing and replaces `file_path` with it, once the block has completed. An interrupted write
+    doesn't leave a corrupt file behind: on an error, the temporary file gets removed and `file_path` stays untouched. Every call gets its own
+    temporary file, so concurrent writers don't interfere. If they write to the same file, the last one to complete wins.
+
+    Args:
+        file_path (str | Path): The path to the file to be written. An existing file gets overwritten.
+        mode (str, optional): The mode to open the temporary file in, either `"w"` or `"wb"`. Defaults to `"w"`.
+        encoding (str, optional): The encoding of a file opened in text mode. Defaults to `None` (`"utf-8"` in text mode).
+
+    Raises:
+        ValueError: Raised, if `mode` is not a write mode.
+        OSError: Raised, if the file can't be written.
+
+    Yields:
+        IO: The temporary file.
+    """
+    if mode not in ("w", "wb"):
+        raise ValueError(f"The parameter `mode` must be 'w' or 'wb', but is '{mode}'.")
+    if mode == "w" and encoding is None:
+        encoding = "utf-8"
+
+    file_path = Path(file_path)
+    fp = tempfile.NamedTemporaryFile(mode, encoding=encoding, dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp", delete=False)
+    temp_file_path = Path(fp.name)
+    try:
+        with fp:
+            yield fp
+        os.replace(temp_file_path, file_path)
+    except BaseException:
+        temp_file_path.unlink(missing_ok=True)
+        raise
@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any, MutableMapping, Optional
 
 from ..models.enums import ParameterInterval
@@ -56,3 +57,32 @@ def merge_headers(client_headers: MutableMapping[str, str], headers: MutableMapp
     request_headers.update(headers or {})
 
     return request_headers
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """Parses the value of a `Retry-After` header, which is either a number of seconds or an HTTP date.
+
+    Args:
+        value (str, optional): The value of the header.
+        now (datetime, optional): The point in time to calculate the delay from, if the value is an HTTP date. Defaults to `None` (the current time).
+
+    Returns:
+        float: The number of seconds to wait before retrying. 0, if the HTTP date is in the past. `None`, if the value is missing or malformed.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if not retry_at.tzinfo:
+        # Dates with the timezone "-0000" get parsed as timezone-naive
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    delay = (retry_at - (now or datetime.now(timezone.utc))).total_seconds()
+    return max(delay, 0.0)
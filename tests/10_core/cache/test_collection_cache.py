@@ -0,0 +1,118 @@
+from pathlib import Path
+
+import pytest
+
+from pss_fleet_data import CollectionCache
+from pss_fleet_data.models import Collection
+from pss_fleet_data.models.api_models import ApiCollection
+
+
+def create_api_collection(api_collection: ApiCollection, collection_id: int) -> ApiCollection:
+    return api_collection.model_copy(update={"meta": api_collection.meta.model_copy(update={"collection_id": collection_id})})
+
+
+def test_get_and_put(api_collection: ApiCollection):
+    cache = CollectionCache()
+    assert cache.get(1) is None
+    assert 1 not in cache
+
+    cache.put(api_collection)
+
+    assert 1 in cache
+    assert len(cache) == 1
+    assert cache.get(1) is api_collection
+
+
+def test_evicts_least_recently_used(api_collection: ApiCollection):
+    cache = CollectionCache(max_size=2)
+    cache.put(create_api_collection(api_collection, 1))
+    cache.put(create_api_collection(api_collection, 2))
+    _ = cache.get(1)
+
+    cache.put(create_api_collection(api_collection, 3))
+
+    assert len(cache) == 2
+    assert 1 in cache
+    assert 2 not in cache
+    assert 3 in cache
+
+
+def test_stores_on_disk(api_collection: ApiCollection, tmp_path: Path):
+    cache = CollectionCache(directory=tmp_path / "collections")
+    cache.put(api_collection)
+
+    other_cache = CollectionCache(directory=tmp_path / "collections")
+
+    assert (tmp_path / "collections" / "1.json").is_file()
+    assert 1 in other_cache
+    assert len(other_cache) == 0
+    assert other_cache.get(1) == api_collection
+    assert len(other_cache) == 1
+
+
+async def test_put_async_stores_on_disk(api_collection: ApiCollection, tmp_path: Path):
+    cache = CollectionCache(directory=tmp_path / "collections")
+    await cache.put_async(api_collection)
+
+    assert cache.get(1) is api_collection
+    assert CollectionCache(directory=tmp_path / "collections").get(1) == api_collection
+    assert not list((tmp_path / "collections").glob("*.tmp"))
+
+
+def test_clear(api_collection: ApiCollection, tmp_path: Path):
+    cache = CollectionCache(directory=tmp_path)
+    cache.put(api_collection)
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.get(1) == api_collection
+
+
+def test_put_without_collection_id(api_collection: ApiCollection):
+    with pytest.raises(ValueError):
+        CollectionCache().put(create_api_collection(api_collection, None))
+
+
+@pytest.mark.parametrize(["max_size", "expected_exception"], [pytest.param(0, ValueError, id="zero"), pytest.param("1", TypeError, id="str")])
+def test_invalid_max_size(max_size, expected_exception: type[Exception]):
+    with pytest.raises(expected_exception):
+        _ = CollectionCache(max_size=max_size)
+
+
+def test_put_collection(collection: Collection):
+    cache = CollectionCache()
+
+    cache.put(collection)
+
+    assert cache.get(1).users[0][0] == collection.users[0].id
+
+
+def test_get_resolver(api_collection: ApiCollection):
+    cache = CollectionCache(max_size=1)
+    assert cache.get_resolver(1) is None
+    cache.put(api_collection)
+
+    resolver = cache.get_resolver(1)
+
+    assert resolver.source is api_collection
+    assert cache.get_resolver(1) is resolver
+
+    cache.put(create_api_collection(api_collection, 1))
+    assert cache.get_resolver(1) is not resolver
+
+
+async def test_get_async_reads_from_disk(api_collection: ApiCollection, tmp_path: Path):
+    CollectionCache(directory=tmp_path).put(api_collection)
+    cache = CollectionCache(directory=tmp_path)
+    assert await cache.get_async(2) is None
+
+    result = await cache.get_async(1)
+
+    assert result == api_collection
+    assert len(cache) == 1
+    assert await cache.get_async(1) is result
+
+    resolver = await cache.get_resolver_async(1)
+    assert resolver.source is result
+    assert cache.get_resolver(1) is resolver
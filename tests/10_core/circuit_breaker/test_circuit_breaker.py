@@ -0,0 +1,209 @@
+import asyncio
+from time import sleep
+from typing import Iterable, Optional
+
+import pytest
+from httpx import ConnectTimeout
+
+from pss_fleet_data import CircuitBreaker, InstrumentationHook
+from pss_fleet_data.core.circuit_breaker import CircuitOpenError, CircuitState
+from pss_fleet_data.core.exceptions import NotFoundError, ServerError, ServiceUnavailableError
+
+
+class StateRecordingHook(InstrumentationHook):
+    def __init__(self):
+        self.changes: list[tuple[CircuitState, CircuitState]] = []
+
+    def on_circuit_state_change(self, previous_state: CircuitState, state: CircuitState):
+        self.changes.append((previous_state, state))
+
+
+@pytest.fixture(scope="function")
+def state_recording_hook() -> StateRecordingHook:
+    return StateRecordingHook()
+
+
+def _create_error(error_type: type[ServerError]) -> ServerError:
+    return error_type("CODE", "message", "details", "timestamp", "suggestion", {})
+
+
+def _call(circuit_breaker: CircuitBreaker, exception: Optional[Exception] = None, hooks: Iterable[InstrumentationHook] = ()):
+    if exception is None:
+        with circuit_breaker.guard(hooks):
+            return
+
+    with pytest.raises(type(exception)), circuit_breaker.guard(hooks):
+        raise exception
+
+
+def test_opens_at_failure_rate_threshold(state_recording_hook: StateRecordingHook):
+    circuit_breaker = CircuitBreaker(failure_rate_threshold=0.5, minimum_calls=4)
+    hooks = [state_recording_hook]
+
+    _call(circuit_breaker, hooks=hooks)
+    _call(circuit_breaker, _create_error(ServiceUnavailableError), hooks)
+    _call(circuit_breaker, hooks=hooks)
+    assert circuit_breaker.state == CircuitState.CLOSED
+    assert circuit_breaker.failure_rate == pytest.approx(1 / 3)
+
+    _call(circuit_breaker, ConnectTimeout("timeout"), hooks)
+
+    assert circuit_breaker.state == CircuitState.OPEN
+    assert state_recording_hook.changes == [(CircuitState.CLOSED, CircuitState.OPEN)]
+
+
+def test_does_not_open_below_minimum_calls():
+    circuit_breaker = CircuitBreaker(minimum_calls=3)
+
+    for _ in range(2):
+        _call(circuit_breaker, _create_error(ServerError))
+
+    assert circuit_breaker.state == CircuitState.CLOSED
+    assert circuit_breaker.failure_rate == 1.0
+
+
+def test_client_errors_are_not_failures():
+    circuit_breaker = CircuitBreaker(minimum_calls=1)
+
+    _call(circuit_breaker, _create_error(NotFoundError))
+    _call(circuit_breaker, ValueError("not a request failure"))
+
+    assert circuit_breaker.state == CircuitState.CLOSED
+    assert circuit_breaker.failure_rate == 0.0
+
+
+def test_slow_calls_are_failures():
+    circuit_breaker = CircuitBreaker(minimum_calls=1, slow_call_threshold=0.01)
+
+    with circuit_breaker.guard():
+        sleep(0.02)
+
+    assert circuit_breaker.state == CircuitState.OPEN
+
+
+def test_forgets_calls_outside_of_window():
+    circuit_breaker = CircuitBreaker(minimum_calls=2, window=0.05)
+
+    _call(circuit_breaker, _create_error(ServerError))
+    sleep(0.1)
+    _call(circuit_breaker, _create_error(ServerError))
+
+    assert circuit_breaker.state == CircuitState.CLOSED
+    assert circuit_breaker.failure_rate == 1.0
+
+
+def test_fails_fast_while_open():
+    circuit_breaker = CircuitBreaker(minimum_calls=1, open_duration=60)
+    _call(circuit_breaker, _create_error(ServerError))
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        with circuit_breaker.guard():
+            pytest.fail("The request must not be sent.")
+
+    assert 0 < exc_info.value.retry_after <= 60
+
+
+def test_closes_after_successful_probes(state_recording_hook: StateRecordingHook):
+    circuit_breaker = CircuitBreaker(minimum_calls=1, open_duration=0.01, probe_count=2)
+    hooks = [state_recording_hook]
+    _call(circuit_breaker, _create_error(ServerError), hooks)
+    sleep(0.02)
+
+    with circuit_breaker.guard(hooks), circuit_breaker.guard(hooks):
+        assert circuit_breaker.state == CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            with circuit_breaker.guard(hooks):
+                pytest.fail("Only `probe_count` requests may be sent.")
+        assert exc_info.value.retry_after == 0.0
+
+    assert circuit_breaker.state == CircuitState.CLOSED
+    assert state_recording_hook.changes == [
+        (CircuitState.CLOSED, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+    ]
+
+
+def test_reopens_after_failed_probe(state_recording_hook: StateRecordingHook):
+    circuit_breaker = CircuitBreaker(minimum_calls=1, open_duration=0.01)
+    hooks = [state_recording_hook]
+    _call(circuit_breaker, _create_error(ServerError), hooks)
+    sleep(0.02)
+
+    _call(circuit_breaker, _create_error(ServerError), hooks)
+
+    assert circuit_breaker.state == CircuitState.OPEN
+    assert state_recording_hook.changes[-1] == (CircuitState.HALF_OPEN, CircuitState.OPEN)
+
+
+async def test_cancelled_probe_releases_its_slot():
+    circuit_breaker = CircuitBreaker(minimum_calls=1, open_duration=0.01)
+    _call(circuit_breaker, _create_error(ServerError))
+    await asyncio.sleep(0.02)
+
+    async def probe():
+        with circuit_breaker.guard():
+            await asyncio.sleep(10)
+
+    task = asyncio.create_task(probe())
+    await asyncio.sleep(0)
+    _ = task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert circuit_breaker.state == CircuitState.HALF_OPEN
+    _call(circuit_breaker)
+    assert circuit_breaker.state == CircuitState.CLOSED
+
+
+def test_ignores_outcomes_of_calls_started_before_state_change():
+    circuit_breaker = CircuitBreaker(minimum_calls=1, open_duration=60)
+
+    with circuit_breaker.guard():
+        _call(circuit_breaker, _create_error(ServerError))
+        assert circuit_breaker.state == CircuitState.OPEN
+
+    assert circuit_breaker.state == CircuitState.OPEN
+
+
+def test_reset(state_recording_hook: StateRecordingHook):
+    circuit_breaker = CircuitBreaker(minimum_calls=1, open_duration=60)
+    _call(circuit_breaker, _create_error(ServerError))
+
+    circuit_breaker.reset([state_recording_hook])
+
+    assert circuit_breaker.state == CircuitState.CLOSED
+    assert circuit_breaker.failure_rate == 0.0
+    assert state_recording_hook.changes == [(CircuitState.OPEN, CircuitState.CLOSED)]
+
+
+def test_properties():
+    circuit_breaker = CircuitBreaker(failure_rate_threshold=1, window=10, minimum_calls=5, open_duration=20, probe_count=3, slow_call_threshold=2)
+    assert circuit_breaker.failure_rate_threshold == 1.0
+    assert circuit_breaker.window == 10.0
+    assert circuit_breaker.minimum_calls == 5
+    assert circuit_breaker.open_duration == 20.0
+    assert circuit_breaker.probe_count == 3
+    assert circuit_breaker.slow_call_threshold == 2.0
+    assert circuit_breaker.state == CircuitState.CLOSED
+
+
+test_cases_invalid_parameters = [
+    # kwargs, expected_exception
+    pytest.param({"failure_rate_threshold": 0}, ValueError, id="zero_failure_rate_threshold"),
+    pytest.param({"failure_rate_threshold": 1.5}, ValueError, id="failure_rate_threshold_too_high"),
+    pytest.param({"failure_rate_threshold": "0.5"}, TypeError, id="failure_rate_threshold_str"),
+    pytest.param({"window": 0}, ValueError, id="zero_window"),
+    pytest.param({"minimum_calls": 0}, ValueError, id="zero_minimum_calls"),
+    pytest.param({"minimum_calls": 1.5}, TypeError, id="minimum_calls_float"),
+    pytest.param({"open_duration": -1}, ValueError, id="negative_open_duration"),
+    pytest.param({"probe_count": 0}, ValueError, id="zero_probe_count"),
+    pytest.param({"slow_call_threshold": 0}, ValueError, id="zero_slow_call_threshold"),
+]
+"""kwargs, expected_exception"""
+
+
+@pytest.mark.parametrize(["kwargs", "expected_exception"], test_cases_invalid_parameters)
+def test_invalid_parameters(kwargs: dict, expected_exception: type[Exception]):
+    with pytest.raises(expected_exception):
+        _ = CircuitBreaker(**kwargs)
@@ -0,0 +1,73 @@
+import pytest
+
+from pss_fleet_data.core.instrumentation import RequestMetrics
+from pss_fleet_data.core.metrics import Histogram, HistogramCollector
+
+
+test_cases_histogram = [
+    # buckets, values, expected_counts, expected_cumulative_counts
+    pytest.param((1.0, 2.0), [], [0, 0, 0], [0, 0, 0], id="empty"),
+    pytest.param((1.0, 2.0), [0.5, 1.0], [2, 0, 0], [2, 2, 2], id="upper_bound_inclusive"),
+    pytest.param((1.0, 2.0), [0.5, 1.5, 2.5], [1, 1, 1], [1, 2, 3], id="one_per_bucket"),
+    pytest.param((2.0, 1.0), [3.0, 4.0], [0, 0, 2], [0, 0, 2], id="unsorted_buckets"),
+]
+"""buckets, values, expected_counts, expected_cumulative_counts"""
+
+
+@pytest.mark.parametrize(["buckets", "values", "expected_counts", "expected_cumulative_counts"], test_cases_histogram)
+def test_histogram_observe(buckets: tuple[float, ...], values: list[float], expected_counts: list[int], expected_cumulative_counts: list[int]):
+    histogram = Histogram(buckets)
+    for value in values:
+        histogram.observe(value)
+
+    assert histogram.counts == expected_counts
+    assert histogram.cumulative_counts() == expected_cumulative_counts
+    assert histogram.count == len(values)
+    assert histogram.sum == sum(values)
+
+
+def test_histogram_collector_records_request_metrics():
+    collector = HistogramCollector(duration_buckets=(0.1, 1.0), size_buckets=(100, 1000))
+    metrics = RequestMetrics(
+        method="GET",
+        route="/collections/{collection_id}",
+        path="/collections/1",
+        status_code=200,
+        time_to_first_byte=0.05,
+        total_time=0.5,
+        bytes_received=500,
+        json_decode_time=0.2,
+        validation_time=0.05,
+        conversion_time=2.0,
+    )
+
+    collector.on_request_end(metrics)
+    collector.on_response_processed(metrics)
+
+    assert collector.get_histogram("request_duration_seconds", "GET", "/collections/{collection_id}", "200").counts == [0, 1, 0]
+    assert collector.get_histogram("time_to_first_byte_seconds", "GET", "/collections/{collection_id}", "200").counts == [1, 0, 0]
+    assert collector.get_histogram("response_size_bytes", "GET", "/collections/{collection_id}", "200").counts == [0, 1, 0]
+    assert collector.get_histogram("json_decode_seconds", "GET", "/collections/{collection_id}", "200").counts == [0, 1, 0]
+    assert collector.get_histogram("validation_seconds", "GET", "/collections/{collection_id}", "200").counts == [1, 0, 0]
+    assert collector.get_histogram("conversion_seconds", "GET", "/collections/{collection_id}", "200").counts == [0, 0, 1]
+    assert len(collector.get_histograms()) == 6
+
+
+def test_histogram_collector_records_failed_request_as_error():
+    collector = HistogramCollector()
+    metrics = RequestMetrics(method="GET", route="/ping", path="/ping", total_time=5.0, error=TimeoutError())
+
+    collector.on_request_end(metrics)
+
+    assert collector.get_histogram("request_duration_seconds", "GET", "/ping", "error").count == 1
+    assert collector.get_histogram("time_to_first_byte_seconds", "GET", "/ping", "error") is None
+    assert collector.get_histogram("response_size_bytes", "GET", "/ping", "error") is None
+
+
+def test_histogram_collector_reset():
+    collector = HistogramCollector()
+    collector.observe("request_duration_seconds", "GET", "/ping", "200", 0.1)
+
+    collector.reset()
+
+    assert collector.get_histograms() == {}
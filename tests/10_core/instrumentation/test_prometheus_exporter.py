@@ -0,0 +1,32 @@
+from pss_fleet_data.core.metrics import HistogramCollector, PrometheusExporter
+
+
+def test_render_empty():
+    exporter = PrometheusExporter(HistogramCollector())
+    assert exporter.render() == ""
+
+
+def test_render():
+    collector = HistogramCollector(duration_buckets=(0.1, 1.0))
+    collector.observe("request_duration_seconds", "GET", "/collections/{collection_id}", "200", 0.05)
+    collector.observe("request_duration_seconds", "GET", "/collections/{collection_id}", "200", 0.5)
+    exporter = PrometheusExporter(collector, namespace="test")
+
+    labels = 'method="GET",route="/collections/{collection_id}",status="200"'
+    assert exporter.render().splitlines() == [
+        "# HELP test_request_duration_seconds Time from sending a request until its response body was received.",
+        "# TYPE test_request_duration_seconds histogram",
+        f'test_request_duration_seconds_bucket{{{labels},le="0.1"}} 1',
+        f'test_request_duration_seconds_bucket{{{labels},le="1.0"}} 2',
+        f'test_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2',
+        f"test_request_duration_seconds_sum{{{labels}}} 0.55",
+        f"test_request_duration_seconds_count{{{labels}}} 2",
+    ]
+
+
+def test_render_escapes_label_values():
+    collector = HistogramCollector()
+    collector.observe("request_duration_seconds", "GET", '/a"b\\c', "200", 0.05)
+    exporter = PrometheusExporter(collector)
+
+    assert 'route="/a\\"b\\\\c"' in exporter.render()
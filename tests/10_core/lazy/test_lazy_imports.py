@@ -0,0 +1,57 @@
+import importlib
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from pss_fleet_data.core.lazy import create_lazy_module_attributes
+
+
+test_cases_packages = [
+    pytest.param("pss_fleet_data", id="pss_fleet_data"),
+    pytest.param("pss_fleet_data.core", id="core"),
+    pytest.param("pss_fleet_data.models", id="models"),
+    pytest.param("pss_fleet_data.utils", id="utils"),
+]
+"""package_name"""
+
+
+@pytest.mark.parametrize(["package_name"], test_cases_packages)
+def test_lazy_package_exports(package_name: str):
+    package = importlib.import_module(package_name)
+
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+        assert name in dir(package)
+
+
+@pytest.mark.parametrize(["package_name"], test_cases_packages)
+def test_lazy_package_unknown_attribute(package_name: str):
+    package = importlib.import_module(package_name)
+
+    with pytest.raises(AttributeError):
+        _ = package.does_not_exist
+
+
+def test_create_lazy_module_attributes():
+    __getattr__, __dir__ = create_lazy_module_attributes(__name__, {"lazy_dumps": "json:dumps", "lazy_json": "json"})
+
+    assert __getattr__("lazy_dumps") is importlib.import_module("json").dumps
+    assert __getattr__("lazy_json") is importlib.import_module("json")
+    assert globals()["lazy_dumps"] is importlib.import_module("json").dumps
+    assert {"lazy_dumps", "lazy_json"} <= set(__dir__())
+
+
+def test_import_does_not_import_dependencies():
+    code = textwrap.dedent(
+        """
+        import sys
+        import pss_fleet_data
+
+        print(",".join(name for name in ("dateutil", "httpx", "pssapi", "pydantic") if name in sys.modules))
+        """
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == ""
@@ -0,0 +1,68 @@
+import asyncio
+import hashlib
+from pathlib import Path
+
+from pss_fleet_data import UploadLedger
+from pss_fleet_data.models import CollectionMetadata
+
+
+def test_get_and_put(collection_metadata_9: CollectionMetadata):
+    ledger = UploadLedger()
+    assert ledger.get("hash") is None
+    assert "hash" not in ledger
+
+    ledger.put("hash", collection_metadata_9)
+
+    assert "hash" in ledger
+    assert len(ledger) == 1
+    assert ledger.get("hash") is collection_metadata_9
+    assert ledger.file_path is None
+
+
+def test_stores_in_file(collection_metadata_9: CollectionMetadata, tmp_path: Path):
+    file_path = tmp_path / "ledger.jsonl"
+    ledger = UploadLedger(file_path)
+    ledger.put("a", collection_metadata_9)
+    ledger.put("b", collection_metadata_9.model_copy(update={"collection_id": 2}))
+    ledger.put("a", collection_metadata_9.model_copy(update={"collection_id": 3}))
+
+    loaded_ledger = UploadLedger(file_path)
+
+    assert len(file_path.read_text().splitlines()) == 3
+    assert len(loaded_ledger) == 2
+    assert loaded_ledger.get("a") == collection_metadata_9.model_copy(update={"collection_id": 3})
+    assert loaded_ledger.get("b").collection_id == 2
+
+
+async def test_put_async(collection_metadata_9: CollectionMetadata, tmp_path: Path):
+    file_path = tmp_path / "ledger.jsonl"
+    ledger = UploadLedger(file_path)
+
+    _ = await asyncio.gather(*(ledger.put_async(str(i), collection_metadata_9.model_copy(update={"collection_id": i})) for i in range(10)))
+
+    assert ledger.get("3").collection_id == 3
+    loaded_ledger = UploadLedger(file_path)
+    assert len(file_path.read_text().splitlines()) == 10
+    assert all(loaded_ledger.get(str(i)).collection_id == i for i in range(10))
+
+
+def test_skips_incomplete_lines(collection_metadata_9: CollectionMetadata, tmp_path: Path):
+    file_path = tmp_path / "ledger.jsonl"
+    UploadLedger(file_path).put("a", collection_metadata_9)
+    with open(file_path, "a", encoding="utf-8") as fp:
+        fp.write('{"hash": "b", "meta')
+
+    ledger = UploadLedger(file_path)
+    ledger.put("c", collection_metadata_9)
+
+    assert "b" not in ledger
+    assert list(UploadLedger(file_path).get(content_hash) is not None for content_hash in "abc") == [True, False, True]
+
+
+def test_hash_file(tmp_path: Path):
+    file_path = tmp_path / "collection.json"
+    file_path.write_bytes(b"x" * 1000)
+    expected_hash = hashlib.sha256(b"x" * 1000).hexdigest()
+
+    assert UploadLedger.hash_file(file_path, chunk_size=7) == expected_hash
+    assert UploadLedger.hash_content(b"x" * 1000) == expected_hash
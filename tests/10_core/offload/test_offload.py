@@ -0,0 +1,76 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Generator
+
+import pytest
+from httpx import Response
+
+from pss_fleet_data.core import offload
+from pss_fleet_data.core.instrumentation import RequestMetrics
+from pss_fleet_data.models.api_models import ApiCollection
+from pss_fleet_data.models.client_models import Collection
+from pss_fleet_data.models.converters import FromResponse
+
+
+@pytest.fixture(scope="module", params=[ThreadPoolExecutor, ProcessPoolExecutor], ids=["thread", "process"])
+def executor(request: pytest.FixtureRequest) -> Generator[Executor, None, None]:
+    executor = request.param(max_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture(scope="function")
+def collection_response(api_collection: ApiCollection) -> Response:
+    return Response(200, content=api_collection.model_dump_json().encode(), headers={"Content-Type": "application/json"})
+
+
+test_cases_converters = [
+    # converter, expected_type
+    pytest.param(FromResponse.to_collection, Collection, id="collection"),
+    pytest.param(FromResponse.to_api_collection, ApiCollection, id="api_collection"),
+]
+"""converter, expected_type"""
+
+
+@pytest.mark.parametrize(["converter", "expected_type"], test_cases_converters)
+async def test_convert_in_executor(executor: Executor, collection_response: Response, converter: Callable[[Response], object], expected_type: type):
+    metrics = RequestMetrics(method="GET", route="/collections/{collection_id}", path="/collections/1")
+
+    result = await offload.convert_in_executor(executor, collection_response, converter, metrics)
+
+    assert isinstance(result, expected_type)
+    assert result.metadata.collection_id == 1 if expected_type is Collection else result.meta.collection_id == 1
+    assert len(result.users) == 1
+    assert metrics.json_decode_time > 0.0
+    assert metrics.validation_time > 0.0
+    assert (metrics.conversion_time > 0.0) == (expected_type is Collection)
+
+
+async def test_convert_in_executor_without_metrics(executor: Executor, collection_response: Response):
+    result = await offload.convert_in_executor(executor, collection_response, FromResponse.to_collection, None)
+
+    assert isinstance(result, Collection)
+
+
+async def test_convert_in_executor_empty_response(executor: Executor):
+    result = await offload.convert_in_executor(executor, Response(200, content=b""), FromResponse.to_collection, None)
+
+    assert result is None
+
+
+async def test_convert_in_process_pool_runs_other_converters_inline(api_collection: ApiCollection):
+    response = Response(200, content=api_collection.meta.model_dump_json().encode(), headers={"Content-Type": "application/json"})
+    # A process pool that has been shut down can't run anything, so the conversion has to happen on the event loop.
+    executor = ProcessPoolExecutor(max_workers=1)
+    executor.shutdown()
+
+    result = await offload.convert_in_executor(executor, response, FromResponse.to_collection_metadata, None)
+
+    assert result.collection_id == 1
+
+
+def test_create_executor():
+    executor = offload.create_executor(max_workers=1)
+    try:
+        assert isinstance(executor, ThreadPoolExecutor if offload.is_free_threaded() else ProcessPoolExecutor)
+    finally:
+        executor.shutdown()
@@ -0,0 +1,48 @@
+import asyncio
+from time import monotonic
+
+import pytest
+
+from pss_fleet_data import RateLimiter
+
+
+async def test_acquire_burst_without_waiting():
+    rate_limiter = RateLimiter(rate=1, burst=3)
+    start = monotonic()
+
+    for _ in range(3):
+        await rate_limiter.acquire()
+
+    assert monotonic() - start < 0.5
+
+
+async def test_acquire_limits_rate():
+    rate_limiter = RateLimiter(rate=20)
+    start = monotonic()
+
+    await asyncio.gather(*(rate_limiter.acquire() for _ in range(5)))
+
+    # The first request is allowed at once, the other 4 wait 1/20 s each.
+    assert monotonic() - start >= 0.19
+
+
+def test_properties():
+    rate_limiter = RateLimiter(rate=2, burst=5)
+    assert rate_limiter.rate == 2.0
+    assert rate_limiter.burst == 5
+
+
+@pytest.mark.parametrize(
+    ["rate", "burst", "expected_exception"],
+    [
+        pytest.param(0, 1, ValueError, id="zero_rate"),
+        pytest.param(-1, 1, ValueError, id="negative_rate"),
+        pytest.param("1", 1, TypeError, id="rate_str"),
+        pytest.param(1, 0, ValueError, id="zero_burst"),
+        pytest.param(1, 1.5, TypeError, id="burst_float"),
+    ],
+)
+def test_invalid_parameters(rate, burst, expected_exception: type[Exception]):
+    """rate, burst, expected_exception"""
+    with pytest.raises(expected_exception):
+        _ = RateLimiter(rate=rate, burst=burst)
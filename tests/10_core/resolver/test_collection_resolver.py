@@ -0,0 +1,59 @@
+from typing import Callable, Union
+
+import pytest
+
+from pss_fleet_data import CollectionResolver
+from pss_fleet_data.core.exceptions import AllianceNotFoundError, UserNotFoundError
+from pss_fleet_data.models import AllianceHistory, Collection, UserHistory
+from pss_fleet_data.models.api_models import ApiAllianceHistory, ApiCollection, ApiUserHistory
+from pss_fleet_data.models.converters import FromAPI
+
+
+@pytest.fixture(scope="function", params=["api_collection", "collection"])
+def resolver_source(request: pytest.FixtureRequest, api_collection: ApiCollection) -> Union[ApiCollection, Collection]:
+    if request.param == "api_collection":
+        return api_collection
+    return FromAPI.to_collection(api_collection)
+
+
+def test_get_alliance_history(
+    resolver_source: Union[ApiCollection, Collection],
+    api_alliance_history_with_members: ApiAllianceHistory,
+    assert_alliance_histories_equal: Callable[[AllianceHistory, AllianceHistory], None],
+):
+    expected = FromAPI.to_alliance_history(api_alliance_history_with_members)
+
+    alliance_history = CollectionResolver(resolver_source).get_alliance_history(1)
+
+    assert_alliance_histories_equal(alliance_history, expected)
+
+
+def test_get_user_history(
+    resolver_source: Union[ApiCollection, Collection],
+    api_user_history_with_fleet: ApiUserHistory,
+    assert_user_histories_equal: Callable[[UserHistory, UserHistory], None],
+):
+    expected = FromAPI.to_user_history(api_user_history_with_fleet)
+
+    user_history = CollectionResolver(resolver_source).get_user_history(1)
+
+    assert_user_histories_equal(user_history, expected)
+
+
+def test_get_user_history_without_alliance(api_collection: ApiCollection):
+    user = api_collection.users[0]
+    api_collection = api_collection.model_copy(update={"users": [(2, "U2", 0) + user[3:5] + (-1,) + user[6:]]})
+
+    user_history = CollectionResolver(api_collection).get_user_history(2)
+
+    assert user_history.user.id == 2
+    assert user_history.alliance is None
+
+
+def test_not_found(resolver_source: Union[ApiCollection, Collection]):
+    resolver = CollectionResolver(resolver_source)
+
+    with pytest.raises(AllianceNotFoundError):
+        _ = resolver.get_alliance_history(2)
+    with pytest.raises(UserNotFoundError):
+        _ = resolver.get_user_history(2)
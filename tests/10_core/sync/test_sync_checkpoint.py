@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pss_fleet_data import SyncCheckpoint
+from pss_fleet_data.models import CollectionMetadata
+
+
+def test_empty(tmp_path: Path):
+    checkpoint = SyncCheckpoint(tmp_path / "checkpoint.json")
+
+    assert checkpoint.collection_id is None
+    assert checkpoint.timestamp is None
+    assert not checkpoint.file_path.exists()
+
+
+def test_save_and_load(collection_metadata_9: CollectionMetadata, tmp_path: Path):
+    file_path = tmp_path / "checkpoint.json"
+    SyncCheckpoint(file_path).save(collection_metadata_9)
+
+    loaded_checkpoint = SyncCheckpoint(file_path)
+
+    assert loaded_checkpoint.collection_id == collection_metadata_9.collection_id
+    assert loaded_checkpoint.timestamp == datetime(2016, 1, 6, 23, 59, tzinfo=timezone.utc)
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+async def test_save_async(collection_metadata_9: CollectionMetadata, tmp_path: Path):
+    file_path = tmp_path / "checkpoint.json"
+    checkpoint = SyncCheckpoint(file_path)
+
+    await checkpoint.save_async(collection_metadata_9)
+
+    assert checkpoint.collection_id == collection_metadata_9.collection_id
+    assert SyncCheckpoint(file_path).timestamp == checkpoint.timestamp
+
+
+def test_ignores_invalid_file(tmp_path: Path):
+    file_path = tmp_path / "checkpoint.json"
+    file_path.write_text('{"collection_id": 1')
+
+    checkpoint = SyncCheckpoint(file_path)
+
+    assert checkpoint.collection_id is None
+    assert checkpoint.timestamp is None
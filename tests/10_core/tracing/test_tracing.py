@@ -0,0 +1,55 @@
+from pss_fleet_data.core import tracing
+from pss_fleet_data.core.instrumentation import RequestMetrics, RequestPhase, measure_phase, track_processing, untrack_processing
+from pss_fleet_data.core.tracing import Tracer, trace_span
+
+
+def test_trace_span_without_tracer_does_nothing():
+    with trace_span("test") as span:
+        assert span is None
+
+    assert tracing.get_current_tracer() is None
+
+
+def test_trace_span_with_tracer(recording_tracer):
+    assert isinstance(recording_tracer, Tracer)
+
+    token = tracing.use_tracer(recording_tracer)
+    try:
+        with trace_span("parent", attributes={"key": "value"}):
+            with trace_span("child") as span:
+                span.set_attribute("status", 200)
+    finally:
+        tracing.reset_tracer(token)
+
+    assert tracing.get_current_tracer() is None
+    assert [span.name for span in recording_tracer.spans] == ["parent", "child"]
+    assert recording_tracer.get_span("parent").attributes == {"key": "value"}
+    assert recording_tracer.get_span("child").attributes == {"status": 200}
+    assert recording_tracer.get_span("child").parent is recording_tracer.get_span("parent")
+
+
+def test_measure_phase_records_span_and_metrics(recording_tracer):
+    metrics = RequestMetrics(method="GET", route="/ping", path="/ping")
+
+    tracer_token = tracing.use_tracer(recording_tracer)
+    metrics_token = track_processing(metrics)
+    try:
+        with measure_phase(RequestPhase.VALIDATION):
+            pass
+    finally:
+        untrack_processing(metrics_token)
+        tracing.reset_tracer(tracer_token)
+
+    assert [span.name for span in recording_tracer.spans] == ["validation"]
+    assert metrics.validation_time > 0
+
+
+def test_measure_phase_records_span_without_metrics(recording_tracer):
+    token = tracing.use_tracer(recording_tracer)
+    try:
+        with measure_phase(RequestPhase.JSON_DECODE):
+            pass
+    finally:
+        tracing.reset_tracer(token)
+
+    assert [span.name for span in recording_tracer.spans] == ["json_decode"]
@@ -0,0 +1,68 @@
+import gzip
+from pathlib import Path
+
+import pytest
+
+from pss_fleet_data.core.upload import CollectionFileStream
+
+
+UPLOAD_TEST_FILE_PATH = Path("tests/files/upload_test_data_schema_9.json")
+
+
+async def read_stream(stream: CollectionFileStream) -> list[bytes]:
+    return [chunk async for chunk in stream]
+
+
+async def test_stream_multipart_body():
+    stream = CollectionFileStream(UPLOAD_TEST_FILE_PATH, chunk_size=100)
+    headers = stream.get_headers()
+    boundary = headers["Content-Type"].removeprefix("multipart/form-data; boundary=")
+
+    chunks = await read_stream(stream)
+    body = b"".join(chunks)
+
+    assert len(chunks) == 2 + -(-UPLOAD_TEST_FILE_PATH.stat().st_size // 100)
+    assert int(headers["Content-Length"]) == len(body)
+    assert "Content-Encoding" not in headers
+    assert body.startswith(f'--{boundary}\r\nContent-Disposition: form-data; name="collection_file"; filename="collection"\r\n'.encode())
+    assert body.endswith(UPLOAD_TEST_FILE_PATH.read_bytes() + f"\r\n--{boundary}--\r\n".encode())
+
+
+async def test_stream_compressed():
+    uncompressed_body = b"".join(await read_stream(CollectionFileStream(UPLOAD_TEST_FILE_PATH)))
+    stream = CollectionFileStream(UPLOAD_TEST_FILE_PATH, chunk_size=16, compress=True)
+    headers = stream.get_headers()
+
+    body = gzip.decompress(b"".join(await read_stream(stream)))
+
+    assert headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in headers
+    # Only the boundaries differ.
+    assert len(body) == len(uncompressed_body)
+    assert UPLOAD_TEST_FILE_PATH.read_bytes() in body
+
+
+def test_stream_default_chunk_size():
+    assert CollectionFileStream(UPLOAD_TEST_FILE_PATH).chunk_size == 64 * 1024
+
+
+@pytest.mark.parametrize(
+    ["chunk_size", "expected_exception"],
+    [
+        pytest.param("1", TypeError, id="type"),
+        pytest.param(0, ValueError, id="value"),
+    ],
+)
+def test_stream_invalid_chunk_size(chunk_size, expected_exception: type[Exception]):
+    """chunk_size, expected_exception"""
+    with pytest.raises(expected_exception):
+        _ = CollectionFileStream(UPLOAD_TEST_FILE_PATH, chunk_size=chunk_size)
+
+
+async def test_stream_missing_file(tmp_path: Path):
+    stream = CollectionFileStream(tmp_path / "missing.json")
+
+    with pytest.raises(FileNotFoundError):
+        _ = stream.get_headers()
+    with pytest.raises(FileNotFoundError):
+        _ = await read_stream(stream)
@@ -0,0 +1,58 @@
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from pss_fleet_data.core.upload import UploadResult, get_collection_file_paths, read_collection_timestamp
+
+
+def test_get_collection_file_paths(tmp_path: Path):
+    (tmp_path / "b.json").write_text("{}")
+    (tmp_path / "a.json").write_text("{}")
+    (tmp_path / "notes.txt").write_text("")
+    other_file_path = tmp_path / "other.dat"
+
+    file_paths = get_collection_file_paths([tmp_path, str(other_file_path)])
+
+    assert file_paths == [tmp_path / "a.json", tmp_path / "b.json", other_file_path]
+    assert get_collection_file_paths(tmp_path) == [tmp_path / "a.json", tmp_path / "b.json"]
+
+
+def test_get_collection_file_paths_invalid_type():
+    with pytest.raises(TypeError):
+        _ = get_collection_file_paths([1])
+
+
+def test_read_collection_timestamp():
+    assert read_collection_timestamp("tests/files/upload_test_data_schema_9.json") == datetime(2016, 1, 6, 23, 59, tzinfo=timezone.utc)
+
+
+def test_read_collection_timestamp_after_data(tmp_path: Path):
+    file_path = tmp_path / "collection.json"
+    file_path.write_text(json.dumps({"users": [[i, "x" * 10] for i in range(1000)], "meta": {"timestamp": "2024-07-31T23:59:00"}}))
+
+    assert read_collection_timestamp(file_path) == datetime(2024, 7, 31, 23, 59, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    ["content"],
+    [
+        pytest.param('{"meta": {}}', id="missing"),
+        pytest.param('{"meta": {"timestamp": "no date"}}', id="invalid"),
+        pytest.param("[]", id="no_metadata"),
+        pytest.param("not json", id="not_json"),
+    ],
+)
+def test_read_collection_timestamp_invalid(content: str, tmp_path: Path):
+    """content"""
+    file_path = tmp_path / "collection.json"
+    file_path.write_text(content)
+
+    with pytest.raises(ValueError):
+        _ = read_collection_timestamp(file_path)
+
+
+def test_upload_result_succeeded():
+    assert not UploadResult(file_path=Path("a.json")).succeeded
+    assert not UploadResult(file_path=Path("a.json"), error=OSError()).succeeded
@@ -0,0 +1,59 @@
+import pytest
+from pssapi.enums import AllianceMembership
+
+from pss_fleet_data.models.enums import UserAllianceMembershipEncoded
+from pss_fleet_data.utils import decode_alliance_membership, decode_alliance_memberships, encode_alliance_membership, encode_alliance_memberships
+
+
+def test_decode_alliance_memberships_matches_decode_alliance_membership():
+    encoded = [int(membership) for membership in UserAllianceMembershipEncoded]
+
+    result = decode_alliance_memberships(encoded)
+
+    assert result == [decode_alliance_membership(membership) for membership in encoded]
+
+
+def test_encode_alliance_memberships_matches_encode_alliance_membership():
+    decoded = [decode_alliance_membership(membership) for membership in UserAllianceMembershipEncoded]
+    decoded_as_str = [str(membership) for membership in decoded]
+
+    assert encode_alliance_memberships(decoded) == [encode_alliance_membership(membership) for membership in decoded]
+    assert encode_alliance_memberships(decoded_as_str) == encode_alliance_memberships(decoded)
+
+
+def test_alliance_memberships_empty():
+    assert decode_alliance_memberships([]) == []
+    assert encode_alliance_memberships(iter(())) == []
+
+
+test_cases_decode_invalid = [
+    # values, expected_exception
+    pytest.param([0, 7], pytest.raises(ValueError), id="too_high"),
+    pytest.param([-2, 0], pytest.raises(ValueError), id="too_low"),
+    pytest.param([0, None], pytest.raises(TypeError), id="none"),
+    pytest.param([0, "1"], pytest.raises(TypeError), id="str"),
+    pytest.param([True], pytest.raises(TypeError), id="bool"),
+]
+"""values, expected_exception"""
+
+
+@pytest.mark.parametrize(["values", "expected_exception"], test_cases_decode_invalid)
+def test_decode_alliance_memberships_invalid(values, expected_exception):
+    with expected_exception:
+        _ = decode_alliance_memberships(values)
+
+
+test_cases_encode_invalid = [
+    # values
+    pytest.param(["Candidate", "1234"], id="str"),
+    pytest.param(["Candidate", None], id="none"),
+    pytest.param([AllianceMembership.STARBASE], id="not_encodable"),
+    pytest.param([[1]], id="list"),
+]
+"""values"""
+
+
+@pytest.mark.parametrize(["values"], test_cases_encode_invalid)
+def test_encode_alliance_memberships_invalid(values):
+    with pytest.raises(ValueError):
+        _ = encode_alliance_memberships(values)
@@ -3,7 +3,7 @@ from datetime import datetime
 import pytest
 from dateutil.parser import parse as parse_datetime
 
-from pss_fleet_data.utils import convert_datetime_to_seconds
+from pss_fleet_data.utils import convert_datetime_to_seconds, convert_datetimes_to_seconds
 
 
 test_cases_invalid = [
@@ -43,3 +43,30 @@ def test_convert_datetime_to_seconds_valid(value, expected_result):
 def test_returns_zero_if_before_pss_start_date():
     result = convert_datetime_to_seconds(datetime(2001, 9, 11))
     assert result == 0
+
+
+def test_convert_datetimes_to_seconds_matches_convert_datetime_to_seconds():
+    values = [value.values[0] for value in test_cases_valid] + [datetime(2001, 9, 11), datetime(2016, 1, 6, 0, 0, 1, 999999)]
+
+    result = convert_datetimes_to_seconds(iter(values))
+
+    assert result == [convert_datetime_to_seconds(value) for value in values]
+
+
+def test_convert_datetimes_to_seconds_empty():
+    assert convert_datetimes_to_seconds([]) == []
+
+
+test_cases_batch_invalid = [
+    # values
+    pytest.param([datetime(2016, 1, 7), 1234], id="int"),
+    pytest.param([datetime(2016, 1, 7), "2016-01-07T01:23:40"], id="str"),
+    pytest.param([[datetime(2016, 1, 7)]], id="list[datetime]"),
+]
+"""values"""
+
+
+@pytest.mark.parametrize(["values"], test_cases_batch_invalid)
+def test_convert_datetimes_to_seconds_invalid(values):
+    with pytest.raises(TypeError):
+        _ = convert_datetimes_to_seconds(values)
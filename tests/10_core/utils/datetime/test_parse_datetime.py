@@ -24,6 +24,8 @@ test_cases_valid = [
     pytest.param("2016-01-06T01:23:40", datetime(2016, 1, 6, 1, 23, 40, tzinfo=None), id="from_str_2"),
     pytest.param("2016-01-06T01:23:40Z", datetime(2016, 1, 6, 1, 23, 40, tzinfo=timezone.utc), id="from_str_3"),
     pytest.param("2016-01-06T01:23:40+00:00", datetime(2016, 1, 6, 1, 23, 40, tzinfo=timezone.utc), id="from_str_4"),
+    pytest.param("2016/01/06 01:23:40", datetime(2016, 1, 6, 1, 23, 40, tzinfo=None), id="from_str_not_iso"),
+    pytest.param("Jan 6th, 2016 1:23:40 am UTC", datetime(2016, 1, 6, 1, 23, 40, tzinfo=timezone.utc), id="from_str_not_iso_utc"),
     pytest.param(5020, datetime(2016, 1, 6, 1, 23, 40, tzinfo=timezone.utc), id="from_int"),
     pytest.param(datetime(2016, 1, 6, 1, 23, 40), datetime(2016, 1, 6, 1, 23, 40, tzinfo=None), id="from_datetime_1"),
     pytest.param(datetime(2016, 1, 6, 1, 23, 40, tzinfo=None), datetime(2016, 1, 6, 1, 23, 40, tzinfo=None), id="from_datetime_2"),
@@ -41,3 +43,13 @@ def test_parse_datetime_invalid(value, expected_exception):
 def test_parse_datetime_valid(value: Union[datetime, int, str], expected_result: datetime):
     result = parse_datetime(value)
     assert result == expected_result
+
+
+def test_parse_datetime_iso_utc_uses_timezone_utc():
+    result = parse_datetime("2016-01-06T01:23:40Z")
+    assert result.tzinfo is timezone.utc
+
+
+def test_parse_datetime_caches_str():
+    value = "2016-01-06T01:23:41Z"
+    assert parse_datetime(value) is parse_datetime(value)
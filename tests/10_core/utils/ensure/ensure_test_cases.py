@@ -35,6 +35,17 @@ invalid_float_or_int = [
 """url, expected_exception"""
 
 
+invalid_positive_int = [
+    # value, expected_exception
+    pytest.param(0, ValueError, id="zero"),
+    pytest.param(-1, ValueError, id="negative"),
+    pytest.param(1.0, TypeError, id="float"),
+    pytest.param(True, TypeError, id="bool"),
+    pytest.param("1", TypeError, id="str"),
+]
+"""value, expected_exception"""
+
+
 valid_str = [
     # value, default, expected_result
     pytest.param(None, None, None, id="none_default_none"),
@@ -74,3 +85,13 @@ valid_positive_float_or_int = [
     pytest.param(10, 5, 10, id="int_with_default"),
 ]
 """value, default, expected_result"""
+
+
+valid_positive_int = [
+    # value, default, expected_result
+    pytest.param(None, None, None, id="none"),
+    pytest.param(None, 5, 5, id="none_with_default"),
+    pytest.param(1, None, 1, id="one"),
+    pytest.param(10, 5, 10, id="int_with_default"),
+]
+"""value, default, expected_result"""
@@ -0,0 +1,18 @@
+from typing import Optional
+
+import ensure_test_cases
+import pytest
+
+from pss_fleet_data.utils.ensure import positive_int
+
+
+@pytest.mark.parametrize(["value", "default", "expected_result"], ensure_test_cases.valid_positive_int)
+def test_positive_int(value: Optional[int], default: Optional[int], expected_result: Optional[int]):
+    result = positive_int(value, "", default)
+    assert result == expected_result
+
+
+@pytest.mark.parametrize(["value", "expected_exception"], ensure_test_cases.invalid_positive_int)
+def test_positive_int_invalid(value: Optional[int], expected_exception: Exception):
+    with pytest.raises(expected_exception):
+        _ = positive_int(value, "", None)
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+import pytest
+
+from pss_fleet_data import utils
+
+
+def test_open_atomic(tmp_path: Path):
+    file_path = tmp_path / "file.json"
+    file_path.write_text("old")
+
+    with utils.open_atomic(file_path) as fp:
+        _ = fp.write("new")
+        assert file_path.read_text() == "old"
+
+    assert file_path.read_text() == "new"
+    assert list(tmp_path.iterdir()) == [file_path]
+
+
+def test_open_atomic_binary(tmp_path: Path):
+    file_path = tmp_path / "file.bin"
+
+    with utils.open_atomic(str(file_path), "wb") as fp:
+        _ = fp.write(b"\0\1")
+
+    assert file_path.read_bytes() == b"\0\1"
+
+
+def test_open_atomic_interrupted(tmp_path: Path):
+    file_path = tmp_path / "file.json"
+    file_path.write_text("old")
+
+    with pytest.raises(RuntimeError), utils.open_atomic(file_path) as fp:
+        _ = fp.write("new")
+        raise RuntimeError()
+
+    assert file_path.read_text() == "old"
+    assert list(tmp_path.iterdir()) == [file_path]
+
+
+def test_open_atomic_concurrent_writers(tmp_path: Path):
+    json_file_path = tmp_path / "1.json"
+    binary_file_path = tmp_path / "1.bin"
+
+    with utils.open_atomic(json_file_path) as json_fp, utils.open_atomic(binary_file_path, "wb") as binary_fp:
+        with utils.open_atomic(json_file_path) as other_json_fp:
+            _ = other_json_fp.write("other")
+        _ = json_fp.write("json")
+        _ = binary_fp.write(b"bin")
+
+    assert json_file_path.read_text() == "json"
+    assert binary_file_path.read_bytes() == b"bin"
+    assert sorted(tmp_path.iterdir()) == [binary_file_path, json_file_path]
+
+
+def test_open_atomic_invalid_mode(tmp_path: Path):
+    with pytest.raises(ValueError), utils.open_atomic(tmp_path / "file.json", "a"):
+        pass
@@ -0,0 +1,30 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+import pytest
+
+from pss_fleet_data.utils import parse_retry_after
+
+
+NOW = datetime(2015, 10, 21, 7, 28, tzinfo=timezone.utc)
+
+
+test_cases = [
+    # value, expected_result
+    pytest.param(None, None, id="none"),
+    pytest.param("", None, id="empty"),
+    pytest.param("120", 120.0, id="seconds"),
+    pytest.param(" 0 ", 0.0, id="seconds_zero_padded"),
+    pytest.param("Wed, 21 Oct 2015 07:30:00 GMT", 120.0, id="http_date"),
+    pytest.param("Wed, 21 Oct 2015 07:30:00 -0000", 120.0, id="http_date_naive"),
+    pytest.param("Wed, 21 Oct 2015 07:00:00 GMT", 0.0, id="http_date_in_the_past"),
+    pytest.param("-1", None, id="negative"),
+    pytest.param("1.5", None, id="float"),
+    pytest.param("soon", None, id="malformed"),
+]
+"""value, expected_result"""
+
+
+@pytest.mark.parametrize(["value", "expected_result"], test_cases)
+def test_parse_retry_after(value: Optional[str], expected_result: Optional[float]):
+    assert parse_retry_after(value, now=NOW) == expected_result
@@ -0,0 +1,127 @@
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from pss_fleet_data.core.validation import CollectionFileError, main, validate_collection_file, validate_collection_files
+
+
+UPLOAD_TEST_FILE_PATH = Path("tests/files/upload_test_data_schema_9.json")
+
+
+@pytest.fixture(scope="function")
+def collection_content() -> dict[str, Any]:
+    content = json.loads(UPLOAD_TEST_FILE_PATH.read_text())
+    content["users"] = [[user_id] + content["users"][0][1:] for user_id in range(1, 2001)]
+    return content
+
+
+def write_collection(tmp_path: Path, content: dict[str, Any]) -> Path:
+    file_path = tmp_path / "collection.json"
+    file_path.write_text(json.dumps(content))
+    return file_path
+
+
+def set_value(key: str, index: int, field_index: int, value: Any) -> Callable[[dict[str, Any]], None]:
+    def update(content: dict[str, Any]):
+        content[key][index][field_index] = value
+
+    return update
+
+
+def update_metadata(key: str, value: Any) -> Callable[[dict[str, Any]], None]:
+    def update(content: dict[str, Any]):
+        content["meta"][key] = value
+
+    return update
+
+
+def remove_fields(index: int) -> Callable[[dict[str, Any]], None]:
+    def update(content: dict[str, Any]):
+        content["users"][index] = content["users"][index][:4]
+
+    return update
+
+
+@pytest.mark.parametrize("chunk_size", [pytest.param(1, id="1"), pytest.param(7, id="7"), pytest.param(None, id="default")])
+def test_validate_collection_file(chunk_size: int, collection_content: dict[str, Any], tmp_path: Path):
+    """chunk_size"""
+    validate_collection_file(UPLOAD_TEST_FILE_PATH, chunk_size=chunk_size)
+    validate_collection_file(write_collection(tmp_path, collection_content), chunk_size=chunk_size)
+
+
+@pytest.mark.parametrize(
+    ["update", "expected_location"],
+    [
+        pytest.param(set_value("users", 1500, 3, -1), "users[1500][3]", id="negative_trophy"),
+        pytest.param(set_value("users", 0, 5, 7), "users[0][5]", id="unknown_membership"),
+        pytest.param(remove_fields(1999), "users[1999][4]", id="missing_user_fields"),
+        pytest.param(set_value("fleets", 0, 0, 0), "fleets[0][0]", id="alliance_id_0"),
+        pytest.param(update_metadata("schema_version", 8), "meta.schema_version", id="schema_version"),
+        pytest.param(update_metadata("timestamp", "2015-01-01T00:00:00"), "meta.timestamp", id="timestamp_too_early"),
+        pytest.param(update_metadata("user_count", -1), "meta.user_count", id="negative_user_count"),
+    ],
+)
+def test_validate_collection_file_invalid_record(
+    update: Callable[[dict[str, Any]], None], expected_location: str, collection_content: dict[str, Any], tmp_path: Path
+):
+    """update, expected_location"""
+    update(collection_content)
+    file_path = write_collection(tmp_path, collection_content)
+
+    with pytest.raises(CollectionFileError) as exc_info:
+        validate_collection_file(file_path, chunk_size=100)
+
+    assert exc_info.value.location == expected_location
+    assert exc_info.value.file_path == file_path
+    assert expected_location in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    ["content", "expected_location"],
+    [
+        pytest.param('{"fleets": [], "users": []}', "meta", id="missing_metadata"),
+        pytest.param('{"meta": []}', "meta", id="metadata_not_an_object"),
+        pytest.param('{"meta": {"timestamp": "2016-01-06 23:59:00", "duration"', "", id="truncated"),
+        pytest.param('{"fleets": []} {}', "", id="trailing_data"),
+        pytest.param('{"users": [[1, "U1"] [2, "U2"]]}', "", id="missing_comma"),
+        pytest.param("[]", "", id="not_an_object"),
+        pytest.param("", "", id="empty"),
+    ],
+)
+def test_validate_collection_file_invalid_json(content: str, expected_location: str, tmp_path: Path):
+    """content, expected_location"""
+    file_path = tmp_path / "collection.json"
+    file_path.write_text(content)
+
+    with pytest.raises(CollectionFileError) as exc_info:
+        validate_collection_file(file_path, chunk_size=8)
+
+    assert exc_info.value.location == expected_location
+
+
+def test_validate_collection_file_not_utf_8(tmp_path: Path):
+    file_path = tmp_path / "collection.json"
+    file_path.write_bytes(b'{"meta": "\xff"}')
+
+    with pytest.raises(CollectionFileError):
+        validate_collection_file(file_path)
+
+
+def test_validate_collection_files(collection_content: dict[str, Any], tmp_path: Path, capsys: pytest.CaptureFixture):
+    collection_content["meta"]["schema_version"] = 3
+    invalid_file_path = tmp_path / "a.json"
+    invalid_file_path.write_text(json.dumps(collection_content))
+    valid_file_path = tmp_path / "b.json"
+    valid_file_path.write_bytes(UPLOAD_TEST_FILE_PATH.read_bytes())
+
+    results = validate_collection_files(tmp_path)
+
+    assert list(results) == [invalid_file_path, valid_file_path]
+    assert isinstance(results[invalid_file_path], CollectionFileError)
+    assert results[valid_file_path] is None
+
+    assert main([str(valid_file_path)]) == 0
+    assert main([str(tmp_path)]) == 1
+    assert "1 valid, 1 invalid" in capsys.readouterr().out
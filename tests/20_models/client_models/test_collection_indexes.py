@@ -0,0 +1,85 @@
+import pytest
+from pssapi.entities import Alliance as PssAlliance
+from pssapi.entities import User as PssUser
+
+from pss_fleet_data.models import Collection, CollectionMetadata
+
+
+def create_pss_user(user_id: int, name: str, alliance_id: int) -> PssUser:
+    return PssUser({"Id": user_id, "Name": name, "AllianceId": alliance_id})
+
+
+@pytest.fixture(scope="function")
+def indexed_collection(collection_metadata_9: CollectionMetadata) -> Collection:
+    return Collection(
+        metadata=collection_metadata_9,
+        alliances=[PssAlliance({"AllianceId": 1, "AllianceName": "A1"}), PssAlliance({"AllianceId": 2, "AllianceName": "A2"})],
+        users=[
+            create_pss_user(1, "Zeta", 1),
+            create_pss_user(2, "alpha", 2),
+            create_pss_user(3, "Alphonse", 1),
+            create_pss_user(4, "beta", 0),
+            create_pss_user(5, "ALPS", 1),
+        ],
+    )
+
+
+def test_get_user(indexed_collection: Collection):
+    assert indexed_collection.get_user(3).name == "Alphonse"
+    assert indexed_collection.get_user(6) is None
+
+
+def test_get_alliance(indexed_collection: Collection):
+    assert indexed_collection.get_alliance(2).alliance_name == "A2"
+    assert indexed_collection.get_alliance(3) is None
+
+
+def test_get_alliance_members(indexed_collection: Collection):
+    assert [user.id for user in indexed_collection.get_alliance_members(1)] == [1, 3, 5]
+    assert [user.id for user in indexed_collection.get_alliance_members(0)] == [4]
+    assert indexed_collection.get_alliance_members(3) == []
+
+
+@pytest.mark.parametrize(
+    ["prefix", "limit", "expected_user_ids"],
+    [
+        pytest.param("alp", None, [2, 3, 5], id="case_insensitive"),
+        pytest.param("ALPH", None, [2, 3], id="upper_case"),
+        pytest.param("alp", 2, [2, 3], id="limit"),
+        pytest.param("", None, [2, 3, 5, 4, 1], id="empty"),
+        pytest.param("x", None, [], id="no_match"),
+    ],
+)
+def test_search_users(indexed_collection: Collection, prefix: str, limit: int, expected_user_ids: list[int]):
+    """prefix, limit, expected_user_ids"""
+    assert [user.id for user in indexed_collection.search_users(prefix, limit=limit)] == expected_user_ids
+
+
+def test_indexes_follow_replaced_users(indexed_collection: Collection):
+    _ = indexed_collection.get_user(1)
+
+    copy = indexed_collection.model_copy(update={"users": indexed_collection.users[:2]})
+    indexed_collection.users = [create_pss_user(6, "Gamma", 2)]
+
+    assert copy.get_user(3) is None
+    assert copy.get_user(2).name == "alpha"
+    assert indexed_collection.get_user(1) is None
+    assert [user.id for user in indexed_collection.search_users("g")] == [6]
+
+
+def test_clear_indexes(indexed_collection: Collection):
+    _ = indexed_collection.get_user(1)
+
+    indexed_collection.users.append(create_pss_user(6, "Gamma", 2))
+    indexed_collection.clear_indexes()
+
+    assert indexed_collection.get_user(6).name == "Gamma"
+
+
+def test_indexes_do_not_affect_equality(indexed_collection: Collection):
+    copy = Collection(metadata=indexed_collection.metadata, alliances=indexed_collection.alliances, users=indexed_collection.users)
+
+    _ = indexed_collection.get_user(1)
+    _ = indexed_collection.search_users("a")
+
+    assert indexed_collection == copy
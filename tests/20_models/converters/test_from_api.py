@@ -1,7 +1,9 @@
-from typing import Callable
+import asyncio
+from typing import Any, Callable
 
 import pytest
 from pssapi.entities import Alliance as PssAlliance
+from pssapi.entities import User as PssUser
 
 from pss_fleet_data.models import Collection
 from pss_fleet_data.models.api_models import ApiAlliance, ApiCollection, ApiCollectionMetadata, ApiUser
@@ -47,3 +49,55 @@ def test_to_pss_user(api_user: ApiUser, assert_pss_user_valid: Callable[[PssAlli
 
     pss_user = FromAPI.to_pss_user(None)
     assert pss_user is None
+
+
+def test_to_pss_users_matches_to_pss_user(api_collection: ApiCollection, assert_pss_users_equal: Callable[[PssUser, PssUser], None]):
+    pss_users = FromAPI.to_pss_users(iter(api_collection.users))
+
+    assert len(pss_users) == len(api_collection.users) > 0
+    for pss_user, api_user in zip(pss_users, api_collection.users, strict=True):
+        assert_pss_users_equal(pss_user, FromAPI.to_pss_user(api_user))
+
+
+def test_to_pss_users_empty():
+    assert FromAPI.to_pss_users([]) == []
+
+
+async def test_to_collection_async(api_collection: ApiCollection, assert_collection_valid: Callable[[Collection], None]):
+    collection = await FromAPI.to_collection_async(api_collection)
+    assert_collection_valid(collection, True, True)
+
+
+async def test_to_collection_async_yields_between_chunks(api_collection: ApiCollection):
+    api_collection = api_collection.model_copy(update={"users": api_collection.users * 5})
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    ticker = asyncio.create_task(tick())
+    await asyncio.sleep(0)
+    ticks = 0
+    collection = await FromAPI.to_collection_async(api_collection, chunk_size=2)
+    ticker.cancel()
+
+    # 5 users in chunks of 2 yield twice.
+    assert ticks == 2
+    assert [user.id for user in collection.users] == [api_user[0] for api_user in api_collection.users]
+
+
+test_cases_chunk_size_invalid = [
+    # chunk_size, expected_exception
+    pytest.param(0, ValueError, id="zero"),
+    pytest.param(1.5, TypeError, id="float"),
+]
+"""chunk_size, expected_exception"""
+
+
+@pytest.mark.parametrize(["chunk_size", "expected_exception"], test_cases_chunk_size_invalid)
+async def test_to_collection_async_chunk_size_invalid(api_collection: ApiCollection, chunk_size: Any, expected_exception: type[Exception]):
+    with pytest.raises(expected_exception):
+        _ = await FromAPI.to_collection_async(api_collection, chunk_size=chunk_size)
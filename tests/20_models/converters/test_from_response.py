@@ -45,6 +45,24 @@ def test_to_alliance_history_with_members(
     assert_alliance_histories_equal(alliance_history_with_members, alliance_history_response)
 
 
+async def test_to_alliance_history_list_async(
+    response_alliance_history_list: Response,
+    alliance_history: AllianceHistory,
+    assert_alliance_history_valid: Callable[[AllianceHistory], None],
+    assert_alliance_histories_equal: Callable[[AllianceHistory, AllianceHistory], None],
+):
+    alliance_history_list_response = await FromResponse.to_alliance_history_list_async(response_alliance_history_list, chunk_size=1)
+
+    assert len(alliance_history_list_response) == 1
+    assert_alliance_history_valid(alliance_history_list_response[0])
+    assert_alliance_histories_equal(alliance_history, alliance_history_list_response[0])
+
+
+async def test_to_alliance_history_list_async_returns_empty_list_on_empty_response(response_text_empty: Response):
+    alliance_history_list_response = await FromResponse.to_alliance_history_list_async(response_text_empty)
+    assert alliance_history_list_response == []
+
+
 def test_to_alliance_history_list(
     response_alliance_history_list: Response,
     alliance_history: AllianceHistory,
@@ -102,6 +120,23 @@ def test_to_collection(
     assert_collections_equal(collection, collection_response, True, True)
 
 
+async def test_to_collection_async(
+    response_collection: Response,
+    collection: Collection,
+    assert_collection_valid: Callable[[Collection], None],
+    assert_collections_equal: Callable[[Collection, Collection], None],
+):
+    collection_response = await FromResponse.to_collection_async(response_collection, chunk_size=1)
+
+    assert_collection_valid(collection_response, True, True)
+    assert_collections_equal(collection, collection_response, True, True)
+
+
+async def test_to_collection_async_returns_none_on_empty_response(response_text_empty: Response):
+    collection_response = await FromResponse.to_collection_async(response_text_empty)
+    assert collection_response is None
+
+
 def test_to_collection_returns_none_on_empty_response(response_text_empty: Response):
     collection_response = FromResponse.to_collection(response_text_empty)
     assert collection_response is None
@@ -225,6 +260,19 @@ def test_to_user_history_returns_none_on_empty_json_response(response_json_empty
     assert user_history_response is None
 
 
+async def test_to_user_history_list_async(
+    response_user_history_list: Response,
+    user_history: UserHistory,
+    assert_user_history_valid: Callable[[UserHistory], None],
+    assert_user_histories_equal: Callable[[UserHistory, UserHistory], None],
+):
+    user_history_list_response = await FromResponse.to_user_history_list_async(response_user_history_list, chunk_size=1)
+
+    assert len(user_history_list_response) == 1
+    assert_user_history_valid(user_history_list_response[0])
+    assert_user_histories_equal(user_history, user_history_list_response[0])
+
+
 def test_to_user_history_list(
     response_user_history_list: Response,
     user_history: UserHistory,
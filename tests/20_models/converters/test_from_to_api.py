@@ -60,3 +60,14 @@ def test_from_to_pss_user(api_user: ApiUser, assert_api_user_valid: Callable[[Ap
     assert_api_user_valid(api_user_after)
 
     assert api_user == api_user_after
+
+
+@pytest.mark.usefixtures("api_user")
+@pytest.mark.usefixtures("assert_api_user_valid")
+def test_from_to_pss_user_without_alliance(api_user: ApiUser, assert_api_user_valid: Callable[[ApiUser], None]):
+    api_user = (*api_user[:2], 0, *api_user[3:5], -1, *api_user[6:])
+    pss_user = FromAPI.to_pss_user(api_user)
+    api_user_after = ToAPI.from_pss_user(pss_user)
+    assert_api_user_valid(api_user_after)
+
+    assert api_user == api_user_after
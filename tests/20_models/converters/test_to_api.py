@@ -35,9 +35,27 @@ def test_from_collection_metadata(
     assert_api_collection_metadata_valid(api_collection_metadata)
 
 
+def test_from_collection_keep_collection_id(collection: Collection):
+    assert collection.metadata.collection_id is not None
+    assert ToAPI.from_collection(collection).meta.collection_id is None
+    assert ToAPI.from_collection(collection, keep_collection_id=True).meta.collection_id == collection.metadata.collection_id
+
+
 @pytest.mark.usefixtures("pss_user")
 @pytest.mark.usefixtures("assert_api_user_valid")
 def test_from_pss_user(pss_user: PssUser, assert_api_user_valid: Callable[[ApiUser], None]):
     api_user = ToAPI.from_pss_user(pss_user)
 
     assert_api_user_valid(api_user)
+
+
+@pytest.mark.usefixtures("collection")
+def test_from_pss_users_matches_from_pss_user(collection: Collection):
+    api_users = ToAPI.from_pss_users(iter(collection.users))
+
+    assert api_users
+    assert api_users == [ToAPI.from_pss_user(user) for user in collection.users]
+
+
+def test_from_pss_users_empty():
+    assert ToAPI.from_pss_users([]) == []
@@ -0,0 +1,70 @@
+from typing import Callable
+
+from pssapi.entities import Alliance as PssAlliance
+from pssapi.entities import User as PssUser
+
+from pss_fleet_data.analytics.columns import ALLIANCE_FIELDS, USER_FIELDS
+from pss_fleet_data.models.api_models import ApiAlliance, ApiCollection, ApiUser
+from pss_fleet_data.models.converters import ToAPI
+from pss_fleet_data.models.records import FleetAlliance, FleetUser, get_fleet_alliances, get_fleet_users
+
+
+def test_fleet_record_fields_match_api_layout():
+    assert FleetUser._fields == USER_FIELDS
+    assert FleetAlliance._fields == ALLIANCE_FIELDS
+
+
+def test_fleet_user_from_api(api_user: ApiUser):
+    fleet_user = FleetUser.from_api(api_user)
+
+    assert fleet_user == api_user
+    assert fleet_user.user_id == api_user[0]
+    assert fleet_user.user_name == api_user[1]
+    assert fleet_user.tournament_bonus_score == api_user[19]
+    assert not hasattr(fleet_user, "__dict__")
+
+
+def test_fleet_user_to_from_pss_user(api_user: ApiUser, assert_pss_user_valid: Callable[[PssUser], None]):
+    pss_user = FleetUser.from_api(api_user).to_pss_user()
+
+    assert_pss_user_valid(pss_user)
+    assert FleetUser.from_pss_user(pss_user) == ToAPI.from_pss_user(pss_user)
+
+
+def test_fleet_alliance_from_api(api_alliance: ApiAlliance):
+    fleet_alliance = FleetAlliance.from_api(api_alliance)
+
+    assert fleet_alliance == api_alliance
+    assert fleet_alliance.alliance_name == api_alliance[1]
+
+
+def test_fleet_alliance_to_from_pss_alliance(api_alliance: ApiAlliance, assert_pss_alliance_valid: Callable[[PssAlliance], None]):
+    pss_alliance = FleetAlliance.from_api(api_alliance).to_pss_alliance()
+
+    assert_pss_alliance_valid(pss_alliance)
+    assert FleetAlliance.from_pss_alliance(pss_alliance) == api_alliance
+
+
+def test_get_fleet_records(api_collection: ApiCollection):
+    fleet_users = get_fleet_users(api_collection)
+    fleet_alliances = get_fleet_alliances(api_collection)
+
+    assert fleet_users == api_collection.users
+    assert all(isinstance(fleet_user, FleetUser) for fleet_user in fleet_users)
+    assert fleet_alliances == api_collection.fleets
+    assert all(isinstance(fleet_alliance, FleetAlliance) for fleet_alliance in fleet_alliances)
+
+
+def test_get_fleet_records_of_empty_collection(api_collection: ApiCollection):
+    api_collection = api_collection.model_copy(update={"fleets": [], "users": []})
+
+    assert get_fleet_users(api_collection) == []
+    assert get_fleet_alliances(api_collection) == []
+
+
+def test_fleet_records_validate_as_api_collection(api_collection: ApiCollection):
+    api_collection_from_records = ApiCollection(
+        meta=api_collection.meta, fleets=get_fleet_alliances(api_collection), users=get_fleet_users(api_collection)
+    )
+
+    assert api_collection_from_records == api_collection
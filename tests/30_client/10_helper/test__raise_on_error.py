@@ -1,3 +1,5 @@
+from typing import Optional
+
 import pytest
 from httpx import Response
 
@@ -5,11 +7,13 @@ from pss_fleet_data import ApiError, ErrorCode
 from pss_fleet_data.client import _raise_on_error
 from pss_fleet_data.core.exceptions import (
     AllianceNotFoundError,
+    BadGatewayError,
     CollectionNotDeletedError,
     CollectionNotFoundError,
     ConflictError,
     FromDateAfterToDateError,
     FromDateTooEarlyError,
+    GatewayTimeoutError,
     InvalidAllianceIdError,
     InvalidBoolError,
     InvalidCollectionIdError,
@@ -34,6 +38,7 @@ from pss_fleet_data.core.exceptions import (
     ParameterValueError,
     SchemaVersionMismatch,
     ServerError,
+    ServiceUnavailableError,
     ToDateTooEarlyError,
     TooManyRequestsError,
     UnsupportedMediaTypeError,
@@ -117,3 +122,87 @@ def test__raise_on_error_raises(status_code: int, error_code: ErrorCode, expecte
 
     with pytest.raises(expected_exception):
         _raise_on_error(response)
+
+
+test_cases_raises_without_error_code = [
+    # status_code, content, expected_exception
+    pytest.param(400, b"", ParameterValidationError, id="400_empty"),
+    pytest.param(404, b"<html><body>Not Found</body></html>", NotFoundError, id="404_html"),
+    pytest.param(418, b"I'm a teapot", ApiError, id="418_text"),
+    pytest.param(422, b'{"detail": "Unprocessable"}', ParameterValidationError, id="422_json_without_code"),
+    pytest.param(429, b"", TooManyRequestsError, id="429_empty"),
+    pytest.param(500, b"<html><body>Internal Server Error</body></html>", ServerError, id="500_html"),
+    pytest.param(502, b"<html><body>Bad Gateway</body></html>", BadGatewayError, id="502_html"),
+    pytest.param(503, b'{"code": 503', ServiceUnavailableError, id="503_invalid_json"),
+    pytest.param(504, b"", GatewayTimeoutError, id="504_empty"),
+    pytest.param(599, b"[]", ServerError, id="599_json_array"),
+]
+"""status_code, content, expected_exception"""
+
+
+@pytest.mark.parametrize(["status_code", "content", "expected_exception"], test_cases_raises_without_error_code)
+def test__raise_on_error_raises_without_error_code(status_code: int, content: bytes, expected_exception: type[ApiError]):
+    response = Response(status_code, content=content)
+
+    with pytest.raises(expected_exception) as exc_info:
+        _raise_on_error(response)
+
+    assert type(exc_info.value) is expected_exception
+    assert exc_info.value.code == f"HTTP_{status_code}"
+    assert exc_info.value.details == content.decode().strip()
+    assert exc_info.value.retry_after is None
+
+
+def test__raise_on_error_truncates_details():
+    response = Response(502, content=b"x" * 10_000)
+
+    with pytest.raises(BadGatewayError) as exc_info:
+        _raise_on_error(response)
+
+    assert 0 < len(exc_info.value.details) < 10_000
+
+
+test_cases_retry_after = [
+    # status_code, error_code, retry_after, expected_exception, expected_retry_after
+    pytest.param(429, ErrorCode.RATE_LIMITED, "30", TooManyRequestsError, 30.0, id="rate_limited"),
+    pytest.param(503, None, "120", ServiceUnavailableError, 120.0, id="service_unavailable"),
+    pytest.param(503, None, "Thu, 01 Jan 1970 00:00:00 GMT", ServiceUnavailableError, 0.0, id="service_unavailable_http_date"),
+    pytest.param(503, None, "soon", ServiceUnavailableError, None, id="service_unavailable_malformed"),
+]
+"""status_code, error_code, retry_after, expected_exception, expected_retry_after"""
+
+
+@pytest.mark.parametrize(["status_code", "error_code", "retry_after", "expected_exception", "expected_retry_after"], test_cases_retry_after)
+def test__raise_on_error_sets_retry_after(
+    status_code: int, error_code: Optional[ErrorCode], retry_after: str, expected_exception: type[ApiError], expected_retry_after: Optional[float]
+):
+    if error_code:
+        response = Response(status_code, json={**RESPONSE_CONTENT_BASE, "code": error_code}, headers={"Retry-After": retry_after})
+    else:
+        response = Response(status_code, text="Service Unavailable", headers={"Retry-After": retry_after})
+
+    with pytest.raises(expected_exception) as exc_info:
+        _raise_on_error(response)
+
+    assert exc_info.value.retry_after == expected_retry_after
+
+
+def test__raise_on_error_unknown_error_code_maps_status_code():
+    response = Response(404, json={**RESPONSE_CONTENT_BASE, "code": "SOMETHING_NEW"})
+
+    with pytest.raises(NotFoundError) as exc_info:
+        _raise_on_error(response)
+
+    assert exc_info.value.code == "SOMETHING_NEW"
+
+
+def test__raise_on_error_keeps_error_response_values():
+    links = [{"path": "/collections", "description": "Collections"}]
+    response = Response(404, json={**RESPONSE_CONTENT_BASE, "code": ErrorCode.COLLECTION_NOT_FOUND, "links": links})
+
+    with pytest.raises(CollectionNotFoundError) as exc_info:
+        _raise_on_error(response)
+
+    error = exc_info.value
+    expected_values = (ErrorCode.COLLECTION_NOT_FOUND, "message", "details", "2024-04-15T00:59:00Z", "", {"/collections": "Collections"}, None)
+    assert (error.code, error.message, error.details, error.timestamp, error.suggestion, error.links, error.retry_after) == expected_values
@@ -0,0 +1,77 @@
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pss_fleet_data import PssFleetDataClient
+from pss_fleet_data.core.exceptions import CollectionNotFoundError
+from pss_fleet_data.core.instrumentation import InstrumentationHook, RequestMetrics
+from pss_fleet_data.models.api_models import ApiCollection
+
+
+class RecordingHook(InstrumentationHook):
+    def __init__(self):
+        self.events: list[tuple[str, RequestMetrics]] = []
+
+    def on_request_start(self, metrics: RequestMetrics):
+        self.events.append(("start", metrics))
+
+    def on_request_end(self, metrics: RequestMetrics):
+        self.events.append(("end", metrics))
+
+    def on_response_processed(self, metrics: RequestMetrics):
+        self.events.append(("processed", metrics))
+
+
+@pytest.fixture(scope="function")
+def recording_hook() -> RecordingHook:
+    return RecordingHook()
+
+
+@pytest.fixture(scope="function")
+def instrumented_client(base_url: str, default_api_key: str, recording_hook: RecordingHook) -> PssFleetDataClient:
+    return PssFleetDataClient(base_url=base_url, api_key=default_api_key, hooks=[recording_hook])
+
+
+async def test_send_notifies_hooks(
+    api_collection: ApiCollection,
+    instrumented_client: PssFleetDataClient,
+    recording_hook: RecordingHook,
+    httpx_mock: HTTPXMock,
+):
+    content = api_collection.model_dump_json()
+    httpx_mock.add_response(text=content)
+
+    _ = await instrumented_client.get_collection(1)
+
+    assert [event for event, _ in recording_hook.events] == ["start", "end", "processed"]
+    metrics = recording_hook.events[-1][1]
+    assert metrics.method == "GET"
+    assert metrics.route == "/collections/{collection_id}"
+    assert metrics.path == "/collections/1"
+    assert metrics.status_code == 200
+    assert metrics.bytes_received == len(content.encode())
+    assert 0 <= metrics.time_to_first_byte <= metrics.total_time
+    assert metrics.json_decode_time > 0
+    assert metrics.conversion_time > 0
+    assert metrics.error is None
+
+
+@pytest.mark.usefixtures("mock_response_collection_not_found")
+async def test_send_notifies_hooks_on_error_response(instrumented_client: PssFleetDataClient, recording_hook: RecordingHook):
+    with pytest.raises(CollectionNotFoundError):
+        _ = await instrumented_client.get_collection(1)
+
+    assert [event for event, _ in recording_hook.events] == ["start", "end"]
+    metrics = recording_hook.events[-1][1]
+    assert metrics.status_code == 404
+    assert isinstance(metrics.error, CollectionNotFoundError)
+
+
+@pytest.mark.usefixtures("mock_response_empty_get_204")
+async def test_send_notifies_hooks_without_processing(instrumented_client: PssFleetDataClient, recording_hook: RecordingHook):
+    _ = await instrumented_client.delete_collection(1)
+
+    assert [event for event, _ in recording_hook.events] == ["start", "end"]
+    metrics = recording_hook.events[-1][1]
+    assert metrics.method == "DELETE"
+    assert metrics.route == "/collections/{collection_id}"
+    assert metrics.status_code == 200
@@ -1,8 +1,9 @@
 from typing import Callable
 
 import pytest
+from pytest_httpx import HTTPXMock
 
-from pss_fleet_data import PssFleetDataClient
+from pss_fleet_data import PssFleetDataClient, UploadLedger
 from pss_fleet_data.core.exceptions import (
     MissingAccessError,
     NonUniqueTimestampError,
@@ -80,3 +81,16 @@ async def test_create_collection_422_unsupported_schema(
 ):
     with pytest.raises(UnsupportedSchemaError):
         _ = await test_client.create_collection(collection)
+
+
+@pytest.mark.usefixtures("mock_response_collections_post_201")
+async def test_create_collection_with_ledger(collection: Collection, base_url: str, httpx_mock: HTTPXMock):
+    ledger = UploadLedger()
+    client = PssFleetDataClient(base_url=base_url, ledger=ledger)
+
+    collection_metadata = await client.create_collection(collection)
+    recorded_collection_metadata = await client.create_collection(collection)
+
+    assert recorded_collection_metadata == collection_metadata
+    assert len(ledger) == 1
+    assert len(httpx_mock.get_requests()) == 1
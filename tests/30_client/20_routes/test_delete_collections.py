@@ -0,0 +1,76 @@
+import pytest
+from httpx import Request, Response
+from pytest_httpx import HTTPXMock
+
+from pss_fleet_data import PssFleetDataClient, RateLimiter
+from pss_fleet_data.core.exceptions import CollectionNotFoundError
+from pss_fleet_data.models.api_models import ApiCollectionMetadata
+from pss_fleet_data.models.enums import ParameterInterval
+
+
+COLLECTION_NOT_FOUND_RESPONSE = {
+    "code": "COLLECTION_NOT_FOUND",
+    "message": "The requested Collection could not be found.",
+    "details": "There is no Collection with the ID '2'.",
+    "timestamp": "2020-01-01T00:00:00+00:00",
+    "url": "https://example.com",
+    "suggestion": "Check the provided `collectionId` parameter in the path.",
+    "links": [],
+}
+
+
+def delete_callback(request: Request) -> Response:
+    if request.url.path.endswith("/2"):
+        return Response(status_code=404, json=COLLECTION_NOT_FOUND_RESPONSE)
+    return Response(status_code=204)
+
+
+async def test_delete_collections(test_client: PssFleetDataClient, httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(delete_callback, method="DELETE", is_reusable=True)
+
+    results = await test_client.delete_collections([1, 2, 3], max_concurrency=2, rate_limiter=RateLimiter(rate=100, burst=3))
+
+    assert [result.collection_id for result in results] == [1, 2, 3]
+    assert [result.succeeded for result in results] == [True, False, True]
+    assert isinstance(results[1].error, CollectionNotFoundError)
+    assert not any(result.dry_run for result in results)
+    assert len(httpx_mock.get_requests(method="DELETE")) == 3
+
+
+async def test_delete_collections_dry_run(api_collection_metadata_9: ApiCollectionMetadata, test_client: PssFleetDataClient, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(method="GET", text=f"[{api_collection_metadata_9.model_dump_json()}]")
+
+    results = await test_client.delete_collections([api_collection_metadata_9.collection_id, 2], dry_run=True)
+
+    assert all(result.dry_run for result in results)
+    assert results[0].succeeded
+    assert results[0].metadata.collection_id == api_collection_metadata_9.collection_id
+    assert isinstance(results[1].error, CollectionNotFoundError)
+    assert not httpx_mock.get_requests(method="DELETE")
+
+
+async def test_delete_collections_dry_run_lists_hourly_collections(
+    api_collection_metadata_9: ApiCollectionMetadata, test_client: PssFleetDataClient, httpx_mock: HTTPXMock
+):
+    hourly_metadata = api_collection_metadata_9.model_copy(update={"timestamp": "2016-01-08 12:59:00"})
+
+    def list_callback(request: Request) -> Response:
+        assert request.url.params.get("interval") == ParameterInterval.HOURLY
+        return Response(status_code=200, text=f"[{hourly_metadata.model_dump_json()}]")
+
+    httpx_mock.add_callback(list_callback, method="GET")
+
+    results = await test_client.delete_collections([hourly_metadata.collection_id], dry_run=True)
+
+    assert results[0].succeeded
+    assert results[0].metadata.collection_id == hourly_metadata.collection_id
+
+
+async def test_delete_collections_empty(test_client: PssFleetDataClient):
+    assert await test_client.delete_collections([], dry_run=True) == []
+    assert await test_client.delete_collections([]) == []
+
+
+async def test_delete_collections_invalid_max_concurrency(test_client: PssFleetDataClient):
+    with pytest.raises(ValueError):
+        _ = await test_client.delete_collections([1], max_concurrency=0)
@@ -0,0 +1,44 @@
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pss_fleet_data import PssFleetDataClient
+from pss_fleet_data.core.exceptions import CollectionNotFoundError
+from pss_fleet_data.models.api_models import ApiCollection
+
+
+async def test_diff_collections_200(api_collection: ApiCollection, base_url: str, test_client: PssFleetDataClient, httpx_mock: HTTPXMock):
+    user = api_collection.users[0]
+    changed_user = (user[0], user[1], user[2], user[3] + 100) + user[4:]
+    api_collection_after = api_collection.model_copy(
+        update={"meta": api_collection.meta.model_copy(update={"collection_id": 2}), "users": [changed_user]}
+    )
+    httpx_mock.add_response(url=f"{base_url}/collections/1", text=api_collection.model_dump_json())
+    httpx_mock.add_response(url=f"{base_url}/collections/2", text=api_collection_after.model_dump_json())
+
+    diff = await test_client.diff_collections(1, 2, changed_only=True)
+
+    assert diff.collection_id_before == 1
+    assert diff.collection_id_after == 2
+    assert diff.users["user_id"] == [user[0]]
+    assert diff.users["trophy_delta"] == [100]
+    assert len(diff.alliances) == 0
+
+
+async def test_diff_collections_404(api_collection: ApiCollection, base_url: str, test_client: PssFleetDataClient, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url=f"{base_url}/collections/1", text=api_collection.model_dump_json(), is_optional=True)
+    httpx_mock.add_response(
+        url=f"{base_url}/collections/2",
+        status_code=404,
+        json={
+            "code": "COLLECTION_NOT_FOUND",
+            "message": "The requested Collection could not be found.",
+            "details": "There is no Collection with the ID '2'.",
+            "timestamp": "2020-01-01T00:00:00+00:00",
+            "url": "https://example.com",
+            "suggestion": "Check the provided `collectionId` parameter in the path.",
+            "links": [],
+        },
+    )
+
+    with pytest.raises(CollectionNotFoundError):
+        _ = await test_client.diff_collections(1, 2)
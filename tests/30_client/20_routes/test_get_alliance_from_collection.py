@@ -2,10 +2,11 @@ from typing import Callable
 
 import pytest
 from pssapi.entities import Alliance as PssAlliance
+from pytest_httpx import HTTPXMock
 
-from pss_fleet_data import PssFleetDataClient
+from pss_fleet_data import CollectionCache, PssFleetDataClient
 from pss_fleet_data.core.exceptions import AllianceNotFoundError, CollectionNotFoundError, InvalidAllianceIdError, InvalidCollectionIdError
-from pss_fleet_data.models import AllianceHistory
+from pss_fleet_data.models import AllianceHistory, Collection
 
 
 @pytest.mark.usefixtures("mock_response_collections_collectionId_alliances_allianceId_get_200")
@@ -58,3 +59,56 @@ async def test_get_alliance_from_collection_collection_id_invalid_422(test_clien
     with pytest.raises(InvalidCollectionIdError):
         _ = await test_client.get_alliance_from_collection("f", 1)
         _ = await test_client.get_alliance_from_collection("f", "f")
+
+
+async def test_get_alliance_from_collection_cached(
+    alliance_history_with_members: AllianceHistory,
+    collection: Collection,
+    base_url: str,
+    assert_alliance_histories_equal: Callable[[AllianceHistory, AllianceHistory], None],
+):
+    cache = CollectionCache()
+    cache.put(collection)
+    client = PssFleetDataClient(base_url=base_url, cache=cache)
+
+    response = await client.get_alliance_from_collection(1, 1)
+    assert_alliance_histories_equal(alliance_history_with_members, response)
+
+    with pytest.raises(AllianceNotFoundError):
+        _ = await client.get_alliance_from_collection(1, 2)
+
+
+async def test_get_alliance_from_collection_cached_str_ids(
+    alliance_history_with_members: AllianceHistory,
+    collection: Collection,
+    base_url: str,
+    httpx_mock: HTTPXMock,
+    assert_alliance_histories_equal: Callable[[AllianceHistory, AllianceHistory], None],
+):
+    cache = CollectionCache()
+    cache.put(collection)
+    client = PssFleetDataClient(base_url=base_url, cache=cache)
+
+    response = await client.get_alliance_from_collection("1", "1")
+
+    assert_alliance_histories_equal(alliance_history_with_members, response)
+    assert not httpx_mock.get_requests()
+
+
+@pytest.mark.parametrize(
+    ["collection_id", "alliance_id", "expected_exception"],
+    [
+        pytest.param("f", 1, InvalidCollectionIdError, id="collection_id_invalid"),
+        pytest.param(1, "f", InvalidAllianceIdError, id="alliance_id_invalid"),
+    ],
+)
+async def test_get_alliance_from_collection_cached_invalid_ids(
+    collection_id, alliance_id, expected_exception: type[Exception], collection: Collection, base_url: str, httpx_mock: HTTPXMock
+):
+    cache = CollectionCache()
+    cache.put(collection)
+    client = PssFleetDataClient(base_url=base_url, cache=cache)
+
+    with pytest.raises(expected_exception):
+        _ = await client.get_alliance_from_collection(collection_id, alliance_id)
+    assert not httpx_mock.get_requests()
@@ -0,0 +1,61 @@
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pss_fleet_data import CollectionCache, PssFleetDataClient
+from pss_fleet_data.core.exceptions import CollectionNotFoundError
+from pss_fleet_data.models.api_models import ApiCollection
+
+
+@pytest.fixture(scope="function")
+def api_collection_2(api_collection: ApiCollection) -> ApiCollection:
+    user = api_collection.users[0]
+    return api_collection.model_copy(
+        update={
+            "meta": api_collection.meta.model_copy(update={"collection_id": 2, "timestamp": api_collection.meta.timestamp.replace(year=2017)}),
+            "users": [(user[0], user[1], user[2], user[3] + 100) + user[4:]],
+        }
+    )
+
+
+async def test_get_time_series_200(
+    api_collection: ApiCollection, api_collection_2: ApiCollection, base_url: str, test_client: PssFleetDataClient, httpx_mock: HTTPXMock
+):
+    httpx_mock.add_response(url=f"{base_url}/collections/1", text=api_collection.model_dump_json())
+    httpx_mock.add_response(url=f"{base_url}/collections/2", text=api_collection_2.model_dump_json())
+    user = api_collection.users[0]
+
+    time_series = await test_client.get_time_series([2, 1], fields=["trophy", "alliance_score"], max_concurrency=1)
+
+    assert list(time_series) == ["trophy", "alliance_score"]
+    assert time_series["trophy"].collection_ids == [1, 2]
+    assert time_series["trophy"].user_ids == [user[0]]
+    assert time_series["trophy"].get_values(user[0]) == [user[3], user[3] + 100]
+
+
+async def test_get_time_series_from_cache(api_collection: ApiCollection, api_collection_2: ApiCollection, base_url: str, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url=f"{base_url}/collections/2", text=api_collection_2.model_dump_json())
+    cache = CollectionCache()
+    cache.put(api_collection)
+    client = PssFleetDataClient(base_url=base_url, cache=cache)
+
+    time_series = await client.get_time_series([1, 2])
+    _ = await client.get_time_series([1, 2])
+
+    assert time_series["trophy"].collection_ids == [1, 2]
+    assert 2 in cache
+    assert len(httpx_mock.get_requests()) == 1
+
+
+async def test_get_time_series_empty_response(api_collection: ApiCollection, base_url: str, test_client: PssFleetDataClient, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url=f"{base_url}/collections/1", text=api_collection.model_dump_json())
+    httpx_mock.add_response(url=f"{base_url}/collections/2", text="")
+
+    with pytest.raises(CollectionNotFoundError) as exc_info:
+        _ = await test_client.get_time_series([1, 2])
+
+    assert "'2'" in exc_info.value.details
+
+
+async def test_get_time_series_unknown_field(test_client: PssFleetDataClient):
+    with pytest.raises(ValueError):
+        _ = await test_client.get_time_series([1], fields=["unknown"])
@@ -1,10 +1,11 @@
 from typing import Callable
 
 import pytest
+from pytest_httpx import HTTPXMock
 
-from pss_fleet_data import PssFleetDataClient
+from pss_fleet_data import CollectionCache, PssFleetDataClient
 from pss_fleet_data.core.exceptions import CollectionNotFoundError, InvalidCollectionIdError, InvalidUserIdError, UserNotFoundError
-from pss_fleet_data.models import UserHistory
+from pss_fleet_data.models import Collection, UserHistory
 
 
 @pytest.mark.usefixtures("mock_response_collections_collectionId_users_userId_get_200")
@@ -57,3 +58,56 @@ async def test_get_user_from_collection_collection_id_invalid_422(test_client: P
 async def test_get_user_from_collection_user_id_invalid_422(test_client: PssFleetDataClient):
     with pytest.raises(InvalidUserIdError):
         _ = await test_client.get_user_from_collection(1, "f")
+
+
+async def test_get_user_from_collection_cached(
+    user_history_with_alliance: UserHistory,
+    collection: Collection,
+    base_url: str,
+    assert_user_histories_equal: Callable[[UserHistory, UserHistory], None],
+):
+    cache = CollectionCache()
+    cache.put(collection)
+    client = PssFleetDataClient(base_url=base_url, cache=cache)
+
+    response = await client.get_user_from_collection(1, 1)
+    assert_user_histories_equal(user_history_with_alliance, response)
+
+    with pytest.raises(UserNotFoundError):
+        _ = await client.get_user_from_collection(1, 2)
+
+
+async def test_get_user_from_collection_cached_str_ids(
+    user_history_with_alliance: UserHistory,
+    collection: Collection,
+    base_url: str,
+    httpx_mock: HTTPXMock,
+    assert_user_histories_equal: Callable[[UserHistory, UserHistory], None],
+):
+    cache = CollectionCache()
+    cache.put(collection)
+    client = PssFleetDataClient(base_url=base_url, cache=cache)
+
+    response = await client.get_user_from_collection("1", "1")
+
+    assert_user_histories_equal(user_history_with_alliance, response)
+    assert not httpx_mock.get_requests()
+
+
+@pytest.mark.parametrize(
+    ["collection_id", "user_id", "expected_exception"],
+    [
+        pytest.param("f", 1, InvalidCollectionIdError, id="collection_id_invalid"),
+        pytest.param(1, "f", InvalidUserIdError, id="user_id_invalid"),
+    ],
+)
+async def test_get_user_from_collection_cached_invalid_ids(
+    collection_id, user_id, expected_exception: type[Exception], collection: Collection, base_url: str, httpx_mock: HTTPXMock
+):
+    cache = CollectionCache()
+    cache.put(collection)
+    client = PssFleetDataClient(base_url=base_url, cache=cache)
+
+    with pytest.raises(expected_exception):
+        _ = await client.get_user_from_collection(collection_id, user_id)
+    assert not httpx_mock.get_requests()
@@ -0,0 +1,159 @@
+from pathlib import Path
+from urllib.parse import parse_qs
+
+import pytest
+from httpx import Request, Response
+from pytest_httpx import HTTPXMock
+
+from pss_fleet_data import CollectionCache, PssFleetDataClient, SyncCheckpoint, utils
+from pss_fleet_data.core.exceptions import CollectionNotFoundError
+from pss_fleet_data.models.api_models import ApiCollection
+from pss_fleet_data.models.converters import FromAPI
+from pss_fleet_data.models.enums import ParameterInterval
+
+
+COLLECTION_NOT_FOUND_RESPONSE = {
+    "code": "COLLECTION_NOT_FOUND",
+    "message": "The requested Collection could not be found.",
+    "details": "There is no Collection with the ID '2'.",
+    "timestamp": "2020-01-01T00:00:00+00:00",
+    "url": "https://example.com",
+    "suggestion": "Check the provided `collectionId` parameter in the path.",
+    "links": [],
+}
+
+
+@pytest.fixture(scope="function")
+def api_collections(api_collection: ApiCollection) -> list[ApiCollection]:
+    return [
+        api_collection.model_copy(
+            update={
+                "meta": api_collection.meta.model_copy(
+                    update={"collection_id": collection_id, "timestamp": api_collection.meta.timestamp.replace(day=6 + collection_id)}
+                )
+            }
+        )
+        for collection_id in (1, 2, 3)
+    ]
+
+
+def create_api_callback(api_collections: list[ApiCollection], missing_collection_ids: tuple[int, ...] = ()):
+    def api_callback(request: Request) -> Response:
+        if request.url.path == "/collections/":
+            from_date = parse_qs(request.url.query.decode()).get("fromDate")
+            metadatas = [
+                api_collection.meta.model_dump_json()
+                for api_collection in api_collections
+                if not from_date or utils.localize_to_utc(api_collection.meta.timestamp) >= utils.localize_to_utc(utils.parse_datetime(from_date[0]))
+            ]
+            return Response(status_code=200, text=f"[{', '.join(metadatas)}]")
+
+        collection_id = int(request.url.path.rsplit("/", 1)[1])
+        if collection_id in missing_collection_ids:
+            return Response(status_code=404, json=COLLECTION_NOT_FOUND_RESPONSE)
+        return Response(status_code=200, text=api_collections[collection_id - 1].model_dump_json())
+
+    return api_callback
+
+
+async def test_sync_collections(
+    api_collections: list[ApiCollection], base_url: str, test_client: PssFleetDataClient, httpx_mock: HTTPXMock, tmp_path: Path
+):
+    httpx_mock.add_callback(create_api_callback(api_collections), is_reusable=True)
+    cache = CollectionCache(directory=tmp_path / "collections")
+    checkpoint = SyncCheckpoint(tmp_path / "checkpoint.json")
+
+    result = await test_client.sync_collections(cache, checkpoint, max_concurrency=2)
+
+    assert result.succeeded
+    assert [collection_metadata.collection_id for collection_metadata in result.downloaded] == [1, 2, 3]
+    assert not result.skipped
+    assert result.checkpoint.collection_id == 3
+    assert checkpoint.collection_id == 3
+    assert all(collection_id in cache for collection_id in (1, 2, 3))
+
+
+async def test_sync_collections_incremental(
+    api_collections: list[ApiCollection], base_url: str, test_client: PssFleetDataClient, httpx_mock: HTTPXMock, tmp_path: Path
+):
+    httpx_mock.add_callback(create_api_callback(api_collections), is_reusable=True)
+    cache = CollectionCache(directory=tmp_path / "collections")
+    cache.put(api_collections[0])
+    cache.put(api_collections[1])
+    checkpoint = SyncCheckpoint(tmp_path / "checkpoint.json")
+    checkpoint.save(api_collections[1].meta)
+
+    result = await test_client.sync_collections(cache, SyncCheckpoint(checkpoint.file_path))
+
+    assert [collection_metadata.collection_id for collection_metadata in result.downloaded] == [3]
+    assert [collection_metadata.collection_id for collection_metadata in result.skipped] == [2]
+    assert result.checkpoint.collection_id == 3
+    assert [request.url.path for request in httpx_mock.get_requests()] == ["/collections/", "/collections/3"]
+
+
+async def test_sync_collections_failed_download(
+    api_collections: list[ApiCollection], base_url: str, test_client: PssFleetDataClient, httpx_mock: HTTPXMock, tmp_path: Path
+):
+    httpx_mock.add_callback(create_api_callback(api_collections, missing_collection_ids=(2,)), is_reusable=True)
+    cache = CollectionCache(directory=tmp_path / "collections")
+    checkpoint = SyncCheckpoint(tmp_path / "checkpoint.json")
+
+    result = await test_client.sync_collections(cache, checkpoint)
+
+    assert not result.succeeded
+    assert isinstance(result.errors[2], CollectionNotFoundError)
+    assert [collection_metadata.collection_id for collection_metadata in result.downloaded] == [1, 3]
+    # The checkpoint stops before the failed download, so that the next sync retries it.
+    assert checkpoint.collection_id == 1
+    assert 3 in cache
+
+
+async def test_sync_collections_client_cache(api_collections: list[ApiCollection], base_url: str, httpx_mock: HTTPXMock, tmp_path: Path):
+    httpx_mock.add_callback(create_api_callback(api_collections), is_reusable=True)
+    client = PssFleetDataClient(base_url=base_url, cache=CollectionCache(directory=tmp_path))
+
+    result = await client.sync_collections()
+
+    assert len(result.downloaded) == 3
+    assert result.checkpoint.collection_id == 3
+
+
+@pytest.mark.parametrize(
+    ["cache"],
+    [
+        pytest.param(None, id="no_cache"),
+        pytest.param(CollectionCache(), id="memory_cache"),
+    ],
+)
+async def test_sync_collections_without_directory(cache: CollectionCache, test_client: PssFleetDataClient):
+    """cache"""
+    with pytest.raises(ValueError):
+        _ = await test_client.sync_collections(cache)
+
+
+async def test_sync_collections_hourly_collections_between_checkpoints(
+    api_collections: list[ApiCollection], base_url: str, test_client: PssFleetDataClient, httpx_mock: HTTPXMock, tmp_path: Path
+):
+    hourly_api_collections = [
+        api_collection.model_copy(
+            update={"meta": api_collection.meta.model_copy(update={"timestamp": api_collection.meta.timestamp.replace(hour=12)})}
+        )
+        for api_collection in api_collections[1:]
+    ]
+    api_callback = create_api_callback([api_collections[0], *hourly_api_collections])
+
+    def hourly_api_callback(request: Request) -> Response:
+        if request.url.path == "/collections/":
+            assert request.url.params.get("interval") == ParameterInterval.HOURLY
+        return api_callback(request)
+
+    httpx_mock.add_callback(hourly_api_callback, is_reusable=True)
+    cache = CollectionCache(directory=tmp_path / "collections")
+    cache.put(api_collections[0])
+    checkpoint = SyncCheckpoint(tmp_path / "checkpoint.json")
+    checkpoint.save(FromAPI.to_collection_metadata(api_collections[0].meta))
+
+    result = await test_client.sync_collections(cache, checkpoint)
+
+    assert [collection_metadata.collection_id for collection_metadata in result.downloaded] == [2, 3]
+    assert SyncCheckpoint(checkpoint.file_path).collection_id == 3
@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+
+from pytest_httpx import HTTPXMock
+
+from pss_fleet_data import PssFleetDataClient
+from pss_fleet_data.core.exceptions import CollectionNotFoundError, ConflictError
+from pss_fleet_data.core.validation import CollectionFileError
+from pss_fleet_data.models.api_models import ApiCollectionMetadata
+
+
+async def test_update_collections(
+    upload_test_file_path: str,
+    api_collection_metadata_9: ApiCollectionMetadata,
+    base_url: str,
+    test_client: PssFleetDataClient,
+    httpx_mock: HTTPXMock,
+):
+    httpx_mock.add_response(method="PUT", url=f"{base_url}/collections/upload/1", text=api_collection_metadata_9.model_dump_json())
+
+    results = await test_client.update_collections({1: upload_test_file_path, 2: "missing.json"})
+
+    assert [result.collection_id for result in results] == [1, 2]
+    assert results[0].succeeded
+    assert results[0].metadata.collection_id == api_collection_metadata_9.collection_id
+    assert isinstance(results[1].error, FileNotFoundError)
+
+
+async def test_update_collections_dry_run(
+    upload_test_file_path: str,
+    api_collection_metadata_9: ApiCollectionMetadata,
+    test_client: PssFleetDataClient,
+    httpx_mock: HTTPXMock,
+    tmp_path: Path,
+):
+    other_metadata = api_collection_metadata_9.model_copy(update={"collection_id": 2, "timestamp": "2016-01-07 23:59:00"})
+    httpx_mock.add_response(method="GET", text=f"[{api_collection_metadata_9.model_dump_json()}, {other_metadata.model_dump_json()}]")
+    invalid_file_path = tmp_path / "invalid.json"
+    invalid_file_path.write_text(json.dumps({"meta": {}}))
+
+    results = await test_client.update_collections(
+        {1: upload_test_file_path, 2: upload_test_file_path, 3: upload_test_file_path, 4: invalid_file_path}, dry_run=True, validate=True
+    )
+
+    assert all(result.dry_run for result in results)
+    assert results[0].succeeded
+    assert results[0].metadata.collection_id == 1
+    assert isinstance(results[1].error, ConflictError)
+    assert isinstance(results[2].error, CollectionNotFoundError)
+    assert isinstance(results[3].error, CollectionNotFoundError)
+    assert not httpx_mock.get_requests(method="PUT")
+
+
+async def test_update_collections_dry_run_invalid_file(
+    api_collection_metadata_9: ApiCollectionMetadata, test_client: PssFleetDataClient, httpx_mock: HTTPXMock, tmp_path: Path
+):
+    httpx_mock.add_response(method="GET", text=f"[{api_collection_metadata_9.model_dump_json()}]")
+    invalid_file_path = tmp_path / "invalid.json"
+    invalid_file_path.write_text(json.dumps({"meta": {}}))
+
+    results = await test_client.update_collections({1: invalid_file_path}, dry_run=True, validate=True)
+
+    assert isinstance(results[0].error, CollectionFileError)
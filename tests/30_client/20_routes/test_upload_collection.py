@@ -1,10 +1,12 @@
+import gzip
 from pathlib import Path
 from typing import Any, Callable, Union
 
 import pytest
 import routes_test_cases
+from pytest_httpx import HTTPXMock
 
-from pss_fleet_data import PssFleetDataClient
+from pss_fleet_data import PssFleetDataClient, UploadLedger
 from pss_fleet_data.core.exceptions import (
     MissingAccessError,
     NonUniqueTimestampError,
@@ -13,7 +15,9 @@ from pss_fleet_data.core.exceptions import (
     UnsupportedMediaTypeError,
     UnsupportedSchemaError,
 )
+from pss_fleet_data.core.validation import CollectionFileError
 from pss_fleet_data.models import Collection, CollectionMetadata
+from pss_fleet_data.models.api_models import ApiCollectionMetadata
 
 
 @pytest.mark.parametrize("file_path", routes_test_cases.upload_test_file_paths)
@@ -92,3 +96,66 @@ async def test_upload_collection_invalid_file_path_type(
 ):
     with pytest.raises(TypeError):
         _ = await test_client.upload_collection(value)
+
+
+async def test_upload_collection_uncompressed_by_default(
+    upload_test_file_path: str,
+    api_collection_metadata_9: ApiCollectionMetadata,
+    base_url: str,
+    test_client: PssFleetDataClient,
+    httpx_mock: HTTPXMock,
+):
+    httpx_mock.add_response(method="POST", url=f"{base_url}/collections/upload", status_code=201, text=api_collection_metadata_9.model_dump_json())
+
+    _ = await test_client.upload_collection(upload_test_file_path, chunk_size=64)
+
+    request = httpx_mock.get_request()
+    assert "Content-Encoding" not in request.headers
+    assert Path(upload_test_file_path).read_bytes() in request.read()
+
+
+async def test_upload_collection_compressed(
+    upload_test_file_path: str,
+    api_collection_metadata_9: ApiCollectionMetadata,
+    base_url: str,
+    test_client: PssFleetDataClient,
+    httpx_mock: HTTPXMock,
+):
+    httpx_mock.add_response(method="POST", url=f"{base_url}/collections/upload", status_code=201, text=api_collection_metadata_9.model_dump_json())
+
+    _ = await test_client.upload_collection(upload_test_file_path, chunk_size=64, compress=True)
+
+    request = httpx_mock.get_request()
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert request.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+    assert Path(upload_test_file_path).read_bytes() in gzip.decompress(request.read())
+
+
+async def test_upload_collection_validate_invalid_file(tmp_path: Path, test_client: PssFleetDataClient, httpx_mock: HTTPXMock):
+    file_path = tmp_path / "collection.json"
+    file_path.write_text('{"meta": {"schema_version": 8}}')
+
+    with pytest.raises(CollectionFileError):
+        _ = await test_client.upload_collection(file_path, validate=True)
+
+    assert not httpx_mock.get_requests()
+
+
+@pytest.mark.usefixtures("mock_response_collections_post_201")
+async def test_upload_collection_validate_valid_file(upload_test_file_path: str, test_client: PssFleetDataClient):
+    collection_metadata = await test_client.upload_collection(upload_test_file_path, validate=True)
+
+    assert collection_metadata is not None
+
+
+@pytest.mark.usefixtures("mock_response_collections_post_201")
+async def test_upload_collection_with_ledger(upload_test_file_path: str, base_url: str, tmp_path: Path, httpx_mock: HTTPXMock):
+    ledger = UploadLedger(tmp_path / "ledger.jsonl")
+    client = PssFleetDataClient(base_url=base_url, ledger=ledger)
+
+    collection_metadata = await client.upload_collection(upload_test_file_path)
+    recorded_collection_metadata = await client.upload_collection(Path(upload_test_file_path))
+
+    assert recorded_collection_metadata == collection_metadata
+    assert UploadLedger(tmp_path / "ledger.jsonl").get(UploadLedger.hash_file(upload_test_file_path)) == collection_metadata
+    assert len(httpx_mock.get_requests()) == 1
@@ -0,0 +1,180 @@
+import json
+from pathlib import Path
+
+import pytest
+from httpx import Request, Response
+from pytest_httpx import HTTPXMock
+
+from pss_fleet_data import PssFleetDataClient, UploadLedger
+from pss_fleet_data.core.exceptions import NonUniqueTimestampError
+from pss_fleet_data.core.validation import CollectionFileError
+from pss_fleet_data.models.api_models import ApiCollectionMetadata
+from pss_fleet_data.models.enums import ParameterInterval
+
+
+NON_UNIQUE_TIMESTAMP_RESPONSE = {
+    "code": "NON_UNIQUE_TIMESTAMP",
+    "message": "The resource could not be created.",
+    "details": "Can't insert collection: A collection with this timestamp already exists in the database.",
+    "timestamp": "2024-07-16T10:55:30.614758+00:00",
+    "url": "https://example.com",
+    "suggestion": "If you want to update the Collection in question, delete and re-insert it.",
+    "links": [],
+}
+
+
+@pytest.fixture(scope="function")
+def collection_directory(upload_test_file_path: str, tmp_path: Path) -> Path:
+    content = json.loads(Path(upload_test_file_path).read_text())
+    for day in (7, 8, 9):
+        content["meta"]["timestamp"] = f"2016-01-0{day} 23:59:00"
+        (tmp_path / f"collection_{day}.json").write_text(json.dumps(content))
+    return tmp_path
+
+
+def create_upload_callback(api_collection_metadata_9: ApiCollectionMetadata, existing_timestamp: str):
+    def upload_callback(request: Request) -> Response:
+        if existing_timestamp.encode() in request.read():
+            return Response(status_code=409, json=NON_UNIQUE_TIMESTAMP_RESPONSE)
+        return Response(status_code=201, text=api_collection_metadata_9.model_dump_json())
+
+    return upload_callback
+
+
+async def test_upload_collections(
+    collection_directory: Path,
+    api_collection_metadata_9: ApiCollectionMetadata,
+    base_url: str,
+    test_client: PssFleetDataClient,
+    httpx_mock: HTTPXMock,
+):
+    httpx_mock.add_callback(
+        create_upload_callback(api_collection_metadata_9, "2016-01-08 23:59:00"), url=f"{base_url}/collections/upload", is_reusable=True
+    )
+
+    results = await test_client.upload_collections(collection_directory, max_concurrency=2)
+
+    assert [result.file_path.name for result in results] == ["collection_7.json", "collection_8.json", "collection_9.json"]
+    assert [result.succeeded for result in results] == [True, False, True]
+    assert results[0].metadata.collection_id == api_collection_metadata_9.collection_id
+    assert isinstance(results[1].error, NonUniqueTimestampError)
+    assert not any(result.skipped for result in results)
+
+
+async def test_upload_collections_missing_file(collection_directory: Path, test_client: PssFleetDataClient):
+    results = await test_client.upload_collections([collection_directory / "missing.json"])
+
+    assert len(results) == 1
+    assert isinstance(results[0].error, FileNotFoundError)
+
+
+async def test_upload_collections_skip_existing(
+    collection_directory: Path,
+    api_collection_metadata_9: ApiCollectionMetadata,
+    base_url: str,
+    test_client: PssFleetDataClient,
+    httpx_mock: HTTPXMock,
+):
+    existing_metadata = api_collection_metadata_9.model_copy(update={"timestamp": "2016-01-08 23:59:00"})
+    httpx_mock.add_response(method="GET", text=f"[{existing_metadata.model_dump_json()}]")
+    httpx_mock.add_response(method="POST", url=f"{base_url}/collections/upload", text=api_collection_metadata_9.model_dump_json(), is_reusable=True)
+
+    results = await test_client.upload_collections(collection_directory, skip_existing=True)
+
+    assert [result.skipped for result in results] == [False, True, False]
+    assert [result.succeeded for result in results] == [True, False, True]
+    list_request = httpx_mock.get_requests(method="GET")[0]
+    assert list_request.url.params["fromDate"].startswith("2016-01-07")
+    assert list_request.url.params["toDate"].startswith("2016-01-09")
+    assert list_request.url.params["interval"] == ParameterInterval.HOURLY
+    assert len(httpx_mock.get_requests(method="POST")) == 2
+
+
+@pytest.mark.parametrize(
+    ["max_concurrency", "expected_exception"],
+    [
+        pytest.param("1", TypeError, id="type"),
+        pytest.param(0, ValueError, id="value"),
+    ],
+)
+async def test_upload_collections_invalid_max_concurrency(
+    max_concurrency, expected_exception: type[Exception], upload_test_file_path: str, test_client: PssFleetDataClient
+):
+    """max_concurrency, expected_exception"""
+    with pytest.raises(expected_exception):
+        _ = await test_client.upload_collections([upload_test_file_path], max_concurrency=max_concurrency)
+
+
+async def test_upload_collections_validate(
+    collection_directory: Path,
+    api_collection_metadata_9: ApiCollectionMetadata,
+    base_url: str,
+    test_client: PssFleetDataClient,
+    httpx_mock: HTTPXMock,
+):
+    (collection_directory / "collection_8.json").write_text('{"meta": {}}')
+    httpx_mock.add_response(method="POST", url=f"{base_url}/collections/upload", text=api_collection_metadata_9.model_dump_json(), is_reusable=True)
+
+    results = await test_client.upload_collections(collection_directory, validate=True)
+
+    assert [result.succeeded for result in results] == [True, False, True]
+    assert isinstance(results[1].error, CollectionFileError)
+    assert len(httpx_mock.get_requests()) == 2
+
+
+async def test_upload_collections_with_ledger(
+    collection_directory: Path, api_collection_metadata_9: ApiCollectionMetadata, base_url: str, httpx_mock: HTTPXMock
+):
+    httpx_mock.add_response(method="POST", url=f"{base_url}/collections/upload", text=api_collection_metadata_9.model_dump_json(), is_reusable=True)
+    (collection_directory / "collection_9_copy.json").write_bytes((collection_directory / "collection_9.json").read_bytes())
+    client = PssFleetDataClient(base_url=base_url, ledger=UploadLedger())
+
+    results = await client.upload_collections(collection_directory, max_concurrency=1)
+    rerun_results = await client.upload_collections(collection_directory)
+
+    assert [result.skipped for result in results] == [False, False, False, True]
+    assert all(result.skipped and result.succeeded for result in rerun_results)
+    assert len(httpx_mock.get_requests()) == 3
+
+
+async def test_upload_collections_with_ledger_identical_files_in_flight(
+    collection_directory: Path, api_collection_metadata_9: ApiCollectionMetadata, base_url: str, httpx_mock: HTTPXMock
+):
+    uploaded_contents = set()
+
+    def upload_callback(request: Request) -> Response:
+        content = request.read()
+        if content in uploaded_contents:
+            return Response(status_code=409, json=NON_UNIQUE_TIMESTAMP_RESPONSE)
+        uploaded_contents.add(content)
+        return Response(status_code=201, text=api_collection_metadata_9.model_dump_json())
+
+    httpx_mock.add_callback(upload_callback, method="POST", url=f"{base_url}/collections/upload", is_reusable=True)
+    file_path = collection_directory / "collection_9.json"
+    file_path_copy = collection_directory / "collection_9_copy.json"
+    file_path_copy.write_bytes(file_path.read_bytes())
+    client = PssFleetDataClient(base_url=base_url, ledger=UploadLedger())
+
+    results = await client.upload_collections([file_path, file_path_copy], max_concurrency=2)
+
+    assert all(result.succeeded for result in results)
+    assert [result.skipped for result in results] == [False, True]
+    assert results[0].metadata == results[1].metadata
+    assert len(httpx_mock.get_requests()) == 1
+
+
+async def test_upload_collections_with_ledger_identical_file_in_flight_failed(
+    collection_directory: Path, api_collection_metadata_9: ApiCollectionMetadata, base_url: str, httpx_mock: HTTPXMock
+):
+    httpx_mock.add_response(method="POST", url=f"{base_url}/collections/upload", status_code=500, text="Internal Server Error")
+    httpx_mock.add_response(method="POST", url=f"{base_url}/collections/upload", text=api_collection_metadata_9.model_dump_json())
+    file_path = collection_directory / "collection_9.json"
+    file_path_copy = collection_directory / "collection_9_copy.json"
+    file_path_copy.write_bytes(file_path.read_bytes())
+    client = PssFleetDataClient(base_url=base_url, ledger=UploadLedger())
+
+    results = await client.upload_collections([file_path, file_path_copy], max_concurrency=2)
+
+    assert [result.succeeded for result in results] == [False, True]
+    assert not results[1].skipped
+    assert len(httpx_mock.get_requests()) == 2
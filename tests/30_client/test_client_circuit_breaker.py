@@ -0,0 +1,60 @@
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pss_fleet_data import CircuitBreaker, InstrumentationHook, PssFleetDataClient, RequestMetrics
+from pss_fleet_data.core.circuit_breaker import CircuitOpenError, CircuitState
+from pss_fleet_data.core.exceptions import NotFoundError, ServiceUnavailableError
+
+
+class RecordingHook(InstrumentationHook):
+    def __init__(self):
+        self.events: list[str] = []
+
+    def on_request_end(self, metrics: RequestMetrics):
+        self.events.append(f"end {metrics.status_code}")
+
+    def on_circuit_state_change(self, previous_state: CircuitState, state: CircuitState):
+        self.events.append(f"{previous_state} -> {state}")
+
+
+async def test_circuit_breaker_fails_fast_while_open(base_url: str, httpx_mock: HTTPXMock):
+    hook = RecordingHook()
+    circuit_breaker = CircuitBreaker(minimum_calls=2, open_duration=60)
+    client = PssFleetDataClient(base_url=base_url, hooks=[hook], circuit_breaker=circuit_breaker)
+    for _ in range(2):
+        httpx_mock.add_response(status_code=503, text="<html><body>Service Unavailable</body></html>", headers={"Retry-After": "60"})
+
+    for _ in range(2):
+        with pytest.raises(ServiceUnavailableError):
+            _ = await client.get_collection(1)
+    with pytest.raises(CircuitOpenError):
+        _ = await client.get_collection(1)
+
+    assert client.circuit_breaker is circuit_breaker
+    assert circuit_breaker.state == CircuitState.OPEN
+    assert len(httpx_mock.get_requests()) == 2
+    assert hook.events == ["end 503", "end 503", "closed -> open"]
+
+
+async def test_circuit_breaker_stays_closed_on_client_errors(base_url: str, httpx_mock: HTTPXMock):
+    circuit_breaker = CircuitBreaker(minimum_calls=1)
+    client = PssFleetDataClient(base_url=base_url, circuit_breaker=circuit_breaker)
+    httpx_mock.add_response(status_code=404, text="Not Found")
+
+    with pytest.raises(NotFoundError):
+        _ = await client.get_collection(1)
+
+    assert circuit_breaker.state == CircuitState.CLOSED
+
+
+async def test_circuit_breaker_open_is_reported_per_item_in_bulk_operations(base_url: str, httpx_mock: HTTPXMock):
+    circuit_breaker = CircuitBreaker(minimum_calls=1, open_duration=60)
+    client = PssFleetDataClient(base_url=base_url, api_key="api_key", circuit_breaker=circuit_breaker)
+    httpx_mock.add_response(method="DELETE", status_code=503, text="Service Unavailable")
+
+    results = await client.delete_collections([1, 2, 3, 4, 5], max_concurrency=1)
+
+    assert [result.collection_id for result in results] == [1, 2, 3, 4, 5]
+    assert isinstance(results[0].error, ServiceUnavailableError)
+    assert all(isinstance(result.error, CircuitOpenError) for result in results[1:])
+    assert len(httpx_mock.get_requests()) == 1
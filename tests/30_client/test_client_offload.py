@@ -0,0 +1,98 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Generator
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pss_fleet_data import HistogramCollector, PssFleetDataClient
+from pss_fleet_data.core.config import get_config
+from pss_fleet_data.models.api_models import ApiCollection
+
+
+@pytest.fixture(scope="module", params=[ThreadPoolExecutor, ProcessPoolExecutor], ids=["thread", "process"])
+def executor(request: pytest.FixtureRequest) -> Generator[Executor, None, None]:
+    executor = request.param(max_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+async def test_get_collection_offloaded(api_collection: ApiCollection, base_url: str, executor: Executor, httpx_mock: HTTPXMock):
+    collector = HistogramCollector()
+    client = PssFleetDataClient(base_url=base_url, hooks=[collector], executor=executor, offload_threshold=1)
+    httpx_mock.add_response(text=api_collection.model_dump_json())
+
+    collection = await client.get_collection(1)
+
+    assert collection.metadata.collection_id == api_collection.meta.collection_id
+    assert [user.id for user in collection.users] == [api_user[0] for api_user in api_collection.users]
+    for name in ("json_decode_seconds", "validation_seconds", "conversion_seconds"):
+        assert collector.get_histogram(name, "GET", "/collections/{collection_id}", "200").count == 1
+
+
+async def test_get_collection_below_offload_threshold(api_collection: ApiCollection, base_url: str, httpx_mock: HTTPXMock):
+    # An executor that has been shut down can't run anything, so the conversion has to happen on the event loop.
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.shutdown()
+    client = PssFleetDataClient(base_url=base_url, executor=executor)
+    httpx_mock.add_response(text=api_collection.model_dump_json())
+
+    collection = await client.get_collection(1)
+
+    assert collection.metadata.collection_id == api_collection.meta.collection_id
+
+
+async def test_get_collection_offloaded_to_thread_records_spans(
+    api_collection: ApiCollection, base_url: str, recording_tracer, httpx_mock: HTTPXMock
+):
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        client = PssFleetDataClient(base_url=base_url, tracer=recording_tracer, executor=executor, offload_threshold=1)
+        httpx_mock.add_response(text=api_collection.model_dump_json())
+
+        _ = await client.get_collection(1)
+
+    method_span = recording_tracer.get_span("PssFleetDataClient.get_collection")
+    for name in ("json_decode", "validation", "conversion"):
+        assert recording_tracer.get_span(name).parent is method_span
+
+
+async def test_get_collection_chunked(api_collection: ApiCollection, base_url: str, httpx_mock: HTTPXMock):
+    collector = HistogramCollector()
+    client = PssFleetDataClient(base_url=base_url, hooks=[collector], conversion_chunk_size=1)
+    api_collection = api_collection.model_copy(update={"users": api_collection.users * 3})
+    httpx_mock.add_response(text=api_collection.model_dump_json())
+
+    collection = await client.get_collection(1)
+
+    assert [user.id for user in collection.users] == [api_user[0] for api_user in api_collection.users]
+    # Chunks add up to a single observation per response.
+    assert collector.get_histogram("conversion_seconds", "GET", "/collections/{collection_id}", "200").count == 1
+
+
+def test_client_creation_offload_defaults():
+    client = PssFleetDataClient()
+
+    assert client.executor is None
+    assert client.offload_threshold == get_config().offload_threshold
+    assert client.conversion_chunk_size == get_config().conversion_chunk_size
+
+
+test_cases_offload_threshold_invalid = [
+    # value, expected_exception
+    pytest.param(0, ValueError, id="zero"),
+    pytest.param(-1, ValueError, id="negative"),
+    pytest.param(1.5, TypeError, id="float"),
+    pytest.param("1", TypeError, id="str"),
+]
+"""value, expected_exception"""
+
+
+@pytest.mark.parametrize(["value", "expected_exception"], test_cases_offload_threshold_invalid)
+def test_client_creation_offload_threshold_invalid(value: Any, expected_exception: type[Exception]):
+    with pytest.raises(expected_exception):
+        _ = PssFleetDataClient(offload_threshold=value)
+
+
+@pytest.mark.parametrize(["value", "expected_exception"], test_cases_offload_threshold_invalid)
+def test_client_creation_conversion_chunk_size_invalid(value: Any, expected_exception: type[Exception]):
+    with pytest.raises(expected_exception):
+        _ = PssFleetDataClient(conversion_chunk_size=value)
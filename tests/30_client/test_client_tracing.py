@@ -0,0 +1,71 @@
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pss_fleet_data import HistogramCollector, PssFleetDataClient
+from pss_fleet_data.core.exceptions import CollectionNotFoundError
+from pss_fleet_data.models.api_models import ApiCollection
+
+
+@pytest.fixture(scope="function")
+def traced_client(base_url: str, default_api_key: str, recording_tracer) -> PssFleetDataClient:
+    return PssFleetDataClient(base_url=base_url, api_key=default_api_key, tracer=recording_tracer)
+
+
+async def test_get_collection_records_spans(
+    api_collection: ApiCollection, traced_client: PssFleetDataClient, recording_tracer, httpx_mock: HTTPXMock
+):
+    httpx_mock.add_response(text=api_collection.model_dump_json())
+
+    _ = await traced_client.get_collection(1)
+
+    assert [span.name for span in recording_tracer.spans] == [
+        "PssFleetDataClient.get_collection",
+        "GET /collections/{collection_id}",
+        "json_decode",
+        "validation",
+        "conversion",
+    ]
+    method_span = recording_tracer.get_span("PssFleetDataClient.get_collection")
+    http_span = recording_tracer.get_span("GET /collections/{collection_id}")
+    assert method_span.parent is None
+    assert http_span.parent is method_span
+    assert http_span.attributes == {
+        "http.request.method": "GET",
+        "http.route": "/collections/{collection_id}",
+        "url.path": "/collections/1",
+        "http.response.status_code": 200,
+    }
+    for name in ("json_decode", "validation", "conversion"):
+        assert recording_tracer.get_span(name).parent is method_span
+
+
+@pytest.mark.usefixtures("mock_response_collection_not_found")
+async def test_get_collection_records_spans_on_error_response(traced_client: PssFleetDataClient, recording_tracer):
+    with pytest.raises(CollectionNotFoundError):
+        _ = await traced_client.get_collection(1)
+
+    assert [span.name for span in recording_tracer.spans] == ["PssFleetDataClient.get_collection", "GET /collections/{collection_id}"]
+    assert recording_tracer.get_span("GET /collections/{collection_id}").attributes["http.response.status_code"] == 404
+
+
+async def test_client_without_tracer_records_no_spans(api_collection: ApiCollection, test_client: PssFleetDataClient, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text=api_collection.model_dump_json())
+
+    collection = await test_client.get_collection(1)
+
+    assert test_client.tracer is None
+    assert collection.metadata.collection_id == api_collection.meta.collection_id
+
+
+async def test_client_with_hooks_and_tracer_records_spans(
+    api_collection: ApiCollection, base_url: str, default_api_key: str, recording_tracer, httpx_mock: HTTPXMock
+):
+    httpx_mock.add_response(text=api_collection.model_dump_json())
+    collector = HistogramCollector()
+    client = PssFleetDataClient(base_url=base_url, api_key=default_api_key, hooks=[collector], tracer=recording_tracer)
+
+    _ = await client.get_collection(1)
+
+    assert len(recording_tracer.spans) == 5
+    assert recording_tracer.get_span("GET /collections/{collection_id}").attributes["http.response.status_code"] == 200
+    assert collector.get_histogram("validation_seconds", "GET", "/collections/{collection_id}", "200").count == 1
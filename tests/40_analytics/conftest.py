@@ -0,0 +1,74 @@
+import pytest
+
+from pss_fleet_data.models.api_models import ApiAlliance, ApiCollection, ApiCollectionMetadata, ApiUser
+
+
+def create_api_user(user_id: int, alliance_id: int, membership: int, trophy: int, alliance_score: int = 0, championship_score: int = 0) -> ApiUser:
+    return (
+        user_id,
+        f"U{user_id}",
+        alliance_id,
+        trophy,
+        alliance_score,
+        membership,
+        0,
+        1000,
+        1000,
+        0,
+        0,
+        0,
+        0,
+        0,
+        0,
+        0,
+        0,
+        championship_score,
+        trophy,
+        0,
+    )
+
+
+def create_api_alliance(alliance_id: int, score: int, division_design_id: int, trophy: int, number_of_members: int) -> ApiAlliance:
+    return (alliance_id, f"A{alliance_id}", score, division_design_id, trophy, 0, number_of_members, 0)
+
+
+@pytest.fixture(scope="function")
+def api_collection_before(api_collection_metadata_9: ApiCollectionMetadata) -> ApiCollection:
+    return ApiCollection(
+        meta=api_collection_metadata_9.model_copy(update={"collection_id": 1}),
+        fleets=[
+            create_api_alliance(1, 100, 1, 5000, 3),
+            create_api_alliance(2, 50, 2, 3000, 2),
+            create_api_alliance(3, 0, 3, 100, 0),
+            create_api_alliance(5, 10, 4, 10, 0),
+        ],
+        users=[
+            create_api_user(1, 1, 0, 1000, alliance_score=10),
+            create_api_user(2, 1, 6, 500),
+            create_api_user(3, 2, 0, 800),
+            create_api_user(4, 0, -1, 100),
+            create_api_user(5, 1, 5, 300),
+            create_api_user(7, 2, 6, 200),
+        ],
+    )
+
+
+@pytest.fixture(scope="function")
+def api_collection_after(api_collection_metadata_9: ApiCollectionMetadata) -> ApiCollection:
+    return ApiCollection(
+        meta=api_collection_metadata_9.model_copy(update={"collection_id": 2}),
+        fleets=[
+            create_api_alliance(1, 120, 1, 5100, 3),
+            create_api_alliance(2, 50, 2, 3000, 2),
+            create_api_alliance(4, 0, 4, 0, 0),
+            create_api_alliance(5, 10, 4, 10, 0),
+        ],
+        users=[
+            create_api_user(1, 1, 0, 1100, alliance_score=15, championship_score=2),
+            create_api_user(2, 1, 5, 500),
+            create_api_user(3, 1, 6, 800),
+            create_api_user(4, 2, 6, 100),
+            create_api_user(6, 0, -1, 50),
+            create_api_user(7, 2, 6, 200),
+        ],
+    )
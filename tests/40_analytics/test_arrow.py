@@ -0,0 +1,72 @@
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from pytest import MonkeyPatch
+
+from pss_fleet_data.analytics import arrow
+from pss_fleet_data.analytics.columns import ALLIANCE_FIELDS, USER_FIELDS, get_alliance_columns, get_user_columns
+from pss_fleet_data.models.api_models import ApiAllianceHistory, ApiCollection, ApiUserHistory
+from pss_fleet_data.models.converters import FromAPI
+
+
+def test_get_user_record_batch(api_collection_before: ApiCollection):
+    _ = pytest.importorskip("pyarrow")
+
+    record_batch = arrow.get_user_record_batch(api_collection_before)
+
+    assert record_batch.schema.names == list(USER_FIELDS)
+    assert record_batch.to_pydict() == get_user_columns(api_collection_before).to_dict()
+    assert not record_batch.schema.field("user_id").nullable
+    assert record_batch.schema.field("championship_score").nullable
+
+
+def test_get_alliance_record_batch_from_collection(api_collection_before: ApiCollection):
+    _ = pytest.importorskip("pyarrow")
+
+    record_batch = arrow.get_alliance_record_batch(FromAPI.to_collection(api_collection_before), include_collection=True)
+
+    assert record_batch.schema.names == ["collection_id", "timestamp", *ALLIANCE_FIELDS]
+    assert record_batch.column("collection_id").to_pylist() == [1] * 4
+    assert record_batch.column("timestamp").to_pylist()[0] == datetime(2016, 1, 6, 23, 59, tzinfo=timezone.utc)
+    assert record_batch.column("alliance_id").to_pylist() == get_alliance_columns(api_collection_before)["alliance_id"]
+
+
+def test_get_user_history_record_batch(api_user_history: ApiUserHistory):
+    _ = pytest.importorskip("pyarrow")
+
+    record_batch = arrow.get_user_history_record_batch([api_user_history, FromAPI.to_user_history(api_user_history)])
+
+    assert record_batch.num_rows == 2
+    assert record_batch.column("user_id").to_pylist() == [api_user_history.user[0]] * 2
+    assert record_batch.slice(0, 1).to_pylist() == record_batch.slice(1, 1).to_pylist()
+
+
+def test_get_alliance_history_record_batch_empty():
+    _ = pytest.importorskip("pyarrow")
+
+    record_batch = arrow.get_alliance_history_record_batch(list[ApiAllianceHistory]())
+
+    assert record_batch.num_rows == 0
+    assert record_batch.schema.names == ["collection_id", "timestamp", *ALLIANCE_FIELDS]
+
+
+def test_write_user_parquet(api_collection_before: ApiCollection, api_collection_after: ApiCollection, tmp_path: Path):
+    _ = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    file_path = tmp_path / "users.parquet"
+
+    row_count = arrow.write_user_parquet((collection for collection in (api_collection_before, api_collection_after)), file_path)
+
+    parquet_file = parquet.ParquetFile(file_path)
+    assert row_count == 12
+    assert parquet_file.metadata.num_row_groups == 2
+    assert parquet_file.read().column("collection_id").to_pylist() == [1] * 6 + [2] * 6
+
+
+def test_get_user_schema_without_pyarrow(monkeypatch: MonkeyPatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    with pytest.raises(ImportError, match=r"pss-fleet-data-client\[arrow\]"):
+        _ = arrow.get_user_schema()
@@ -0,0 +1,90 @@
+from pathlib import Path
+
+import pytest
+
+from pss_fleet_data.analytics.binary import MappedCollection, write_mapped_collection
+from pss_fleet_data.analytics.columns import get_alliance_columns, get_user_columns
+from pss_fleet_data.models.api_models import ApiCollection
+from pss_fleet_data.models.converters import FromAPI
+
+
+@pytest.fixture(scope="function")
+def mapped_collection_file_path(api_collection_before: ApiCollection, tmp_path: Path) -> Path:
+    file_path = tmp_path / "collection.bin"
+    _ = write_mapped_collection(api_collection_before, file_path)
+    return file_path
+
+
+def test_round_trip(api_collection_before: ApiCollection, mapped_collection_file_path: Path):
+    with MappedCollection(mapped_collection_file_path) as mapped_collection:
+        assert mapped_collection.user_count == 6
+        assert mapped_collection.alliance_count == 4
+        assert mapped_collection.metadata.collection_id == api_collection_before.meta.collection_id
+        assert mapped_collection.get_user_columns().to_dict() == get_user_columns(api_collection_before).to_dict()
+        assert mapped_collection.get_alliance_columns().to_dict() == get_alliance_columns(api_collection_before).to_dict()
+        assert mapped_collection.to_api_collection() == api_collection_before
+
+
+def test_from_collection(api_collection_before: ApiCollection, tmp_path: Path):
+    file_path = tmp_path / "collection.bin"
+    _ = write_mapped_collection(FromAPI.to_collection(api_collection_before), file_path)
+
+    with MappedCollection(file_path) as mapped_collection:
+        assert mapped_collection.metadata.collection_id == 1
+        assert mapped_collection.get_user_columns(["user_id", "user_name"]).to_dict() == {
+            "user_id": [1, 2, 3, 4, 5, 7],
+            "user_name": ["U1", "U2", "U3", "U4", "U5", "U7"],
+        }
+
+
+def test_get_user_view(api_collection_before: ApiCollection, mapped_collection_file_path: Path):
+    with MappedCollection(mapped_collection_file_path) as mapped_collection:
+        with mapped_collection.get_user_view("trophy") as trophies:
+            assert trophies.readonly
+            assert trophies.format == "i"
+            assert trophies.tolist() == [user[3] for user in api_collection_before.users]
+
+
+def test_none_and_large_values(api_collection_before: ApiCollection, tmp_path: Path):
+    alliance = api_collection_before.fleets[0]
+    api_collection = api_collection_before.model_copy(update={"fleets": [alliance[:4] + (None, 2**40) + alliance[6:]]})
+    file_path = tmp_path / "collection.bin"
+    _ = write_mapped_collection(api_collection, file_path)
+
+    with MappedCollection(file_path) as mapped_collection:
+        assert mapped_collection.get_alliance_columns(["trophy", "championship_score"]).to_dict() == {"trophy": [None], "championship_score": [2**40]}
+        with mapped_collection.get_alliance_view("championship_score") as championship_scores:
+            assert championship_scores.format == "q"
+
+
+def test_close_with_view_in_use(mapped_collection_file_path: Path):
+    mapped_collection = MappedCollection(mapped_collection_file_path)
+    trophies = mapped_collection.get_user_view("trophy")
+
+    with pytest.raises(BufferError):
+        mapped_collection.close()
+
+    trophies.release()
+    mapped_collection.close()
+
+
+@pytest.mark.parametrize(
+    ["field"],
+    [
+        pytest.param("user_name", id="not_numeric"),
+        pytest.param("unknown", id="unknown"),
+    ],
+)
+def test_get_user_view_invalid_field(field: str, mapped_collection_file_path: Path):
+    """field"""
+    with MappedCollection(mapped_collection_file_path) as mapped_collection:
+        with pytest.raises(ValueError):
+            _ = mapped_collection.get_user_view(field)
+
+
+def test_invalid_file(tmp_path: Path):
+    file_path = tmp_path / "collection.bin"
+    file_path.write_bytes(b'{"meta": {}}')
+
+    with pytest.raises(ValueError):
+        _ = MappedCollection(file_path)
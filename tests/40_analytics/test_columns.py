@@ -0,0 +1,31 @@
+import pytest
+
+from pss_fleet_data.analytics.columns import ALLIANCE_FIELDS, USER_FIELDS, check_alliance_fields, get_alliance_columns, get_user_columns
+from pss_fleet_data.models.api_models import ApiCollection
+from pss_fleet_data.models.converters import FromAPI
+
+
+def test_get_user_columns(api_collection_before: ApiCollection):
+    columns = get_user_columns(api_collection_before, ["user_id", "alliance_membership"])
+
+    assert columns.to_dict() == {"user_id": [1, 2, 3, 4, 5, 7], "alliance_membership": [0, 6, 0, -1, 5, 6]}
+
+
+def test_get_columns_from_collection_match_api_collection(api_collection_before: ApiCollection):
+    collection = FromAPI.to_collection(api_collection_before)
+
+    assert get_user_columns(collection).column_names == USER_FIELDS
+    assert get_user_columns(collection).to_dict() == get_user_columns(api_collection_before).to_dict()
+    assert get_alliance_columns(collection).column_names == ALLIANCE_FIELDS
+    assert get_alliance_columns(collection).to_dict() == get_alliance_columns(api_collection_before).to_dict()
+
+
+def test_get_columns_unknown_field(api_collection_before: ApiCollection):
+    with pytest.raises(ValueError):
+        _ = get_user_columns(api_collection_before, ["user_id", "unknown"])
+
+
+def test_check_alliance_fields():
+    assert check_alliance_fields(["alliance_id", "score"]) == ("alliance_id", "score")
+    with pytest.raises(ValueError):
+        _ = check_alliance_fields(["user_id"])
@@ -0,0 +1,85 @@
+from pss_fleet_data.analytics import diff_collections
+from pss_fleet_data.analytics.diff import ALLIANCE_DELTA_COLUMNS, USER_DELTA_COLUMNS, diff_alliances, diff_users
+from pss_fleet_data.models.api_models import ApiCollection
+from pss_fleet_data.models.converters import FromAPI
+
+
+def test_diff_users(api_collection_before: ApiCollection, api_collection_after: ApiCollection):
+    users = diff_users(api_collection_before, api_collection_after)
+
+    assert users.column_names == USER_DELTA_COLUMNS
+    assert users["user_id"] == [1, 2, 3, 4, 6, 7, 5]
+    assert users["added"] == [False, False, False, False, True, False, False]
+    assert users["removed"] == [False, False, False, False, False, False, True]
+    assert users["joined"] == [False, False, True, True, False, False, False]
+    assert users["left"] == [False, False, True, False, False, False, False]
+    assert users["rank_changed"] == [False, True, False, False, False, False, False]
+    assert users["alliance_id_before"] == [1, 1, 2, 0, None, 2, 1]
+    assert users["alliance_id_after"] == [1, 1, 1, 2, 0, 2, None]
+    assert users["trophy_delta"] == [100, 0, 0, 0, None, 0, None]
+    assert users["alliance_score_delta"] == [5, 0, 0, 0, None, 0, None]
+    assert users["championship_score_delta"] == [2, 0, 0, 0, None, 0, None]
+
+
+def test_diff_users_added_and_removed_users_dont_join_or_leave(api_collection_before: ApiCollection, api_collection_after: ApiCollection):
+    # A new member of the Alliance 2
+    api_collection_after.users.append((8, *api_collection_after.users[3][1:]))
+
+    diff = diff_collections(api_collection_before, api_collection_after)
+
+    assert diff.users["user_id"][-2:] == [8, 5]
+    assert diff.users["added"][-2:] == [True, False]
+    assert diff.users["removed"][-2:] == [False, True]
+    assert not any(diff.users["joined"][-2:])
+    assert not any(diff.users["left"][-2:])
+    assert diff.alliances["members_joined"][:2] == [1, 1]
+    assert diff.alliances["members_left"][:2] == [0, 1]
+
+
+def test_diff_users_changed_only(api_collection_before: ApiCollection, api_collection_after: ApiCollection):
+    users = diff_users(api_collection_before, api_collection_after, changed_only=True)
+
+    assert users["user_id"] == [1, 2, 3, 4, 6, 5]
+
+
+def test_diff_alliances(api_collection_before: ApiCollection, api_collection_after: ApiCollection):
+    alliances = diff_alliances(api_collection_before, api_collection_after)
+
+    assert alliances.column_names == ALLIANCE_DELTA_COLUMNS
+    assert alliances["alliance_id"] == [1, 2, 4, 5, 3]
+    assert alliances["added"] == [False, False, True, False, False]
+    assert alliances["removed"] == [False, False, False, False, True]
+    assert alliances["division_design_id_before"] == [1, 2, None, 4, 3]
+    assert alliances["division_design_id_after"] == [1, 2, 4, 4, None]
+    assert alliances["score_delta"] == [20, 0, None, 0, None]
+    assert alliances["trophy_delta"] == [100, 0, None, 0, None]
+    assert alliances["members_joined"] == [1, 1, 0, 0, 0]
+    assert alliances["members_left"] == [0, 1, 0, 0, 0]
+
+
+def test_diff_collections_changed_only(api_collection_before: ApiCollection, api_collection_after: ApiCollection):
+    diff = diff_collections(api_collection_before, api_collection_after, changed_only=True)
+
+    assert diff.collection_id_before == 1
+    assert diff.collection_id_after == 2
+    assert diff.users["user_id"] == [1, 2, 3, 4, 6, 5]
+    assert diff.alliances["alliance_id"] == [1, 2, 4, 3]
+
+
+def test_diff_collections_client_and_api_collections_match(api_collection_before: ApiCollection, api_collection_after: ApiCollection):
+    expected = diff_collections(api_collection_before, api_collection_after)
+
+    diff = diff_collections(FromAPI.to_collection(api_collection_before), api_collection_after)
+
+    assert diff.users.to_dict() == expected.users.to_dict()
+    assert diff.alliances.to_dict() == expected.alliances.to_dict()
+
+
+def test_diff_collections_empty(api_collection_before: ApiCollection):
+    empty = api_collection_before.model_copy(update={"fleets": [], "users": []})
+
+    diff = diff_collections(empty, empty)
+
+    assert len(diff.users) == 0
+    assert len(diff.alliances) == 0
+    assert diff.users.column_names == USER_DELTA_COLUMNS
@@ -0,0 +1,91 @@
+import pytest
+
+from pss_fleet_data.analytics import LeaderboardGrouping, get_top_alliances, get_top_users
+from pss_fleet_data.models.api_models import ApiCollection
+from pss_fleet_data.models.converters import FromAPI
+
+
+def test_get_top_users(api_collection_before: ApiCollection):
+    top_users = get_top_users(api_collection_before, n=3)
+
+    assert top_users.column_names == ("rank", "user_id", "user_name", "alliance_id", "trophy")
+    assert top_users["rank"] == [1, 2, 3]
+    assert top_users["user_id"] == [1, 3, 2]
+    assert top_users["trophy"] == [1000, 800, 500]
+
+
+def test_get_top_users_all(api_collection_before: ApiCollection):
+    top_users = get_top_users(api_collection_before, n=100)
+
+    assert top_users["user_id"] == [1, 3, 2, 5, 7, 4]
+
+
+def test_get_top_users_by_alliance(api_collection_before: ApiCollection):
+    top_users = get_top_users(api_collection_before, n=2, group_by=LeaderboardGrouping.ALLIANCE)
+
+    assert top_users["alliance_id"] == [1, 1, 2, 2]
+    assert top_users["rank"] == [1, 2, 1, 2]
+    assert top_users["user_id"] == [1, 2, 3, 7]
+
+
+def test_get_top_users_by_division(api_collection_before: ApiCollection):
+    top_users = get_top_users(api_collection_before, n=2, group_by="division")
+
+    assert top_users.column_names == ("rank", "user_id", "user_name", "alliance_id", "trophy", "division_design_id")
+    assert top_users["division_design_id"] == [1, 1, 2, 2]
+    assert top_users["rank"] == [1, 2, 1, 2]
+    assert top_users["user_id"] == [1, 2, 3, 7]
+
+
+def test_get_top_users_with_collection(api_collection_before: ApiCollection):
+    collection = FromAPI.to_collection(api_collection_before)
+
+    top_users = collection.get_top_users(field="alliance_score", n=1)
+
+    assert top_users["user_id"] == [1]
+    assert top_users["alliance_score"] == [10]
+    assert top_users.to_dict() == get_top_users(api_collection_before, field="alliance_score", n=1).to_dict()
+
+
+def test_get_top_users_n_0(api_collection_before: ApiCollection):
+    top_users = get_top_users(api_collection_before, n=0)
+
+    assert len(top_users) == 0
+    assert top_users.column_names == ("rank", "user_id", "user_name", "alliance_id", "trophy")
+
+
+def test_get_top_alliances(api_collection_before: ApiCollection):
+    top_alliances = get_top_alliances(api_collection_before, n=2)
+
+    assert top_alliances.column_names == ("rank", "alliance_id", "alliance_name", "division_design_id", "score")
+    assert top_alliances["alliance_id"] == [1, 2]
+    assert top_alliances["score"] == [100, 50]
+
+
+def test_get_top_alliances_by_division(api_collection_before: ApiCollection):
+    collection = FromAPI.to_collection(api_collection_before)
+
+    top_alliances = collection.get_top_alliances(field="trophy", n=1, group_by="division")
+
+    assert top_alliances["division_design_id"] == [1, 2, 3, 4]
+    assert top_alliances["rank"] == [1, 1, 1, 1]
+    assert top_alliances["alliance_id"] == [1, 2, 3, 5]
+
+
+@pytest.mark.parametrize(
+    ["kwargs", "expected_message"],
+    [
+        pytest.param({"field": "unknown"}, "Unknown field", id="unknown_field"),
+        pytest.param({"group_by": "unknown"}, "Unknown grouping", id="unknown_grouping"),
+        pytest.param({"n": -1}, "must not be negative", id="negative_n"),
+    ],
+)
+def test_get_top_users_invalid(api_collection_before: ApiCollection, kwargs: dict, expected_message: str):
+    """kwargs, expected_message"""
+    with pytest.raises(ValueError, match=expected_message):
+        _ = get_top_users(api_collection_before, **kwargs)
+
+
+def test_get_top_alliances_by_alliance(api_collection_before: ApiCollection):
+    with pytest.raises(ValueError):
+        _ = get_top_alliances(api_collection_before, group_by="alliance")
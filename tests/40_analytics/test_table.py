@@ -0,0 +1,57 @@
+import sys
+
+import pytest
+from pytest import MonkeyPatch
+
+from pss_fleet_data.analytics import Table
+
+
+@pytest.fixture(scope="function")
+def table() -> Table:
+    return Table({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+
+
+def test_table(table: Table):
+    assert len(table) == 3
+    assert table.column_names == ("id", "name")
+    assert "id" in table
+    assert table["name"] == ["a", "b", "c"]
+    assert table.row(1) == {"id": 2, "name": "b"}
+    assert list(table.rows()) == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}, {"id": 3, "name": "c"}]
+
+
+def test_table_columns_of_different_lengths():
+    with pytest.raises(ValueError):
+        _ = Table({"id": [1, 2], "name": ["a"]})
+
+
+def test_table_filter_and_select(table: Table):
+    filtered = table.filter(value > 1 for value in table["id"])
+
+    assert filtered.to_dict() == {"id": [2, 3], "name": ["b", "c"]}
+    assert table.select("name").to_dict() == {"name": ["a", "b", "c"]}
+
+
+def test_table_to_numpy(table: Table):
+    numpy = pytest.importorskip("numpy")
+
+    arrays = table.to_numpy(["id"])
+
+    assert list(arrays) == ["id"]
+    assert numpy.array_equal(arrays["id"], numpy.array([1, 2, 3]))
+
+
+def test_table_to_pandas(table: Table):
+    _ = pytest.importorskip("pandas")
+
+    data_frame = table.to_pandas(index="id")
+
+    assert list(data_frame.columns) == ["name"]
+    assert data_frame.loc[2, "name"] == "b"
+
+
+def test_table_to_numpy_without_numpy(table: Table, monkeypatch: MonkeyPatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+
+    with pytest.raises(ImportError, match=r"pss-fleet-data-client\[analytics\]"):
+        _ = table.to_numpy()
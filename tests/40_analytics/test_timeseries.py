@@ -0,0 +1,64 @@
+import pytest
+
+from pss_fleet_data.analytics import build_time_series
+from pss_fleet_data.models.api_models import ApiCollection
+from pss_fleet_data.models.converters import FromAPI
+
+
+def test_build_time_series(api_collection_before: ApiCollection, api_collection_after: ApiCollection):
+    # Passed in reverse order, sorted by timestamp
+    after = api_collection_after.model_copy(
+        update={"meta": api_collection_after.meta.model_copy(update={"timestamp": api_collection_after.meta.timestamp.replace(year=2024)})}
+    )
+
+    time_series = build_time_series([after, api_collection_before], ["trophy", "alliance_id"])
+
+    trophies = time_series["trophy"]
+    assert trophies.field == "trophy"
+    assert trophies.collection_ids == [1, 2]
+    assert trophies.timestamps == [api_collection_before.meta.timestamp, after.meta.timestamp]
+    assert trophies.user_ids == [1, 2, 3, 4, 5, 7, 6]
+    assert trophies.columns == [[1000, 500, 800, 100, 300, 200, None], [1100, 500, 800, 100, None, 200, 50]]
+    assert trophies.get_values(5) == [300, None]
+    assert time_series["alliance_id"].get_values(3) == [2, 1]
+
+
+def test_build_time_series_for_users(api_collection_before: ApiCollection, api_collection_after: ApiCollection):
+    time_series = build_time_series([api_collection_before, FromAPI.to_collection(api_collection_after)], ["trophy"], user_ids=[6, 1, 99])
+
+    assert time_series["trophy"].columns == [[None, 1000, None], [50, 1100, None]]
+
+
+def test_build_time_series_unknown_field(api_collection_before: ApiCollection):
+    with pytest.raises(ValueError):
+        _ = build_time_series([api_collection_before], ["unknown"])
+
+
+def test_time_series_to_table(api_collection_before: ApiCollection):
+    time_series = build_time_series([api_collection_before], ["trophy"], user_ids=[1, 2])["trophy"]
+
+    table = time_series.to_table()
+
+    assert table.column_names == ("user_id", api_collection_before.meta.timestamp.isoformat())
+    assert table.to_dict()["user_id"] == [1, 2]
+
+
+def test_time_series_to_numpy(api_collection_before: ApiCollection, api_collection_after: ApiCollection):
+    numpy = pytest.importorskip("numpy")
+    time_series = build_time_series([api_collection_before, api_collection_after], ["trophy"], user_ids=[1, 6])["trophy"]
+
+    array = time_series.to_numpy()
+
+    assert array.shape == (2, 2)
+    assert array[0, 0] == 1000
+    assert numpy.isnan(array[1, 0])
+
+
+def test_time_series_to_pandas(api_collection_before: ApiCollection):
+    _ = pytest.importorskip("pandas")
+    time_series = build_time_series([api_collection_before], ["trophy"], user_ids=[1, 2])["trophy"]
+
+    data_frame = time_series.to_pandas()
+
+    assert data_frame.index.name == "user_id"
+    assert data_frame.loc[2, api_collection_before.meta.timestamp] == 500
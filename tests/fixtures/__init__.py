@@ -2,3 +2,4 @@ from .api_asserts import *  # noqa: F401,F403
 from .api_objects import *  # noqa: F401,F403
 from .client_asserts import *  # noqa: F401,F403
 from .client_objects import *  # noqa: F401,F403
+from .tracing import *  # noqa: F401,F403
@@ -0,0 +1,38 @@
+from contextlib import contextmanager
+from typing import Any, Optional
+
+import pytest
+
+
+class RecordingSpan:
+    def __init__(self, name: str, attributes: dict[str, Any], parent: Optional["RecordingSpan"]):
+        self.name = name
+        self.attributes = attributes
+        self.parent = parent
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+
+class RecordingTracer:
+    def __init__(self):
+        self.spans: list[RecordingSpan] = []
+        self.__stack: list[RecordingSpan] = []
+
+    @contextmanager
+    def start_as_current_span(self, name: str, attributes: Optional[dict[str, Any]] = None):
+        span = RecordingSpan(name, dict(attributes or {}), self.__stack[-1] if self.__stack else None)
+        self.spans.append(span)
+        self.__stack.append(span)
+        try:
+            yield span
+        finally:
+            self.__stack.pop()
+
+    def get_span(self, name: str) -> RecordingSpan:
+        return next(span for span in self.spans if span.name == name)
+
+
+@pytest.fixture(scope="function")
+def recording_tracer() -> RecordingTracer:
+    return RecordingTracer()